@@ -2,12 +2,22 @@
 
 import math
 
-class ArbreStirling:
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+
+class ArbreStirling(Piece):
     """
     Modélisation d’un arbre (axe principal) de moteur Stirling pour CAO :
     - Géométrie, volume, masse, section, résistance, état de surface, matière, etc.
     """
 
+    __slots__ = (
+        "diametre", "longueur", "matiere", "densite", "rugosite", "etat_surface",
+    )
+    ARGUMENTS = {
+        "diametre_m": "diametre", "longueur_m": "longueur", "matiere": "matiere",
+        "densite_kg_m3": "densite", "rugosite_um": "rugosite", "etat_surface": "etat_surface",
+    }
+
     def __init__(
         self,
         diametre_m,                # Diamètre (m)
@@ -26,42 +36,43 @@ class ArbreStirling:
         self.rugosite = rugosite_um
         self.etat_surface = etat_surface
 
-    @property
+    @propriete_cachee
     def rayon(self):
         return self.diametre / 2
 
-    @property
+    @propriete_cachee
     def section(self):
         "Section droite (m²)"
         return math.pi * (self.rayon ** 2)
 
-    @property
+    @propriete_cachee
     def volume(self):
         "Volume total (m³)"
         return self.section * self.longueur
 
-    @property
+    @propriete_cachee
     def masse(self):
         "Masse totale (kg)"
         return self.volume * self.densite
 
-    @property
+    @propriete_cachee
     def surface_laterale(self):
         "Surface latérale (m²)"
         return math.pi * self.diametre * self.longueur
 
-    @property
+    @propriete_cachee
     def moment_inertie(self):
         "Moment quadratique de la section (m⁴), utile pour flexion"
         # I = (pi/64) * D^4
         return (math.pi / 64) * self.diametre ** 4
 
-    @property
+    @propriete_cachee
     def module_resistance(self):
         "Module de résistance à la flexion (m³)"
         # W = I / (D/2)
         return self.moment_inertie / (self.diametre / 2)
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Diamètre (mm)": round(self.diametre * 1000, 3),
@@ -78,6 +89,7 @@ class ArbreStirling:
             "Module de résistance W (mm3)": round(self.module_resistance * 1e9, 2),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"ArbreStirling(D={self.diametre*1000:.2f} mm, L={self.longueur*1000:.2f} mm, "
@@ -0,0 +1,288 @@
+# calculs/assemblage.py
+
+import math
+
+from calculs import assemblage_visse, percage
+from calculs.arbre import ArbreStirling
+from calculs.axe_piston import AxePistonStirling
+from calculs.bielle import bielle_depuis_stirling
+from calculs.couvercle_cylindre import CouvercleCylindreStirling
+from calculs.cylindre import CylindreStirling
+from calculs.displacer import DisplacerStirling
+from calculs.joints import trouve_joint_torique
+from calculs.piston import PistonStirling
+from calculs.stirling import DEFAULTS
+from calculs.support_roulement import DUREE_CIBLE_H, SupportRoulement
+from calculs.villebrequin import VillebrequinStirling
+from calculs.visserie import calc_visserie
+
+# Entrées de l’assemblage : clés de la fiche technique (`calcul_complet`) puis options
+# de construction. None = obligatoire ; entraxe_vis_pct « auto » : cercle d’entraxe au
+# milieu de la paroi du cylindre, paroi portée au minimum des perçages (percage.paroi_percee).
+ENTREES_DEFAUT = {
+    # Fiche technique
+    "Diametre_interne_m": None,
+    "Course_m": None,
+    "Temp_chaud_C": DEFAULTS["Th"] - 273.15,
+    "Temp_froid_C": DEFAULTS["Tc"] - 273.15,
+    "Pression_Pa": DEFAULTS["pm"],
+    "Frequence_Hz": DEFAULTS["f"],
+    "Nb_cylindres": DEFAULTS["Nc"],
+    "Materiau": "Acier",
+    # Cylindre, couvercle et visserie de fixation
+    "epaisseur_cylindre_m": 0.003,
+    "epaisseur_couvercle_m": 0.005,
+    "diam_entree_air_m": 0.008,
+    "diam_entree_bruleur_m": 0.012,
+    "nb_vis": 6,
+    "dim_vis_iso": "M6",
+    "entraxe_vis_pct": "auto",
+    "classe_vis": "8.8",
+    "securite_vis": 2.0,
+    # Déplaceur
+    "jeu_radial_displacer_m": 0.001,
+    "rapport_hauteur_displacer": 1.5,
+    # Ligne d’arbre
+    "diametre_arbre_m": 0.012,
+    "longueur_arbre_m": 0.080,
+    "charge_palier_N": 1000,
+    "duree_roulement_h": DUREE_CIBLE_H,
+    "matiere_support": "Alu",
+}
+
+# Axe de piston (acier trempé rectifié)
+MATIERE_AXE_PISTON = "Acier trempé 100Cr6"
+DENSITE_AXE_PISTON = 7810
+RUGOSITE_AXE_PISTON_UM = 0.6
+ETAT_SURFACE_AXE_PISTON = "Rectifié miroir"
+
+def _cylindre(Diametre_interne_m, Course_m, Temp_chaud_C, Temp_froid_C, Materiau,
+              epaisseur_cylindre_m, nb_vis, dim_vis_iso, entraxe_vis_pct):
+    fiche = {"Diametre_interne_m": Diametre_interne_m, "Course_m": Course_m, "Materiau": Materiau,
+             "Temp_chaud_C": Temp_chaud_C, "Temp_froid_C": Temp_froid_C}
+    if entraxe_vis_pct == "auto":
+        r_int_mm = Diametre_interne_m / 2 * 1000
+        epaisseur_mm, entraxe_mm = percage.paroi_percee(r_int_mm, CylindreStirling.DIAM_PERCAGE_TARAUD_ISO[dim_vis_iso],
+                                                        epaisseur_cylindre_m * 1000)
+        epaisseur_cylindre_m, entraxe_vis_pct = epaisseur_mm / 1000, entraxe_mm / r_int_mm
+    return CylindreStirling.depuis_calcul_complet(fiche, epaisseur_m=epaisseur_cylindre_m, nb_vis=nb_vis,
+                                                  dim_vis_iso=dim_vis_iso, entraxe_vis_pct=entraxe_vis_pct)
+
+def _piston(cylindre):
+    return PistonStirling.depuis_cylindre(cylindre)
+
+def _axe_piston(piston):
+    return AxePistonStirling(piston.axe_diam, piston.axe_longueur, MATIERE_AXE_PISTON,
+                             DENSITE_AXE_PISTON, RUGOSITE_AXE_PISTON_UM, ETAT_SURFACE_AXE_PISTON)
+
+def _bielle(Diametre_interne_m, Course_m, Materiau):
+    return bielle_depuis_stirling({"Diametre_interne_m": Diametre_interne_m, "Course_m": Course_m,
+                                   "Materiau": Materiau})
+
+def _displacer(Diametre_interne_m, Course_m, jeu_radial_displacer_m, rapport_hauteur_displacer):
+    return DisplacerStirling(diametre_m=Diametre_interne_m - 2 * jeu_radial_displacer_m,
+                             hauteur_m=Course_m * rapport_hauteur_displacer)
+
+def _couvercle(cylindre, epaisseur_couvercle_m, diam_entree_air_m, diam_entree_bruleur_m):
+    """Couvercle au diamètre extérieur du cylindre, perçages sur le même cercle d’entraxe."""
+    return CouvercleCylindreStirling(
+        diametre_m=cylindre.diametre_ext,
+        epaisseur_m=epaisseur_couvercle_m,
+        matiere=cylindre.matiere,
+        densite_kg_m3=cylindre.densite,
+        rugosite_um=cylindre.rugosite,
+        etat_surface=cylindre.etat_surface,
+        type_couvercle="plat",
+        diam_entrée_air_m=diam_entree_air_m,
+        nb_entree_air=1,
+        diam_entrée_bruleur_m=diam_entree_bruleur_m,
+        nb_entree_bruleur=1,
+        distance_bruleur_centre_m=0.0,
+        nb_vis=cylindre.nb_vis,
+        dim_vis_iso=cylindre.dim_vis_iso,
+        entraxe_vis_pct=cylindre.entraxe_vis / cylindre.rayon_ext,
+    )
+
+def _joints(piston, displacer):
+    """Joint torique de piston (fond de rainure / alésage) et joints d’axe du déplaceur."""
+    profondeur = piston.rainures[0]["profondeur_m"] if piston.rainures else 0.0
+    largeur = piston.rainures[0]["largeur_m"] * 1000 if piston.rainures else None
+    try:
+        joint_piston = trouve_joint_torique(d_arbre_mm=(piston.diametre - 2 * profondeur) * 1000,
+                                            d_alésage_mm=piston.diametre * 1000, tol="dynamique",
+                                            largeur_gorge_mm=largeur)
+    except ValueError:
+        joint_piston = None
+    return {"piston": joint_piston, "nb_piston": piston.nb_rainures, "displacer": displacer.joints_toriques}
+
+def _visserie(Diametre_interne_m, Pression_Pa, nb_vis, classe_vis, securite_vis):
+    """Vis de fixation du couvercle sous l’effort de pression sur l’alésage."""
+    effort = Pression_Pa * math.pi * (Diametre_interne_m / 2) ** 2
+    return calc_visserie(effort, "traction", classe_vis, securite_vis, nb_vis)
+
+def _assemblage_couvercle(cylindre, couvercle, Pression_Pa, classe_vis):
+    """Vissage du couvercle (VDI 2230 simplifiée) sous la pression de la fiche."""
+    res = assemblage_visse.depuis_pieces(cylindre, couvercle, Pression_Pa, classe=classe_vis)
+    return {cle: valeur.item() for cle, valeur in res.items()}
+
+def _percages_couvercle(cylindre, couvercle):
+    """Ligaments des perçages du couvercle (alésage du cylindre, orifices) et coïncidence des entraxes."""
+    res = percage.depuis_pieces(cylindre, couvercle)
+    return {cle: float(valeur) if cle != "OK" else bool(valeur) for cle, valeur in res.items()}
+
+def _villebrequin(Course_m, Nb_cylindres, diametre_arbre_m, longueur_arbre_m):
+    return VillebrequinStirling(nb_manetons=int(Nb_cylindres), rayon_maneton_m=Course_m / 2,
+                                diametre_axe_m=diametre_arbre_m, longueur_axe_m=longueur_arbre_m)
+
+def _arbre(diametre_arbre_m, longueur_arbre_m):
+    return ArbreStirling(diametre_m=diametre_arbre_m, longueur_m=longueur_arbre_m)
+
+def _support_roulement(diametre_arbre_m, charge_palier_N, matiere_support, Frequence_Hz, duree_roulement_h):
+    return SupportRoulement(d_arbre_mm=diametre_arbre_m * 1000, charge_radiale_N=charge_palier_N,
+                            matiere=matiere_support, frequence_Hz=Frequence_Hz, duree_cible_h=duree_roulement_h)
+
+# Graphe de dépendances : pièce -> (dépendances, construction). Une dépendance est une
+# entrée (ENTREES_DEFAUT) ou une autre pièce ; la fonction de construction reçoit ses
+# dépendances par nom. L’ordre des clés est un ordre topologique.
+GRAPHE = {
+    "cylindre": (("Diametre_interne_m", "Course_m", "Temp_chaud_C", "Temp_froid_C", "Materiau",
+                  "epaisseur_cylindre_m", "nb_vis", "dim_vis_iso", "entraxe_vis_pct"), _cylindre),
+    "piston": (("cylindre",), _piston),
+    "axe_piston": (("piston",), _axe_piston),
+    "bielle": (("Diametre_interne_m", "Course_m", "Materiau"), _bielle),
+    "displacer": (("Diametre_interne_m", "Course_m", "jeu_radial_displacer_m",
+                   "rapport_hauteur_displacer"), _displacer),
+    "couvercle": (("cylindre", "epaisseur_couvercle_m", "diam_entree_air_m", "diam_entree_bruleur_m"), _couvercle),
+    "joints": (("piston", "displacer"), _joints),
+    "visserie": (("Diametre_interne_m", "Pression_Pa", "nb_vis", "classe_vis", "securite_vis"), _visserie),
+    "assemblage_couvercle": (("cylindre", "couvercle", "Pression_Pa", "classe_vis"), _assemblage_couvercle),
+    "percages_couvercle": (("cylindre", "couvercle"), _percages_couvercle),
+    "villebrequin": (("Course_m", "Nb_cylindres", "diametre_arbre_m", "longueur_arbre_m"), _villebrequin),
+    "arbre": (("diametre_arbre_m", "longueur_arbre_m"), _arbre),
+    "support_roulement": (("diametre_arbre_m", "charge_palier_N", "matiere_support", "Frequence_Hz",
+                           "duree_roulement_h"), _support_roulement),
+}
+
+def _dependants_transitifs():
+    """Pour chaque entrée ou pièce, les pièces à invalider quand elle change."""
+    dependants = {nom: set() for nom in list(ENTREES_DEFAUT) + list(GRAPHE)}
+    for piece, (dependances, _) in GRAPHE.items():
+        for dep in dependances:
+            if dep not in dependants:
+                raise ValueError(f"Dépendance inconnue « {dep} » pour la pièce « {piece} »")
+            dependants[dep].add(piece)
+    # GRAPHE étant ordonné topologiquement, un parcours inverse suffit à fermer les ensembles
+    for piece in reversed(GRAPHE):
+        for dep in GRAPHE[piece][0]:
+            dependants[dep] |= dependants[piece]
+    return dependants
+
+DEPENDANTS = _dependants_transitifs()
+
+class AssemblageMoteur:
+    """
+    Moteur complet dérivé d’une seule fiche technique par le graphe GRAPHE :
+    chaque pièce est construite à la première lecture puis conservée ; `modifier`
+    n’invalide que les pièces qui dépendent (transitivement) des entrées changées.
+    - fiche : dict de `calcul_complet` (seules les clés de ENTREES_DEFAUT sont lues)
+    - options : autres entrées de ENTREES_DEFAUT
+    `recalculs` compte les constructions de chaque pièce.
+    """
+
+    def __init__(self, fiche, **options):
+        inconnues = set(options) - set(ENTREES_DEFAUT)
+        if inconnues:
+            raise ValueError(f"Entrées inconnues : {', '.join(sorted(inconnues))}")
+        self._entrees = dict(ENTREES_DEFAUT)
+        self._entrees.update({cle: fiche[cle] for cle in ENTREES_DEFAUT if cle in fiche})
+        self._entrees.update(options)
+        manquantes = [cle for cle, valeur in self._entrees.items() if valeur is None]
+        if manquantes:
+            raise ValueError(f"Entrées obligatoires manquantes : {', '.join(manquantes)}")
+        self._pieces = {}
+        self.recalculs = {nom: 0 for nom in GRAPHE}
+
+    @property
+    def entrees(self):
+        return dict(self._entrees)
+
+    def piece(self, nom):
+        """Pièce `nom`, construite (avec ses dépendances) si elle est invalide."""
+        if nom not in GRAPHE:
+            raise ValueError(f"Pièce inconnue : {nom} (attendu : {', '.join(GRAPHE)})")
+        if nom not in self._pieces:
+            dependances, construire = GRAPHE[nom]
+            arguments = {dep: self.piece(dep) if dep in GRAPHE else self._entrees[dep] for dep in dependances}
+            self._pieces[nom] = construire(**arguments)
+            self.recalculs[nom] += 1
+        return self._pieces[nom]
+
+    def __getattr__(self, nom):
+        if nom in GRAPHE:
+            return self.piece(nom)
+        raise AttributeError(nom)
+
+    def modifier(self, **valeurs):
+        """
+        Change des entrées et invalide les pièces qui en dépendent.
+        Renvoie les pièces invalidées (dans l’ordre du graphe) ; une valeur inchangée
+        n’invalide rien.
+        """
+        inconnues = set(valeurs) - set(ENTREES_DEFAUT)
+        if inconnues:
+            raise ValueError(f"Entrées inconnues : {', '.join(sorted(inconnues))}")
+        invalides = set()
+        for cle, valeur in valeurs.items():
+            if valeur is None:
+                raise ValueError(f"L’entrée {cle} ne peut pas être vide.")
+            if valeur != self._entrees[cle]:
+                self._entrees[cle] = valeur
+                invalides |= DEPENDANTS[cle]
+        for nom in invalides:
+            self._pieces.pop(nom, None)
+        return tuple(nom for nom in GRAPHE if nom in invalides)
+
+    def est_valide(self, nom):
+        """True si la pièce est construite et à jour."""
+        return nom in self._pieces
+
+    def construire(self):
+        """Construit toutes les pièces invalides."""
+        for nom in GRAPHE:
+            self.piece(nom)
+        return self
+
+    def pieces(self):
+        return {nom: self.piece(nom) for nom in GRAPHE}
+
+    def to_dict(self):
+        return {nom: p.to_dict() if hasattr(p, "to_dict") else p for nom, p in self.pieces().items()}
+
+    def resume(self, noms=None):
+        """Résumé texte des pièces (toutes par défaut), format de la page de création."""
+        texte = "=== Résumé des pièces principales ===\n"
+        for nom in noms or GRAPHE:
+            p = self.piece(nom)
+            titre = nom.replace("_", " ").capitalize()
+            if hasattr(p, "to_dict"):
+                texte += f"[{titre}]\n{p}\n{p.to_dict()}\n\n"
+            else:
+                texte += f"[{titre}]\n{p}\n\n"
+        return texte
+
+    def __repr__(self):
+        valides = sum(nom in self._pieces for nom in GRAPHE)
+        return (f"AssemblageMoteur(D={self._entrees['Diametre_interne_m']*1000:.2f} mm, "
+                f"C={self._entrees['Course_m']*1000:.2f} mm, Nc={self._entrees['Nb_cylindres']}, "
+                f"{valides}/{len(GRAPHE)} pièces à jour)")
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    from calculs.stirling import calcul_complet
+
+    moteur = AssemblageMoteur(calcul_complet(P=1000)).construire()
+    print(moteur)
+    print("Piston :", moteur.piston)
+    print("Invalidées par l’alésage :", moteur.modifier(Diametre_interne_m=0.07))
+    moteur.construire()
+    print("Reconstructions :", moteur.recalculs)
@@ -0,0 +1,217 @@
+# calculs/assemblage_visse.py
+
+import math
+
+import numpy as np
+
+from calculs.fatigue import MATERIAUX_FATIGUE, materiau_fatigue
+from calculs.vibrations import modules_elastiques
+from calculs.visserie import CLASSES_QUALITE, FILETAGES_ISO
+from materiaux import famille
+
+# Assemblage vissé, méthode VDI 2230 simplifiée (une vis chargée axialement, pièces
+# serrées cylindriques, vis à tête hexagonale dans un taraudage) :
+# précharge de montage, couple de serrage, raideurs vis / pièces, facteur de charge,
+# serrage résiduel, contrainte équivalente en service, arrachement du filet taraudé.
+# Toutes les entrées sont des scalaires ou des tableaux diffusables : un lot de
+# (effort, nombre de vis, classe, filetage) est évalué en un appel.
+
+E_VIS = 205e9                   # Module d’Young de la vis (Pa)
+COEF_UTILISATION = 0.9          # ν : fraction de Re atteinte au montage (contrainte équivalente)
+FROTTEMENT_FILET = 0.12         # μG
+FROTTEMENT_TETE = 0.12          # μK
+FACTEUR_SERRAGE = 1.6           # αA = F_M,max / F_M,min (clé dynamométrique)
+FACTEUR_INTRODUCTION = 0.5      # n : introduction de la charge dans les pièces
+TASSEMENT_M = 8e-6              # f_Z : tassement des surfaces d’appui et du filet (m)
+COEF_TORSION_RESIDUELLE = 0.5   # k_τ : part de la torsion de montage conservée en service
+RAPPORT_CISAILLEMENT = 0.6      # τ_B / Rm du matériau taraudé
+# Longueur d’implantation par défaut (x d) selon la matière taraudée
+IMPLANTATION = {"Acier": 1.0, "Inox": 1.25, "Laiton": 1.5, "Aluminium": 2.0}
+
+def _colonnes_filetages():
+    """Colonnes NumPy de FILETAGES_ISO (mm, mm²) et ordre croissant des sections."""
+    colonnes = {cle: np.array([f[cle] for f in FILETAGES_ISO])
+                for cle in ("d_nom", "pas", "d2", "d3", "section", "d_perc", "s")}
+    colonnes["designation"] = np.array([f["designation"] for f in FILETAGES_ISO])
+    colonnes["gros"] = np.array([f["serie"] == "gros" for f in FILETAGES_ISO])
+    colonnes["ordre_section"] = np.argsort(colonnes["section"], kind="stable")
+    return colonnes
+
+FILETAGES = _colonnes_filetages()
+
+def indices_filetages(designations):
+    """Indices dans FILETAGES_ISO d’une désignation ou d’un tableau de désignations (« M6 », « m10x1.25 »)."""
+    position = {nom: i for i, nom in enumerate(FILETAGES["designation"])}
+    noms, inverse = np.unique(np.char.replace(np.char.upper(np.asarray(designations, dtype=str)), "X", "x"),
+                              return_inverse=True)
+    try:
+        table = np.array([position[nom] for nom in noms])
+    except KeyError as e:
+        raise ValueError(f"Filetage inconnu : {e.args[0]}") from None
+    return table[inverse].reshape(np.shape(designations))
+
+def proprietes_classes(classes):
+    """Re et Rm (Pa) d’une classe de qualité ou d’un tableau de classes (« 8.8 », 10.9...)."""
+    noms, inverse = np.unique(np.asarray(classes, dtype=str), return_inverse=True)
+    inconnues = [nom for nom in noms if nom not in CLASSES_QUALITE]
+    if inconnues:
+        raise ValueError(f"Classe de vis inconnue : {', '.join(inconnues)} (attendu : {', '.join(CLASSES_QUALITE)})")
+    Re = np.array([CLASSES_QUALITE[nom]["Re"] for nom in noms]) * 1e6
+    Rm = np.array([CLASSES_QUALITE[nom]["Rm"] for nom in noms]) * 1e6
+    forme = np.shape(classes)
+    return Re[inverse].reshape(forme), Rm[inverse].reshape(forme)
+
+def evaluer_assemblage(F, nb_vis, classe, designation, longueur_serree, mat_pieces="Acier", mat_taraud=None,
+                       longueur_implantation=None, D_A=None, F_K_requis=0.0, mu_filet=FROTTEMENT_FILET,
+                       mu_tete=FROTTEMENT_TETE, alpha_A=FACTEUR_SERRAGE, nu=COEF_UTILISATION,
+                       n=FACTEUR_INTRODUCTION, f_Z=TASSEMENT_M):
+    """
+    Évaluation VDI 2230 simplifiée d’un lot d’assemblages :
+    - F : effort axial de service total (N), réparti sur nb_vis vis
+    - classe, designation : classe de qualité et filetage (FILETAGES_ISO)
+    - longueur_serree : épaisseur des pièces serrées l_k (m)
+    - mat_pieces, mat_taraud : matières de la pièce serrée et de la pièce taraudée (par défaut la même)
+    - longueur_implantation : engagement du filet (m), par défaut IMPLANTATION x d
+    - D_A : diamètre extérieur équivalent des pièces (m), par défaut cône complet d_w + l_k
+    - F_K_requis : serrage résiduel minimal par vis (N), 0 = pas de décollement
+    Renvoie un dict de tableaux (forme diffusée des entrées) ; OK si serrage résiduel,
+    contrainte de la vis et arrachement du taraudage sont satisfaits.
+    """
+    i = indices_filetages(designation) if np.asarray(designation).dtype.kind in "US" else np.asarray(designation)
+    Re, Rm = proprietes_classes(classe)
+    F, nb_vis, l_k, F_K_requis, i, Re, Rm = np.broadcast_arrays(
+        np.asarray(F, dtype=float), np.asarray(nb_vis, dtype=float), np.asarray(longueur_serree, dtype=float),
+        np.asarray(F_K_requis, dtype=float), i, Re, Rm)
+    d, P, d2, d3 = (FILETAGES[cle][i] / 1000 for cle in ("d_nom", "pas", "d2", "d3"))
+    A_s = FILETAGES["section"][i] / 1e6
+    d_h = FILETAGES["d_perc"][i] / 1000
+    d_w = FILETAGES["s"][i] / 1000                  # diamètre d’appui sous tête ≈ cote sur plats
+    d_s = (d2 + d3) / 2
+    A_N, A_d3 = math.pi / 4 * d ** 2, math.pi / 4 * d3 ** 2
+    mat_taraud = mat_pieces if mat_taraud is None else mat_taraud
+    E_P = modules_elastiques(mat_pieces)["E"]
+    E_M = modules_elastiques(mat_taraud)["E"]
+
+    # Précharge admissible (contrainte équivalente ν Re au montage) et couple de serrage
+    filet = P / (math.pi * d2) + 1.155 * mu_filet
+    F_M_max = A_s * nu * Re / np.sqrt(1 + 3 * (1.5 * d2 / d_s * filet) ** 2)
+    F_M_min = F_M_max / alpha_A
+    D_Km = (d_w + d_h) / 2
+    couple = F_M_max * (0.16 * P + 0.58 * d2 * mu_filet + mu_tete * D_Km / 2)
+
+    # Souplesses : tête, fût sur l_k, filet engagé, taraudage ; cône de compression des pièces
+    delta_S = (0.5 * d / A_N + l_k / A_N + 0.5 * d / A_d3) / E_VIS + 0.33 * d / (E_M * A_N)
+    D_A = d_w + l_k if D_A is None else np.minimum(np.asarray(D_A, dtype=float), d_w + l_k)
+    x = np.cbrt(l_k * d_w / np.maximum(D_A, d_w) ** 2)
+    A_ers = np.where(D_A >= d_w,
+                     math.pi / 4 * (d_w ** 2 - d_h ** 2) + math.pi / 8 * d_w * (D_A - d_w) * ((x + 1) ** 2 - 1),
+                     math.pi / 4 * (D_A ** 2 - d_h ** 2))
+    delta_P = l_k / (E_P * A_ers)
+    phi = n * delta_P / (delta_S + delta_P)
+
+    # Service : effort additionnel dans la vis, serrage résiduel après tassement
+    F_A = F / nb_vis
+    F_SA = phi * F_A
+    F_Z = f_Z / (delta_S + delta_P)
+    F_KR = F_M_min - (1 - phi) * F_A - F_Z
+    M_G = F_M_max * d2 / 2 * filet
+    tau = M_G / (math.pi * d_s ** 3 / 16)
+    sigma = np.sqrt(((F_M_max + F_SA) / A_s) ** 2 + 3 * (COEF_TORSION_RESIDUELLE * tau) ** 2)
+    securite_vis = Re / sigma
+
+    # Arrachement du filet taraudé (cisaillement au diamètre nominal) face à la rupture de la vis
+    fam = famille(mat_taraud)
+    m = IMPLANTATION[fam] * d if longueur_implantation is None else np.asarray(longueur_implantation, dtype=float)
+    tau_B = RAPPORT_CISAILLEMENT * materiau_fatigue(mat_taraud if mat_taraud in MATERIAUX_FATIGUE else fam)["Rm"]
+    cisaille_par_m = tau_B * math.pi * d * (P / 2 + (d - d2) * math.tan(math.pi / 6)) / P
+    securite_arrachement = m * cisaille_par_m / (Rm * A_s)
+    m_min = Rm * A_s / cisaille_par_m
+
+    return {
+        "Designation": FILETAGES["designation"][i],
+        "Section_resistante_m2": A_s,
+        "Effort_par_vis_N": F_A,
+        "Precharge_max_N": F_M_max,
+        "Precharge_min_N": F_M_min,
+        "Couple_serrage_N_m": couple,
+        "Raideur_vis_N_m": 1 / delta_S,
+        "Raideur_pieces_N_m": 1 / delta_P,
+        "Facteur_charge": phi,
+        "Effort_additionnel_N": F_SA,
+        "Perte_tassement_N": F_Z,
+        "Serrage_residuel_N": F_KR,
+        "Contrainte_vis_Pa": sigma,
+        "Securite_vis": securite_vis,
+        "Longueur_implantation_m": np.broadcast_to(m, d.shape),
+        "Implantation_mini_m": m_min,
+        "Securite_arrachement": securite_arrachement,
+        "OK": (F_KR >= F_K_requis) & (securite_vis >= 1) & (securite_arrachement >= 1),
+    }
+
+def choix_vis(F, nb_vis, classe, longueur_serree, serie="gros", **options):
+    """
+    Plus petit filetage (section résistante croissante, série « gros » ou « tous ») satisfaisant
+    evaluer_assemblage pour chaque cas du lot. Le premier candidat est trouvé par
+    np.searchsorted sur les sections, avec une borne inférieure de la section (précharge mini
+    < ν Re As / αA devant (1 - n) x effort par vis), puis les cas non satisfaits passent au
+    filetage suivant.
+    Renvoie l’évaluation du filetage retenu et Indice (-1, Designation vide : aucun ne convient).
+    """
+    if serie not in ("gros", "tous"):
+        raise ValueError("serie doit être 'gros' ou 'tous'")
+    ordre = FILETAGES["ordre_section"]
+    if serie == "gros":
+        ordre = ordre[FILETAGES["gros"][ordre]]
+    sections = FILETAGES["section"][ordre] / 1e6
+    Re, _ = proprietes_classes(classe)
+    F, nb_vis, l_k, Re = np.broadcast_arrays(np.asarray(F, dtype=float), np.asarray(nb_vis, dtype=float),
+                                             np.asarray(longueur_serree, dtype=float), Re)
+    alpha_A = options.get("alpha_A", FACTEUR_SERRAGE)
+    nu = options.get("nu", COEF_UTILISATION)
+    n = options.get("n", FACTEUR_INTRODUCTION)
+    section_requise = np.abs(F) / nb_vis * alpha_A * (1 - n) / (nu * Re)
+    rang = np.searchsorted(sections, section_requise.ravel())
+    classes = np.broadcast_to(np.asarray(classe, dtype=str), F.shape).ravel()
+    F, nb_vis, l_k = F.ravel(), nb_vis.ravel(), l_k.ravel()
+    a_tester = rang < ordre.size
+    while np.any(a_tester):
+        k = np.flatnonzero(a_tester)
+        res = evaluer_assemblage(F[k], nb_vis[k], classes[k], ordre[rang[k]], l_k[k], **options)
+        a_tester[k[res["OK"]]] = False
+        rang[k[~res["OK"]]] += 1
+        a_tester &= rang < ordre.size
+    trouve = rang < ordre.size
+    indice = np.where(trouve, ordre[np.minimum(rang, ordre.size - 1)], -1)
+    res = evaluer_assemblage(F, nb_vis, classes, np.maximum(indice, 0), l_k, **options)
+    res["Designation"] = np.where(trouve, res["Designation"], "")
+    res["OK"] &= trouve
+    forme = np.shape(section_requise)
+    return {"Indice": indice.reshape(forme), **{cle: np.asarray(v).reshape(forme) for cle, v in res.items()}}
+
+def depuis_pieces(cylindre, couvercle, pression_Pa, classe="8.8", **options):
+    """
+    Vissage du couvercle sur le cylindre sous la pression maximale : effort sur l’alésage,
+    vis du couvercle (nombre, filetage), épaisseur de couvercle serrée, taraudage dans la
+    matière du cylindre, diamètre équivalent limité au pas circonférentiel des vis.
+    """
+    F = pression_Pa * math.pi * (cylindre.diametre / 2) ** 2
+    options.setdefault("D_A", 2 * math.pi * couvercle.entraxe_vis / couvercle.nb_vis)
+    return evaluer_assemblage(F, couvercle.nb_vis, classe, couvercle.dim_vis_iso, couvercle.epaisseur,
+                              mat_pieces=couvercle.matiere, mat_taraud=cylindre.matiere, **options)
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.assemblage import AssemblageMoteur
+    from calculs.stirling import calcul_complet
+
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    res = depuis_pieces(moteur.cylindre, moteur.couvercle, 3 * moteur.entrees["Pression_Pa"])
+    print(f"{moteur.couvercle.nb_vis} x {res['Designation']} : précharge {res['Precharge_min_N']:.0f}-{res['Precharge_max_N']:.0f} N, "
+          f"couple {res['Couple_serrage_N_m']:.1f} N.m, Φ {res['Facteur_charge']:.3f}, sécurité vis {res['Securite_vis']:.2f}, "
+          f"arrachement {res['Securite_arrachement']:.2f}, OK : {bool(res['OK'])}")
+    rng = np.random.default_rng(0)
+    n = 100_000
+    t0 = time.perf_counter()
+    lot = choix_vis(rng.uniform(1e3, 2e5, n), rng.integers(3, 13, n), rng.choice(["5.6", "8.8"], n), 0.01)
+    print(f"{n} assemblages dimensionnés en {time.perf_counter() - t0:.2f} s, {int(np.sum(lot['Indice'] < 0))} sans solution")
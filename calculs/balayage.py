@@ -0,0 +1,373 @@
+# calculs/balayage.py
+
+import csv
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculs.stirling import calcul_complet_batch
+
+# Paramètres d’entrée de calcul_complet (ordre des colonnes en sortie)
+PARAMETRES = ("P", "Th", "Tc", "pm", "f", "Nc", "eta", "C", "gaz", "materiau")
+PARAMETRES_TEXTE = ("gaz", "materiau")
+
+# Résultats conservés pour chaque design
+COLONNES_RESULTATS = (
+    "Volume_balayé_m3",
+    "Course_m",
+    "Diametre_interne_m",
+    "Epaisseur_min_m",
+    "Diametre_externe_m",
+    "Masse_cylindre_kg",
+    "Vitesse_piston_m_s",
+    "Puissance_specifique_W_kg",
+)
+
+FICHIER_ETAT = "etat.json"
+FICHIER_CSV = "resultats.csv"
+DOSSIER_COLONNES = "colonnes"
+
+
+class Plage:
+    """Plage régulière de `nb` valeurs de `debut` à `fin` incluses (np.linspace), pour Grille."""
+
+    def __init__(self, debut, fin, nb):
+        self.debut, self.fin, self.nb = float(debut), float(fin), int(nb)
+
+    def valeurs(self):
+        return np.linspace(self.debut, self.fin, self.nb)
+
+    def __repr__(self):
+        return f"Plage({self.debut:g}, {self.fin:g}, {self.nb})"
+
+
+class Grille:
+    """
+    Produit cartésien paresseux de plages de paramètres pour calcul_complet.
+    Chaque plage est :
+    - un scalaire (valeur fixe),
+    - une liste, un tuple ou un tableau de valeurs, prises telles quelles,
+    - une Plage(debut, fin, nb), convertie en np.linspace.
+    La grille n’est jamais matérialisée : `bloc(debut, fin)` reconstruit les
+    lignes demandées à partir de leurs indices (np.unravel_index).
+    Une course C à None signifie « non renseignée » (cylindre carré).
+    """
+
+    def __init__(self, **plages):
+        if "P" not in plages:
+            raise ValueError("La plage de puissance P est obligatoire.")
+        inconnus = set(plages) - set(PARAMETRES)
+        if inconnus:
+            raise ValueError(f"Paramètres de balayage inconnus : {sorted(inconnus)}")
+        self.noms = [nom for nom in PARAMETRES if nom in plages]
+        self.valeurs = {nom: self._normalise(nom, plages[nom]) for nom in self.noms}
+        self.forme = tuple(len(self.valeurs[nom]) for nom in self.noms)
+        self.taille = int(np.prod(self.forme, dtype=np.int64))
+
+    @staticmethod
+    def _normalise(nom, plage):
+        if isinstance(plage, Plage):
+            if nom in PARAMETRES_TEXTE:
+                raise ValueError(f"Une Plage numérique ne s’applique pas au paramètre texte {nom}.")
+            return plage.valeurs()
+        if isinstance(plage, (str, int, float)) or plage is None:
+            plage = [plage]
+        if nom in PARAMETRES_TEXTE:
+            return np.array([str(v) for v in plage], dtype=object)
+        return np.array([np.nan if v is None else float(v) for v in np.ravel(plage).tolist()])
+
+    def categories(self, nom):
+        """Liste des modalités d’un paramètre texte (codes des colonnes binaires)."""
+        return [str(v) for v in self.valeurs[nom]] if nom in self.valeurs else []
+
+    def signature(self):
+        """Empreinte de la grille, pour vérifier qu’une reprise porte sur le même balayage."""
+        contenu = json.dumps({nom: [str(v) for v in self.valeurs[nom]] for nom in self.noms}, sort_keys=True)
+        return hashlib.sha1(contenu.encode()).hexdigest()
+
+    def bloc(self, debut, fin):
+        """Colonnes des lignes [debut, fin) de la grille, plus les codes des paramètres texte."""
+        indices = np.unravel_index(np.arange(debut, fin, dtype=np.int64), self.forme)
+        colonnes, codes = {}, {}
+        for nom, idx in zip(self.noms, indices):
+            colonnes[nom] = self.valeurs[nom][idx]
+            if nom in PARAMETRES_TEXTE:
+                codes[nom] = idx.astype(np.int32)
+        return colonnes, codes
+
+    def __len__(self):
+        return self.taille
+
+    def __repr__(self):
+        return f"Grille({' x '.join(f'{n}[{len(self.valeurs[n])}]' for n in self.noms)} = {self.taille} designs)"
+
+
+def _evaluer_bloc(grille, debut, fin):
+    """Évalue un bloc de la grille (exécuté dans un processus de travail)."""
+    t0 = time.perf_counter()
+    colonnes, codes = grille.bloc(debut, fin)
+    res = calcul_complet_batch(colonnes)
+    sortie = {}
+    for nom in PARAMETRES:
+        if nom in PARAMETRES_TEXTE:
+            if nom in codes:
+                sortie[nom] = codes[nom]
+        elif nom == "C":
+            sortie[nom] = np.asarray(colonnes.get("C", np.full(fin - debut, np.nan)), dtype=float)
+        else:
+            sortie[nom] = np.asarray(_colonne_entree(nom, res), dtype=float)
+    for nom in COLONNES_RESULTATS:
+        sortie[nom] = np.asarray(res[nom], dtype=float)
+    return debut, sortie, time.perf_counter() - t0, os.getpid()
+
+
+def _colonne_entree(nom, res):
+    """Valeur effective (défauts appliqués) d’un paramètre numérique."""
+    if nom == "Th":
+        return res["Temp_chaud_C"] + 273.15
+    if nom == "Tc":
+        return res["Temp_froid_C"] + 273.15
+    cles = {"P": "Puissance_W", "pm": "Pression_Pa", "f": "Frequence_Hz",
+            "Nc": "Nb_cylindres", "eta": "Rendement"}
+    return res[cles[nom]]
+
+
+def colonnes_sortie(grille):
+    """Noms des colonnes écrites pour une grille donnée."""
+    entrees = [n for n in PARAMETRES if n not in PARAMETRES_TEXTE or n in grille.noms]
+    return entrees + list(COLONNES_RESULTATS)
+
+
+class _Ecrivains:
+    """Écriture incrémentale CSV et colonnes binaires (float64 / int32 bruts + manifeste)."""
+
+    def __init__(self, dossier, grille, formats, etat):
+        self.colonnes = colonnes_sortie(grille)
+        self.grille = grille
+        self.csv = None
+        self.binaire = {}
+        if "colonnes" in formats:
+            dossier_col = os.path.join(dossier, DOSSIER_COLONNES)
+            os.makedirs(dossier_col, exist_ok=True)
+            manifeste = {
+                "colonnes": {n: ("int32" if n in PARAMETRES_TEXTE else "float64") for n in self.colonnes},
+                "categories": {n: grille.categories(n) for n in PARAMETRES_TEXTE if n in grille.noms},
+                "signature": grille.signature(),
+            }
+            with open(os.path.join(dossier_col, "manifeste.json"), "w", encoding="utf-8") as fh:
+                json.dump(manifeste, fh, ensure_ascii=False, indent=1)
+            for nom, dtype in manifeste["colonnes"].items():
+                chemin = os.path.join(dossier_col, f"{nom}.bin")
+                fh = open(chemin, "ab")
+                fh.truncate(etat["lignes"] * np.dtype(dtype).itemsize)
+                fh.seek(0, os.SEEK_END)
+                self.binaire[nom] = (fh, np.dtype(dtype).newbyteorder("<"))
+        if "csv" in formats:
+            chemin = os.path.join(dossier, FICHIER_CSV)
+            self.csv = open(chemin, "a+", newline="", encoding="utf-8")
+            self.csv.truncate(etat["octets_csv"])
+            self.csv.seek(0, os.SEEK_END)
+            if etat["octets_csv"] == 0:
+                csv.writer(self.csv).writerow(self.colonnes)
+
+    def ecrire(self, sortie):
+        for nom, (fh, dtype) in self.binaire.items():
+            fh.write(np.ascontiguousarray(sortie[nom], dtype=dtype).tobytes())
+        if self.csv is not None:
+            lignes = []
+            for nom in self.colonnes:
+                if nom in PARAMETRES_TEXTE:
+                    lignes.append(np.asarray(self.grille.categories(nom), dtype=object)[sortie[nom]].tolist())
+                else:
+                    lignes.append(sortie[nom].tolist())
+            csv.writer(self.csv).writerows(zip(*lignes))
+
+    def synchroniser(self):
+        for fh, _ in self.binaire.values():
+            fh.flush()
+        if self.csv is not None:
+            self.csv.flush()
+            return self.csv.tell()
+        return 0
+
+    def fermer(self):
+        for fh, _ in self.binaire.values():
+            fh.close()
+        if self.csv is not None:
+            self.csv.close()
+
+
+def _lire_etat(dossier, grille, taille_bloc, formats, reprendre):
+    vierge = {"signature": grille.signature(), "taille_bloc": taille_bloc, "formats": sorted(formats),
+              "blocs_termines": 0, "lignes": 0, "octets_csv": 0}
+    chemin = os.path.join(dossier, FICHIER_ETAT)
+    if not reprendre or not os.path.exists(chemin):
+        for nom in (FICHIER_CSV,):
+            if os.path.exists(os.path.join(dossier, nom)):
+                os.remove(os.path.join(dossier, nom))
+        dossier_col = os.path.join(dossier, DOSSIER_COLONNES)
+        if os.path.isdir(dossier_col):
+            for nom in os.listdir(dossier_col):
+                os.remove(os.path.join(dossier_col, nom))
+        return vierge
+    with open(chemin, encoding="utf-8") as fh:
+        etat = json.load(fh)
+    if (etat["signature"] != vierge["signature"] or etat["taille_bloc"] != taille_bloc
+            or etat["formats"] != vierge["formats"]):
+        raise ValueError("Reprise impossible : la grille, la taille de bloc ou les formats ont changé.")
+    return etat
+
+
+def _ecrire_etat(dossier, etat):
+    chemin = os.path.join(dossier, FICHIER_ETAT)
+    provisoire = chemin + ".tmp"
+    with open(provisoire, "w", encoding="utf-8") as fh:
+        json.dump(etat, fh)
+    os.replace(provisoire, chemin)
+
+
+def balayer(grille, dossier, taille_bloc=100_000, max_workers=None, formats=("csv", "colonnes"),
+            reprendre=True, rappel=None):
+    """
+    Balaye une Grille par blocs sur un pool de processus et écrit les résultats au fil de l’eau.
+    - dossier : dossier de sortie (resultats.csv, colonnes/*.bin + manifeste.json, etat.json)
+    - taille_bloc : nombre de designs par bloc (mémoire constante ~ taille_bloc x colonnes)
+    - max_workers : nombre de processus (1 = calcul dans le processus courant)
+    - formats : sous-ensemble de ("csv", "colonnes")
+    - reprendre : repart du dernier bloc terminé si etat.json correspond à la même grille
+    - rappel : fonction optionnelle appelée avec (blocs_termines, nb_blocs) après chaque bloc
+    Les blocs sont écrits dans l’ordre de la grille ; renvoie un rapport de débit.
+    """
+    formats = tuple(formats)
+    if not formats or set(formats) - {"csv", "colonnes"}:
+        raise ValueError("formats doit contenir 'csv' et/ou 'colonnes'.")
+    if taille_bloc <= 0:
+        raise ValueError("taille_bloc doit être strictement positive.")
+    os.makedirs(dossier, exist_ok=True)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    etat = _lire_etat(dossier, grille, taille_bloc, formats, reprendre)
+    nb_blocs = -(-grille.taille // taille_bloc)
+    premier = etat["blocs_termines"]
+    ecrivains = _Ecrivains(dossier, grille, formats, etat)
+
+    par_processus = {}
+    t0 = time.perf_counter()
+    designs = 0
+
+    def enregistrer(resultat):
+        nonlocal designs
+        debut, sortie, duree, pid = resultat
+        n = len(sortie["P"])
+        ecrivains.ecrire(sortie)
+        etat["octets_csv"] = ecrivains.synchroniser()
+        etat["blocs_termines"] = debut // taille_bloc + 1
+        etat["lignes"] += n
+        _ecrire_etat(dossier, etat)
+        stats = par_processus.setdefault(pid, [0, 0.0])
+        stats[0] += n
+        stats[1] += duree
+        designs += n
+        if rappel is not None:
+            rappel(etat["blocs_termines"], nb_blocs)
+
+    def bornes(k):
+        return k * taille_bloc, min((k + 1) * taille_bloc, grille.taille)
+
+    try:
+        if max_workers == 1:
+            for k in range(premier, nb_blocs):
+                enregistrer(_evaluer_bloc(grille, *bornes(k)))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                en_cours = deque()
+                k = premier
+                # Fenêtre bornée de blocs en vol : la mémoire reste constante
+                while k < nb_blocs or en_cours:
+                    while k < nb_blocs and len(en_cours) < 2 * max_workers:
+                        en_cours.append(pool.submit(_evaluer_bloc, grille, *bornes(k)))
+                        k += 1
+                    enregistrer(en_cours.popleft().result())
+    finally:
+        ecrivains.fermer()
+
+    duree = time.perf_counter() - t0
+    return {
+        "designs": designs,
+        "designs_total": etat["lignes"],
+        "blocs": nb_blocs,
+        "blocs_repris": premier,
+        "duree_s": duree,
+        "debit_designs_s": designs / duree if duree > 0 else 0.0,
+        "debit_par_processus": {
+            pid: (n / t if t > 0 else 0.0) for pid, (n, t) in par_processus.items()
+        },
+    }
+
+
+def lire_colonnes(dossier):
+    """
+    Ouvre les colonnes binaires d’un balayage en mémoire projetée (np.memmap).
+    Renvoie (colonnes, categories).
+    """
+    dossier_col = os.path.join(dossier, DOSSIER_COLONNES)
+    with open(os.path.join(dossier_col, "manifeste.json"), encoding="utf-8") as fh:
+        manifeste = json.load(fh)
+    colonnes = {}
+    for nom, dtype in manifeste["colonnes"].items():
+        chemin = os.path.join(dossier_col, f"{nom}.bin")
+        dt = np.dtype(dtype).newbyteorder("<")
+        if os.path.getsize(chemin) == 0:
+            colonnes[nom] = np.empty(0, dtype=dt)
+        else:
+            colonnes[nom] = np.memmap(chemin, dtype=dt, mode="r")
+    return colonnes, manifeste["categories"]
+
+
+def evaluer_en_parallele(colonnes, max_workers=None, taille_bloc=50_000, pool=None):
+    """
+    Évalue calcul_complet_batch sur des colonnes déjà en mémoire, découpées en blocs
+    répartis sur un pool de processus. Renvoie les colonnes de résultats concaténées
+    (mêmes clés que calcul_complet_batch, hors "autofill").
+    - pool : ProcessPoolExecutor existant à réutiliser (appels répétés, ex. optimiseur)
+    """
+    n = max(len(v) for v in colonnes.values() if np.ndim(v))
+    max_workers = max_workers or os.cpu_count() or 1
+    if (pool is None and max_workers == 1) or n <= taille_bloc:
+        return _evaluer_colonnes(colonnes)
+    blocs = [
+        {k: (v[i:i + taille_bloc] if np.ndim(v) else v) for k, v in colonnes.items()}
+        for i in range(0, n, taille_bloc)
+    ]
+    if pool is not None:
+        resultats = list(pool.map(_evaluer_colonnes, blocs))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool_local:
+            resultats = list(pool_local.map(_evaluer_colonnes, blocs))
+    return {k: np.concatenate([r[k] for r in resultats]) for k in resultats[0]}
+
+
+def _evaluer_colonnes(colonnes):
+    res = calcul_complet_batch(colonnes)
+    res.pop("autofill")
+    return res
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    grille = Grille(
+        P=Plage(50, 500, 10),
+        Th=[600, 650, 700, 800],
+        pm=Plage(5e5, 2e6, 8),
+        f=[20, 25, 30],
+        Nc=[1, 2, 4],
+        materiau=["Acier", "Aluminium", "Inox"],
+    )
+    print(grille)
+    rapport = balayer(grille, "balayage_exemple", taille_bloc=2000)
+    print("Rapport :", rapport)
@@ -2,6 +2,8 @@
 
 import math
 
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+
 MATERIAUX = {
     "Acier": {"rho": 7850},
     "Aluminium": {"rho": 2700},
@@ -9,11 +11,33 @@ MATERIAUX = {
     "Laiton": {"rho": 8500},
 }
 
-class BielleStirling:
+# Proportions de la bielle générée par bielle_depuis_stirling (rapportées à la course
+# ou au diamètre du piston)
+RAPPORT_LONGUEUR_COURSE = 1.8
+RAPPORT_LARGEUR_DIAMETRE = 0.4
+DIVISEUR_EPAISSEUR_CORPS = 3
+RAPPORT_TETE_DIAMETRE = 0.8
+RAPPORT_PIED_DIAMETRE = 0.45
+RAPPORT_AXE_TETE_DIAMETRE = 0.35
+RAPPORT_AXE_PIED_DIAMETRE = 0.30
+
+class BielleStirling(Piece):
     """
     Modélisation d’une bielle de moteur Stirling pour CAO.
     """
 
+    __slots__ = (
+        "longueur", "largeur", "epaisseur", "diametre_tete", "diametre_pied", "axe_tete_diam",
+        "axe_pied_diam", "matiere", "densite", "etat_surface", "rugosite",
+    )
+    ARGUMENTS = {
+        "longueur_m": "longueur", "largeur_corps_m": "largeur", "epaisseur_corps_m": "epaisseur",
+        "diametre_tete_m": "diametre_tete", "diametre_pied_m": "diametre_pied",
+        "axe_tete_diam_m": "axe_tete_diam", "axe_pied_diam_m": "axe_pied_diam",
+        "matiere": "matiere", "densite_kg_m3": "densite", "etat_surface": "etat_surface",
+        "rugosite_um": "rugosite",
+    }
+
     def __init__(
         self,
         longueur_m,
@@ -42,42 +66,43 @@ class BielleStirling:
         self.etat_surface = etat_surface
         self.rugosite = rugosite_um
 
-    @property
+    @propriete_cachee
     def section(self):
         return self.largeur * self.epaisseur
 
-    @property
+    @propriete_cachee
     def volume_corps(self):
         return self.section * self.longueur
 
-    @property
+    @propriete_cachee
     def volume_tete(self):
         return math.pi * (self.diametre_tete / 2) ** 2 * self.epaisseur
 
-    @property
+    @propriete_cachee
     def volume_pied(self):
         return math.pi * (self.diametre_pied / 2) ** 2 * self.epaisseur
 
-    @property
+    @propriete_cachee
     def volume_total(self):
         return self.volume_corps + self.volume_tete + self.volume_pied
 
-    @property
+    @propriete_cachee
     def masse(self):
         return self.volume_total * self.densite
 
-    @property
+    @propriete_cachee
     def surface_totale(self):
         surf_corps = 2 * (self.largeur + self.epaisseur) * self.longueur
         surf_tete = math.pi * self.diametre_tete * self.epaisseur
         surf_pied = math.pi * self.diametre_pied * self.epaisseur
         return surf_corps + surf_tete + surf_pied
 
-    @property
+    @propriete_cachee
     def moment_quadratique(self):
         # I = (b * h^3) / 12 pour rectangle (b = largeur, h = épaisseur)
         return (self.largeur * self.epaisseur ** 3) / 12
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Longueur (mm)": round(self.longueur * 1000, 3),
@@ -97,6 +122,7 @@ class BielleStirling:
             "Moment quadratique (mm4)": round(self.moment_quadratique * 1e12, 2),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"BielleStirling(L={self.longueur*1000:.2f} mm, "
@@ -116,15 +142,15 @@ def bielle_depuis_stirling(data: dict) -> BielleStirling:
     densite = MATERIAUX.get(matiere, MATERIAUX["Acier"])["rho"]
 
     # Longueur bielle typique pour moteur Stirling (ratio 1.6 à 2)
-    longueur_bielle = 1.8 * course if course else 0.05
-    largeur_corps = diametre_piston * 0.4 if diametre_piston else 0.012
-    epaisseur_corps = largeur_corps / 3
+    longueur_bielle = RAPPORT_LONGUEUR_COURSE * course if course else 0.05
+    largeur_corps = diametre_piston * RAPPORT_LARGEUR_DIAMETRE if diametre_piston else 0.012
+    epaisseur_corps = largeur_corps / DIVISEUR_EPAISSEUR_CORPS
 
     # Têtes et axes dimensionnés selon le piston
-    diametre_tete = diametre_piston * 0.8 if diametre_piston else 0.018
-    diametre_pied = diametre_piston * 0.45 if diametre_piston else 0.010
-    axe_tete = diametre_piston * 0.35 if diametre_piston else 0.008
-    axe_pied = diametre_piston * 0.30 if diametre_piston else 0.008
+    diametre_tete = diametre_piston * RAPPORT_TETE_DIAMETRE if diametre_piston else 0.018
+    diametre_pied = diametre_piston * RAPPORT_PIED_DIAMETRE if diametre_piston else 0.010
+    axe_tete = diametre_piston * RAPPORT_AXE_TETE_DIAMETRE if diametre_piston else 0.008
+    axe_pied = diametre_piston * RAPPORT_AXE_PIED_DIAMETRE if diametre_piston else 0.008
 
     return BielleStirling(
         longueur_m=longueur_bielle,
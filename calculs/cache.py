@@ -0,0 +1,237 @@
+# calculs/cache.py
+
+import copy
+import functools
+import inspect
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from calculs.piece import Piece
+from calculs.stirling import DEFAULTS, calcul_complet, resoudre_parametres
+from calculs.cylindre import CylindreStirling
+from calculs.piston import PistonStirling
+from calculs.bielle import BielleStirling, bielle_depuis_stirling
+
+TAILLE_MAX_DEFAUT = 512
+# Les flottants sont arrondis à ce nombre de chiffres significatifs dans les clés
+CHIFFRES_SIGNIFICATIFS = 12
+
+
+class CacheLRU:
+    """
+    Cache LRU borné, partagé par tout le processus et protégé par un verrou.
+    - taille_max : nombre maximal d’entrées (éviction de la moins récemment utilisée)
+    - ttl : durée de vie par défaut des entrées en secondes (None = illimitée), qu’une
+      écriture peut remplacer pour son entrée (cf. memoise(ttl=...))
+    - actif : False pour contourner entièrement le cache (tests)
+    Compteurs : hits, misses, evictions, expirations.
+    """
+
+    def __init__(self, taille_max=TAILLE_MAX_DEFAUT, ttl=None, actif=True):
+        if taille_max <= 0:
+            raise ValueError("taille_max doit être strictement positive.")
+        self.taille_max = taille_max
+        self.ttl = ttl
+        self.actif = actif
+        self._entrees = OrderedDict()
+        self._verrou = threading.RLock()
+        self.reinitialiser_stats()
+
+    def reinitialiser_stats(self):
+        with self._verrou:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def lire(self, cle):
+        """Renvoie (trouve, valeur) et met à jour les compteurs."""
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                valeur, expiration = entree
+                if expiration is None or time.monotonic() <= expiration:
+                    self._entrees.move_to_end(cle)
+                    self.hits += 1
+                    return True, valeur
+                del self._entrees[cle]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def ecrire(self, cle, valeur, ttl=None):
+        """Stocke `valeur` ; ttl (s) remplace la durée de vie par défaut du cache pour cette entrée."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._verrou:
+            self._entrees[cle] = (valeur, None if ttl is None else time.monotonic() + ttl)
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.taille_max:
+                self._entrees.popitem(last=False)
+                self.evictions += 1
+
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+
+    def stats(self):
+        with self._verrou:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "taille": len(self._entrees),
+                "taille_max": self.taille_max,
+                "taux_hits": self.hits / total if total else 0.0,
+                "actif": self.actif,
+            }
+
+    def __len__(self):
+        return len(self._entrees)
+
+    def __repr__(self):
+        s = self.stats()
+        return (f"CacheLRU({s['taille']}/{s['taille_max']} entrées, hits={s['hits']}, "
+                f"misses={s['misses']}, evictions={s['evictions']}, actif={s['actif']})")
+
+
+# Cache global du processus ; STERLING_CACHE=0 le désactive (tests, débogage),
+# STERLING_CACHE_TTL fixe la durée de vie des entrées en secondes
+CACHE = CacheLRU(ttl=float(os.environ["STERLING_CACHE_TTL"]) if os.environ.get("STERLING_CACHE_TTL") else None,
+                 actif=os.environ.get("STERLING_CACHE", "1") != "0")
+
+
+def normaliser(valeur, chiffres=CHIFFRES_SIGNIFICATIFS):
+    """
+    Forme canonique et hachable d’un argument :
+    flottants arrondis à `chiffres` chiffres significatifs, conteneurs convertis en tuples,
+    pièces réduites à leur type et aux arguments de leur constructeur (autres objets :
+    type et attributs).
+    """
+    if isinstance(valeur, np.generic):
+        valeur = valeur.item()
+    if valeur is None or isinstance(valeur, (bool, str, bytes)):
+        return valeur
+    if isinstance(valeur, (int, float)):
+        v = float(valeur)
+        if v == 0 or not math.isfinite(v):
+            return v
+        return round(v, chiffres - 1 - int(math.floor(math.log10(abs(v)))))
+    if isinstance(valeur, dict):
+        return tuple(sorted((str(k), normaliser(v, chiffres)) for k, v in valeur.items()))
+    if isinstance(valeur, (list, tuple)):
+        return tuple(normaliser(v, chiffres) for v in valeur)
+    if isinstance(valeur, np.ndarray):
+        return tuple(normaliser(v, chiffres) for v in valeur.tolist())
+    if isinstance(valeur, Piece):
+        return (type(valeur).__qualname__, normaliser(valeur.arguments(), chiffres))
+    if hasattr(valeur, "__dict__"):
+        return (type(valeur).__qualname__, normaliser(vars(valeur), chiffres))
+    return valeur
+
+
+def memoise(fonction=None, *, cache=None, copier=True, chiffres=CHIFFRES_SIGNIFICATIFS, ttl=None, resoudre=None):
+    """
+    Décorateur de mémoïsation sur le cache LRU global (ou `cache`).
+    La clé est formée du nom qualifié de la fonction et de ses arguments liés à la
+    signature, valeurs par défaut résolues, puis normalisés (cf. normaliser).
+    - resoudre : fonction dict d’arguments -> dict d’arguments canoniques pour la clé
+      (valeurs implicites rendues explicites, cf. calcul_complet_memo)
+    - ttl : durée de vie (s) des entrées de cette fonction, à défaut celle du cache
+    copier=True renvoie une copie profonde des résultats dict/list, que l’appelant
+    peut modifier sans polluer le cache ; les pièces sont partagées telles quelles.
+    La fonction d’origine reste accessible via `.sans_cache`.
+    """
+    if fonction is None:
+        return functools.partial(memoise, cache=cache, copier=copier, chiffres=chiffres, ttl=ttl, resoudre=resoudre)
+
+    signature = inspect.signature(fonction)
+    nom = f"{getattr(fonction, '__module__', '')}.{getattr(fonction, '__qualname__', repr(fonction))}"
+
+    def copie(valeur):
+        return copy.deepcopy(valeur) if copier and isinstance(valeur, (dict, list)) else valeur
+
+    @functools.wraps(fonction)
+    def enveloppe(*args, **kwargs):
+        c = cache if cache is not None else CACHE
+        if not c.actif:
+            return fonction(*args, **kwargs)
+        liaison = signature.bind(*args, **kwargs)
+        liaison.apply_defaults()
+        arguments = resoudre(dict(liaison.arguments)) if resoudre is not None else liaison.arguments
+        cle = (nom, normaliser(tuple(arguments.items()), chiffres))
+        trouve, valeur = c.lire(cle)
+        if trouve:
+            return copie(valeur)
+        valeur = fonction(*args, **kwargs)
+        c.ecrire(cle, copie(valeur), ttl)
+        return copie(valeur)
+
+    enveloppe.sans_cache = fonction
+    return enveloppe
+
+
+@contextmanager
+def cache_desactive(cache=None):
+    """Contexte dans lequel le cache est contourné (restauré en sortie)."""
+    c = cache if cache is not None else CACHE
+    precedent = c.actif
+    c.actif = False
+    try:
+        yield c
+    finally:
+        c.actif = precedent
+
+
+def activer_cache(actif=True, cache=None):
+    (cache if cache is not None else CACHE).actif = actif
+
+
+def statistiques(cache=None):
+    """Compteurs du cache global : hits, misses, evictions, expirations, taille."""
+    return (cache if cache is not None else CACHE).stats()
+
+
+def _arguments_stirling(arguments):
+    """Paramètres de DEFAULTS tels que calcul_complet les utilise : P=500 et P=500, Th=650 partagent une entrée."""
+    valeurs, _ = resoudre_parametres(**{nom: arguments[nom] for nom in DEFAULTS})
+    return {**arguments, **valeurs}
+
+_calcul_complet_cache = memoise(calcul_complet, resoudre=_arguments_stirling)
+_SIGNATURE_CALCUL = inspect.signature(calcul_complet)
+
+
+@functools.wraps(calcul_complet)
+def calcul_complet_memo(*args, **kwargs):
+    # L’entrée est partagée entre valeurs implicites et explicites : les drapeaux
+    # autofill sont ceux de l’appel courant, pas ceux de l’appel qui a rempli le cache.
+    resultat = _calcul_complet_cache(*args, **kwargs)
+    liaison = _SIGNATURE_CALCUL.bind(*args, **kwargs)
+    liaison.apply_defaults()
+    resultat["autofill"] = resoudre_parametres(**{nom: liaison.arguments[nom] for nom in DEFAULTS})[1]
+    return resultat
+
+calcul_complet_memo.sans_cache = calcul_complet
+
+# Points d’entrée mémoïsés utilisés par l’interface
+cylindre_memo = memoise(CylindreStirling)
+piston_memo = memoise(PistonStirling)
+piston_depuis_cylindre_memo = memoise(PistonStirling.depuis_cylindre)
+bielle_memo = memoise(BielleStirling)
+bielle_depuis_stirling_memo = memoise(bielle_depuis_stirling)
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    for _ in range(3):
+        calcul_complet_memo(P=120, gaz="Air")
+    calcul_complet_memo(P=120.0000000000001)
+    print(CACHE)
+    print(statistiques())
@@ -0,0 +1,243 @@
+# calculs/catalogue.py
+
+import contextlib
+import csv
+import functools
+import glob
+import hashlib
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+# Catalogue unique des éléments normalisés et des matériaux : une base SQLite en lecture
+# seule (calculs/data/catalogue.sqlite, non versionnée), indexée sur les dimensions de
+# recherche. Elle est construite à la première requête à partir des sources du dépôt
+# (tables des modules de calcul et fichiers CSV de calculs/data), puis reconstruite
+# seulement si l’une des sources a changé. L’import de ce module ne lit rien.
+#
+# Un catalogue fabricant complet s’ajoute en déposant dans calculs/data un CSV (séparateur
+# « ; », lignes de commentaire en « # ») dont les colonnes sont celles de la table et
+# dont le nom suit le motif de la table (par ex. roulements_fabricant.csv).
+
+DOSSIER_DONNEES = os.path.join(os.path.dirname(__file__), "data")
+FICHIER_BASE = os.path.join(DOSSIER_DONNEES, "catalogue.sqlite")
+VERSION_SCHEMA = 1
+
+# Table -> colonnes (nom, type SQL), clé primaire, index, motif des CSV de calculs/data.
+# SQLite ne distinguant pas la casse des noms de colonnes, le « D » extérieur des
+# roulements est stocké sous D_ext (COLONNES_SQL) et rendu sous son nom dans `lignes`.
+TABLES = {
+    "roulements": {
+        "colonnes": (("ref", "TEXT"), ("d", "REAL"), ("D", "REAL"), ("B", "REAL"), ("charge_C", "REAL"),
+                     ("charge_C0", "REAL"), ("masse", "REAL")),
+        "cle": "ref",
+        "index": (("d", "charge_C"), ("D_ext",)),
+        "csv": "roulements*.csv",
+    },
+    "joints": {
+        "colonnes": (("ref", "TEXT"), ("d_int", "REAL"), ("section", "REAL"), ("mat", "TEXT"), ("serie", "TEXT")),
+        "cle": None,
+        "index": (("mat", "d_int", "section"),),
+        "csv": "joints_toriques*.csv",
+    },
+    "filetages": {
+        "colonnes": (("designation", "TEXT"), ("d_nom", "REAL"), ("pas", "REAL"), ("d2", "REAL"), ("d3", "REAL"),
+                     ("section", "REAL"), ("d_perc", "REAL"), ("d_taraud", "REAL"), ("s", "REAL"), ("serie", "TEXT")),
+        "cle": "designation",
+        "index": (("section",), ("d_nom", "pas")),
+        "csv": "filetages*.csv",
+    },
+    "tolerances": {
+        "colonnes": (("code", "TEXT"), ("ecart_mm", "REAL")),
+        "cle": "code",
+        "index": (),
+        "csv": "tolerances*.csv",
+    },
+    "materiaux": {
+        "colonnes": (("nom", "TEXT"), ("densite", "REAL"), ("limite_rupture", "REAL"), ("Rm", "REAL"), ("Re", "REAL"),
+                     ("sigma_D", "REAL"), ("E", "REAL"), ("G", "REAL")),
+        "cle": "nom",
+        "index": (),
+        "csv": "materiaux*.csv",
+    },
+}
+
+COLONNES_SQL = {("roulements", "D"): "D_ext"}
+
+# Modules dont les tables alimentent le catalogue (leur modification déclenche une reconstruction)
+MODULES_SOURCES = ("support_roulement", "visserie", "stirling", "bielle", "fatigue", "vibrations")
+
+_verrou = threading.RLock()
+
+def _lignes_modules():
+    """Lignes de chaque table tirées des modules de calcul (import différé)."""
+    from calculs import bielle, fatigue, stirling, support_roulement, vibrations, visserie
+
+    materiaux = {}
+    for nom, mat in stirling.MATERIAUX.items():
+        materiaux.setdefault(nom, {})["densite"] = mat["rho"]
+        materiaux[nom]["limite_rupture"] = mat["limite_rupture"]
+    for nom, mat in bielle.MATERIAUX.items():
+        materiaux.setdefault(nom, {}).setdefault("densite", mat["rho"])
+    for nom, mat in support_roulement.MATERIAUX_SUPP.items():
+        materiaux.setdefault(nom, {}).setdefault("densite", mat["densite"])
+        materiaux[nom].setdefault("limite_rupture", mat["limite"])
+    for nom, mat in fatigue.MATERIAUX_FATIGUE.items():
+        materiaux.setdefault(nom, {}).update(mat)
+    for nom, mat in materiaux.items():
+        mat.update(vibrations.modules_elastiques(nom))
+    return {
+        "roulements": list(support_roulement.ROULEMENTS_ISO),
+        "joints": [],
+        "filetages": list(visserie.FILETAGES_ISO),
+        "tolerances": [{"code": code, "ecart_mm": ecart} for code, ecart in support_roulement.TOLERANCES_ISO.items()],
+        "materiaux": [{"nom": nom, **mat} for nom, mat in materiaux.items()],
+    }
+
+def _fichiers_csv(table):
+    return sorted(glob.glob(os.path.join(DOSSIER_DONNEES, TABLES[table]["csv"])))
+
+def _lire_csv(chemin):
+    with open(chemin, encoding="utf-8") as f:
+        return list(csv.DictReader((ligne for ligne in f if not ligne.startswith("#")), delimiter=";"))
+
+def signature_sources():
+    """Empreinte des sources (schéma, fichiers des modules et CSV : taille et date)."""
+    fichiers = [os.path.join(os.path.dirname(__file__), f"{nom}.py") for nom in MODULES_SOURCES]
+    fichiers.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "materiaux.py"))   # familles
+    fichiers += [chemin for table in TABLES for chemin in _fichiers_csv(table)]
+    empreinte = hashlib.sha1(f"schema {VERSION_SCHEMA} {sorted(TABLES)}".encode())
+    for chemin in fichiers:
+        etat = os.stat(chemin)
+        empreinte.update(f"{os.path.basename(chemin)} {etat.st_size} {etat.st_mtime_ns}".encode())
+    return empreinte.hexdigest()
+
+def _remplir(connexion, signature):
+    lignes = _lignes_modules()
+    for table, definition in TABLES.items():
+        noms = [nom for nom, _ in definition["colonnes"]]
+        noms_sql = [COLONNES_SQL.get((table, nom), nom) for nom in noms]
+        colonnes = ", ".join(f"{nom_sql} {type_sql}" + (" PRIMARY KEY" if nom == definition["cle"] else "")
+                             for nom, nom_sql, (_, type_sql) in zip(noms, noms_sql, definition["colonnes"]))
+        connexion.execute(f"CREATE TABLE {table} ({colonnes})")
+        for i, cles in enumerate(definition["index"]):
+            connexion.execute(f"CREATE INDEX idx_{table}_{i} ON {table} ({', '.join(cles)})")
+        sources = lignes[table] + [ligne for chemin in _fichiers_csv(table) for ligne in _lire_csv(chemin)]
+        types = dict(definition["colonnes"])
+        connexion.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(noms_sql)}) VALUES ({', '.join('?' * len(noms))})",
+            ([None if ligne.get(nom) in (None, "") else float(ligne[nom]) if types[nom] == "REAL" else ligne[nom]
+              for nom in noms] for ligne in sources))
+    connexion.execute("CREATE TABLE meta (cle TEXT PRIMARY KEY, valeur TEXT)")
+    connexion.execute("INSERT INTO meta VALUES ('signature', ?)", (signature,))
+    connexion.commit()
+
+def _signature_base(chemin):
+    try:
+        with contextlib.closing(sqlite3.connect(f"file:{chemin}?mode=ro", uri=True)) as c:
+            return c.execute("SELECT valeur FROM meta WHERE cle = 'signature'").fetchone()[0]
+    except (sqlite3.Error, TypeError):
+        return None
+
+def construire(chemin=FICHIER_BASE):
+    """(Re)construit la base dans `chemin` (écriture dans un fichier temporaire puis renommage)."""
+    signature = signature_sources()
+    temporaire = f"{chemin}.{os.getpid()}.tmp"
+    try:
+        base = sqlite3.connect(temporaire)
+        try:
+            _remplir(base, signature)
+        finally:
+            base.close()
+        os.replace(temporaire, chemin)
+    finally:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+    return chemin
+
+@functools.lru_cache(maxsize=None)
+def connexion():
+    """
+    Connexion en lecture seule à la base, construite ou reconstruite au premier appel si
+    elle manque ou si les sources ont changé. Si calculs/data n’est pas inscriptible, la
+    base est construite en mémoire.
+    """
+    with _verrou:
+        if _signature_base(FICHIER_BASE) != signature_sources():
+            try:
+                construire(FICHIER_BASE)
+            except OSError:
+                memoire = sqlite3.connect(":memory:", check_same_thread=False)
+                _remplir(memoire, signature_sources())
+                return memoire
+        return sqlite3.connect(f"file:{FICHIER_BASE}?mode=ro", uri=True, check_same_thread=False)
+
+def recharger():
+    """Oublie la connexion et les colonnes en cache (après ajout d’un CSV, par exemple)."""
+    with _verrou:
+        connexion.cache_clear()
+        colonnes.cache_clear()
+        lignes.cache_clear()
+
+def requete(sql, parametres=()):
+    """Lignes (dicts) d’une requête SQL sur le catalogue."""
+    with _verrou:
+        curseur = connexion().execute(sql, parametres)
+        noms = [c[0] for c in curseur.description]
+        return [dict(zip(noms, ligne)) for ligne in curseur.fetchall()]
+
+def premiere(sql, parametres=()):
+    """Première ligne d’une requête (dict), None si aucune."""
+    with _verrou:
+        curseur = connexion().execute(sql, parametres)
+        ligne = curseur.fetchone()
+        return None if ligne is None else dict(zip([c[0] for c in curseur.description], ligne))
+
+@functools.lru_cache(maxsize=None)
+def lignes(table):
+    """Toutes les lignes d’une table (tuple de dicts, ordre d’insertion), en cache."""
+    if table not in TABLES:
+        raise ValueError(f"Table inconnue : {table} (attendu : {', '.join(TABLES)})")
+    noms = ", ".join(f"{COLONNES_SQL.get((table, nom), nom)} AS \"{nom}\"" for nom, _ in TABLES[table]["colonnes"])
+    return tuple(requete(f"SELECT {noms} FROM {table} ORDER BY rowid"))
+
+@functools.lru_cache(maxsize=None)
+def colonnes(table):
+    """Colonnes NumPy d’une table (même ordre que `lignes`), pour les calculs vectorisés."""
+    definition = TABLES[table] if table in TABLES else None
+    if definition is None:
+        raise ValueError(f"Table inconnue : {table} (attendu : {', '.join(TABLES)})")
+    contenu = lignes(table)
+    return {nom: np.array([ligne[nom] for ligne in contenu], dtype=float if type_sql == "REAL" else str)
+            for nom, type_sql in definition["colonnes"]}
+
+def roulement(ref):
+    """Roulement par référence (« 6201 »), None si absent."""
+    return premiere('SELECT ref, d, D_ext AS "D", B, charge_C, charge_C0, masse FROM roulements WHERE ref = ?', (str(ref),))
+
+def filetage(designation):
+    """Filetage ISO par désignation (« M6 », « M10x1.25 »), None si absent."""
+    return premiere("SELECT * FROM filetages WHERE designation = ? COLLATE NOCASE", (designation,))
+
+def materiau(nom):
+    """Propriétés d’un matériau (densité, Rm, Re, E...), None si absent."""
+    return premiere("SELECT * FROM materiaux WHERE nom = ?", (nom,))
+
+def tolerance(code):
+    """Écart de tolérance de logement (mm), None si absent."""
+    ligne = premiere("SELECT ecart_mm FROM tolerances WHERE code = ?", (code,))
+    return None if ligne is None else ligne["ecart_mm"]
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    print(roulement("6201"), f"(première requête {1000 * (time.perf_counter() - t0):.1f} ms)")
+    t0 = time.perf_counter()
+    for d in np.linspace(5, 200, 10_000):
+        premiere("SELECT ref FROM joints WHERE mat = ? AND d_int >= ? ORDER BY d_int LIMIT 1", ("NBR", float(d)))
+    print(f"Recherche indexée d’un joint : {100 * (time.perf_counter() - t0):.1f} µs")
+    print(materiau("Aluminium"), filetage("m8"), tolerance("H7"))
@@ -0,0 +1,135 @@
+# calculs/cinematique.py
+
+import math
+
+import numpy as np
+
+# Système bielle-manivelle, repère lié au carter : origine sur l’axe du vilebrequin, x le
+# long de l’axe du cylindre orienté vers la culasse (point mort haut à θ = 0), y
+# perpendiculaire, θ angle du vilebrequin depuis le PMH dans le sens de rotation.
+
+NB_ANGLES_DEFAUT = 3600
+# Répartition de la masse de bielle en deux masses ponctuelles : fraction portée par le
+# pied (mouvement alternatif), le reste par la tête (mouvement rotatif)
+FRACTION_BIELLE_ALTERNATIVE = 1 / 3
+
+def angles(nb_angles=NB_ANGLES_DEFAUT):
+    """Angles du vilebrequin (rad) régulièrement répartis sur un tour, PMH compris."""
+    return np.linspace(0.0, 2 * math.pi, int(nb_angles), endpoint=False)
+
+def _colonne(x, dtype):
+    """Paramètre de design -> colonne (n, 1) (ou scalaire 0-D) pour la diffusion sur les angles."""
+    x = np.asarray(x, dtype=dtype)
+    if x.ndim > 1:
+        raise ValueError("Les paramètres de design doivent être des scalaires ou des tableaux 1-D.")
+    return x[:, None] if x.ndim == 1 else x
+
+def cinematique(rayon_maneton, longueur_bielle, f, theta=None, nb_angles=NB_ANGLES_DEFAUT, dtype=np.float64):
+    """
+    Cinématique exacte du système bielle-manivelle.
+    - rayon_maneton r (m), longueur_bielle L (m, entraxe), f (Hz) : scalaires ou tableaux 1-D
+      de n designs
+    - theta : angles du vilebrequin (rad, 1-D) ; par défaut `angles(nb_angles)`
+    - dtype : np.float32 divise par deux la mémoire des très grands lots
+    Renvoie des tableaux (n, nb_angles) (ou (nb_angles,) pour un design scalaire) :
+    position de l’axe de piston s = r cos θ + L cos β, déplacement depuis le PMH, vitesse,
+    accélération (selon x), angle de bielle β (sin β = λ sin θ, λ = r / L) et sa vitesse.
+    """
+    theta = angles(nb_angles) if theta is None else np.asarray(theta, dtype=float)
+    r, L, f = (_colonne(x, dtype) for x in (rayon_maneton, longueur_bielle, f))
+    if np.any(r <= 0) or np.any(L <= r):
+        raise ValueError("Il faut 0 < rayon de manivelle < longueur de bielle.")
+    if np.any(f <= 0):
+        raise ValueError("La fréquence de rotation doit être strictement positive.")
+    lam = r / L
+    omega = 2 * math.pi * f
+    s, c = np.sin(theta).astype(dtype), np.cos(theta).astype(dtype)
+    s2, c2 = np.sin(2 * theta).astype(dtype), np.cos(2 * theta).astype(dtype)
+
+    sin_beta = lam * s
+    A2 = 1 - sin_beta ** 2          # cos² β
+    A = np.sqrt(A2)                 # cos β
+    position = r * c + L * A
+    vitesse = -r * omega * (s + lam * s2 / (2 * A))
+    acceleration = -r * omega ** 2 * (c + lam * (c2 * A2 + lam ** 2 * (s * c) ** 2) / (A2 * A))
+    return {
+        "Angle_vilebrequin_rad": theta,
+        "Position_m": position,
+        "Deplacement_PMH_m": (r + L) - position,
+        "Vitesse_m_s": vitesse,
+        "Acceleration_m_s2": acceleration,
+        "Angle_bielle_rad": np.arcsin(sin_beta),
+        "Vitesse_angulaire_bielle_rad_s": omega * lam * c / A,
+        "Lambda": lam[..., 0] if lam.ndim else lam,
+    }
+
+def forces_inertie(rayon_maneton, longueur_bielle, f, masse_piston, masse_bielle, masse_rotative_supp=0.0,
+                   fraction_bielle=FRACTION_BIELLE_ALTERNATIVE, theta=None, nb_angles=NB_ANGLES_DEFAUT,
+                   dtype=np.float64):
+    """
+    Forces d’inertie d’un embiellage (modèle à deux masses ponctuelles) :
+    - masse alternative = piston (axe compris) + fraction_bielle x bielle
+    - masse rotative = (1 - fraction_bielle) x bielle + masse_rotative_supp (maneton...)
+    Forces exercées sur le carter (N), tableaux (n, nb_angles) :
+    - Force_alternative_N = -m_alt · ẍ selon x, et ses harmoniques d’ordre 1 et 2
+      (m_alt r ω² cos θ, m_alt r ω² λ cos 2θ)
+    - Force_rotative_x_N / _y_N : force centrifuge m_rot r ω² (cos θ, sin θ)
+    - Effort_bielle_N, Effort_lateral_N : réactions de la force alternative dans la bielle
+      et sur la paroi du cylindre (F / cos β, F tan β)
+    Les entrées sont des scalaires ou des tableaux 1-D de designs (cf. cinematique).
+    """
+    cin = cinematique(rayon_maneton, longueur_bielle, f, theta=theta, nb_angles=nb_angles, dtype=dtype)
+    theta = cin["Angle_vilebrequin_rad"]
+    r, f, m_p, m_b, m_supp = (_colonne(x, dtype) for x in (rayon_maneton, f, masse_piston, masse_bielle,
+                                                           masse_rotative_supp))
+    m_alt = m_p + fraction_bielle * m_b
+    m_rot = (1 - fraction_bielle) * m_b + m_supp
+    omega = 2 * math.pi * f
+    lam = np.asarray(cin["Lambda"], dtype=dtype)
+    lam = lam[:, None] if lam.ndim == 1 else lam
+    c, c2 = np.cos(theta).astype(dtype), np.cos(2 * theta).astype(dtype)
+
+    f_alt = -m_alt * cin["Acceleration_m_s2"]
+    centrifuge = m_rot * r * omega ** 2
+    beta = cin["Angle_bielle_rad"]
+    resultat = dict(cin)
+    resultat.update({
+        "Masse_alternative_kg": m_alt[..., 0] if m_alt.ndim else m_alt,
+        "Masse_rotative_kg": m_rot[..., 0] if m_rot.ndim else m_rot,
+        "Force_alternative_N": f_alt,
+        "Force_alternative_primaire_N": m_alt * r * omega ** 2 * c,
+        "Force_alternative_secondaire_N": m_alt * r * omega ** 2 * lam * c2,
+        "Force_rotative_x_N": centrifuge * c,
+        "Force_rotative_y_N": centrifuge * np.sin(theta).astype(dtype),
+        "Effort_bielle_N": f_alt / np.cos(beta),
+        "Effort_lateral_N": f_alt * np.tan(beta),
+        "Force_alternative_max_N": np.max(np.abs(f_alt), axis=-1),
+        "Vitesse_max_m_s": np.max(np.abs(cin["Vitesse_m_s"]), axis=-1),
+        "Acceleration_max_m_s2": np.max(np.abs(cin["Acceleration_m_s2"]), axis=-1),
+    })
+    return resultat
+
+def depuis_pieces(villebrequin, bielle, piston, f, **options):
+    """
+    forces_inertie à partir des pièces : rayon_maneton du vilebrequin, longueur et masse
+    de la bielle, masse du piston. Accepte les objets scalaires comme les collections
+    de calculs.tableaux (VillebrequinArray, BielleArray, PistonArray).
+    """
+    return forces_inertie(villebrequin.rayon_maneton, bielle.longueur, f, piston.masse, bielle.masse, **options)
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.assemblage import AssemblageMoteur
+    from calculs.stirling import calcul_complet
+
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    res = depuis_pieces(moteur.villebrequin, moteur.bielle, moteur.piston, f=25)
+    print(f"λ = {res['Lambda']:.3f}, vitesse maxi {res['Vitesse_max_m_s']:.2f} m/s, "
+          f"accélération maxi {res['Acceleration_max_m_s2']:.0f} m/s², "
+          f"force alternative maxi {res['Force_alternative_max_N']:.1f} N")
+    n = 1000
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    lot = forces_inertie(rng.uniform(0.01, 0.03, n), 0.1, rng.uniform(10, 50, n), 0.2, 0.1)
+    print(f"{n} designs x {NB_ANGLES_DEFAUT} angles en {time.perf_counter() - t0:.2f} s")
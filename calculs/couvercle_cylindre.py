@@ -1,7 +1,11 @@
 # calculs/couvercle_cylindre.py
 import math
 
-class CouvercleCylindreStirling:
+from calculs.percage import ligaments, orifices_couvercle, positions_arrondies
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+from calculs.visserie import DIAM_PERCAGE_TARAUD_ISO
+
+class CouvercleCylindreStirling(Piece):
     """
     Modélisation d’un couvercle de cylindre Stirling :
     - Entrées d’air, brûleur
@@ -9,17 +13,25 @@ class CouvercleCylindreStirling:
     - Toutes options géométriques et masses
     """
 
-    # Tableau ISO des diamètres de perçage pour taraudage (pas gros standard, mm)
-    DIAM_PERCAGE_TARAUD_ISO = {
-        "M4": 3.3,
-        "M5": 4.2,
-        "M6": 5.0,
-        "M8": 6.8,
-        "M10": 8.5,
-        "M12": 10.2,
-        "M16": 14.0,
+    __slots__ = (
+        "diametre", "epaisseur", "matiere", "densite", "rugosite", "etat_surface",
+        "type_couvercle", "diam_entrée_air", "nb_entree_air", "diam_entrée_bruleur",
+        "nb_entree_bruleur", "distance_bruleur_centre", "nb_vis", "dim_vis_iso",
+        "diam_percage_vis", "diam_taraudage_nominal", "entraxe_vis", "entraxe_vis_pct",
+    )
+    ARGUMENTS = {
+        "diametre_m": "diametre", "epaisseur_m": "epaisseur", "matiere": "matiere",
+        "densite_kg_m3": "densite", "rugosite_um": "rugosite", "etat_surface": "etat_surface",
+        "type_couvercle": "type_couvercle", "diam_entrée_air_m": "diam_entrée_air",
+        "nb_entree_air": "nb_entree_air", "diam_entrée_bruleur_m": "diam_entrée_bruleur",
+        "nb_entree_bruleur": "nb_entree_bruleur",
+        "distance_bruleur_centre_m": "distance_bruleur_centre", "nb_vis": "nb_vis",
+        "dim_vis_iso": "dim_vis_iso", "entraxe_vis_pct": "entraxe_vis_pct",
     }
 
+    # Diamètres de perçage pour taraudage (pas gros standard, mm), table commune de calculs.visserie
+    DIAM_PERCAGE_TARAUD_ISO = DIAM_PERCAGE_TARAUD_ISO
+
     def __init__(
         self,
         diametre_m,                   # Diamètre du cylindre/couvercle (m)
@@ -70,15 +82,15 @@ class CouvercleCylindreStirling:
         self.entraxe_vis = (self.diametre / 2) * entraxe_vis_pct
         self.entraxe_vis_pct = entraxe_vis_pct
 
-    @property
+    @propriete_cachee
     def rayon(self):
         return self.diametre / 2
 
-    @property
+    @propriete_cachee
     def surface_totale(self):
         return math.pi * (self.rayon ** 2)
 
-    @property
+    @propriete_cachee
     def volume(self):
         if self.type_couvercle == "plat":
             return self.surface_totale * self.epaisseur
@@ -90,41 +102,44 @@ class CouvercleCylindreStirling:
         else:
             raise ValueError("Type de couvercle inconnu")
 
-    @property
+    @propriete_cachee
     def volume_percages(self):
         v_entree_air = self.nb_entree_air * math.pi * (self.diam_entrée_air / 2) ** 2 * self.epaisseur
         v_entree_bruleur = self.nb_entree_bruleur * math.pi * (self.diam_entrée_bruleur / 2) ** 2 * self.epaisseur
         v_percage_vis = self.nb_vis * math.pi * (self.diam_percage_vis / 2) ** 2 * self.epaisseur
         return v_entree_air + v_entree_bruleur + v_percage_vis
 
-    @property
+    @propriete_cachee
     def volume_net(self):
         v = self.volume - self.volume_percages
         return max(v, 0)
 
-    @property
+    @propriete_cachee
     def masse(self):
         return self.volume_net * self.densite
 
-    @property
+    @propriete_cachee
     def profondeur_taraudage(self):
         """
         Profondeur de taraudage recommandée : 1x à 1.5x diamètre nominal pour l'acier (min : 1x diam)
         """
         return round(self.diam_taraudage_nominal * 1000, 2)  # mm
 
-    @property
+    @propriete_cachee
     def perçage_vis(self):
         """Renvoie (x, y) des centres de perçages sur le cercle d’entraxe (mm)"""
-        result = []
-        r = self.entraxe_vis * 1000  # mm
-        for i in range(self.nb_vis):
-            a = 2 * math.pi * i / self.nb_vis
-            x = r * math.cos(a)
-            y = r * math.sin(a)
-            result.append((round(x, 2), round(y, 2)))
-        return result
+        return positions_arrondies(self.nb_vis, self.entraxe_vis * 1000)
+
+    @propriete_cachee
+    def verification_percages(self):
+        """
+        Ligaments (mm) des perçages de vis entre eux, avec le bord et avec les entrées d’air
+        et de brûleur (calculs.percage) ; l’alésage du cylindre est vérifié à l’assemblage.
+        """
+        return ligaments(self.nb_vis, self.entraxe_vis * 1000, self.diam_percage_vis * 1000,
+                         r_ext_mm=self.rayon * 1000, orifices=orifices_couvercle(self))
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Diamètre (mm)": round(self.diametre * 1000, 3),
@@ -145,11 +160,13 @@ class CouvercleCylindreStirling:
             "Profondeur taraudage min. (mm)": self.profondeur_taraudage,
             "Rayon entraxe vis (mm)": round(self.entraxe_vis * 1000, 2),
             "Positions vis (mm)": self.perçage_vis,
+            "Ligament mini perçages (mm)": round(float(self.verification_percages["Ligament_mini_mm"]), 2),
             "Masse (kg)": round(self.masse, 5),
             "Volume net (cm3)": round(self.volume_net * 1e6, 3),
             "Surface (cm2)": round(self.surface_totale * 1e4, 3),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"CouvercleCylindreStirling(D={self.diametre*1000:.2f} mm, e={self.epaisseur*1000:.2f} mm, "
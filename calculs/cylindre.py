@@ -1,23 +1,33 @@
 # calculs/cylindre.py
 import math
 
-class CylindreStirling:
+from calculs.percage import ligaments, positions_arrondies
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+from calculs.visserie import DIAM_PERCAGE_TARAUD_ISO
+from materiaux import propriete as propriete_materiau
+
+class CylindreStirling(Piece):
     """
     Modélisation d’un cylindre de moteur Stirling pour CAO :
     - Zones chaude/froide paramétrables, géométrie, matière, masse, état de surface, visserie, RDM.
     """
 
-    # Tableau ISO des diamètres de perçage pour taraudage (mm)
-    DIAM_PERCAGE_TARAUD_ISO = {
-        "M4": 3.3,
-        "M5": 4.2,
-        "M6": 5.0,
-        "M8": 6.8,
-        "M10": 8.5,
-        "M12": 10.2,
-        "M16": 14.0,
+    __slots__ = (
+        "diametre", "course", "epaisseur", "matiere", "densite", "rugosite", "etat_surface", "Tc",
+        "Th", "nb_vis", "dim_vis_iso", "diam_percage_vis", "diam_taraudage_nominal", "entraxe_vis",
+        "entraxe_vis_pct", "limite_rupture_MPa",
+    )
+    ARGUMENTS = {
+        "diametre_m": "diametre", "course_m": "course", "epaisseur_m": "epaisseur",
+        "matiere": "matiere", "densite_kg_m3": "densite", "rugosite_um": "rugosite",
+        "etat_surface": "etat_surface", "Tc": "Tc", "Th": "Th", "nb_vis": "nb_vis",
+        "dim_vis_iso": "dim_vis_iso", "entraxe_vis_pct": "entraxe_vis_pct",
+        "limite_rupture_MPa": "limite_rupture_MPa",
     }
 
+    # Diamètres de perçage pour taraudage (pas gros standard, mm), table commune de calculs.visserie
+    DIAM_PERCAGE_TARAUD_ISO = DIAM_PERCAGE_TARAUD_ISO
+
     def __init__(
         self,
         diametre_m,
@@ -86,86 +96,124 @@ class CylindreStirling:
             limite_rupture_MPa = 400
         )
 
-    @property
+    @classmethod
+    def depuis_calcul_complet(cls, data, epaisseur_m=0.003, rugosite_um=0.8, etat_surface="Usinage fin",
+                              nb_vis=6, dim_vis_iso="M6", entraxe_vis_pct=0.85):
+        """
+        Cylindre construit à partir du dict renvoyé par `calcul_complet` (unités SI) :
+        alésage, course, températures et matériau (densité et limite de rupture de
+        stirling.MATERIAUX). L’épaisseur est portée au diamètre de perçage si nécessaire.
+        """
+        from calculs.stirling import MATERIAUX
+        mat = MATERIAUX.get(data.get("Materiau", "Acier"), MATERIAUX["Acier"])
+        epaisseur_min = cls.DIAM_PERCAGE_TARAUD_ISO.get(dim_vis_iso, 5.0) / 1000.0
+        return cls(
+            diametre_m=data["Diametre_interne_m"],
+            course_m=data["Course_m"],
+            epaisseur_m=max(epaisseur_m, epaisseur_min),
+            matiere=data.get("Materiau", "Acier"),
+            densite_kg_m3=mat["rho"],
+            rugosite_um=rugosite_um,
+            etat_surface=etat_surface,
+            Tc=data["Temp_froid_C"] + 273.15,
+            Th=data["Temp_chaud_C"] + 273.15,
+            nb_vis=nb_vis,
+            dim_vis_iso=dim_vis_iso,
+            entraxe_vis_pct=entraxe_vis_pct,
+            limite_rupture_MPa=mat["limite_rupture"] / 1e6,
+        )
+
+    @propriete_cachee
     def rayon(self):
         return self.diametre / 2
 
-    @property
+    @propriete_cachee
     def rayon_ext(self):
         return self.rayon + self.epaisseur
 
-    @property
+    @propriete_cachee
     def diametre_ext(self):
         return self.diametre + 2 * self.epaisseur
 
-    @property
+    @propriete_cachee
     def volume_interne(self):
         return math.pi * (self.rayon ** 2) * self.course
 
-    @property
+    @propriete_cachee
     def volume_metal(self):
         vi = self.volume_interne
         ve = math.pi * (self.rayon_ext ** 2) * self.course
         fond = math.pi * (self.rayon_ext ** 2) * self.epaisseur
         return max(ve - vi, 0) + fond
 
-    @property
+    @propriete_cachee
     def masse(self):
         return self.volume_metal * self.densite
 
-    @property
+    @propriete_cachee
     def surface_interne(self):
         return math.pi * self.diametre * self.course
 
-    @property
+    @propriete_cachee
     def surface_fond(self):
         return math.pi * (self.rayon ** 2)
 
-    @property
+    @propriete_cachee
     def surface_externe(self):
         return math.pi * self.diametre_ext * self.course
 
-    @property
+    @propriete_cachee
     def surface_totale_interne(self):
         return self.surface_interne + 2 * self.surface_fond
 
-    @property
+    @propriete_cachee
     def surface_totale_externe(self):
         sf = math.pi * (self.rayon_ext ** 2)
         return self.surface_externe + 2 * sf
 
-    @property
+    @propriete_cachee
     def percage_vis(self):
-        result = []
-        r = self.entraxe_vis * 1000
-        for i in range(self.nb_vis):
-            a = 2 * math.pi * i / self.nb_vis
-            x = r * math.cos(a)
-            y = r * math.sin(a)
-            result.append((round(x, 2), round(y, 2)))
-        return result
-
-    @property
+        return positions_arrondies(self.nb_vis, self.entraxe_vis * 1000)
+
+    @propriete_cachee
+    def verification_percages(self):
+        """Ligaments (mm) des taraudages entre eux, avec l’alésage et avec le bord extérieur (calculs.percage)."""
+        return ligaments(self.nb_vis, self.entraxe_vis * 1000, self.diam_percage_vis * 1000,
+                         r_int_mm=self.rayon * 1000, r_ext_mm=self.rayon_ext * 1000)
+
+    @propriete_cachee
     def section_anneau_autour_taraudage(self):
         r_ext = self.rayon_ext * 1000
         r_trou = self.diam_percage_vis * 1000 / 2
         section = math.pi * (r_ext ** 2 - r_trou ** 2) - math.pi * (self.rayon * 1000) ** 2
         return max(section, 0)
 
-    @property
+    @propriete_cachee
     def effort_max_admissible_par_taraudage(self):
         S = self.section_anneau_autour_taraudage / 1e6
         return S * self.limite_rupture_MPa * 1e6
 
-    @property
+    @propriete_cachee
     def effort_total_visserie(self):
         return self.nb_vis * self.effort_max_admissible_par_taraudage
 
-    @property
+    @propriete_cachee
     def pression_maxi_admissible(self):
         S_fond = self.surface_fond
         return self.effort_total_visserie / S_fond if S_fond else 0
 
+    @propriete_cachee
+    def limite_rupture_chaude_MPa(self):
+        """Limite de rupture à Th, réduite selon la famille de la matière (module materiaux)."""
+        return propriete_materiau(self.matiere, "Rm", self.Th, self.limite_rupture_MPa)
+
+    @propriete_cachee
+    def pression_maxi_admissible_chaude(self):
+        """Pression maxi admissible avec la limite de rupture à Th (zone chaude)."""
+        if not self.limite_rupture_MPa:
+            return 0
+        return self.pression_maxi_admissible * self.limite_rupture_chaude_MPa / self.limite_rupture_MPa
+
     def zone_chaude(self, frac):
         if not (0 < frac <= 1):
             raise ValueError("Le paramètre frac doit être compris entre 0 exclu et 1 inclus.")
@@ -180,6 +228,7 @@ class CylindreStirling:
         sz = math.pi * self.diametre * lz
         return lz, sz
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Diamètre interne (mm)": round(self.diametre * 1000, 3),
@@ -200,12 +249,15 @@ class CylindreStirling:
             "Diam. perçage taraudage (mm)": round(self.diam_percage_vis * 1000, 2),
             "Rayon entraxe vis (mm)": round(self.entraxe_vis * 1000, 2),
             "Positions vis (mm)": self.percage_vis,
+            "Ligament mini perçages (mm)": round(float(self.verification_percages["Ligament_mini_mm"]), 2),
             "Section paroi autour vis (mm2)": round(self.section_anneau_autour_taraudage, 2),
             "Effort max/vis (N)": int(self.effort_max_admissible_par_taraudage),
             "Effort total visserie (N)": int(self.effort_total_visserie),
             "Pression max admissible (bar)": round(self.pression_maxi_admissible / 1e5, 2),
+            "Pression max admissible à Th (bar)": round(self.pression_maxi_admissible_chaude / 1e5, 2),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"CylindreStirling(D={self.diametre*1000:.2f} mm, C={self.course*1000:.2f} mm, "
@@ -0,0 +1,124 @@
+# calculs/dimensionnement.py
+
+import numpy as np
+
+from calculs.stirling import DEFAULTS, MATERIAUX, calcul_complet, calcul_complet_batch
+
+# Bornes de recherche de la pression moyenne (Pa)
+PM_BORNE_INF = 1e5
+PM_BORNE_SUP = 20e6
+
+# Rapport course maxi / alésage maxi quand seule la contrainte d’alésage est donnée
+RAPPORT_COURSE_MAX = 2.0
+# Plage des courses candidates : [C_max * RAPPORT_COURSE_MIN, C_max]
+RAPPORT_COURSE_MIN = 0.1
+
+
+def bissection(fonction, a, b, tol=1e-9, max_iter=200, geometrique=False):
+    """
+    Recherche de racine par dichotomie, vectorisée sur des tableaux de bornes.
+    - fonction(x) doit renvoyer un tableau de même forme que x, de signes opposés en a et b
+    - geometrique=True : coupe au milieu géométrique (bornes strictement positives)
+    Les lignes dont l’intervalle ne change pas de signe renvoient NaN.
+    Renvoie la borne b finale (côté du signe de fonction(b)), à tol relatif près.
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    a, b = np.broadcast_arrays(a, b)
+    a, b = a.copy(), b.copy()
+    fa = fonction(a)
+    fb = fonction(b)
+    encadre = np.sign(fa) != np.sign(fb)
+    for _ in range(max_iter):
+        if np.all(np.abs(b - a) <= tol * np.maximum(np.abs(b), 1e-300)):
+            break
+        m = np.sqrt(a * b) if geometrique else 0.5 * (a + b)
+        fm = fonction(m)
+        meme_signe_a = np.sign(fm) == np.sign(fa)
+        a = np.where(meme_signe_a, m, a)
+        fa = np.where(meme_signe_a, fm, fa)
+        b = np.where(meme_signe_a, b, m)
+    return np.where(encadre, b, np.nan)
+
+
+def dimensionner(P, D_max=None, v_piston_max=None, pm_max=None, materiaux=None,
+                 Th=None, Tc=None, f=None, Nc=None, eta=None, gaz="Air", nb_courses=64, tol=1e-6):
+    """
+    Dimensionnement inverse : puissance cible + contraintes -> design de masse de cylindre minimale.
+    - D_max : alésage maximal (m)
+    - v_piston_max : vitesse moyenne de piston maximale (m/s), cf. vitesse_piston
+    - pm_max : pression moyenne maximale (Pa)
+    - materiaux : matériaux autorisés (clés de MATERIAUX, tous par défaut)
+    Les autres paramètres suivent calcul_complet (défauts DEFAULTS).
+    Pour chaque couple (matériau, course) candidat, la pression minimale respectant D_max
+    est trouvée par dichotomie vectorisée, puis tous les candidats sont évalués en un lot.
+    Renvoie le dict de calcul_complet du meilleur design, complété par le bilan des contraintes.
+    """
+    if P is None or float(P) <= 0:
+        raise ValueError("La puissance P doit être renseignée et strictement positive.")
+    materiaux = list(materiaux) if materiaux else list(MATERIAUX)
+    inconnus = [m for m in materiaux if m not in MATERIAUX]
+    if inconnus:
+        raise ValueError(f"Matériaux inconnus : {inconnus}")
+    f_eff = float(f) if f else DEFAULTS["f"]
+    pm_sup = float(pm_max) if pm_max else PM_BORNE_SUP
+    if pm_sup < PM_BORNE_INF:
+        raise ValueError(f"pm_max doit être supérieure à {PM_BORNE_INF:.0f} Pa.")
+
+    if v_piston_max:
+        C_max = v_piston_max / (2 * f_eff)
+    elif D_max:
+        C_max = RAPPORT_COURSE_MAX * D_max
+    else:
+        raise ValueError("Au moins une contrainte géométrique (D_max ou v_piston_max) est requise.")
+
+    courses = np.geomspace(C_max * RAPPORT_COURSE_MIN, C_max, nb_courses)
+    mat = np.repeat(np.array(materiaux, dtype=object), len(courses))
+    C = np.tile(courses, len(materiaux))
+    communs = dict(Th=Th, Tc=Tc, f=f, Nc=Nc, eta=eta, gaz=gaz)
+
+    def evaluer(pm):
+        return calcul_complet_batch(P=float(P), pm=pm, C=C, materiau=mat, **communs)
+
+    if D_max:
+        # Alésage décroissant avec la pression : plus petite pression telle que D <= D_max
+        def ecart(pm):
+            return evaluer(pm)["Diametre_interne_m"] - D_max
+
+        bas = np.full(len(C), PM_BORNE_INF)
+        pm = bissection(ecart, bas, np.full(len(C), pm_sup), tol=tol, geometrique=True)
+        deja_ok = ecart(bas) <= 0
+        pm = np.where(deja_ok, PM_BORNE_INF, pm)
+    else:
+        pm = np.full(len(C), PM_BORNE_INF)
+
+    faisable = ~np.isnan(pm)
+    pm = np.where(faisable, pm, pm_sup)
+    res = evaluer(pm)
+    if D_max:
+        faisable &= res["Diametre_interne_m"] <= D_max * (1 + 10 * tol)
+    if v_piston_max:
+        faisable &= res["Vitesse_piston_m_s"] <= v_piston_max * (1 + 1e-12)
+    faisable &= res["Masse_cylindre_kg"] > 0
+    if not np.any(faisable):
+        raise ValueError("Aucun design ne respecte les contraintes (alésage, vitesse piston, pression).")
+
+    masse = np.where(faisable, res["Masse_cylindre_kg"], np.inf)
+    i = int(np.argmin(masse))
+    meilleur = calcul_complet(P, pm=float(pm[i]), C=float(C[i]), materiau=mat[i], **communs)
+    meilleur["Contraintes"] = {
+        "D_max_m": D_max,
+        "v_piston_max_m_s": v_piston_max,
+        "pm_max_Pa": pm_max,
+        "materiaux": materiaux,
+    }
+    meilleur["Candidats_evalues"] = int(len(C))
+    meilleur["Candidats_faisables"] = int(np.count_nonzero(faisable))
+    return meilleur
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    design = dimensionner(P=300, D_max=0.040, v_piston_max=2.0, pm_max=3e6, materiaux=["Acier", "Aluminium"])
+    for k, v in design.items():
+        print(f"  {k:28}: {v}")
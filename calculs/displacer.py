@@ -2,13 +2,28 @@
 
 import math
 
-class DisplacerStirling:
+from calculs.joints import section_conseillee, trouve_joint_torique
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+from calculs.tolerances import ajustement, ecarts
+
+class DisplacerStirling(Piece):
     """
     Modélisation d’un displacer ("galette" séparatrice) pour moteur Stirling :
     - Géométrie, matière, densité, masse, surfaces, état de surface, etc.
     - Calcul automatique des joints toriques d'étanchéité d'axe (ISO 3601 + tolérances du guide du dessinateur industriel).
     """
 
+    __slots__ = (
+        "diametre", "hauteur", "epaisseur_fond", "matiere", "densite", "axe_diam", "axe_longueur",
+        "rugosite", "etat_surface",
+    )
+    ARGUMENTS = {
+        "diametre_m": "diametre", "hauteur_m": "hauteur", "epaisseur_fond_m": "epaisseur_fond",
+        "matiere": "matiere", "densite_kg_m3": "densite", "axe_diam_m": "axe_diam",
+        "axe_longueur_m": "axe_longueur", "rugosite_um": "rugosite",
+        "etat_surface": "etat_surface",
+    }
+
     def __init__(
         self,
         diametre_m,
@@ -33,48 +48,48 @@ class DisplacerStirling:
         self.rugosite = rugosite_um
         self.etat_surface = etat_surface
 
-    @property
+    @propriete_cachee
     def rayon(self):
         return self.diametre / 2
 
-    @property
+    @propriete_cachee
     def volume_displacer(self):
         """Volume apparent du displacer, sans axe (m³)"""
         return math.pi * (self.rayon ** 2) * self.hauteur
 
-    @property
+    @propriete_cachee
     def volume_axe(self):
         """Volume de l’axe (m³)"""
         r = self.axe_diam / 2
         return math.pi * (r ** 2) * self.axe_longueur
 
-    @property
+    @propriete_cachee
     def volume_total(self):
         """Volume total galette + axe (m³)"""
         return self.volume_displacer + self.volume_axe
 
-    @property
+    @propriete_cachee
     def masse(self):
         """Masse totale (kg)"""
         return self.volume_total * self.densite
 
-    @property
+    @propriete_cachee
     def surface_lat(self):
         """Surface latérale de la galette (m²)"""
         return math.pi * self.diametre * self.hauteur
 
-    @property
+    @propriete_cachee
     def surface_faces(self):
         """Surface totale des deux faces (m²)"""
         return 2 * math.pi * (self.rayon ** 2)
 
-    @property
+    @propriete_cachee
     def surface_totale(self):
         """Surface totale (latérale + 2 faces + axe, m²)"""
         axe_surf = math.pi * self.axe_diam * self.axe_longueur + 2 * math.pi * (self.axe_diam / 2) ** 2
         return self.surface_lat + self.surface_faces + axe_surf
 
-    @property
+    @propriete_cachee
     def joints_toriques(self):
         """
         Calcule le nombre, la taille ISO et les tolérances des joints toriques pour l'axe.
@@ -83,25 +98,25 @@ class DisplacerStirling:
         nb_joints = 2
         d_axe_mm = round(self.axe_diam * 1000, 2)
 
-        # Choix section tore standard ISO
-        if d_axe_mm <= 2.9:
-            d2 = 1.0
-        elif d_axe_mm <= 4.9:
-            d2 = 1.5
-        elif d_axe_mm <= 7.9:
-            d2 = 2.0
-        elif d_axe_mm <= 12:
-            d2 = 2.5
-        else:
-            d2 = 3.0
-
-        taille_joint = f"{d_axe_mm}x{d2}"
-
-        # Tolérances de montage (exemple axe Ø6 mm)
-        tol_axe = "h8"  # -0.022/0 mm pour 6 mm (voir tables ISO)
-        tol_alésage = "H7"  # +0.015/0 mm pour 6 mm
-        largeur_rainure = round(d2 + 0.1, 2)
-        profondeur_rainure = round(d2 * 0.9, 2)
+        # Joint du catalogue le mieux adapté à l’axe ; à défaut, section usuelle et cotes déduites
+        try:
+            joint = trouve_joint_torique(d_arbre_mm=d_axe_mm, tol="dynamique")
+            d2 = joint["section (mm)"]
+            taille_joint = f"{joint['d_int (mm)']:g}x{d2:g}"
+            largeur_rainure = joint["largeur_gorge_recom (mm)"]
+            profondeur_rainure = joint["profondeur_gorge_recom (mm)"]
+        except ValueError:
+            d2 = section_conseillee(d_axe_mm)
+            taille_joint = f"{d_axe_mm}x{d2}"
+            largeur_rainure = round(d2 + 0.1, 2)
+            profondeur_rainure = round(d2 * 0.9, 2)
+
+        # Tolérances de montage : écarts ISO 286 au diamètre de l’axe
+        tol_axe = "h8"
+        tol_alésage = "H7"
+        es, ei = ecarts(tol_axe, d_axe_mm)
+        ES, EI = ecarts(tol_alésage, d_axe_mm)
+        jeu = ajustement(tol_alésage, tol_axe, d_axe_mm)
 
         return {
             "Nombre": nb_joints,
@@ -109,10 +124,14 @@ class DisplacerStirling:
             "Section tore (d2 mm)": d2,
             "Tolérance axe": tol_axe,
             "Tolérance alésage (guide)": tol_alésage,
+            "Écarts axe (mm)": (round(float(es), 3), round(float(ei), 3)),
+            "Écarts alésage (mm)": (round(float(ES), 3), round(float(EI), 3)),
+            "Jeu axe/guide (mm)": (round(float(jeu["Jeu_min_mm"]), 3), round(float(jeu["Jeu_max_mm"]), 3)),
             "Largeur rainure (mm)": largeur_rainure,
             "Profondeur rainure (mm)": profondeur_rainure,
         }
 
+    @resultat_cache
     def to_dict(self):
         d = {
             "Diamètre galette (mm)": round(self.diametre * 1000, 3),
@@ -132,6 +151,7 @@ class DisplacerStirling:
         d.update({f"Joint torique {k}": v for k, v in self.joints_toriques.items()})
         return d
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"DisplacerStirling(D={self.diametre*1000:.2f} mm, H={self.hauteur*1000:.2f} mm, "
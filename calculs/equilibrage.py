@@ -0,0 +1,196 @@
+# calculs/equilibrage.py
+
+import math
+
+import numpy as np
+
+from calculs.cinematique import angles, cinematique, FRACTION_BIELLE_ALTERNATIVE, NB_ANGLES_DEFAUT
+
+# Repère du carter (cf. calculs.cinematique) : z le long du vilebrequin, x et y dans le plan
+# des manivelles. Le maneton j est à l’angle θ + φ_j ; le cylindre j a son axe à l’angle ψ_j
+# (0 pour des cylindres en ligne, 90° pour le second cylindre d’un Stirling alpha en V).
+# Les contrepoids d’un maneton sont diamétralement opposés à celui-ci.
+# Les efforts sont manipulés en complexes : F = Fx + i Fy.
+
+TAILLE_BLOC = 2_000_000     # Nombre maximal de valeurs (candidats x angles) par bloc de calcul
+
+def _par_maneton(x, n):
+    x = np.asarray(x, dtype=float)
+    return np.broadcast_to(x, (n,)) if x.ndim == 0 else x
+
+def positions_manetons(nb_manetons, longueur_axe):
+    """Positions axiales z (m) des manetons, régulièrement réparties et centrées sur l’axe."""
+    pas = longueur_axe / nb_manetons
+    return (np.arange(nb_manetons) - (nb_manetons - 1) / 2) * pas
+
+def facteurs_phases(phases, positions_z=None):
+    """
+    Facteurs de calage d’une disposition de manetons (sans dimension, ou en m pour les moments) :
+    |Σ e^{iφ}| et |Σ e^{2iφ}| pour les forces primaires et secondaires, |Σ z e^{iφ}| et
+    |Σ z e^{2iφ}| pour les moments. Un facteur nul signifie un ordre équilibré par la disposition.
+    """
+    phases = np.asarray(phases, dtype=float)
+    z = np.zeros_like(phases) if positions_z is None else np.asarray(positions_z, dtype=float)
+    e1, e2 = np.exp(1j * phases), np.exp(2j * phases)
+    return {
+        "Force_primaire": float(abs(e1.sum())),
+        "Force_secondaire": float(abs(e2.sum())),
+        "Moment_primaire_m": float(abs((z * e1).sum())),
+        "Moment_secondaire_m": float(abs((z * e2).sum())),
+    }
+
+def efforts_sans_contrepoids(phases, rayon, longueur_bielle, f, masse_alternative, masse_rotative,
+                             positions_z=None, angles_cylindres=0.0, theta=None, nb_angles=NB_ANGLES_DEFAUT):
+    """
+    Efforts transmis au carter sur un tour, contrepoids exclus (complexes, forme (nb_angles,)) :
+    force F0(θ) et moment M0(θ) = Σ z_j F_j (composantes M_x = -Im, M_y = Re).
+    Renvoie aussi G(θ) = e^{iθ} Σ e^{iφ_j} et H(θ) = e^{iθ} Σ z_j e^{iφ_j} : un balourd de
+    contrepoids U (kg.m, par maneton) ajoute -U ω² G à la force et -U ω² H au moment.
+    - phases, positions_z, angles_cylindres, masses, rayon, longueur_bielle : par maneton
+      (scalaire = identique pour tous)
+    """
+    phases = np.asarray(phases, dtype=float)
+    n = phases.size
+    theta = angles(nb_angles) if theta is None else np.asarray(theta, dtype=float)
+    r, L, m_alt, m_rot, psi = (_par_maneton(x, n) for x in (rayon, longueur_bielle, masse_alternative,
+                                                           masse_rotative, angles_cylindres))
+    z = np.zeros(n) if positions_z is None else _par_maneton(positions_z, n)
+    omega = 2 * math.pi * f
+    rotation = np.exp(1j * theta)
+    F0 = np.zeros(theta.shape, dtype=complex)
+    M0 = np.zeros(theta.shape, dtype=complex)
+    for j in range(n):
+        # Angle du maneton compté depuis le PMH de son propre cylindre
+        cin = cinematique(r[j], L[j], f, theta=theta + phases[j] - psi[j])
+        F = (-m_alt[j] * cin["Acceleration_m_s2"]) * np.exp(1j * psi[j])
+        F = F + m_rot[j] * r[j] * omega ** 2 * rotation * np.exp(1j * phases[j])
+        F0 += F
+        M0 += z[j] * F
+    e1 = np.exp(1j * phases)
+    return {
+        "Angle_vilebrequin_rad": theta,
+        "Omega_rad_s": omega,
+        "Force": F0,
+        "Moment": M0,
+        "G": rotation * e1.sum(),
+        "H": rotation * (z * e1).sum(),
+    }
+
+def _crete(Z0, unite, omega2, desequilibres, taille_bloc=TAILLE_BLOC):
+    """
+    max_θ |Z0(θ) - U ω² unite(θ)| pour chaque balourd candidat U, par blocs de candidats :
+    |Z0 - a u|² = |Z0|² - 2 a Re(Z0 ū) + a² |u|², trois tableaux réels précalculés.
+    """
+    p = np.abs(Z0) ** 2
+    q = np.real(Z0 * np.conj(unite))
+    g = np.abs(unite) ** 2
+    a = omega2 * np.asarray(desequilibres, dtype=float).ravel()
+    pas = max(1, taille_bloc // max(1, p.size))
+    crete = np.empty(a.size)
+    for debut in range(0, a.size, pas):
+        ab = a[debut:debut + pas, None]
+        carre = p - 2 * ab * q + ab ** 2 * g
+        crete[debut:debut + pas] = np.sqrt(np.maximum(carre.max(axis=1), 0.0))
+    return crete
+
+def forces_residuelles(efforts, desequilibre_contrepoids):
+    """
+    Efforts résiduels sur un tour pour un balourd de contrepoids U (kg.m par maneton) :
+    composantes de force et de moment (tableaux (nb_angles,)) et valeurs crêtes.
+    """
+    w2 = efforts["Omega_rad_s"] ** 2
+    F = efforts["Force"] - desequilibre_contrepoids * w2 * efforts["G"]
+    M = efforts["Moment"] - desequilibre_contrepoids * w2 * efforts["H"]
+    return {
+        "Angle_vilebrequin_rad": efforts["Angle_vilebrequin_rad"],
+        "Force_x_N": F.real,
+        "Force_y_N": F.imag,
+        "Moment_x_N_m": -M.imag,
+        "Moment_y_N_m": M.real,
+        "Force_max_N": float(np.max(np.abs(F))),
+        "Moment_max_N_m": float(np.max(np.abs(M))),
+    }
+
+def optimiser_desequilibre(efforts, desequilibres, poids_moment=0.0, taille_bloc=TAILLE_BLOC):
+    """
+    Évalue des balourds de contrepoids candidats (kg.m par maneton, tableau 1-D) et retient celui
+    qui minimise la crête résiduelle : Force_max + poids_moment x Moment_max (poids en 1/m).
+    """
+    desequilibres = np.asarray(desequilibres, dtype=float).ravel()
+    w2 = efforts["Omega_rad_s"] ** 2
+    force = _crete(efforts["Force"], efforts["G"], w2, desequilibres, taille_bloc)
+    moment = _crete(efforts["Moment"], efforts["H"], w2, desequilibres, taille_bloc)
+    critere = force + poids_moment * moment
+    i = int(np.argmin(critere))
+    return {
+        "Force_max_N": force,
+        "Moment_max_N_m": moment,
+        "Critere": critere,
+        "Indice_optimal": i,
+        "Desequilibre_optimal_kg_m": float(desequilibres[i]),
+    }
+
+def desequilibre_contrepoids(diametre, largeur, densite, excentricite, nb_par_maneton=2):
+    """Balourd (kg.m) des contrepoids d’un maneton : disques de diamètre et largeur donnés."""
+    masse = nb_par_maneton * densite * math.pi * (np.asarray(diametre) / 2) ** 2 * np.asarray(largeur)
+    return masse * excentricite
+
+def depuis_pieces(villebrequin, bielle, piston, f, phases=None, phase=math.pi / 2, angles_cylindres=0.0,
+                  fraction_bielle=FRACTION_BIELLE_ALTERNATIVE, **options):
+    """
+    Efforts sans contrepoids d’un embiellage décrit par ses pièces (une bielle et un piston
+    identiques par maneton). Masses rotatives par maneton : part tournante de la bielle,
+    maneton à r et bras ramenés à r (moitié de leur masse, centre à r / 2).
+    - phases : calage des manetons (rad), par défaut j x phase (déphasage de 90° du moteur
+      Stirling, cf. calculs.schmidt)
+    """
+    n = villebrequin.nb_manetons
+    phases = phase * np.arange(n) if phases is None else np.asarray(phases, dtype=float)
+    if phases.size != n:
+        raise ValueError(f"{phases.size} phases pour {n} manetons.")
+    r = villebrequin.rayon_maneton
+    m_maneton = villebrequin.volume_maneton * villebrequin.densite / n
+    m_bras = villebrequin.volume_bras * villebrequin.densite / n
+    m_alt = piston.masse + fraction_bielle * bielle.masse
+    m_rot = (1 - fraction_bielle) * bielle.masse + m_maneton + m_bras / 2
+    return efforts_sans_contrepoids(phases, r, bielle.longueur, f, m_alt, m_rot,
+                                    positions_z=positions_manetons(n, villebrequin.longueur_axe),
+                                    angles_cylindres=angles_cylindres, **options)
+
+def contrepoids_optimal(villebrequin, bielle, piston, f, diametres, largeurs=None, excentricite=None,
+                        poids_moment=0.0, **options):
+    """
+    Recherche des dimensions de contrepoids minimisant la crête résiduelle (grille
+    diametres x largeurs, en m). excentricite : distance du centre des contrepoids à l’axe,
+    par défaut le rayon de manivelle. Renvoie le vilebrequin modifié (replace) et le détail.
+    """
+    efforts = depuis_pieces(villebrequin, bielle, piston, f, **options)
+    largeurs = [villebrequin.largeur_contrepoids] if largeurs is None else largeurs
+    e = villebrequin.rayon_maneton if excentricite is None else excentricite
+    D, W = np.meshgrid(np.asarray(diametres, dtype=float), np.asarray(largeurs, dtype=float), indexing="ij")
+    D, W = D.ravel(), W.ravel()
+    res = optimiser_desequilibre(efforts, desequilibre_contrepoids(D, W, villebrequin.densite, e),
+                                 poids_moment=poids_moment)
+    i = res["Indice_optimal"]
+    res["Diametre_contrepoids_m"] = float(D[i])
+    res["Largeur_contrepoids_m"] = float(W[i])
+    res["Villebrequin"] = villebrequin.replace(diametre_contrepoids_m=float(D[i]), largeur_contrepoids_m=float(W[i]))
+    res["Residus"] = forces_residuelles(efforts, res["Desequilibre_optimal_kg_m"])
+    return res
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.assemblage import AssemblageMoteur
+    from calculs.stirling import calcul_complet
+
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    vil, bielle, piston = moteur.villebrequin, moteur.bielle, moteur.piston
+    print("Facteurs de calage 2 manetons à 90° :", facteurs_phases([0, math.pi / 2], [-0.02, 0.02]))
+    efforts = depuis_pieces(vil, bielle, piston, f=25)
+    print("Sans contrepoids : crête", round(forces_residuelles(efforts, 0.0)["Force_max_N"], 1), "N")
+    t0 = time.perf_counter()
+    res = contrepoids_optimal(vil, bielle, piston, 25, np.linspace(0.01, 0.08, 200), np.linspace(0.005, 0.02, 25))
+    duree = time.perf_counter() - t0
+    print(f"{res['Force_max_N'].size} candidats en {duree:.3f} s -> D = {res['Diametre_contrepoids_m']*1000:.1f} mm, "
+          f"l = {res['Largeur_contrepoids_m']*1000:.1f} mm, crête {res['Residus']['Force_max_N']:.1f} N")
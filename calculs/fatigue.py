@@ -0,0 +1,217 @@
+# calculs/fatigue.py
+
+import math
+
+import numpy as np
+
+# Caractéristiques de fatigue (Pa) : Rm rupture, Re limite élastique, sigma_D limite
+# d’endurance en flexion rotative sur éprouvette polie (≈ 0.5 Rm pour les aciers, plafonnée
+# à 700 MPa ; ≈ 0.35 Rm à 5·10^8 cycles pour l’aluminium). Clés : matières des pièces et
+# matériaux de calculs.stirling ; une matière inconnue est traitée comme « Acier ».
+MATERIAUX_FATIGUE = {
+    "Acier": {"Rm": 400e6, "Re": 235e6, "sigma_D": 200e6},
+    "Acier C45": {"Rm": 650e6, "Re": 430e6, "sigma_D": 325e6},
+    "Acier 18NiCrMo5": {"Rm": 1100e6, "Re": 800e6, "sigma_D": 550e6},
+    "Acier trempé 100Cr6": {"Rm": 2000e6, "Re": 1700e6, "sigma_D": 700e6},
+    "Aluminium": {"Rm": 150e6, "Re": 110e6, "sigma_D": 55e6},
+    "Inox": {"Rm": 600e6, "Re": 250e6, "sigma_D": 240e6},
+    "Laiton": {"Rm": 300e6, "Re": 150e6, "sigma_D": 100e6},
+}
+
+# Facteur d’état de surface de Marin k_a = a · Rm[MPa]^b
+ETATS_SURFACE = {
+    "Rectifié": (1.58, -0.085),
+    "Usiné": (4.51, -0.265),
+    "Laminé à chaud": (57.7, -0.718),
+    "Brut de forge": (272.0, -0.995),
+}
+CRITERES = ("goodman", "soderberg")
+# Courbe de Wöhler (Basquin) : FRACTION_RM_1000_CYCLES · Rm à 10^3 cycles, limite corrigée à 10^6
+FRACTION_RM_1000_CYCLES = 0.9
+
+def materiau_fatigue(nom):
+    """Caractéristiques de fatigue d’une matière (repli sur « Acier »)."""
+    return MATERIAUX_FATIGUE.get(nom, MATERIAUX_FATIGUE["Acier"])
+
+def _categorie_surface(etat_surface):
+    texte = (etat_surface or "").lower()
+    if any(mot in texte for mot in ("rectif", "miroir", "poli")):
+        return "Rectifié"
+    if "forg" in texte:
+        return "Brut de forge"
+    if "lamin" in texte:
+        return "Laminé à chaud"
+    return "Usiné"
+
+def limite_endurance(materiau, diametre, etat_surface="Usiné"):
+    """
+    Limite d’endurance corrigée S_e = k_a · k_b · sigma_D (Pa) :
+    - k_a état de surface (ETATS_SURFACE, libellé libre : « Rectifié fin », « Usinage standard »...)
+    - k_b effet d’échelle en flexion rotative (diamètre en m)
+    """
+    mat = materiau_fatigue(materiau) if isinstance(materiau, str) else materiau
+    a, b = ETATS_SURFACE[_categorie_surface(etat_surface)]
+    k_a = min(1.0, a * (mat["Rm"] / 1e6) ** b)
+    d = diametre * 1000
+    if d <= 2.79:
+        k_b = 1.0
+    elif d <= 51:
+        k_b = 1.24 * d ** -0.107
+    else:
+        k_b = 1.51 * d ** -0.157
+    return k_a * k_b * mat["sigma_D"]
+
+def contraintes(piece, moment_flexion, couple=0.0, effort_normal=0.0):
+    """
+    Contraintes nominales en peau d’une section circulaire pleine (arbre, axe de piston) :
+    σ = M / W + N / A, τ = T / (2 W), von Mises σ_eq = √(σ² + 3τ²).
+    L’équivalent signé (signe de σ, ou de τ en torsion pure) sert au comptage des cycles.
+    Les efforts (N.m, N) sont des scalaires ou des tableaux de même forme.
+    """
+    M, T, N = (np.asarray(x, dtype=float) for x in (moment_flexion, couple, effort_normal))
+    sigma = M / piece.module_resistance + N / piece.section
+    tau = T / (2 * piece.module_resistance)
+    von_mises = np.sqrt(sigma ** 2 + 3 * tau ** 2)
+    signe = np.where(sigma != 0, np.sign(sigma), np.sign(tau))
+    return {
+        "Contrainte_flexion_Pa": sigma,
+        "Contrainte_torsion_Pa": tau,
+        "Von_Mises_Pa": von_mises,
+        "Von_Mises_signe_Pa": signe * von_mises,
+    }
+
+def points_inversion(signal):
+    """Indices des extrema locaux (plateaux réduits à leur premier point, extrémités comprises)."""
+    x = np.asarray(signal, dtype=float).ravel()
+    if x.size < 3:
+        return np.arange(x.size)
+    indices = np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+    d = np.diff(x[indices])
+    if d.size < 2:
+        return indices
+    return indices[np.r_[True, d[1:] * d[:-1] < 0, True]]
+
+def rainflow(signal, periodique=False):
+    """
+    Comptage rainflow (méthode des quatre points) par passes vectorisées : à chaque passe,
+    toutes les étendues internes encadrées par leurs deux voisines sont comptées comme cycles
+    complets et retirées ; le résidu final donne des demi-cycles.
+    - periodique : signal répété (un tour moteur) ; il est recommencé sur son maximum, ce qui
+      ferme tous les cycles
+    Renvoie des tableaux Etendue, Moyenne (unité du signal) et Nombre (1 ou 0.5).
+    """
+    x = np.asarray(signal, dtype=float).ravel()
+    y = x[points_inversion(x)]
+    if periodique and y.size > 1:
+        i = int(np.argmax(y))
+        y = np.r_[y[i:], y[:i], y[i]]
+        y = y[points_inversion(y)]
+    etendues, moyennes = [], []
+    while y.size >= 4:
+        r = np.abs(np.diff(y))
+        interne = r[1:-1]
+        ferme = (interne <= r[:-2]) & (interne <= r[2:])
+        if not ferme.any():
+            break
+        # Deux paires adjacentes (égalité d’étendues) ne sont pas retirées dans la même passe
+        ferme[1:] &= ~ferme[:-1]
+        i = np.flatnonzero(ferme) + 1
+        etendues.append(r[i])
+        moyennes.append((y[i] + y[i + 1]) / 2)
+        garde = np.ones(y.size, dtype=bool)
+        garde[i] = False
+        garde[i + 1] = False
+        y = y[garde]
+    n_complets = sum(e.size for e in etendues)
+    etendues.append(np.abs(np.diff(y)))
+    moyennes.append((y[1:] + y[:-1]) / 2)
+    nombre = np.full(n_complets + max(y.size - 1, 0), 0.5)
+    nombre[:n_complets] = 1.0
+    return {
+        "Etendue": np.concatenate(etendues),
+        "Moyenne": np.concatenate(moyennes),
+        "Nombre": nombre,
+    }
+
+def coefficient_securite(amplitude, moyenne, S_e, Rm, Re, critere="goodman"):
+    """
+    Coefficient de sécurité en endurance par cycle : 1 / (σa / S_e + σm / S_u), S_u = Rm
+    (Goodman) ou Re (Soderberg) ; une contrainte moyenne de compression est négligée.
+    """
+    if critere not in CRITERES:
+        raise ValueError(f"Critère inconnu : {critere} (attendu : {', '.join(CRITERES)})")
+    S_u = Rm if critere == "goodman" else Re
+    charge = np.asarray(amplitude) / S_e + np.maximum(np.asarray(moyenne), 0.0) / S_u
+    with np.errstate(divide="ignore"):
+        return np.where(charge > 0, 1 / np.maximum(charge, 1e-300), np.inf)
+
+def dommage_miner(amplitude, moyenne, nombre, S_e, Rm):
+    """
+    Dommage de Miner Σ n / N : amplitude ramenée à un cycle alterné équivalent (Goodman),
+    N de la droite de Basquin entre (10^3, 0.9 Rm) et (10^6, S_e), infini sous S_e.
+    """
+    amplitude, moyenne = np.asarray(amplitude, dtype=float), np.maximum(np.asarray(moyenne, dtype=float), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equivalente = np.where(moyenne < Rm, amplitude / (1 - moyenne / Rm), np.inf)
+    haut = FRACTION_RM_1000_CYCLES * Rm
+    b = -math.log10(haut / S_e) / 3
+    a = haut ** 2 / S_e
+    with np.errstate(divide="ignore", over="ignore"):
+        cycles = np.where(equivalente > S_e, (equivalente / a) ** (1 / b), np.inf)
+    return float(np.sum(np.asarray(nombre) / cycles))
+
+def analyse_fatigue(piece, moment_flexion, couple=0.0, effort_normal=0.0, materiau=None, critere="goodman",
+                    periodique=True):
+    """
+    Analyse de fatigue d’un arbre ou d’un axe sous un spectre d’efforts (par ex. un tour de
+    vilebrequin, cf. spectre_vilebrequin) :
+    historique de von Mises, cycles rainflow, coefficient de sécurité mini (Goodman ou
+    Soderberg), coefficient vis-à-vis de la plastification, dommage par passage du spectre.
+    - materiau : nom dans MATERIAUX_FATIGUE, par défaut la matière de la pièce
+    """
+    mat = materiau_fatigue(piece.matiere if materiau is None else materiau)
+    S_e = limite_endurance(mat, piece.diametre, piece.etat_surface)
+    ctr = contraintes(piece, moment_flexion, couple, effort_normal)
+    cycles = rainflow(ctr["Von_Mises_signe_Pa"], periodique=periodique)
+    amplitude = cycles["Etendue"] / 2
+    coef = coefficient_securite(amplitude, cycles["Moyenne"], S_e, mat["Rm"], mat["Re"], critere)
+    dommage = dommage_miner(amplitude, cycles["Moyenne"], cycles["Nombre"], S_e, mat["Rm"])
+    sigma_max = float(np.max(ctr["Von_Mises_Pa"])) if ctr["Von_Mises_Pa"].size else 0.0
+    return {
+        **ctr,
+        "Cycles": cycles,
+        "Limite_endurance_Pa": S_e,
+        "Von_Mises_max_Pa": sigma_max,
+        "Nb_cycles": float(np.sum(cycles["Nombre"])),
+        "Coefficient_securite": float(np.min(coef)) if coef.size else math.inf,
+        "Coefficient_plastification": mat["Re"] / sigma_max if sigma_max > 0 else math.inf,
+        "Dommage_par_passage": dommage,
+        "Duree_vie_passages": 1 / dommage if dommage > 0 else math.inf,
+    }
+
+def spectre_vilebrequin(efforts, rayon_maneton, porte_a_faux):
+    """
+    Spectre flexion / torsion d’un tour de vilebrequin à partir de calculs.cinematique.forces_inertie :
+    - flexion au palier : effort de bielle x porte-à-faux (m)
+    - couple : composante tangentielle de l’effort de bielle, F_b · r · sin(θ + β)
+    """
+    F_b = efforts["Effort_bielle_N"]
+    theta, beta = efforts["Angle_vilebrequin_rad"], efforts["Angle_bielle_rad"]
+    return F_b * porte_a_faux, F_b * rayon_maneton * np.sin(theta + beta)
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.arbre import ArbreStirling
+    from calculs.cinematique import forces_inertie
+
+    arbre = ArbreStirling(diametre_m=0.012, longueur_m=0.080)
+    efforts = forces_inertie(0.02, 0.08, 30.0, 0.4, 0.2)
+    M, T = spectre_vilebrequin(efforts, 0.02, porte_a_faux=0.03)
+    res = analyse_fatigue(arbre, M, T)
+    print(f"σ_vm maxi {res['Von_Mises_max_Pa'] / 1e6:.1f} MPa, S_e {res['Limite_endurance_Pa'] / 1e6:.0f} MPa, "
+          f"{res['Nb_cycles']:.1f} cycles par tour, sécurité Goodman {res['Coefficient_securite']:.2f}")
+    signal = np.random.default_rng(0).normal(size=1_000_000).cumsum()
+    t0 = time.perf_counter()
+    cycles = rainflow(signal)
+    print(f"Rainflow 10^6 points : {cycles['Nombre'].sum():.0f} cycles en {time.perf_counter() - t0:.2f} s")
@@ -0,0 +1,277 @@
+# calculs/gaz.py
+
+from functools import lru_cache
+
+import numpy as np
+
+# Propriétés thermophysiques du gaz de travail en fonction de T (K) et p (Pa) :
+# - chaleurs massiques : polynômes de Shomate (NIST) pour le gaz parfait, corrigés
+#   par l’équation d’état du viriel tronquée au second coefficient (Abbott) ;
+# - masse volumique : Z = 1 + B p / (R T) ;
+# - viscosité : loi de Sutherland (gaz dilué, indépendante de p) ;
+# - conductivité : Eucken (monoatomique) ou Eucken modifiée (polyatomique).
+# Les propriétés sont tabulées une fois pour toutes sur une grille régulière (T, p)
+# puis relues par interpolation bilinéaire vectorisée (coût O(1) par point).
+
+R_UNIVERSEL = 8.314462618  # J/mol/K
+
+# Grille des tables (hors grille : valeurs bornées au bord)
+T_MIN, T_MAX, PAS_T = 200.0, 1500.0, 10.0
+P_MIN, P_MAX, PAS_P = 0.0, 30e6, 0.5e6
+
+PROPRIETES = ("cp", "cv", "gamma", "mu", "k", "rho", "Pr", "Z")
+
+# Coefficients de Shomate (A, B, C, D, E) par plage de température (K), cp en J/mol/K
+# avec t = T/1000 : cp = A + B t + C t² + D t³ + E / t². Hors plage, la plage la plus
+# proche est extrapolée.
+SHOMATE = {
+    "N2": (
+        (500.0, (28.98641, 1.853978, -9.647459, 16.63537, 0.000117)),
+        (2000.0, (19.50583, 19.88705, -8.598535, 1.369784, 0.527601)),
+    ),
+    "O2": (
+        (700.0, (31.32234, -20.23531, 57.86644, -36.50624, -0.007374)),
+        (2000.0, (30.03235, 8.772972, -3.988133, 0.788313, -0.741599)),
+    ),
+    "H2": (
+        (1000.0, (33.066178, -11.363417, 11.432816, -2.772874, -0.158558)),
+        (2500.0, (18.563083, 12.257357, -2.859786, 0.268238, 1.977990)),
+    ),
+    "CO2": (
+        (1200.0, (24.99735, 55.18696, -33.69137, 7.948387, -0.136638)),
+        (6000.0, (58.16639, 2.720074, -0.492289, 0.038844, -6.447293)),
+    ),
+}
+
+# Données des gaz : masse molaire (kg/mol), composition molaire (espèces SHOMATE,
+# ou None pour un monoatomique à cp = 5/2 R), point critique (K, Pa), facteur
+# acentrique, constantes de Sutherland (mu0 à T0 = 273.15 K, S en K).
+GAZ = {
+    "Air": {"M": 28.9647e-3, "composition": {"N2": 0.7808, "O2": 0.2095, "Ar": 0.0097},
+            "Tc": 132.5, "Pc": 37.7e5, "omega": 0.035, "mu0": 1.716e-5, "S": 110.4},
+    "He": {"M": 4.002602e-3, "composition": None,
+           "Tc": 5.19, "Pc": 2.27e5, "omega": -0.39, "mu0": 1.87e-5, "S": 79.4},
+    "H2": {"M": 2.01588e-3, "composition": {"H2": 1.0},
+           "Tc": 33.19, "Pc": 13.13e5, "omega": -0.216, "mu0": 8.411e-6, "S": 97.0},
+    "N2": {"M": 28.0134e-3, "composition": {"N2": 1.0},
+           "Tc": 126.2, "Pc": 33.98e5, "omega": 0.037, "mu0": 1.663e-5, "S": 106.7},
+    "CO2": {"M": 44.0095e-3, "composition": {"CO2": 1.0},
+            "Tc": 304.13, "Pc": 73.77e5, "omega": 0.225, "mu0": 1.370e-5, "S": 222.0},
+}
+T0_SUTHERLAND = 273.15
+
+# Libellés acceptés (interface Tk comprise). Les gaz d’échappement, de composition
+# non précisée, sont assimilés à l’air ; un nom inconnu est refusé.
+ALIAS = {
+    "air": "Air",
+    "gaz d'échappement (cycle régénératif)": "Air",
+    "gaz d’échappement (cycle régénératif)": "Air",
+    "he": "He", "hélium": "He", "helium": "He", "hélium (he)": "He",
+    "h2": "H2", "hydrogène": "H2", "hydrogene": "H2", "hydrogène (h₂)": "H2", "hydrogène (h2)": "H2",
+    "n2": "N2", "azote": "N2", "azote (n₂)": "N2", "azote (n2)": "N2",
+    "co2": "CO2", "dioxyde de carbone": "CO2", "dioxyde de carbone (co₂)": "CO2",
+    "dioxyde de carbone (co2)": "CO2",
+}
+
+def nom_gaz(gaz):
+    """Nom normalisé d’un gaz ("Air", "He", "H2", "N2", "CO2") ; ValueError si le nom est inconnu."""
+    if gaz in GAZ:
+        return gaz
+    nom = ALIAS.get(str(gaz).strip().lower())
+    if nom is None:
+        raise ValueError(f"Gaz inconnu : {gaz!r} (attendu : {', '.join(GAZ)} ou un libellé de l’interface)")
+    return nom
+
+def _cp_shomate(espece, T):
+    """cp molaire (J/mol/K) d’une espèce SHOMATE (ou "Ar", monoatomique)."""
+    if espece == "Ar":
+        return np.full_like(T, 2.5 * R_UNIVERSEL)
+    t = T / 1000.0
+    plages = SHOMATE[espece]
+    cp = np.empty_like(T)
+    bas = -np.inf
+    for i, (haut, (A, B, C, D, E)) in enumerate(plages):
+        masque = (T >= bas) if i == len(plages) - 1 else (T >= bas) & (T < haut)
+        tm = t[masque]
+        cp[masque] = A + B * tm + C * tm**2 + D * tm**3 + E / tm**2
+        bas = haut
+    return cp
+
+def _cp_molaire_parfait(gaz, T):
+    composition = GAZ[gaz]["composition"]
+    if composition is None:
+        return np.full_like(T, 2.5 * R_UNIVERSEL)
+    return sum(x * _cp_shomate(espece, T) for espece, x in composition.items())
+
+def _viriel(gaz, T):
+    """Second coefficient du viriel B (m³/mol) et ses dérivées dB/dT, d²B/dT² (Abbott)."""
+    d = GAZ[gaz]
+    Tr = T / d["Tc"]
+    b = R_UNIVERSEL * d["Tc"] / d["Pc"]
+    w = d["omega"]
+    B = b * ((0.083 - 0.422 / Tr**1.6) + w * (0.139 - 0.172 / Tr**4.2))
+    dB = b / d["Tc"] * (0.6752 / Tr**2.6 + w * 0.7224 / Tr**5.2)
+    d2B = b / d["Tc"]**2 * (-1.75552 / Tr**3.6 - w * 3.75648 / Tr**6.2)
+    return B, dB, d2B
+
+def viscosite(gaz, T):
+    """Viscosité dynamique (Pa.s), loi de Sutherland."""
+    d = GAZ[nom_gaz(gaz)]
+    T = np.asarray(T, dtype=float)
+    return d["mu0"] * (T / T0_SUTHERLAND) ** 1.5 * (T0_SUTHERLAND + d["S"]) / (T + d["S"])
+
+def proprietes_exactes(gaz, T, p):
+    """
+    Évaluation directe (sans table) des propriétés, en unités massiques SI :
+    cp, cv (J/kg/K), gamma, mu (Pa.s), k (W/m/K), rho (kg/m³), Pr, Z.
+    Sert à construire les tables et de référence pour les contrôler.
+    """
+    gaz = nom_gaz(gaz)
+    d = GAZ[gaz]
+    T, p = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(p, dtype=float))
+    T, p = T.astype(float), p.astype(float)
+    M = d["M"]
+    R = R_UNIVERSEL / M
+
+    cp0 = _cp_molaire_parfait(gaz, T.ravel()).reshape(T.shape)
+    B, dB, d2B = _viriel(gaz, T)
+    # Équation d’état V = R T / p + B(T) :
+    # cp - cp0 = -T p B''   et   cp - cv = R (1 + p B' / R)²
+    # Le développement au second coefficient ne vaut que pour des densités modérées
+    # (p_r < Tr / 2) : au-delà, les écarts au gaz parfait sont figés à leur valeur limite.
+    pv = np.minimum(p, 0.5 * T / d["Tc"] * d["Pc"])
+    cp_m = cp0 - T * pv * d2B
+    cv_m = cp_m - R_UNIVERSEL * (1 + pv * dB / R_UNIVERSEL) ** 2
+    Z = 1 + B * pv / (R_UNIVERSEL * T)
+
+    mu = viscosite(gaz, T)
+    cv0 = (cp0 - R_UNIVERSEL) / M
+    if d["composition"] is None:
+        k = 15 / 4 * R * mu
+    else:
+        k = mu * cv0 * (1.32 + 1.77 * R / cv0)
+    cp, cv = cp_m / M, cv_m / M
+    return {
+        "cp": cp,
+        "cv": cv,
+        "gamma": cp / cv,
+        "mu": mu,
+        "k": k,
+        "rho": p / (Z * R * T),
+        "Pr": mu * cp / k,
+        "Z": Z,
+    }
+
+def grille():
+    """Nœuds (T, p) des tables."""
+    nT = int(round((T_MAX - T_MIN) / PAS_T)) + 1
+    nP = int(round((P_MAX - P_MIN) / PAS_P)) + 1
+    return np.linspace(T_MIN, T_MAX, nT), np.linspace(P_MIN, P_MAX, nP)
+
+@lru_cache(maxsize=None)
+def table(gaz):
+    """
+    Table des propriétés d’un gaz, construite au premier appel puis conservée :
+    tableau (nT, nP, len(PROPRIETES)) en lecture seule, les propriétés d’un même
+    nœud étant contiguës en mémoire.
+    """
+    gaz = nom_gaz(gaz)
+    Tg, pg = grille()
+    TT, PP = np.meshgrid(Tg, pg, indexing="ij")
+    valeurs = proprietes_exactes(gaz, TT, PP)
+    tab = np.ascontiguousarray(np.stack([valeurs[nom] for nom in PROPRIETES], axis=-1))
+    tab.flags.writeable = False
+    return tab
+
+def _interpoler(tab, T, p):
+    """
+    Interpolation bilinéaire de toutes les colonnes de `tab` (nT, nP, m) aux points
+    (T, p) 1-D : renvoie un tableau (m, N).
+    """
+    nT, nP, m = tab.shape
+    x = np.clip((T - T_MIN) * (1.0 / PAS_T), 0.0, nT - 1)
+    y = np.clip((p - P_MIN) * (1.0 / PAS_P), 0.0, nP - 1)
+    i = np.minimum(x.astype(np.intp), nT - 2)
+    j = np.minimum(y.astype(np.intp), nP - 2)
+    u, v = (x - i)[:, None], (y - j)[:, None]
+    plat = tab.reshape(nT * nP, m)
+    k = i * nP + j
+    bas = plat[k] + (plat[k + 1] - plat[k]) * v
+    haut = plat[k + nP] + (plat[k + nP + 1] - plat[k + nP]) * v
+    return (bas + (haut - bas) * u).T
+
+def proprietes(gaz, T, p=1e5):
+    """
+    Propriétés tabulées du gaz à (T en K, p en Pa) : dict des PROPRIETES plus "R"
+    (constante spécifique, J/kg/K).
+    - T et p : scalaires ou tableaux (diffusion NumPy) ; renvoie des float si tous
+      deux sont scalaires.
+    - gaz : nom (cf. nom_gaz) ou tableau de noms de même forme que le résultat.
+    """
+    scalaire = np.ndim(T) == 0 and np.ndim(p) == 0 and np.ndim(gaz) == 0
+    if np.ndim(gaz) == 0:
+        nom = nom_gaz(gaz if not isinstance(gaz, np.ndarray) else gaz.item())
+        T, p = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(p, dtype=float))
+        valeurs = _interpoler(table(nom), T.ravel(), p.ravel()).reshape((len(PROPRIETES),) + T.shape)
+        R = np.full(T.shape, R_UNIVERSEL / GAZ[nom]["M"])
+    else:
+        T, p, noms = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(p, dtype=float),
+                                         np.asarray(gaz, dtype=object))
+        noms = np.array([nom_gaz(g) for g in noms.ravel().tolist()], dtype=object)
+        valeurs = np.empty((len(PROPRIETES), noms.size))
+        R = np.empty(noms.size)
+        Tp, pp = T.ravel(), p.ravel()
+        for nom in set(noms.tolist()):
+            masque = noms == nom
+            valeurs[:, masque] = _interpoler(table(nom), Tp[masque], pp[masque])
+            R[masque] = R_UNIVERSEL / GAZ[nom]["M"]
+        valeurs = valeurs.reshape((len(PROPRIETES),) + T.shape)
+        R = R.reshape(T.shape)
+
+    resultat = dict(zip(PROPRIETES, valeurs))
+    resultat["R"] = R
+    if scalaire:
+        return {k: float(v) for k, v in resultat.items()}
+    return resultat
+
+def propriete(gaz, nom, T, p=1e5):
+    """Une seule propriété tabulée (cf. PROPRIETES, ou "R")."""
+    if nom == "R":
+        return proprietes(gaz, T, p)["R"]
+    tab = table(nom_gaz(gaz))[:, :, PROPRIETES.index(nom), None]
+    T, p = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(p, dtype=float))
+    valeur = _interpoler(tab, T.ravel(), p.ravel()).reshape(T.shape)
+    return float(valeur) if valeur.ndim == 0 else valeur
+
+def parametres_cycle(gaz, T_moy, pm):
+    """
+    Constantes du gaz au format attendu par les modèles de cycle (cf. nodal.GAZ_AIR) :
+    R, gamma et Pr pris à (T_moy, pm), constantes de Sutherland du gaz. T_moy et pm
+    sont diffusables : R, gamma et Pr sont alors des tableaux (un design par élément).
+    """
+    nom = nom_gaz(gaz)
+    pr = proprietes(nom, T_moy, pm)
+    d = GAZ[nom]
+    return {"R": pr["R"], "gamma": pr["gamma"], "mu0": d["mu0"], "T0": T0_SUTHERLAND,
+            "S": d["S"], "Pr": pr["Pr"]}
+
+def temperature_moyenne_log(Th, Tc):
+    """Température moyenne logarithmique entre sources chaude et froide (K)."""
+    Th, Tc = np.asarray(Th, dtype=float), np.asarray(Tc, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        T = (Th - Tc) / np.log(Th / Tc)
+    T = np.where(np.isfinite(T) & (T > 0), T, 0.5 * (Th + Tc))
+    return float(T) if T.ndim == 0 else T
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    for g in GAZ:
+        pr = proprietes(g, 450.0, 1e6)
+        print(f"{g:>4} : cp={pr['cp']:8.1f} J/kg/K  gamma={pr['gamma']:.3f}  "
+              f"rho={pr['rho']:7.3f} kg/m³  mu={pr['mu']:.3e} Pa.s  k={pr['k']:.4f} W/m/K  "
+              f"Pr={pr['Pr']:.3f}  Z={pr['Z']:.4f}")
+    T = np.random.default_rng(0).uniform(300, 900, 1_000_000)
+    import time
+    t0 = time.perf_counter()
+    proprietes("He", T, 2e6)
+    print(f"10^6 points hélium : {time.perf_counter() - t0:.3f} s")
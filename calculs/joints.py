@@ -1,17 +1,15 @@
 # calculs\joints.py
 
+import functools
 import math
 
-# Tableau résumé joints toriques ISO 3601 (extrait, extensible à volonté)
-JOINTS_TORIQUES_ISO = [
-    {"ref": "OR 10x2", "d_int": 10.0, "section": 2.0, "mat": "NBR"},
-    {"ref": "OR 12x2", "d_int": 12.0, "section": 2.0, "mat": "NBR"},
-    {"ref": "OR 15x2.5", "d_int": 15.0, "section": 2.5, "mat": "NBR"},
-    {"ref": "OR 20x3", "d_int": 20.0, "section": 3.0, "mat": "NBR"},
-    {"ref": "OR 25x3", "d_int": 25.0, "section": 3.0, "mat": "NBR"},
-    {"ref": "OR 30x3", "d_int": 30.0, "section": 3.0, "mat": "NBR"},
-    # ... complète avec des tailles plus petites/grandes si besoin
-]
+import numpy as np
+
+from calculs.catalogue import lignes
+
+# Catalogue des joints toriques (séries ISO 3601-1 classe A et métriques courantes, par
+# matériau) : table « joints » de calculs.catalogue (calculs/data/joints_toriques.csv),
+# chargée à la première recherche.
 
 # Tableau résumé des tolérances ISO (ISO 3601-1:2012, statique/dynamique)
 TOLERANCES = {
@@ -19,40 +17,162 @@ TOLERANCES = {
     "dynamique": {"diam_int": 0.10, "section": 0.06},
 }
 
-def trouve_joint_torique(d_arbre_mm=None, d_alésage_mm=None, tol="dynamique", mat="NBR", clearance=0.1):
+# Critères de montage (fractions) : (mini, maxi, visé) pour l’étirement du diamètre
+# intérieur sur le fond de gorge et l’écrasement radial de la section, remplissage
+# maximal de la gorge (gonflement du matériau).
+CRITERES_MONTAGE = {
+    "dynamique": {"etirement": (0.0, 0.05, 0.02), "ecrasement": (0.10, 0.20, 0.15), "remplissage_max": 0.85},
+    "statique": {"etirement": (0.0, 0.05, 0.02), "ecrasement": (0.15, 0.30, 0.22), "remplissage_max": 0.85},
+}
+RAPPORT_LARGEUR_GORGE = 1.3     # Largeur de gorge recommandée / section
+TOLERANCE_BORNES = 1e-9         # Les bornes des critères sont incluses (arrondis des cotes)
+
+def section_conseillee(d_mm):
+    """Section de tore usuelle (mm) pour un diamètre d’arbre donné, quand l’alésage n’est pas imposé."""
+    if d_mm <= 2.9:
+        return 1.0
+    if d_mm <= 4.9:
+        return 1.5
+    if d_mm <= 7.9:
+        return 2.0
+    if d_mm <= 12:
+        return 2.5
+    if d_mm <= 50:
+        return 3.0
+    if d_mm <= 150:
+        return 5.3
+    return 7.0
+
+def catalogue():
+    """Lignes du catalogue (dicts ref, d_int, section, mat, serie)."""
+    return lignes("joints")
+
+@functools.lru_cache(maxsize=None)
+def index_joints():
+    """
+    Index par matériau : lignes triées par (d_int, section) et colonnes NumPy associées,
+    pour une recherche par dichotomie sur le diamètre intérieur.
+    """
+    index = {}
+    for jt in catalogue():
+        index.setdefault(jt["mat"], []).append(jt)
+    for mat, joints in index.items():
+        joints.sort(key=lambda jt: (jt["d_int"], jt["section"]))
+        index[mat] = {
+            "lignes": tuple(joints),
+            "d_int": np.array([jt["d_int"] for jt in joints]),
+            "section": np.array([jt["section"] for jt in joints]),
+        }
+    return index
+
+def __getattr__(nom):
+    # Compatibilité : l’ancienne table en liste de dicts, construite à la demande
+    if nom == "JOINTS_TORIQUES_ISO":
+        return list(catalogue())
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+def _partition(mat):
+    index = index_joints()
+    mat = mat or "NBR"
+    if mat not in index:
+        raise ValueError(f"Aucun joint torique en {mat} au catalogue (disponibles : {', '.join(sorted(index))}).")
+    return index[mat]
+
+def meilleurs_joints(d_arbre_mm, d_alésage_mm=None, tol="dynamique", mat="NBR", largeur_gorge_mm=None):
     """
-    Sélectionne le joint torique standard le plus adapté, retourne ses cotes normalisées et tolérances.
-    - d_arbre_mm : diamètre arbre (ou diamètre intérieur pour piston)
-    - d_alésage_mm : diamètre alésage (alésage du logement joint sur le cylindre)
+    Meilleur joint du catalogue pour chaque diamètre de fond de gorge (tableau) :
+    - candidats : diamètre intérieur donnant un étirement admissible, trouvés par dichotomie
+      (np.searchsorted) dans la partition du matériau, puis notés ensemble
+    - note : écarts quadratiques réduits à l’étirement et à l’écrasement visés (sans alésage,
+      écart à la section conseillée), remplissage de gorge ≤ remplissage_max
+    Renvoie des tableaux : indice dans index_joints()[mat]["lignes"] (-1 si aucun), etirement,
+    ecrasement, remplissage, score.
+    """
+    partition = _partition(mat)
+    crit = CRITERES_MONTAGE.get(tol, CRITERES_MONTAGE["dynamique"])
+    e_min, e_max, e_vise = crit["etirement"]
+    q_min, q_max, q_vise = crit["ecrasement"]
+    d = np.atleast_1d(np.asarray(d_arbre_mm, dtype=float))
+    alesage = None if d_alésage_mm is None else np.broadcast_to(np.asarray(d_alésage_mm, dtype=float), d.shape)
+
+    eps = TOLERANCE_BORNES
+    debut = np.searchsorted(partition["d_int"], d / (1 + e_max + eps), side="left")
+    fin = np.searchsorted(partition["d_int"], d / (1 + e_min - eps), side="right")
+    largeur = int(np.max(fin - debut, initial=0))
+    indices = debut[:, None] + np.arange(max(largeur, 1))
+    valide = indices < fin[:, None]
+    indices = np.minimum(indices, len(partition["lignes"]) - 1)
+
+    d1, d2 = partition["d_int"][indices], partition["section"][indices]
+    etirement = d[:, None] / d1 - 1
+    d2_monte = d2 / np.sqrt(1 + etirement)          # section réduite par l’étirement (volume constant)
+    if alesage is None:
+        profondeur = d2 * (1 - q_vise)
+        ecrasement = 1 - profondeur / d2_monte
+        conseil = np.array([section_conseillee(x) for x in d])[:, None]
+        ecart_section = ((d2 - conseil) / conseil) ** 2
+    else:
+        profondeur = np.broadcast_to(((alesage - d) / 2)[:, None], d1.shape)
+        ecrasement = 1 - profondeur / d2_monte
+        valide &= (ecrasement >= q_min - eps) & (ecrasement <= q_max + eps)
+        ecart_section = 0.0
+    b = d2 * RAPPORT_LARGEUR_GORGE if largeur_gorge_mm is None else np.asarray(largeur_gorge_mm, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        remplissage = (math.pi / 4 * d2_monte ** 2) / (profondeur * b)
+    valide &= (profondeur > 0) & (remplissage <= crit["remplissage_max"] + eps)
+
+    score = (((etirement - e_vise) / ((e_max - e_min) / 2)) ** 2
+             + ((ecrasement - q_vise) / ((q_max - q_min) / 2)) ** 2 + ecart_section)
+    score = np.where(valide, score, np.inf)
+    choix = np.argmin(score, axis=1)
+    rang = np.arange(d.size)
+    trouve = np.isfinite(score[rang, choix])
+    return {
+        "indice": np.where(trouve, indices[rang, choix], -1),
+        "etirement": np.where(trouve, etirement[rang, choix], np.nan),
+        "ecrasement": np.where(trouve, ecrasement[rang, choix], np.nan),
+        "remplissage": np.where(trouve, remplissage[rang, choix], np.nan),
+        "score": score[rang, choix],
+    }
+
+def trouve_joint_torique(d_arbre_mm=None, d_alésage_mm=None, tol="dynamique", mat="NBR", clearance=0.1,
+                         largeur_gorge_mm=None):
+    """
+    Sélectionne le joint torique standard le mieux noté (cf. meilleurs_joints), retourne ses cotes
+    normalisées, tolérances et conditions de montage.
+    - d_arbre_mm : diamètre arbre (ou fond de gorge pour piston)
+    - d_alésage_mm : diamètre alésage (alésage du logement joint sur le cylindre) ; la gorge
+      rapportée est alors celle de cet alésage (d_alesage, profondeur_gorge). Sans alésage,
+      la gorge recommandée donne l’écrasement visé (d_alesage_recommande, profondeur_gorge_recom).
     - tol : type d’application ("dynamique"=piston/displacer, "statique"=couvercle)
-    - mat : matériau du joint ("NBR", "FKM", "EPDM", "PTFE"…)
+    - mat : matériau du joint ("NBR", "FKM", "EPDM"…)
     - clearance : jeu de fonctionnement visé (mm) (typiquement 0.05 à 0.15 mm)
+    - largeur_gorge_mm : largeur de gorge imposée (sinon RAPPORT_LARGEUR_GORGE x section)
     """
-    # Cherche la référence qui va bien (choix simple : la plus proche sans serrage excessif)
-    joint_ok = None
-    for jt in JOINTS_TORIQUES_ISO:
-        if mat and jt["mat"] != mat:
-            continue
-        if d_arbre_mm and abs(jt["d_int"] - d_arbre_mm) <= 0.2:
-            # Match sur l’arbre
-            joint_ok = jt
-            break
-        if d_alésage_mm and d_arbre_mm and abs((jt["d_int"] + 2 * jt["section"]) - d_alésage_mm) <= 0.3:
-            # Match sur l’alésage
-            joint_ok = jt
-            break
-    if not joint_ok:
+    if not d_arbre_mm or d_arbre_mm <= 0:
+        raise ValueError("Diamètre d’arbre requis pour choisir un joint torique.")
+    res = meilleurs_joints(d_arbre_mm, d_alésage_mm, tol, mat, largeur_gorge_mm)
+    i = int(res["indice"][0])
+    if i < 0:
         raise ValueError("Aucun joint torique standard adapté trouvé. Prends la ref. la plus proche à la main.")
-    
+    joint_ok = _partition(mat)["lignes"][i]
+    crit = CRITERES_MONTAGE.get(tol, CRITERES_MONTAGE["dynamique"])
+
     # Applique les tolérances ISO
     tol_app = TOLERANCES.get(tol, TOLERANCES["dynamique"])
     diam_int_min = joint_ok["d_int"] - tol_app["diam_int"]
     diam_int_max = joint_ok["d_int"] + tol_app["diam_int"]
     section_min = joint_ok["section"] - tol_app["section"]
     section_max = joint_ok["section"] + tol_app["section"]
-    
-    # Calcul du diamètre d’alésage idéal
-    diam_alesage = joint_ok["d_int"] + 2 * joint_ok["section"] + clearance
+
+    if d_alésage_mm:
+        # Gorge imposée par l’alésage : celle sur laquelle écrasement et remplissage sont calculés
+        gorge = {"d_alesage (mm)": d_alésage_mm, "profondeur_gorge (mm)": round((d_alésage_mm - d_arbre_mm) / 2, 3)}
+    else:
+        # Gorge donnant l’écrasement visé, alésage correspondant
+        profondeur = joint_ok["section"] * (1 - crit["ecrasement"][2])
+        gorge = {"d_alesage_recommande (mm)": round(d_arbre_mm + 2 * profondeur, 3),
+                 "profondeur_gorge_recom (mm)": round(profondeur, 2)}
 
     return {
         "ref_joint": joint_ok["ref"],
@@ -62,9 +182,11 @@ def trouve_joint_torique(d_arbre_mm=None, d_alésage_mm=None, tol="dynamique", m
         "diam_ext (mm)": joint_ok["d_int"] + 2 * joint_ok["section"],
         "d_int tol (mm)": (diam_int_min, diam_int_max),
         "section tol (mm)": (section_min, section_max),
-        "d_alesage_recommande (mm)": round(diam_alesage, 3),
-        "largeur_gorge_recom (mm)": round(joint_ok["section"] * 1.1, 2),   # Marge mini
-        "profondeur_gorge_recom (mm)": round(joint_ok["section"] * 0.85, 2),  # Cf. guides standards
+        **gorge,
+        "largeur_gorge_recom (mm)": round(joint_ok["section"] * RAPPORT_LARGEUR_GORGE, 2),
+        "etirement (%)": round(float(res["etirement"][0]) * 100, 2),
+        "ecrasement (%)": round(float(res["ecrasement"][0]) * 100, 2),
+        "remplissage gorge (%)": round(float(res["remplissage"][0]) * 100, 2),
         "type_emploi": tol,
         "clearance": clearance,
     }
@@ -78,7 +200,9 @@ def nb_joints_requis(longueur_mm, pas_joints_mm=10):
 
 # EXEMPLE D’UTILISATION :
 if __name__ == "__main__":
-    # Pour un piston de Ø20 mm dans un cylindre Ø21.8 mm
-    res = trouve_joint_torique(d_arbre_mm=20.0, d_alésage_mm=21.8, tol="dynamique")
+    # Pour un fond de gorge de Ø20 mm dans un cylindre Ø24 mm
+    res = trouve_joint_torique(d_arbre_mm=20.0, d_alésage_mm=24.0, tol="dynamique")
     print("Sélection joint torique :", res)
+    lot = meilleurs_joints(np.linspace(5, 200, 100_000))
+    print("Lot de 100 000 diamètres :", int(np.sum(lot["indice"] >= 0)), "joints trouvés")
     print("Nombre de joints requis sur 30 mm :", nb_joints_requis(30, pas_joints_mm=15))
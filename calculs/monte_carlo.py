@@ -0,0 +1,353 @@
+# calculs/monte_carlo.py
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculs.stirling import DEFAULTS, calcul_complet, calcul_complet_batch
+from calculs.tableaux import BielleArray, CylindreArray, PistonArray
+
+# Paramètres de calcul_complet pouvant recevoir une loi de probabilité
+PARAMETRES_INCERTAINS = ("P", "Th", "Tc", "pm", "f", "eta", "C")
+
+# Sorties suivies (colonnes de calcul_complet_batch et de la chaîne de pièces)
+SORTIES = (
+    "Puissance_effective_W",
+    "Volume_balayé_m3",
+    "Diametre_interne_m",
+    "Course_m",
+    "Epaisseur_min_m",
+    "Masse_cylindre_kg",
+    "Vitesse_piston_m_s",
+    "Masse_cylindre_piece_kg",
+    "Masse_piston_kg",
+    "Masse_bielle_kg",
+    "Masse_totale_kg",
+    "Pression_maxi_admissible_Pa",
+    "Marge_pression",
+)
+
+# Proportions de pièces remplaçables dans chaine_pieces (constantes des modules piston / bielle)
+PROPORTIONS = (
+    "piston.RAPPORT_HAUTEUR_COURSE",
+    "piston.EPAISSEUR_FOND_M",
+    "piston.EPAISSEUR_JUPE_M",
+    "piston.RAPPORT_AXE_DIAMETRE",
+    "piston.RAPPORT_AXE_LONGUEUR",
+    "piston.DENSITE_PISTON",
+    "bielle.RAPPORT_LONGUEUR_COURSE",
+    "bielle.RAPPORT_LARGEUR_DIAMETRE",
+    "bielle.DIVISEUR_EPAISSEUR_CORPS",
+    "bielle.RAPPORT_TETE_DIAMETRE",
+    "bielle.RAPPORT_PIED_DIAMETRE",
+)
+
+PERCENTILES_DEFAUT = (5, 25, 50, 75, 95)
+TAILLE_ESQUISSE = 2048
+
+
+class Loi:
+    """
+    Loi de probabilité d’un paramètre d’entrée (objet picklable, tirage vectorisé).
+    Construite par normale(), uniforme(), triangulaire() ou tolerance().
+    """
+
+    TYPES = ("normale", "uniforme", "triangulaire")
+
+    def __init__(self, type_loi, parametres, nominal, mini=None, maxi=None):
+        if type_loi not in self.TYPES:
+            raise ValueError(f"Loi inconnue : {type_loi} (attendu : {', '.join(self.TYPES)})")
+        self.type = type_loi
+        self.parametres = tuple(float(p) for p in parametres)
+        self.nominal = float(nominal)
+        self.mini = mini
+        self.maxi = maxi
+
+    def tirer(self, rng, n):
+        if self.type == "normale":
+            x = rng.normal(self.parametres[0], self.parametres[1], n)
+        elif self.type == "uniforme":
+            x = rng.uniform(self.parametres[0], self.parametres[1], n)
+        else:
+            x = rng.triangular(*self.parametres, n)
+        if self.mini is not None or self.maxi is not None:
+            x = np.clip(x, self.mini, self.maxi)
+        return x
+
+    def __repr__(self):
+        return f"Loi({self.type}, {self.parametres}, nominal={self.nominal})"
+
+
+def normale(moyenne, ecart_type, mini=None, maxi=None):
+    """Loi normale, éventuellement écrêtée à [mini, maxi]."""
+    if ecart_type < 0:
+        raise ValueError("L’écart-type doit être positif.")
+    return Loi("normale", (moyenne, ecart_type), moyenne, mini, maxi)
+
+
+def uniforme(mini, maxi):
+    if not mini <= maxi:
+        raise ValueError("Bornes de loi uniforme invalides (mini > maxi).")
+    return Loi("uniforme", (mini, maxi), 0.5 * (mini + maxi))
+
+
+def triangulaire(mini, mode, maxi):
+    if not mini <= mode <= maxi:
+        raise ValueError("Loi triangulaire invalide : mini <= mode <= maxi requis.")
+    return Loi("triangulaire", (mini, mode, maxi), mode)
+
+
+def tolerance(nominal, ecart, nb_sigma=3.0):
+    """
+    Cote tolérancée nominal ± ecart : loi normale centrée de ±ecart = ±nb_sigma écarts-types,
+    écrêtée à l’intervalle de tolérance (pièces hors tolérance rebutées au contrôle).
+    """
+    ecart = abs(float(ecart))
+    return Loi("normale", (nominal, ecart / nb_sigma), nominal, nominal - ecart, nominal + ecart)
+
+
+class StatistiquesFlux:
+    """
+    Statistiques incrémentales d’une grandeur, alimentées par blocs :
+    - moyenne / variance par l’algorithme de Welford, fusion de blocs par la formule de Chan ;
+    - quantiles par une esquisse fusionnable de taille bornée (centroïdes de poids égaux),
+      mise à jour par blocs vectorisés.
+    Les valeurs non finies sont comptées à part (invalides) et ignorées.
+    La mémoire utilisée ne dépend pas du nombre d’échantillons.
+    """
+
+    def __init__(self, taille_esquisse=TAILLE_ESQUISSE):
+        self.taille_esquisse = int(taille_esquisse)
+        self.n = 0
+        self.invalides = 0
+        self.moyenne = 0.0
+        self.m2 = 0.0
+        self.mini = math.inf
+        self.maxi = -math.inf
+        self._valeurs = np.empty(0)
+        self._poids = np.empty(0)
+
+    def ajouter(self, x):
+        """Ajoute un bloc d’échantillons (tableau 1-D)."""
+        x = np.asarray(x, dtype=float).ravel()
+        finis = np.isfinite(x)
+        self.invalides += int(x.size - np.count_nonzero(finis))
+        x = x[finis]
+        if x.size == 0:
+            return self
+        bloc = StatistiquesFlux(self.taille_esquisse)
+        bloc.n = int(x.size)
+        bloc.moyenne = float(x.mean())
+        bloc.m2 = float(np.sum((x - bloc.moyenne) ** 2))
+        bloc.mini, bloc.maxi = float(x.min()), float(x.max())
+        bloc._valeurs, bloc._poids = self._compresser(np.sort(x), np.ones(x.size))
+        return self.fusionner(bloc)
+
+    def fusionner(self, autre):
+        """Fusionne les statistiques d’un autre flux (autre bloc, autre processus)."""
+        self.invalides += autre.invalides
+        if autre.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.moyenne, self.m2 = autre.n, autre.moyenne, autre.m2
+            self.mini, self.maxi = autre.mini, autre.maxi
+            self._valeurs, self._poids = autre._valeurs.copy(), autre._poids.copy()
+            return self
+        n = self.n + autre.n
+        delta = autre.moyenne - self.moyenne
+        self.moyenne += delta * autre.n / n
+        self.m2 += autre.m2 + delta ** 2 * self.n * autre.n / n
+        self.n = n
+        self.mini = min(self.mini, autre.mini)
+        self.maxi = max(self.maxi, autre.maxi)
+        valeurs = np.concatenate([self._valeurs, autre._valeurs])
+        poids = np.concatenate([self._poids, autre._poids])
+        ordre = np.argsort(valeurs, kind="stable")
+        self._valeurs, self._poids = self._compresser(valeurs[ordre], poids[ordre])
+        return self
+
+    def _compresser(self, valeurs, poids):
+        """Regroupe des centroïdes triés en au plus `taille_esquisse` centroïdes de poids égaux."""
+        if len(valeurs) <= self.taille_esquisse:
+            return valeurs, poids
+        cumul = np.cumsum(poids)
+        total = cumul[-1]
+        groupe = np.minimum(((cumul - 0.5 * poids) / total * self.taille_esquisse).astype(np.int64),
+                            self.taille_esquisse - 1)
+        debuts = np.flatnonzero(np.r_[True, groupe[1:] != groupe[:-1]])
+        p = np.add.reduceat(poids, debuts)
+        v = np.add.reduceat(valeurs * poids, debuts) / p
+        return v, p
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def ecart_type(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        """Quantile(s) approché(s), q dans [0, 1]."""
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else math.nan
+        cumul = np.cumsum(self._poids)
+        positions = (cumul - 0.5 * self._poids) / cumul[-1]
+        x = np.r_[0.0, positions, 1.0]
+        y = np.r_[self.mini, self._valeurs, self.maxi]
+        res = np.interp(q, x, y)
+        return float(res) if np.ndim(res) == 0 else res
+
+    def resume(self, percentiles=PERCENTILES_DEFAUT):
+        res = {
+            "n": self.n,
+            "invalides": self.invalides,
+            "moyenne": self.moyenne if self.n else math.nan,
+            "ecart_type": self.ecart_type,
+            "min": self.mini if self.n else math.nan,
+            "max": self.maxi if self.n else math.nan,
+        }
+        quantiles = self.quantile(np.asarray(percentiles, dtype=float) / 100)
+        for p, v in zip(percentiles, np.atleast_1d(quantiles)):
+            res[f"p{p:g}"] = float(v)
+        return res
+
+    def __repr__(self):
+        return f"StatistiquesFlux(n={self.n}, moyenne={self.moyenne:.6g}, ecart_type={self.ecart_type:.6g})"
+
+
+def chaine_pieces(res, epaisseur_cylindre_m=0.003, nb_vis=6, dim_vis_iso="M6", entraxe_vis_pct=0.85,
+                  proportions=None):
+    """
+    Chaîne de pièces vectorisée à partir des colonnes de calcul_complet_batch (collections
+    de calculs.tableaux), équivalente à CylindreStirling.depuis_calcul_complet ->
+    PistonStirling.depuis_cylindre -> bielle_depuis_stirling.
+    - proportions : {"piston.RAPPORT_...": valeur, "bielle.RAPPORT_...": valeur} remplaçant les
+      constantes des modules piston / bielle (scalaires ou colonnes, cf. PROPORTIONS)
+    Renvoie masses des pièces (kg) et pression maxi admissible par la visserie du fond (Pa).
+    """
+    proportions = proportions or {}
+    par_module = {module: {cle.split(".", 1)[1]: v for cle, v in proportions.items() if cle.startswith(module + ".")}
+                  for module in ("piston", "bielle")}
+    cylindres = CylindreArray.depuis_calcul_complet(res, epaisseur_m=epaisseur_cylindre_m, nb_vis=nb_vis,
+                                                    dim_vis_iso=dim_vis_iso, entraxe_vis_pct=entraxe_vis_pct)
+    pistons = PistonArray.depuis_cylindres(cylindres, par_module["piston"])
+    bielles = BielleArray.depuis_stirling(res, par_module["bielle"])
+    masse_cyl, masse_piston, masse_bielle = cylindres.masse, pistons.masse, bielles.masse
+    p_adm = cylindres.pression_maxi_admissible
+
+    return {
+        "Masse_cylindre_piece_kg": masse_cyl,
+        "Masse_piston_kg": masse_piston,
+        "Masse_bielle_kg": masse_bielle,
+        "Masse_totale_kg": masse_cyl + masse_piston + masse_bielle,
+        "Pression_maxi_admissible_Pa": p_adm,
+    }
+
+
+def _puissance_effective(Vs_nominal, Nc, pm, f, Th, Tc, eta):
+    """Puissance délivrée par la géométrie nominale dans les conditions tirées (cf. puissance_stirling)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dT = (Th - Tc) / Th
+        eta_c = np.where(eta > 1, eta / 100, eta)
+        P = Nc * pm * Vs_nominal * f * dT * eta_c
+    return np.where((np.abs(Th - Tc) < 1e-8) | (Th <= 0) | (Tc < 0), 0.0, P)
+
+
+def _evaluer_bloc(args):
+    """Tire et évalue un bloc d’échantillons ; renvoie les statistiques partielles."""
+    graine, n, lois, fixes, options, Vs_nominal, taille_esquisse = args
+    rng = np.random.default_rng(graine)
+    entrees = dict(fixes)
+    for nom, loi in lois.items():
+        entrees[nom] = loi.tirer(rng, n)
+    res = calcul_complet_batch(**entrees)
+    res.update(chaine_pieces(res, **options))
+    res["Puissance_effective_W"] = _puissance_effective(
+        Vs_nominal, res["Nb_cylindres"], res["Pression_Pa"], res["Frequence_Hz"],
+        res["Temp_chaud_C"] + 273.15, res["Temp_froid_C"] + 273.15, res["Rendement"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        res["Marge_pression"] = res["Pression_maxi_admissible_Pa"] / res["Pression_Pa"]
+    return {nom: StatistiquesFlux(taille_esquisse).ajouter(res[nom]) for nom in SORTIES}
+
+
+def propager(P, lois=None, n=1_000_000, taille_bloc=200_000, graine=None, percentiles=PERCENTILES_DEFAUT,
+             Nc=None, gaz="Air", materiau="Acier", max_workers=1, taille_esquisse=TAILLE_ESQUISSE,
+             **options_pieces):
+    """
+    Propagation d’incertitudes par Monte Carlo sur la chaîne calcul_complet -> pièces.
+    - P : puissance visée ; lois : {paramètre: Loi ou valeur fixe} parmi PARAMETRES_INCERTAINS
+    - n : nombre d’échantillons, tirés et évalués par blocs de `taille_bloc` (calcul_complet_batch)
+    - graine : reproductibilité ; chaque bloc a son propre flux aléatoire (SeedSequence.spawn),
+      le résultat ne dépend donc pas de max_workers
+    - options_pieces : epaisseur_cylindre_m, nb_vis, dim_vis_iso, entraxe_vis_pct (cf. chaine_pieces)
+    Les dimensions sont recalculées pour chaque tirage (dimensionnement sous incertitude) ;
+    Puissance_effective_W est la puissance délivrée par la géométrie nominale (valeurs nominales
+    des lois) dans les conditions tirées.
+    Aucun échantillon n’est conservé : seules les statistiques incrémentales le sont.
+    Renvoie {sortie: {n, moyenne, ecart_type, min, max, p5, ..., p95}} et les métadonnées.
+    """
+    lois = dict(lois or {})
+    inconnus = set(lois) - set(PARAMETRES_INCERTAINS)
+    if inconnus:
+        raise ValueError(f"Paramètres incertains inconnus : {sorted(inconnus)}")
+    if n <= 0 or taille_bloc <= 0:
+        raise ValueError("n et taille_bloc doivent être strictement positifs.")
+    fixes = {"P": P, "Nc": Nc, "gaz": gaz, "materiau": materiau}
+    aleatoires = {}
+    for nom, loi in lois.items():
+        if isinstance(loi, Loi):
+            aleatoires[nom] = loi
+        else:
+            fixes[nom] = loi
+
+    nominal = dict(fixes)
+    nominal.update({nom: loi.nominal for nom, loi in aleatoires.items()})
+    Vs_nominal = calcul_complet(**nominal)["Volume_balayé_m3"]
+
+    tailles = [min(taille_bloc, n - i) for i in range(0, n, taille_bloc)]
+    graines = np.random.SeedSequence(graine).spawn(len(tailles))
+    taches = [(g, t, aleatoires, fixes, options_pieces, Vs_nominal, taille_esquisse) for g, t in zip(graines, tailles)]
+
+    t0 = time.perf_counter()
+    stats = {nom: StatistiquesFlux(taille_esquisse) for nom in SORTIES}
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(taches) == 1:
+        partiels = map(_evaluer_bloc, taches)
+        for partiel in partiels:
+            for nom in SORTIES:
+                stats[nom].fusionner(partiel[nom])
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for partiel in pool.map(_evaluer_bloc, taches):
+                for nom in SORTIES:
+                    stats[nom].fusionner(partiel[nom])
+    duree = time.perf_counter() - t0
+
+    res = {nom: stats[nom].resume(percentiles) for nom in SORTIES}
+    res["Echantillons"] = n
+    res["Nominal"] = {**nominal, "Volume_balayé_m3": Vs_nominal}
+    res["Duree_s"] = duree
+    res["Debit_echantillons_s"] = n / duree if duree > 0 else math.inf
+    return res
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    res = propager(
+        P=300,
+        lois={
+            "eta": triangulaire(0.15, 0.20, 0.24),
+            "Th": normale(DEFAULTS["Th"], 15.0),
+            "pm": tolerance(1e6, 0.1e6),
+        },
+        n=1_000_000,
+        graine=42,
+    )
+    print(f"{res['Echantillons']} tirages en {res['Duree_s']:.2f} s ({res['Debit_echantillons_s']:.3g} /s)")
+    for nom in ("Puissance_effective_W", "Masse_totale_kg", "Pression_maxi_admissible_Pa"):
+        r = res[nom]
+        print(f"  {nom:28}: p5={r['p5']:.4g}  p50={r['p50']:.4g}  p95={r['p95']:.4g}")
@@ -0,0 +1,407 @@
+# calculs/nodal.py
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculs.gaz import parametres_cycle, temperature_moyenne_log
+from calculs.schmidt import volumes, temperature_regenerateur, TYPES_MOTEUR
+
+# Propriétés du gaz de travail : constante spécifique (J/kg/K), rapport des chaleurs
+# massiques, viscosité de Sutherland (mu0 à T0, constante S) et nombre de Prandtl.
+GAZ_AIR = {"R": 287.05, "gamma": 1.40, "mu0": 1.716e-5, "T0": 273.15, "S": 110.4, "Pr": 0.71}
+
+ECHANGEURS = ("refroidisseur", "regenerateur", "rechauffeur")
+
+# Nombre de pas RK4 par cycle, tolérance de convergence cyclique (K) et nombre maximal de cycles
+NB_PAS_DEFAUT = 72
+TOL_CYCLE_K = 1e-2
+MAX_CYCLES = 50
+
+
+def echangeur(section_m2, diametre_hydraulique_m, longueur_m, surface_mouillee_m2=None):
+    """
+    Géométrie d’un échangeur (ou d’un volume de passage) du modèle nodal.
+    - section_m2 : section libre de passage du gaz
+    - diametre_hydraulique_m : 4 x section / périmètre mouillé
+    - longueur_m : longueur d’écoulement
+    Le volume mort vaut section x longueur ; la surface mouillée par défaut
+    se déduit du diamètre hydraulique (4 x volume / dh).
+    """
+    section = np.asarray(section_m2, dtype=float)
+    dh = np.asarray(diametre_hydraulique_m, dtype=float)
+    longueur = np.asarray(longueur_m, dtype=float)
+    if np.any(section <= 0) or np.any(dh <= 0) or np.any(longueur <= 0):
+        raise ValueError("Section, diamètre hydraulique et longueur d’échangeur doivent être strictement positifs.")
+    volume = section * longueur
+    surface = 4 * volume / dh if surface_mouillee_m2 is None else np.asarray(surface_mouillee_m2, dtype=float)
+    return {"section": section, "dh": dh, "longueur": longueur, "volume": volume, "surface": surface}
+
+
+def viscosite(T, gaz=GAZ_AIR):
+    """Viscosité dynamique (Pa.s), loi de Sutherland."""
+    T0, S = gaz["T0"], gaz["S"]
+    return gaz["mu0"] * (T / T0) ** 1.5 * (T0 + S) / (T + S)
+
+
+def _perte_de_charge(debit, p, T, ech, R, gaz):
+    """
+    Perte de charge (Pa, en valeur absolue) d’un échangeur traversé par `debit` (kg/s),
+    corrélation « Simple » d’Urieli : f.Re = max(16, 0.0791 Re^0.75).
+    Renvoie (dp, Re, fRe).
+    """
+    mu = viscosite(T, gaz)
+    rho = p / (R * T)
+    u = np.abs(debit) / (rho * ech["section"])
+    Re = np.abs(debit) * ech["dh"] / (ech["section"] * mu)
+    fRe = np.maximum(16.0, 0.0791 * Re ** 0.75)
+    dp = 2 * fRe * mu * u * ech["longueur"] / ech["dh"] ** 2
+    return dp, Re, fRe
+
+
+def simuler(Vse, Vsc, Th, Tc, pm, echangeurs, f=25.0, Nc=1, phase=math.pi / 2, Vde=0.0, Vdc=0.0,
+            type_moteur="gamma", gaz=None, efficacite_regenerateur=None,
+            nb_pas=NB_PAS_DEFAUT, tol=TOL_CYCLE_K, max_cycles=MAX_CYCLES):
+    """
+    Modèle nodal du 3e ordre : cinq espaces en série
+    compression (adiabatique) / refroidisseur / régénérateur / réchauffeur / détente (adiabatique),
+    analyse adiabatique idéale d’Urieli & Berchowitz complétée par les pertes « Simple »
+    (pertes de charge dans les échangeurs, efficacité finie du régénérateur).
+    - Vse, Vsc : volumes balayés détente / compression (m³) ; Vde, Vdc : volumes morts (m³, > 0)
+    - Th, Tc : températures de paroi du réchauffeur / refroidisseur (K) ; pm : pression moyenne (Pa)
+    - echangeurs : {"refroidisseur", "regenerateur", "rechauffeur"} -> dict de `echangeur`
+    - gaz : propriétés du gaz (GAZ_AIR par défaut ; R, gamma et Pr scalaires ou par design),
+      ou nom d’un gaz de calculs.gaz dont les constantes sont prises, design par design,
+      à la température moyenne logarithmique et à pm
+    - efficacite_regenerateur : imposée, ou None pour la déduire du NTU (analogie de Reynolds)
+    Les températures des espaces adiabatiques sont intégrées par RK4 à pas fixe (nb_pas
+    par cycle), vectorisé sur les designs, jusqu’au régime cyclique établi (écart de
+    température sur un cycle < tol K). Chaque paramètre peut être un tableau 1-D.
+    """
+    entrees = [Vse, Vsc, Th, Tc, pm, f, Nc, phase, Vde, Vdc]
+    geometrie = [echangeurs[nom][cle] for nom in ECHANGEURS for cle in ("section", "dh", "longueur", "volume", "surface")]
+    scalaire = all(np.ndim(x) == 0 for x in entrees + geometrie) and np.ndim(efficacite_regenerateur) == 0
+    if type_moteur not in TYPES_MOTEUR:
+        raise ValueError(f"Type de moteur inconnu : {type_moteur} (attendu : {', '.join(TYPES_MOTEUR)})")
+    diffuses = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in entrees + geometrie])
+    n = max(1, diffuses[0].size)
+    Vse, Vsc, Th, Tc, pm, f, Nc, phase, Vde, Vdc = (np.ravel(x).copy() for x in diffuses[:10])
+    ech = {}
+    for i, nom in enumerate(ECHANGEURS):
+        valeurs = diffuses[10 + 5 * i:15 + 5 * i]
+        ech[nom] = dict(zip(("section", "dh", "longueur", "volume", "surface"), (np.ravel(v) for v in valeurs)))
+    if np.any(Th <= 0) or np.any(Tc <= 0):
+        raise ValueError("Les températures Th et Tc doivent être strictement positives (K).")
+    if np.any(Vde <= 0) or np.any(Vdc <= 0):
+        raise ValueError("Les volumes morts Vde et Vdc doivent être strictement positifs (espaces adiabatiques).")
+    if np.any(pm <= 0) or np.any(Vse < 0) or np.any(Vsc < 0):
+        raise ValueError("Volumes balayés positifs et pression moyenne strictement positive requis.")
+    if isinstance(gaz, str):
+        gaz = parametres_cycle(gaz, temperature_moyenne_log(Th, Tc), pm)
+    gaz = dict(GAZ_AIR, **(gaz or {}))
+    R, g, Pr = (np.broadcast_to(np.asarray(gaz[cle], dtype=float), (n,)) for cle in ("R", "gamma", "Pr"))
+
+    Tk, Th_ = Tc, Th
+    Tr = temperature_regenerateur(Th, Tc)
+    Vk, Vr, Vh = ech["refroidisseur"]["volume"], ech["regenerateur"]["volume"], ech["rechauffeur"]["volume"]
+    Vmort = Vk / Tk + Vr / Tr + Vh / Th_
+
+    # Volumes aux demi-pas, calculés une fois : colonnes 0, 1, ..., 2.nb_pas
+    h = 2 * math.pi / nb_pas
+    theta_demi = np.arange(2 * nb_pas + 1) * (h / 2)
+    col = lambda x: x[:, None]
+    Ve_t, Vc_t, dVe_t, dVc_t = (
+        np.broadcast_to(v, (n, len(theta_demi)))
+        for v in volumes(theta_demi, col(Vse), col(Vsc), col(phase), col(Vde), col(Vdc), type_moteur)
+    )
+    # Masse de gaz (x R) arbitraire : le modèle adiabatique est linéaire en M, on remet
+    # ensuite la pression moyenne à pm.
+    MR = pm * (np.mean(Vc_t / Tk[:, None] + Ve_t / Th_[:, None], axis=1) + Vmort)
+
+    _, Q, Qr_trace, traces, Tce_trace, cycles, converge = _integrer(
+        (Vc_t, Ve_t, dVc_t, dVe_t), MR, Tk, Tr, Th_, Vk, Vr, Vh, g, nb_pas, tol, max_cycles)
+
+    # Remise à l’échelle : pression moyenne = pm
+    p = traces[0]
+    facteur = pm / p.mean(axis=1)
+    p = p * facteur[:, None]
+    Qk, Qr, Qh, Wc, We = Q * facteur
+    Qr_trace = Qr_trace * facteur[:, None]
+    W = Wc + We
+    omega = 2 * math.pi * f
+    # Débits massiques réels (kg/s) au milieu de chaque échangeur
+    mck, mkr, mrh, mhe = (traces[k] * facteur[:, None] / R[:, None] * omega[:, None] for k in range(1, 5))
+    debits = {
+        "refroidisseur": (0.5 * (mck + mkr), Tk),
+        "regenerateur": (0.5 * (mkr + mrh), Tr),
+        "rechauffeur": (0.5 * (mrh + mhe), Th_),
+    }
+    pertes = {}
+    dp_total = np.zeros_like(p)
+    for nom, (debit, T) in debits.items():
+        geometrie_col = {cle: v[:, None] for cle, v in ech[nom].items()}
+        dp, Re, _ = _perte_de_charge(debit, p, T[:, None], geometrie_col, R[:, None], gaz)
+        dp_total += dp
+        # Puissance dissipée = dp x débit volumique, intégrée sur le cycle (J)
+        pertes[nom] = np.sum(dp * np.abs(debit) * R[:, None] * T[:, None] / p, axis=1) * h / omega
+        if nom == "regenerateur":
+            Re_r = Re
+    W_pertes = sum(pertes.values())
+
+    if efficacite_regenerateur is None:
+        # Analogie de Reynolds (Urieli) : St = f.Re / (2 Re Pr), NTU = St.Aw / (2 A)
+        Re_moy = np.mean(Re_r, axis=1)
+        fRe_moy = np.maximum(16.0, 0.0791 * Re_moy ** 0.75)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            St = np.where(Re_moy > 0, fRe_moy / (2 * Re_moy * Pr), 0.0)
+        ntu = St * ech["regenerateur"]["surface"] / (2 * ech["regenerateur"]["section"])
+        efficacite = ntu / (1 + ntu)
+    else:
+        efficacite = np.broadcast_to(np.asarray(efficacite_regenerateur, dtype=float), (n,))
+    Q_perte_reg = (1 - efficacite) * (Qr_trace.max(axis=1) - Qr_trace.min(axis=1))
+
+    W_net = W - W_pertes
+    Q_chaud = Qh + Q_perte_reg
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rendement_ideal = np.where(Qh > 0, W / Qh, 0.0)
+        rendement = np.where(Q_chaud > 0, W_net / Q_chaud, 0.0)
+
+    theta = np.arange(nb_pas) * h
+    res = {
+        "theta": theta,
+        "Pression_Pa": p,
+        "Temperature_compression_K": Tce_trace[0],
+        "Temperature_detente_K": Tce_trace[1],
+        "Pression_max_Pa": p.max(axis=1),
+        "Pression_min_Pa": p.min(axis=1),
+        "Perte_charge_max_Pa": dp_total.max(axis=1),
+        "Travail_compression_J": Wc,
+        "Travail_detente_J": We,
+        "Travail_indique_J": W,
+        "Pertes_charge_J": W_pertes,
+        "Pertes_charge_refroidisseur_J": pertes["refroidisseur"],
+        "Pertes_charge_regenerateur_J": pertes["regenerateur"],
+        "Pertes_charge_rechauffeur_J": pertes["rechauffeur"],
+        "Travail_net_J": W_net,
+        "Chaleur_refroidisseur_J": Qk,
+        "Chaleur_regenerateur_J": Qr,
+        "Chaleur_rechauffeur_J": Qh,
+        "Perte_regenerateur_J": Q_perte_reg,
+        "Efficacite_regenerateur": efficacite,
+        "Puissance_indiquee_W": W * f * Nc,
+        "Pertes_charge_W": W_pertes * f * Nc,
+        "Puissance_nette_W": W_net * f * Nc,
+        "Flux_chaud_W": Q_chaud * f * Nc,
+        "Rendement_ideal": rendement_ideal,
+        "Rendement": rendement,
+        "Masse_gaz_kg": MR * facteur / R,
+        "Cycles": cycles,
+        "Converge": converge,
+    }
+    if scalaire:
+        for cle in ("Pression_Pa", "Temperature_compression_K", "Temperature_detente_K"):
+            res[cle] = res[cle][0]
+        for cle, val in res.items():
+            if cle != "theta" and np.ndim(val) == 1 and len(val) == 1:
+                res[cle] = val[0].item()
+    return res
+
+
+def _integrer(tables, MR, Tk, Tr, Th, Vk, Vr, Vh, g, nb_pas, tol, max_cycles):
+    """
+    Intégration RK4 à pas fixe du modèle adiabatique idéal, cycle après cycle, jusqu’au
+    régime cyclique établi. Le même code opère sur des tableaux (lot de designs) ou, pour
+    un design isolé, sur des flottants Python (le surcoût par opération NumPy domine alors).
+    Les températures de début de cycle sont extrapolées (Δ² d’Aitken) dès que trois cycles
+    successifs sont disponibles, ce qui divise par deux environ le nombre de cycles.
+    Renvoie l’état final, les intégrales (Qk, Qr, Qh, Wc, We) du dernier cycle et les traces.
+    """
+    n = len(MR)
+    h = 2 * math.pi / nb_pas
+    Vmort = Vk / Tk + Vr / Tr + Vh / Th
+    if n == 1:
+        Vc_t, Ve_t, dVc_t, dVe_t = (t[0].tolist() for t in tables)
+        MR, Tk, Tr, Th, Vk, Vr, Vh, Vmort, g = (float(x[0]) for x in (MR, Tk, Tr, Th, Vk, Vr, Vh, Vmort, g))
+    else:
+        Vc_t, Ve_t, dVc_t, dVe_t = (list(np.ascontiguousarray(t.T)) for t in tables)
+    cv, cp = 1 / (g - 1), g / (g - 1)  # rapportés à R
+    VkT, VrT, VhT = Vk / Tk, Vr / Tr, Vh / Th
+    sens = [1.0, 1.0]
+
+    def derivees(Tc, Te, j):
+        Vc, Ve, dVc, dVe = Vc_t[j], Ve_t[j], dVc_t[j], dVe_t[j]
+        p = MR / (Vc / Tc + Vmort + Ve / Te)
+        # Températures conditionnelles aux interfaces, selon le sens d’écoulement
+        Tck = Tk + (Tc - Tk) * (sens[0] > 0)
+        The = Te + (Th - Te) * (sens[1] > 0)
+        dp = -g * p * (dVc / Tck + dVe / The) / (Vc / Tck + g * Vmort + Ve / The)
+        # Débits massiques (x R) : c->k, k->r, r->h, h->e
+        dmc = (p * dVc + Vc * dp / g) / Tck
+        dme = (p * dVe + Ve * dp / g) / The
+        mck = -dmc
+        mkr = mck - VkT * dp
+        mrh = mkr - VrT * dp
+        mhe = mrh - VhT * dp
+        sens[0], sens[1] = mck, mhe
+        dTc = Tc * (dp / p + dVc / Vc - dmc * Tc / (p * Vc))
+        dTe = Te * (dp / p + dVe / Ve - dme * Te / (p * Ve))
+        dQ = (
+            Vk * dp * cv - cp * (Tck * mck - Tk * mkr),
+            Vr * dp * cv - cp * (Tk * mkr - Th * mrh),
+            Vh * dp * cv - cp * (Th * mrh - The * mhe),
+            p * dVc,
+            p * dVe,
+        )
+        return dTc, dTe, dQ, (p, mck, mkr, mrh, mhe)
+
+    Tc, Te = Tk, Th
+    historique = []
+    converge = np.zeros(n, dtype=bool)
+    cycles = np.zeros(n, dtype=np.int64)
+    h2, h6 = 0.5 * h, h / 6
+    for cycle in range(1, max_cycles + 1):
+        Tc0, Te0 = Tc, Te
+        Q = (0.0 if n == 1 else np.zeros(n),) * 5
+        Qr_trace, traces, Tce_trace = [], [], []
+        for i in range(nb_pas):
+            Qr_trace.append(Q[1])
+            Tce_trace.append((Tc, Te))
+            a1, b1, q1, etat = derivees(Tc, Te, 2 * i)
+            traces.append(etat)
+            a2, b2, q2, _ = derivees(Tc + h2 * a1, Te + h2 * b1, 2 * i + 1)
+            a3, b3, q3, _ = derivees(Tc + h2 * a2, Te + h2 * b2, 2 * i + 1)
+            a4, b4, q4, _ = derivees(Tc + h * a3, Te + h * b3, 2 * i + 2)
+            Tc = Tc + h6 * (a1 + 2 * a2 + 2 * a3 + a4)
+            Te = Te + h6 * (b1 + 2 * b2 + 2 * b3 + b4)
+            Q = tuple(Qi + h6 * (w1 + 2 * w2 + 2 * w3 + w4) for Qi, w1, w2, w3, w4 in zip(Q, q1, q2, q3, q4))
+        ecart = np.maximum(np.abs(np.asarray(Tc - Tc0)), np.abs(np.asarray(Te - Te0))).reshape(n)
+        nouveaux = ~converge & (ecart < tol)
+        cycles[nouveaux] = cycle
+        converge |= nouveaux
+        if converge.all():
+            break
+        historique.append((Tc0, Te0))
+        if len(historique) == 2:
+            # Δ² d’Aitken sur (T0, T1, T2), composante par composante
+            (Tc_a, Te_a), (Tc_b, Te_b) = historique
+            Tc, Te = _aitken(Tc_a, Tc_b, Tc), _aitken(Te_a, Te_b, Te)
+            historique = []
+    cycles[~converge] = max_cycles
+
+    forme = lambda x: np.asarray(x, dtype=float).reshape(-1, n)
+    Q = np.asarray(Q, dtype=float).reshape(5, n)
+    Qr_trace = forme(Qr_trace).T
+    traces = np.asarray(traces, dtype=float).reshape(nb_pas, 5, n).transpose(1, 2, 0)
+    Tce_trace = np.asarray(Tce_trace, dtype=float).reshape(nb_pas, 2, n).transpose(1, 2, 0)
+    return (Tc, Te), Q, Qr_trace, traces, Tce_trace, cycles, converge
+
+
+def _aitken(x0, x1, x2):
+    """Extrapolation Δ² d’Aitken d’une suite à convergence linéaire (sans effet si non monotone)."""
+    x0, x1, x2 = (np.asarray(x, dtype=float) for x in (x0, x1, x2))
+    d1, d2 = x1 - x0, x2 - x1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = d2 / d1
+        extrapole = x2 + d2 * rho / (1 - rho)
+    valide = np.isfinite(extrapole) & (rho > 0) & (rho < 0.95)
+    res = np.where(valide, extrapole, x2)
+    return float(res) if res.ndim == 0 else res
+
+
+def _simuler_bloc(arguments):
+    return simuler(**arguments)
+
+
+def simuler_lot(max_workers=None, taille_bloc=256, **arguments):
+    """
+    Lance `simuler` sur un lot de designs réparti entre processus : les designs sont
+    découpés en blocs de `taille_bloc` lignes, chacun intégré vectoriellement.
+    Les arguments sont ceux de `simuler` (tableaux 1-D de même longueur ou scalaires).
+    """
+    echangeurs = arguments["echangeurs"]
+    colonnes = {k: v for k, v in arguments.items() if k != "echangeurs" and np.ndim(v) == 1}
+    for nom in ECHANGEURS:
+        for cle, v in echangeurs[nom].items():
+            if np.ndim(v) == 1:
+                colonnes[(nom, cle)] = v
+    n = max((len(v) for v in colonnes.values()), default=1)
+    debuts = range(0, n, taille_bloc)
+
+    def bloc(i):
+        args = {k: (v[i:i + taille_bloc] if k in colonnes else v) for k, v in arguments.items() if k != "echangeurs"}
+        args["echangeurs"] = {
+            nom: {cle: (v[i:i + taille_bloc] if (nom, cle) in colonnes else v) for cle, v in echangeurs[nom].items()}
+            for nom in ECHANGEURS
+        }
+        return args
+
+    max_workers = max_workers or 1
+    if max_workers == 1 or n <= taille_bloc:
+        resultats = [simuler(**bloc(i)) for i in debuts]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            resultats = list(pool.map(_simuler_bloc, [bloc(i) for i in debuts]))
+    return {
+        k: (resultats[0][k] if k == "theta" else np.concatenate([np.atleast_1d(r[k]) for r in resultats]))
+        for k in resultats[0]
+    }
+
+
+def echangeurs_depuis_pieces(cylindre, displacer, frac_chaud=0.3, frac_froid=0.3):
+    """
+    Échangeurs d’un moteur gamma à déplaceur, le gaz transitant par le jeu annulaire
+    entre l’alésage du cylindre et le déplaceur (diamètre hydraulique = 2 x jeu) :
+    - réchauffeur : zone chaude du cylindre (cylindre.zone_chaude(frac_chaud))
+    - refroidisseur : zone froide du cylindre (cylindre.zone_froide(frac_froid))
+    - régénérateur : reste de la hauteur du déplaceur (au moins 10 %)
+    """
+    jeu = cylindre.rayon - displacer.rayon
+    if jeu <= 0:
+        raise ValueError("Le déplaceur doit être plus petit que l’alésage du cylindre.")
+    section = math.pi * (cylindre.rayon ** 2 - displacer.rayon ** 2)
+    dh = 2 * jeu
+    l_chaud, _ = cylindre.zone_chaude(frac_chaud)
+    l_froid, _ = cylindre.zone_froide(frac_froid)
+    l_reg = max(displacer.hauteur - l_chaud - l_froid, 0.1 * displacer.hauteur)
+    return {
+        "refroidisseur": echangeur(section, dh, l_froid),
+        "regenerateur": echangeur(section, dh, l_reg),
+        "rechauffeur": echangeur(section, dh, l_chaud),
+    }
+
+
+def depuis_pieces(cylindre, displacer, pm, f=25.0, Nc=1, phase=math.pi / 2, course_displacer=None,
+                  jeu_axial_m=0.001, frac_chaud=0.3, frac_froid=0.3, **options):
+    """
+    Modèle nodal d’un moteur gamma construit à partir des pièces (cf. schmidt.depuis_pieces) :
+    volumes balayés du déplaceur et du piston moteur, échangeurs annulaires
+    (echangeurs_depuis_pieces), volumes morts = section x jeu axial en fond de course.
+    """
+    course_d = course_displacer if course_displacer is not None else cylindre.course
+    Vse = math.pi * displacer.rayon ** 2 * course_d
+    Vsc = cylindre.volume_interne
+    Vde = math.pi * displacer.rayon ** 2 * jeu_axial_m
+    Vdc = math.pi * cylindre.rayon ** 2 * jeu_axial_m
+    echangeurs = echangeurs_depuis_pieces(cylindre, displacer, frac_chaud, frac_froid)
+    return simuler(Vse, Vsc, cylindre.Th, cylindre.Tc, pm, echangeurs, f=f, Nc=Nc, phase=phase,
+                   Vde=Vde, Vdc=Vdc, type_moteur="gamma", **options)
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.cylindre import CylindreStirling
+    from calculs.displacer import DisplacerStirling
+
+    cyl = CylindreStirling(diametre_m=0.04, course_m=0.03, epaisseur_m=0.004, matiere="Acier",
+                           densite_kg_m3=7850, rugosite_um=0.8, etat_surface="Usinage fin",
+                           Tc=300, Th=850, nb_vis=6, dim_vis_iso="M6", entraxe_vis_pct=0.85,
+                           limite_rupture_MPa=700)
+    disp = DisplacerStirling(diametre_m=0.038, hauteur_m=0.05)
+    t0 = time.perf_counter()
+    res = depuis_pieces(cyl, disp, pm=1e6, f=25)
+    print(f"Convergence en {res['Cycles']} cycles, {1000 * (time.perf_counter() - t0):.1f} ms")
+    for cle in ("Puissance_indiquee_W", "Pertes_charge_W", "Puissance_nette_W", "Rendement_ideal",
+                "Rendement", "Efficacite_regenerateur", "Perte_charge_max_Pa"):
+        print(f"  {cle:26}: {res[cle]:.4g}")
@@ -0,0 +1,299 @@
+# calculs/pareto.py
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculs.balayage import evaluer_en_parallele
+from calculs.stirling import MATERIAUX
+
+# Nombres de cylindres candidats : couvrent toutes les architectures de archi_conseillee
+NC_CANDIDATS = tuple(range(1, 13))
+
+# Bornes par défaut des variables continues (paramètres de calcul_complet)
+BORNES_DEFAUT = {
+    "pm": (2e5, 5e6),
+    "f": (5.0, 60.0),
+    "C": (0.005, 0.08),
+}
+VARIABLES_CONTINUES = ("Th", "Tc", "pm", "f", "eta", "C")
+
+# Objectifs : clé de résultat de calcul_complet -> sens (+1 minimiser, -1 maximiser)
+OBJECTIFS_DEFAUT = {
+    "Puissance_specifique_W_kg": -1,
+    "Masse_cylindre_kg": +1,
+    "Epaisseur_min_m": +1,
+    "Vitesse_piston_m_s": +1,
+}
+
+# Paramètres des opérateurs génétiques (NSGA-II, Deb et al. 2002)
+PROBA_CROISEMENT = 0.9
+ETA_CROISEMENT = 15.0
+ETA_MUTATION = 20.0
+
+
+def tri_non_domine(F):
+    """
+    Rang de Pareto de chaque ligne de F (objectifs à minimiser, forme (n, m)).
+    Rang 0 = front non dominé. Les NaN sont traités comme +inf.
+    La matrice de dominance est construite objectif par objectif (n x n),
+    puis les fronts sont retirés successivement.
+    """
+    F = np.asarray(F, dtype=float)
+    F = np.where(np.isnan(F), np.inf, F)
+    n, m = F.shape
+    inf_ou_egal = np.ones((n, n), dtype=bool)
+    strict = np.zeros((n, n), dtype=bool)
+    for k in range(m):
+        colonne = F[:, k]
+        inf_ou_egal &= colonne[:, None] <= colonne[None, :]
+        strict |= colonne[:, None] < colonne[None, :]
+    domine = (inf_ou_egal & strict).astype(np.float32)  # domine[i, j] : i domine j
+    nb_dominants = domine.sum(axis=0)
+    rangs = np.full(n, -1, dtype=np.int64)
+    restant = np.ones(n, dtype=bool)
+    rang = 0
+    while restant.any():
+        front = restant & (nb_dominants == 0)
+        rangs[front] = rang
+        restant &= ~front
+        nb_dominants -= front.astype(np.float32) @ domine
+        rang += 1
+    return rangs
+
+
+def distance_encombrement(F, rangs):
+    """
+    Distance d’encombrement (crowding distance) de chaque ligne au sein de son front.
+    Les extrémités de chaque front reçoivent une distance infinie.
+    """
+    F = np.asarray(F, dtype=float)
+    n, m = F.shape
+    distance = np.zeros(n)
+    if n == 0:
+        return distance
+    for k in range(m):
+        ordre = np.lexsort((F[:, k], rangs))
+        valeurs = F[ordre, k]
+        r = rangs[ordre]
+        debut = np.r_[True, r[1:] != r[:-1]]
+        fin = np.r_[r[1:] != r[:-1], True]
+        groupes = np.cumsum(debut) - 1
+        idx_debut = np.flatnonzero(debut)
+        idx_fin = np.flatnonzero(fin)
+        with np.errstate(invalid="ignore"):
+            etendue = (valeurs[idx_fin] - valeurs[idx_debut])[groupes]
+            contrib = np.zeros(n)
+            contrib[1:-1] = (valeurs[2:] - valeurs[:-2]) / np.where(etendue[1:-1] > 0, etendue[1:-1], np.inf)
+        contrib = np.nan_to_num(contrib, nan=0.0)
+        contrib[debut | fin] = np.inf
+        distance[ordre] += contrib
+    return distance
+
+
+def _selection_tournoi(rangs, distance, nb, rng):
+    """Tournoi binaire : rang le plus faible, puis distance d’encombrement la plus grande."""
+    a = rng.integers(0, len(rangs), nb)
+    b = rng.integers(0, len(rangs), nb)
+    meilleur_b = (rangs[b] < rangs[a]) | ((rangs[b] == rangs[a]) & (distance[b] > distance[a]))
+    return np.where(meilleur_b, b, a)
+
+
+def _croisement_sbx(p1, p2, rng, eta=ETA_CROISEMENT, proba=PROBA_CROISEMENT):
+    """Croisement binaire simulé (SBX) sur des variables normalisées dans [0, 1]."""
+    u = rng.random(p1.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (eta + 1)), (1 / (2 * (1 - u))) ** (1 / (eta + 1)))
+    actif = (rng.random((len(p1), 1)) < proba) & (rng.random(p1.shape) < 0.5)
+    beta = np.where(actif, beta, 1.0)
+    e1 = 0.5 * ((1 + beta) * p1 + (1 - beta) * p2)
+    e2 = 0.5 * ((1 - beta) * p1 + (1 + beta) * p2)
+    return np.clip(e1, 0.0, 1.0), np.clip(e2, 0.0, 1.0)
+
+
+def _mutation_polynomiale(x, rng, proba, eta=ETA_MUTATION):
+    """Mutation polynomiale bornée sur des variables normalisées dans [0, 1]."""
+    u = rng.random(x.shape)
+    delta = np.where(u < 0.5, (2 * u) ** (1 / (eta + 1)) - 1, 1 - (2 * (1 - u)) ** (1 / (eta + 1)))
+    mute = rng.random(x.shape) < proba
+    return np.clip(x + np.where(mute, delta, 0.0), 0.0, 1.0)
+
+
+def _variation(X, K, cardinalites, parents, rng):
+    """Enfants d’une liste de parents : SBX + mutation polynomiale (continues),
+    croisement uniforme + réinitialisation aléatoire (discrètes)."""
+    nb_var = X.shape[1] + K.shape[1]
+    proba_mut = 1.0 / nb_var
+    i1, i2 = parents[0::2], parents[1::2]
+    x1, x2 = _croisement_sbx(X[i1], X[i2], rng)
+    X_enf = _mutation_polynomiale(np.concatenate([x1, x2]), rng, proba_mut)
+
+    echange = rng.random(K[i1].shape) < 0.5
+    k1 = np.where(echange, K[i2], K[i1])
+    k2 = np.where(echange, K[i1], K[i2])
+    K_enf = np.concatenate([k1, k2])
+    reinit = rng.random(K_enf.shape) < proba_mut
+    tirage = (rng.random(K_enf.shape) * cardinalites).astype(np.int64)
+    K_enf = np.where(reinit, tirage, K_enf)
+    return X_enf, K_enf
+
+
+def optimiser(P, bornes=None, materiaux=None, nc_candidats=NC_CANDIDATS, objectifs=None,
+              fixes=None, taille_population=200, generations=500, max_evaluations=None,
+              graine=None, patience=25, tol=1e-4, max_workers=1, taille_bloc=None, rappel=None):
+    """
+    Optimisation multi-objectif (NSGA-II) d’un moteur de puissance P.
+    - bornes : {paramètre: (min, max)} des variables continues parmi VARIABLES_CONTINUES
+      (BORNES_DEFAUT par défaut)
+    - materiaux : matériaux candidats (clés de MATERIAUX, tous par défaut)
+    - nc_candidats : nombres de cylindres candidats (toutes les architectures par défaut)
+    - objectifs : {clé de résultat: +1 minimiser / -1 maximiser} (OBJECTIFS_DEFAUT)
+    - fixes : autres paramètres de calcul_complet imposés (ex. {"Th": 700, "gaz": "Hélium"})
+    - graine : graine du générateur aléatoire (résultats reproductibles)
+    - patience, tol : arrêt anticipé quand le point idéal du front (meilleure valeur de
+      chaque objectif) progresse de moins de `tol` (relatif à l’étendue de la population
+      initiale) pendant `patience` générations (patience=None le désactive)
+    - max_workers > 1 : évaluation des populations sur un pool de processus
+    Chaque génération est évaluée en un seul lot (calcul_complet_batch).
+    Renvoie le front non dominé final : entrées, objectifs et colonnes de résultats.
+    """
+    bornes = dict(BORNES_DEFAUT if bornes is None else bornes)
+    inconnues = set(bornes) - set(VARIABLES_CONTINUES)
+    if inconnues:
+        raise ValueError(f"Variables continues inconnues : {sorted(inconnues)}")
+    for nom, (bas, haut) in bornes.items():
+        if not bas < haut:
+            raise ValueError(f"Bornes invalides pour {nom} : {bas} >= {haut}")
+    materiaux = list(materiaux) if materiaux else list(MATERIAUX)
+    inconnus = [m for m in materiaux if m not in MATERIAUX]
+    if inconnus:
+        raise ValueError(f"Matériaux inconnus : {inconnus}")
+    nc_candidats = np.array(sorted(set(int(n) for n in nc_candidats)), dtype=np.int64)
+    if len(nc_candidats) == 0 or nc_candidats[0] < 1:
+        raise ValueError("nc_candidats doit contenir des entiers strictement positifs.")
+    objectifs = dict(OBJECTIFS_DEFAUT if objectifs is None else objectifs)
+    fixes = dict(fixes or {})
+    conflits = (set(fixes) & set(bornes)) | (set(fixes) & {"P", "Nc", "materiau"})
+    if conflits:
+        raise ValueError(f"Paramètres à la fois fixés et optimisés : {sorted(conflits)}")
+    n = int(taille_population)
+    if n < 4:
+        raise ValueError("taille_population doit être au moins 4.")
+    n += n % 2
+
+    rng = np.random.default_rng(graine)
+    noms = list(bornes)
+    bas = np.array([bornes[k][0] for k in noms], dtype=float)
+    haut = np.array([bornes[k][1] for k in noms], dtype=float)
+    cardinalites = np.array([len(materiaux), len(nc_candidats)], dtype=np.int64)
+    mat_tableau = np.array(materiaux, dtype=object)
+    sens = np.array(list(objectifs.values()), dtype=float)
+
+    if max_evaluations is not None:
+        generations = min(generations, max(0, int(max_evaluations) // n - 1))
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers and max_workers > 1 else None
+    bloc = taille_bloc or (math.ceil(n / max_workers) if pool else n)
+    compteur = {"evaluations": 0}
+
+    def decoder(X, K):
+        colonnes = {"P": float(P), **fixes}
+        for j, nom in enumerate(noms):
+            colonnes[nom] = bas[j] + X[:, j] * (haut[j] - bas[j])
+        colonnes["materiau"] = mat_tableau[K[:, 0]]
+        colonnes["Nc"] = nc_candidats[K[:, 1]]
+        return colonnes
+
+    def evaluer(X, K):
+        res = evaluer_en_parallele(decoder(X, K), max_workers=max_workers, taille_bloc=bloc, pool=pool)
+        compteur["evaluations"] += len(X)
+        F = np.column_stack([np.asarray(res[k], dtype=float) for k in objectifs]) * sens
+        invalide = ~np.all(np.isfinite(F), axis=1) | ~(np.asarray(res["Masse_cylindre_kg"]) > 0)
+        F[invalide] = np.inf
+        return F, res
+
+    def indicateur(F, rangs):
+        front = F[(rangs == 0) & np.all(np.isfinite(F), axis=1)]
+        if len(front) == 0:
+            return None
+        return front.min(axis=0)
+
+    try:
+        X = rng.random((n, len(noms)))
+        K = (rng.random((n, 2)) * cardinalites).astype(np.int64)
+        F, res = evaluer(X, K)
+        rangs = tri_non_domine(F)
+        distance = distance_encombrement(F, rangs)
+        ind = indicateur(F, rangs)
+        finis = np.isfinite(F).all(axis=1)
+        echelle = np.ptp(F[finis], axis=0) if finis.any() else np.ones(F.shape[1])
+        echelle = np.where(echelle > 0, echelle, 1.0)
+        stagnation = 0
+        arret_anticipe = False
+        historique = []
+        g = 0
+        for g in range(1, generations + 1):
+            parents = _selection_tournoi(rangs, distance, n, rng)
+            X_enf, K_enf = _variation(X, K, cardinalites, parents, rng)
+            F_enf, res_enf = evaluer(X_enf, K_enf)
+
+            X = np.concatenate([X, X_enf])
+            K = np.concatenate([K, K_enf])
+            F = np.concatenate([F, F_enf])
+            res = {k: np.concatenate([res[k], res_enf[k]]) for k in res}
+            rangs = tri_non_domine(F)
+            distance = distance_encombrement(F, rangs)
+            survivants = np.lexsort((-distance, rangs))[:n]
+            X, K, F = X[survivants], K[survivants], F[survivants]
+            res = {k: v[survivants] for k, v in res.items()}
+            rangs, distance = rangs[survivants], distance[survivants]
+
+            nouvel_ind = indicateur(F, rangs)
+            if ind is not None and nouvel_ind is not None:
+                variation = float(np.max(np.abs(nouvel_ind - ind) / echelle))
+                historique.append(variation)
+                stagnation = stagnation + 1 if variation < tol else 0
+            ind = nouvel_ind
+            if rappel is not None:
+                rappel(g, compteur["evaluations"])
+            if patience is not None and stagnation >= patience:
+                arret_anticipe = True
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Front final : rang 0, sans doublons, trié selon le premier objectif
+    front = np.flatnonzero((rangs == 0) & np.all(np.isfinite(F), axis=1))
+    _, uniques = np.unique(np.column_stack([X[front], K[front]]), axis=0, return_index=True)
+    front = front[np.sort(uniques)]
+    front = front[np.argsort(F[front, 0], kind="stable")]
+
+    colonnes = decoder(X[front], K[front])
+    entrees = {nom: colonnes[nom] for nom in noms}
+    entrees["Nc"] = colonnes["Nc"]
+    entrees["materiau"] = colonnes["materiau"]
+    entrees["Architecture"] = res["Architecture"][front]
+    return {
+        "entrees": entrees,
+        "objectifs": {k: np.asarray(res[k][front], dtype=float) for k in objectifs},
+        "resultats": {k: v[front] for k, v in res.items()},
+        "taille_front": int(len(front)),
+        "generations": g,
+        "evaluations": compteur["evaluations"],
+        "arret_anticipe": arret_anticipe,
+        "historique": historique,
+    }
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    front = optimiser(P=500, taille_population=200, generations=500, graine=1, patience=None)
+    duree = time.perf_counter() - t0
+    print(f"{front['evaluations']} évaluations en {duree:.2f} s, {front['taille_front']} designs non dominés")
+    for i in range(0, front["taille_front"], max(1, front["taille_front"] // 10)):
+        e = {k: v[i] for k, v in front["entrees"].items()}
+        o = {k: round(float(v[i]), 4) for k, v in front["objectifs"].items()}
+        print(f"  {e['materiau']:9} Nc={e['Nc']:2d} pm={e['pm']:.3g} f={e['f']:.3g} C={e['C']:.3g} -> {o}")
@@ -0,0 +1,164 @@
+# calculs/percage.py
+
+import functools
+import math
+
+import numpy as np
+
+from calculs.visserie import DIAM_PERCAGE_TARAUD_ISO
+
+# Perçages de fixation sur cercle d’entraxe (brides, couvercles, fonds de cylindre) :
+# coordonnées des trous, ligaments de matière entre trous, avec l’alésage, le bord
+# extérieur et les orifices (entrées d’air, brûleur), et recherche des combinaisons
+# (nb_vis, dim_vis_iso, entraxe_vis_pct) réalisables. Le trou le plus proche d’un
+# orifice est obtenu par l’écart angulaire au trou voisin, sans boucle sur les trous ;
+# tous les calculs acceptent des tableaux (diffusion NumPy).
+
+# Ligament mini entre deux bords de perçage : max(LIGAMENT_MINI_MM, RAPPORT_LIGAMENT_MINI x diamètre du trou)
+LIGAMENT_MINI_MM = 1.0
+RAPPORT_LIGAMENT_MINI = 0.5
+# Tolérance de comparaison des ligaments (mm), pour les cotes construites au ligament requis
+TOLERANCE_MM = 1e-6
+
+# Plage de recherche par défaut
+NB_VIS_RECHERCHE = tuple(range(3, 13))
+DIMS_RECHERCHE = ("M3", "M4", "M5", "M6", "M8", "M10", "M12")
+ENTRAXES_PCT_RECHERCHE = tuple(np.round(np.arange(0.50, 1.501, 0.01), 2))
+
+@functools.lru_cache(maxsize=256)
+def positions(nb_vis, entraxe_mm):
+    """Centres (x, y) des perçages (mm), tableau (nb_vis, 2) en lecture seule, premier trou sur l’axe x."""
+    angles = 2 * np.pi * np.arange(nb_vis) / max(nb_vis, 1)
+    xy = entraxe_mm * np.column_stack((np.cos(angles), np.sin(angles)))
+    xy.setflags(write=False)
+    return xy
+
+@functools.lru_cache(maxsize=256)
+def _positions_arrondies(nb_vis, entraxe_mm):
+    return tuple((round(x, 2), round(y, 2)) for x, y in positions(nb_vis, entraxe_mm).tolist())
+
+def positions_arrondies(nb_vis, entraxe_mm):
+    """Centres des perçages arrondis au 1/100 mm, liste de tuples (x, y) pour les exports CAO."""
+    return list(_positions_arrondies(int(nb_vis), float(entraxe_mm)))
+
+def ligament_requis(diam_trou_mm):
+    """Ligament mini (mm) autour d’un perçage de diamètre donné."""
+    return np.maximum(LIGAMENT_MINI_MM, RAPPORT_LIGAMENT_MINI * np.asarray(diam_trou_mm, dtype=float))
+
+def paroi_percee(r_int_mm, diam_trou_mm, epaisseur_mm=0.0):
+    """
+    Paroi autour d’un alésage r_int recevant des perçages de diamètre donné : épaisseur
+    (mm) portée au moins à diamètre + 2 ligaments requis (côtés alésage et bord), et
+    rayon d’entraxe (mm) au milieu de cette paroi. Diffusable ; renvoie (épaisseur, entraxe).
+    """
+    d = np.asarray(diam_trou_mm, dtype=float)
+    epaisseur = np.maximum(epaisseur_mm, d + 2 * ligament_requis(d))
+    return epaisseur[()], (np.asarray(r_int_mm, dtype=float) + epaisseur / 2)[()]
+
+def ligaments(nb_vis, entraxe_mm, diam_trou_mm, r_int_mm=0.0, r_ext_mm=np.inf, orifices=None):
+    """
+    Ligaments de matière (mm, négatifs en cas d’interférence) d’un cercle de perçages :
+    - entre deux trous voisins : 2 R sin(π/n) - d
+    - avec l’alésage r_int (0 : pas d’alésage) et avec le bord extérieur r_ext
+    - avec les orifices, tableau (k, 3) de (x, y, diamètre) en mm
+    nb_vis, entraxe_mm et diam_trou_mm sont diffusables (lots de combinaisons).
+    Renvoie un dict de tableaux, dont Ligament_mini_mm, Ligament_requis_mm et OK.
+    """
+    n, R, d, r_int, r_ext = np.broadcast_arrays(np.asarray(nb_vis, dtype=float), np.asarray(entraxe_mm, dtype=float),
+                                                np.asarray(diam_trou_mm, dtype=float), np.asarray(r_int_mm, dtype=float),
+                                                np.asarray(r_ext_mm, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entre_vis = np.where(n >= 2, 2 * R * np.sin(np.pi / np.maximum(n, 1)) - d, np.inf)
+    alesage = np.where(r_int > 0, R - d / 2 - r_int, np.inf)
+    bord = r_ext - R - d / 2
+    orifices = np.zeros((0, 3)) if orifices is None else np.asarray(orifices, dtype=float).reshape(-1, 3)
+    if orifices.shape[0]:
+        rho = np.hypot(orifices[:, 0], orifices[:, 1])
+        theta = np.arctan2(orifices[:, 1], orifices[:, 0])
+        pas = 2 * np.pi / np.maximum(n, 1)[..., None]
+        ecart = theta - pas * np.round(theta / pas)         # écart angulaire au trou le plus proche
+        distance = np.sqrt(np.maximum(rho**2 + R[..., None]**2 - 2 * rho * R[..., None] * np.cos(ecart), 0.0))
+        vers_orifices = np.min(distance - (d[..., None] + orifices[:, 2]) / 2, axis=-1)
+    else:
+        vers_orifices = np.full(n.shape, np.inf)
+    mini = np.minimum.reduce([entre_vis, alesage, bord, vers_orifices])
+    requis = ligament_requis(d)
+    return {
+        "Ligament_entre_vis_mm": entre_vis[()],
+        "Ligament_alesage_mm": alesage[()],
+        "Ligament_bord_mm": bord[()],
+        "Ligament_orifices_mm": vers_orifices[()],
+        "Ligament_mini_mm": mini[()],
+        "Ligament_requis_mm": requis[()],
+        "OK": (mini >= requis - TOLERANCE_MM)[()],
+    }
+
+def orifices_couvercle(couvercle, rayon_entree_air_mm=None):
+    """
+    Orifices (x, y, diamètre) en mm d’un couvercle : entrée(s) brûleur réparties sur le
+    rayon distance_bruleur_centre à partir de l’axe x, entrée(s) d’air côté opposé. Le
+    modèle ne cotant pas les entrées d’air, elles sont placées par défaut au plus près
+    du brûleur avec le ligament mini.
+    """
+    r_b = couvercle.distance_bruleur_centre * 1000
+    d_b, d_a = couvercle.diam_entrée_bruleur * 1000, couvercle.diam_entrée_air * 1000
+    if rayon_entree_air_mm is None:
+        rayon_entree_air_mm = r_b + (d_b + d_a) / 2 + float(ligament_requis(d_a))
+    lignes = []
+    for nb, rayon, diam, depart in ((couvercle.nb_entree_bruleur, r_b, d_b, 0.0),
+                                    (couvercle.nb_entree_air, rayon_entree_air_mm, d_a, math.pi)):
+        for i in range(int(nb)):
+            a = depart + 2 * math.pi * i / nb
+            lignes.append((rayon * math.cos(a), rayon * math.sin(a), diam))
+    return np.array(lignes, dtype=float).reshape(-1, 3)
+
+def depuis_pieces(cylindre, couvercle, **options):
+    """
+    Perçages du couvercle sur le cylindre : ligaments avec l’alésage du cylindre, le bord
+    (plus petit des deux rayons extérieurs) et les orifices du couvercle, et écart entre
+    les cercles d’entraxe des deux pièces (les trous doivent coïncider).
+    """
+    res = ligaments(couvercle.nb_vis, couvercle.entraxe_vis * 1000, couvercle.diam_percage_vis * 1000,
+                    r_int_mm=cylindre.rayon * 1000, r_ext_mm=min(cylindre.rayon_ext, couvercle.rayon) * 1000,
+                    orifices=orifices_couvercle(couvercle, **options))
+    res["Ecart_entraxe_mm"] = (couvercle.entraxe_vis - cylindre.entraxe_vis) * 1000
+    res["OK"] = res["OK"] & (abs(res["Ecart_entraxe_mm"]) < 0.01) & (couvercle.nb_vis == cylindre.nb_vis)
+    return res
+
+def combinaisons_realisables(rayon_reference_mm, r_int_mm=0.0, r_ext_mm=np.inf, orifices=None,
+                             nb_vis=NB_VIS_RECHERCHE, dims=DIMS_RECHERCHE, entraxe_vis_pct=ENTRAXES_PCT_RECHERCHE):
+    """
+    Combinaisons (nb_vis, dim_vis_iso, entraxe_vis_pct) dont tous les ligaments sont
+    suffisants, l’entraxe valant entraxe_vis_pct x rayon_reference_mm (convention de la
+    pièce). Toute la grille est évaluée en un appel ; renvoie des colonnes triées par
+    nombre de vis, filetage puis entraxe.
+    """
+    dims = np.asarray(dims, dtype=str)
+    n = np.asarray(nb_vis, dtype=float)[:, None, None]
+    d = np.array([DIAM_PERCAGE_TARAUD_ISO[dim] for dim in dims])[None, :, None]
+    pct = np.asarray(entraxe_vis_pct, dtype=float)[None, None, :]
+    res = ligaments(n, pct * rayon_reference_mm, d, r_int_mm, r_ext_mm, orifices)
+    i, j, k = np.nonzero(res["OK"])
+    return {
+        "nb_vis": np.asarray(nb_vis)[i],
+        "dim_vis_iso": dims[j],
+        "entraxe_vis_pct": pct[0, 0, k],
+        "entraxe_mm": pct[0, 0, k] * rayon_reference_mm,
+        "Ligament_mini_mm": res["Ligament_mini_mm"][i, j, k],
+    }
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.assemblage import AssemblageMoteur
+    from calculs.stirling import calcul_complet
+
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    cyl, couv = moteur.cylindre, moteur.couvercle
+    res = depuis_pieces(cyl, couv)
+    print(f"Couvercle {couv.nb_vis}x{couv.dim_vis_iso} : ligament mini {res['Ligament_mini_mm']:.2f} mm "
+          f"(alésage {res['Ligament_alesage_mm']:.2f}, orifices {res['Ligament_orifices_mm']:.2f}), OK={res['OK']}")
+    t0 = time.perf_counter()
+    possibles = combinaisons_realisables(cyl.rayon * 1000, cyl.rayon * 1000, cyl.rayon_ext * 1000, orifices_couvercle(couv))
+    print(f"{possibles['nb_vis'].size} combinaisons dans la paroi de {cyl.epaisseur * 1000:.1f} mm ({1000 * (time.perf_counter() - t0):.1f} ms), "
+          f"première : {possibles['nb_vis'][0]} x {possibles['dim_vis_iso'][0]} à {possibles['entraxe_mm'][0]:.1f} mm")
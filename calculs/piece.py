@@ -0,0 +1,105 @@
+# calculs/piece.py
+
+import functools
+
+class propriete_cachee:
+    """
+    Propriété calculée à la première lecture puis conservée dans le cache de la pièce
+    (les pièces étant immuables, elle ne devient jamais obsolète).
+    """
+
+    def __init__(self, fonction):
+        self.fonction = fonction
+        self.nom = fonction.__name__
+        self.__doc__ = fonction.__doc__
+
+    def __set_name__(self, classe, nom):
+        self.nom = nom
+
+    def __get__(self, piece, classe=None):
+        if piece is None:
+            return self
+        try:
+            cache = piece._cache
+        except AttributeError:
+            # Lecture pendant la construction : pas encore de cache
+            return self.fonction(piece)
+        try:
+            return cache[self.nom]
+        except KeyError:
+            valeur = cache[self.nom] = self.fonction(piece)
+            return valeur
+
+def resultat_cache(methode):
+    """
+    Méthode sans argument (to_dict, __repr__) calculée une seule fois par pièce ; un dict
+    est renvoyé en copie superficielle pour que l’appelant puisse le compléter.
+    """
+    nom = methode.__name__
+
+    @functools.wraps(methode)
+    def enveloppe(self):
+        try:
+            cache = self._cache
+        except AttributeError:
+            return methode(self)
+        try:
+            valeur = cache[nom]
+        except KeyError:
+            valeur = cache[nom] = methode(self)
+        return dict(valeur) if isinstance(valeur, dict) else valeur
+
+    return enveloppe
+
+def _reconstruire(classe, arguments):
+    return classe(**arguments)
+
+class _MetaPiece(type):
+    """Fige la pièce à la sortie du constructeur (création du cache)."""
+
+    def __call__(cls, *args, **kwargs):
+        piece = super().__call__(*args, **kwargs)
+        object.__setattr__(piece, "_cache", {})
+        return piece
+
+class Piece(metaclass=_MetaPiece):
+    """
+    Base des pièces : attributs déclarés dans __slots__ (pas de __dict__ par instance),
+    figés après construction, grandeurs dérivées en cache (propriete_cachee).
+    Une modification passe par `replace(**arguments)`, qui construit une nouvelle pièce
+    (avec un cache vide) à partir des arguments du constructeur.
+    - ARGUMENTS : argument du constructeur -> attribut qui en conserve la valeur
+    """
+
+    __slots__ = ("_cache",)
+    ARGUMENTS = {}
+
+    def __setattr__(self, nom, valeur):
+        if hasattr(self, "_cache"):
+            raise AttributeError(f"{type(self).__name__} est immuable : utiliser replace() pour modifier « {nom} ».")
+        object.__setattr__(self, nom, valeur)
+
+    def __delattr__(self, nom):
+        raise AttributeError(f"{type(self).__name__} est immuable : impossible de supprimer « {nom} ».")
+
+    def arguments(self):
+        """Arguments du constructeur reproduisant la pièce."""
+        return {arg: getattr(self, attr) for arg, attr in self.ARGUMENTS.items()}
+
+    def replace(self, **changements):
+        """Nouvelle pièce identique à un ou plusieurs arguments du constructeur près."""
+        inconnus = set(changements) - set(self.ARGUMENTS)
+        if inconnus:
+            raise ValueError(f"Arguments inconnus pour {type(self).__name__} : {', '.join(sorted(inconnus))}")
+        return type(self)(**{**self.arguments(), **changements})
+
+    def __reduce__(self):
+        return (_reconstruire, (type(self), self.arguments()))
+
+    def __eq__(self, autre):
+        if type(autre) is not type(self):
+            return NotImplemented
+        return self.arguments() == autre.arguments()
+
+    def __hash__(self):
+        return hash((type(self).__qualname__, tuple(self.arguments().items())))
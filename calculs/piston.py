@@ -1,13 +1,35 @@
 # calculs/piston.py
 from calculs.cylindre import CylindreStirling
+from calculs.piece import Piece, propriete_cachee, resultat_cache
 import math
 
-class PistonStirling:
+# Proportions du piston généré depuis le cylindre (PistonStirling.depuis_cylindre)
+RAPPORT_HAUTEUR_COURSE = 0.9
+EPAISSEUR_FOND_M = 0.003
+EPAISSEUR_JUPE_M = 0.002
+RAPPORT_AXE_DIAMETRE = 0.4
+RAPPORT_AXE_LONGUEUR = 0.8
+DENSITE_PISTON = 2680
+
+class PistonStirling(Piece):
     """
     Modélisation d’un piston de moteur Stirling pour CAO :
     Généré à partir du cylindre, avec masse, volume, surfaces, rainures.
     """
 
+    __slots__ = (
+        "diametre", "hauteur", "epaisseur_fond", "epaisseur_jupe", "hauteur_jupe", "matiere",
+        "densite", "rugosite", "etat_surface", "nb_rainures", "axe_diam", "axe_longueur",
+        "rainures",
+    )
+    ARGUMENTS = {
+        "diametre_m": "diametre", "hauteur_m": "hauteur", "epaisseur_fond_m": "epaisseur_fond",
+        "epaisseur_jupe_m": "epaisseur_jupe", "hauteur_jupe_m": "hauteur_jupe",
+        "matiere": "matiere", "densite_kg_m3": "densite", "rugosite_um": "rugosite",
+        "etat_surface": "etat_surface", "nb_rainures": "nb_rainures", "axe_diam_m": "axe_diam",
+        "axe_longueur_m": "axe_longueur",
+    }
+
     def __init__(
         self,
         diametre_m,
@@ -44,17 +66,17 @@ class PistonStirling:
         diam = cylindre.diametre
         course = cylindre.course
 
-        hauteur_piston = course * 0.9
-        ep_fond = 0.003  # 3 mm
-        ep_jupe = 0.002  # 2 mm
+        hauteur_piston = course * RAPPORT_HAUTEUR_COURSE
+        ep_fond = EPAISSEUR_FOND_M
+        ep_jupe = EPAISSEUR_JUPE_M
         hauteur_jupe = hauteur_piston - ep_fond
         nb_rainures = 2 if diam < 0.04 else 3
 
-        axe_diam = diam * 0.4
-        axe_longueur = diam * 0.8
+        axe_diam = diam * RAPPORT_AXE_DIAMETRE
+        axe_longueur = diam * RAPPORT_AXE_LONGUEUR
 
         matiere = "AlSi12"
-        densite = 2680
+        densite = DENSITE_PISTON
         rugosite = 0.8
         etat_surface = "Rectifié"
 
@@ -94,43 +116,44 @@ class PistonStirling:
             position += largeur + espacement
         return rainures
 
-    @property
+    @propriete_cachee
     def masse(self):
         return self.volume_total * self.densite
 
-    @property
+    @propriete_cachee
     def rayon(self):
         return self.diametre / 2
 
-    @property
+    @propriete_cachee
     def volume_externe(self):
         return math.pi * self.rayon**2 * self.hauteur
 
-    @property
+    @propriete_cachee
     def volume_interne(self):
         r_int = self.rayon - self.epaisseur_jupe
         return max(0, math.pi * r_int**2 * self.hauteur_jupe)
 
-    @property
+    @propriete_cachee
     def volume_fond(self):
         return math.pi * self.rayon**2 * self.epaisseur_fond
 
-    @property
+    @propriete_cachee
     def volume_axe(self):
         r = self.axe_diam / 2
         return math.pi * r**2 * self.axe_longueur
 
-    @property
+    @propriete_cachee
     def volume_total(self):
         return self.volume_externe - self.volume_interne + self.volume_axe
 
-    @property
+    @propriete_cachee
     def surface_totale(self):
         surf_lateral = math.pi * self.diametre * self.hauteur
         surf_faces = 2 * math.pi * self.rayon**2
         surf_axe = math.pi * self.axe_diam * self.axe_longueur + 2 * math.pi * (self.axe_diam / 2)**2
         return surf_lateral + surf_faces + surf_axe
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Diamètre (mm)": round(self.diametre * 1000, 2),
@@ -150,5 +173,6 @@ class PistonStirling:
             "Surface (cm²)": round(self.surface_totale * 1e4, 2),
         }
 
+    @resultat_cache
     def __repr__(self):
         return f"PistonStirling(D={self.diametre*1000:.2f}mm, H={self.hauteur*1000:.2f}mm, Rainures={self.nb_rainures})"
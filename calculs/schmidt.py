@@ -0,0 +1,145 @@
+# calculs/schmidt.py
+
+import math
+
+import numpy as np
+
+# Constante spécifique de l’air (J/kg/K), utilisée pour estimer la masse de gaz
+R_AIR = 287.05
+
+TYPES_MOTEUR = ("alpha", "gamma")
+
+
+def volumes(theta, Vse, Vsc, phase=math.pi / 2, Vde=0.0, Vdc=0.0, type_moteur="gamma"):
+    """
+    Volumes de détente Ve et de compression Vc (m³) et leurs dérivées par rapport à l’angle vilebrequin.
+    - alpha : deux pistons, Ve balayé par le piston chaud, Vc par le piston froid déphasé de `phase`
+    - gamma : Ve balayé par le déplaceur, Vc = face froide du déplaceur + piston moteur déphasé
+    Tous les arguments sont diffusés (NumPy) : designs en colonnes (n, 1), angles en ligne (m,).
+    Renvoie (Ve, Vc, dVe, dVc).
+    """
+    if type_moteur not in TYPES_MOTEUR:
+        raise ValueError(f"Type de moteur inconnu : {type_moteur} (attendu : {', '.join(TYPES_MOTEUR)})")
+    Ve = Vde + 0.5 * Vse * (1 - np.cos(theta))
+    dVe = 0.5 * Vse * np.sin(theta)
+    Vc = Vdc + 0.5 * Vsc * (1 - np.cos(theta - phase))
+    dVc = 0.5 * Vsc * np.sin(theta - phase)
+    if type_moteur == "gamma":
+        Vc = Vc + 0.5 * Vse * (1 + np.cos(theta))
+        dVc = dVc - 0.5 * Vse * np.sin(theta)
+    return Ve, Vc, dVe, dVc
+
+
+def temperature_regenerateur(Th, Tc):
+    """Température effective du régénérateur (moyenne logarithmique, K)."""
+    Th, Tc = np.asarray(Th, dtype=float), np.asarray(Tc, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Tr = (Th - Tc) / np.log(Th / Tc)
+    return np.where(np.isclose(Th, Tc), Tc, Tr)
+
+
+def simuler(Vse, Vsc, Th, Tc, pm, f=25.0, Nc=1, phase=math.pi / 2, Vde=0.0, Vdc=0.0, Vr=0.0,
+            type_moteur="gamma", nb_angles=360, R=R_AIR):
+    """
+    Cycle isotherme de Schmidt intégré sur une discrétisation de l’angle vilebrequin.
+    - Vse, Vsc : volumes balayés détente / compression (m³)
+    - Th, Tc : températures chaude / froide (K) ; pm : pression moyenne du cycle (Pa)
+    - Vde, Vdc, Vr : volumes morts chaud, froid et régénérateur (m³)
+    Chaque paramètre peut être un tableau 1-D (un design par ligne) : tout le lot est
+    calculé en une seule opération (n designs x nb_angles).
+    Les intégrales cycliques utilisent la règle des rectangles, exacte à la précision
+    machine pour des fonctions périodiques régulières.
+    """
+    entrees = [Vse, Vsc, Th, Tc, pm, f, Nc, phase, Vde, Vdc, Vr]
+    scalaire = all(np.ndim(x) == 0 for x in entrees)
+    Vse, Vsc, Th, Tc, pm, f, Nc, phase, Vde, Vdc, Vr = (
+        np.asarray(x, dtype=float).reshape(-1, 1) for x in np.broadcast_arrays(*entrees)
+    )
+    if np.any(Th <= 0) or np.any(Tc <= 0):
+        raise ValueError("Les températures Th et Tc doivent être strictement positives (K).")
+    if np.any(Vse < 0) or np.any(Vsc < 0) or np.any(pm <= 0):
+        raise ValueError("Volumes balayés positifs et pression moyenne strictement positive requis.")
+
+    theta = np.linspace(0.0, 2 * math.pi, nb_angles, endpoint=False)
+    dtheta = 2 * math.pi / nb_angles
+    Ve, Vc, dVe, dVc = volumes(theta, Vse, Vsc, phase, Vde, Vdc, type_moteur)
+    Tr = temperature_regenerateur(Th, Tc)
+
+    s = Ve / Th + Vr / Tr + Vc / Tc
+    # Masse de gaz fixée par la pression moyenne : pm = M.R.moyenne(1/s)
+    MR = pm / np.mean(1.0 / s, axis=1, keepdims=True)
+    p = MR / s
+
+    We = np.sum(p * dVe, axis=1) * dtheta
+    Wc = np.sum(p * dVc, axis=1) * dtheta
+    W = We + Wc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rendement = np.where(We > 0, W / We, 0.0)
+
+    f, Nc = f[:, 0], Nc[:, 0]
+    res = {
+        "theta": theta,
+        "Ve_m3": Ve,
+        "Vc_m3": Vc,
+        "Pression_Pa": p,
+        "Pression_max_Pa": p.max(axis=1),
+        "Pression_min_Pa": p.min(axis=1),
+        "Travail_detente_J": We,
+        "Travail_compression_J": Wc,
+        "Travail_indique_J": W,
+        # Cycle isotherme : chaleurs échangées = travaux des espaces correspondants
+        "Chaleur_chaude_J": We,
+        "Chaleur_froide_J": Wc,
+        "Puissance_indiquee_W": W * f * Nc,
+        "Flux_chaud_W": We * f * Nc,
+        "Flux_froid_W": Wc * f * Nc,
+        "Rendement": rendement,
+        "Masse_gaz_kg": MR[:, 0] / R,
+    }
+    if scalaire:
+        for cle in ("Ve_m3", "Vc_m3", "Pression_Pa"):
+            res[cle] = res[cle][0]
+        for cle, val in res.items():
+            if cle != "theta" and np.ndim(val) == 1 and len(val) == 1:
+                res[cle] = float(val[0])
+    return res
+
+
+def travail_schmidt_analytique(Vse, Vsc, Th, Tc, pm, phase=math.pi / 2, Vde=0.0, Vdc=0.0, Vr=0.0):
+    """
+    Travail indiqué par cycle (J) de la solution fermée de Schmidt pour un moteur alpha
+    (forme de Walker). Sert de référence au calcul numérique.
+    """
+    tau = Tc / Th
+    Tr = float(temperature_regenerateur(Th, Tc))
+    A = 0.5 * tau * Vse + 0.5 * Vsc + tau * Vde + Vdc + Vr * Tc / Tr
+    B = 0.5 * math.sqrt((tau * Vse) ** 2 + Vsc ** 2 + 2 * tau * Vse * Vsc * math.cos(phase))
+    delta = B / A
+    theta0 = math.atan2(Vsc * math.sin(phase), tau * Vse + Vsc * math.cos(phase))
+    racine = math.sqrt(1 - delta ** 2)
+    We = math.pi * pm * Vse * delta * math.sin(theta0) / (1 + racine)
+    return We * (1 - tau)
+
+
+def depuis_pieces(cylindre, displacer, pm, f=25.0, Nc=1, phase=math.pi / 2, course_displacer=None,
+                  Vde=0.0, Vdc=0.0, **options):
+    """
+    Cycle de Schmidt d’un moteur gamma construit à partir des pièces :
+    - piston moteur : volume balayé du CylindreStirling (alésage x course)
+    - déplaceur : section du DisplacerStirling x course (par défaut celle du cylindre)
+    - régénérateur : jeu annulaire entre alésage et déplaceur sur la hauteur du déplaceur
+    Les températures chaude/froide sont celles portées par le cylindre.
+    """
+    course_d = course_displacer if course_displacer is not None else cylindre.course
+    Vse = math.pi * displacer.rayon ** 2 * course_d
+    Vsc = cylindre.volume_interne
+    Vr = max(math.pi * (cylindre.rayon ** 2 - displacer.rayon ** 2) * displacer.hauteur, 0.0)
+    return simuler(Vse, Vsc, cylindre.Th, cylindre.Tc, pm, f=f, Nc=Nc, phase=phase,
+                   Vde=Vde, Vdc=Vdc, Vr=Vr, type_moteur="gamma", **options)
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    res = simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, f=25, Nc=2, Vde=5e-6, Vdc=5e-6, Vr=8e-6)
+    print(f"Puissance indiquée : {res['Puissance_indiquee_W']:.1f} W, rendement : {res['Rendement']:.3f}")
+    print(f"Pression : {res['Pression_min_Pa']/1e5:.2f} à {res['Pression_max_Pa']/1e5:.2f} bar")
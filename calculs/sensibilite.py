@@ -0,0 +1,264 @@
+# calculs/sensibilite.py
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calculs import bielle as bielle_mod
+from calculs import piston as piston_mod
+from calculs.monte_carlo import PROPORTIONS, chaine_pieces
+from calculs.stirling import calcul_complet_batch
+
+# Plages par défaut des paramètres de calcul_complet étudiés
+FACTEURS_CALCUL = {
+    "Th": (550.0, 900.0),
+    "Tc": (280.0, 340.0),
+    "pm": (5e5, 3e6),
+    "f": (10.0, 50.0),
+    "Nc": (1, 6),
+    "eta": (0.10, 0.30),
+    "C": (0.01, 0.06),
+}
+# Facteurs entiers : tirés uniformément sur {min, ..., max}
+FACTEURS_ENTIERS = ("Nc",)
+# Variation relative par défaut des proportions de pièces autour de leur valeur nominale
+VARIATION_PROPORTIONS = 0.2
+
+SORTIES_DEFAUT = ("Masse_cylindre_kg", "Puissance_specifique_W_kg", "Masse_piston_kg",
+                  "Masse_bielle_kg", "Masse_totale_kg")
+
+NIVEAU_CONFIANCE = 0.95
+
+
+def facteurs_par_defaut(proportions=True, variation=VARIATION_PROPORTIONS):
+    """
+    Facteurs étudiés et leurs plages : paramètres de calcul_complet (FACTEURS_CALCUL)
+    et, si demandé, proportions des pièces (PROPORTIONS) à ±variation de leur valeur nominale.
+    """
+    facteurs = dict(FACTEURS_CALCUL)
+    if proportions:
+        modules = {"piston": piston_mod, "bielle": bielle_mod}
+        for cle in PROPORTIONS:
+            module, nom = cle.split(".")
+            v = float(getattr(modules[module], nom))
+            facteurs[cle] = (v * (1 - variation), v * (1 + variation))
+    return facteurs
+
+
+def _vers_physique(U, facteurs):
+    """Passage de l’hypercube unité aux valeurs physiques des facteurs (colonnes)."""
+    colonnes = {}
+    for j, (nom, (bas, haut)) in enumerate(facteurs.items()):
+        if nom in FACTEURS_ENTIERS:
+            colonnes[nom] = np.minimum(np.floor(bas + U[:, j] * (haut - bas + 1)), haut)
+        else:
+            colonnes[nom] = bas + U[:, j] * (haut - bas)
+    return colonnes
+
+
+def modele_moteur(U, facteurs, P=500.0, sorties=SORTIES_DEFAUT, **fixes):
+    """
+    Modèle évalué par l’analyse de sensibilité : calcul_complet_batch puis chaîne de pièces
+    vectorisée (monte_carlo.chaine_pieces), les proportions de pièces étant remplacées
+    ligne à ligne. U : échantillon dans l’hypercube unité, une colonne par facteur.
+    Renvoie {sortie: tableau}.
+    """
+    colonnes = _vers_physique(U, facteurs)
+    proportions = {k: v for k, v in colonnes.items() if k in PROPORTIONS}
+    calcul = {k: v for k, v in colonnes.items() if k not in PROPORTIONS}
+    res = calcul_complet_batch(P=P, **calcul, **fixes)
+    res.update(chaine_pieces(res, proportions=proportions))
+    return {s: np.asarray(res[s], dtype=float) for s in sorties}
+
+
+def _evaluer_bloc(modele, U):
+    return modele(U)
+
+
+def evaluer(modele, U, max_workers=1, taille_bloc=100_000):
+    """
+    Évalue un modèle vectorisé sur les lignes de U, par blocs répartis sur un pool de
+    processus si max_workers > 1 (le modèle doit alors être picklable : fonction de
+    module ou functools.partial).
+    """
+    n = len(U)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or n <= taille_bloc:
+        return modele(U)
+    blocs = [U[i:i + taille_bloc] for i in range(0, n, taille_bloc)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        resultats = list(pool.map(functools.partial(_evaluer_bloc, modele), blocs))
+    return {k: np.concatenate([r[k] for r in resultats]) for k in resultats[0]}
+
+
+def _intervalle(echantillons, niveau):
+    """Intervalle de confiance par percentiles bootstrap (axe 0 = rééchantillonnages)."""
+    alpha = (1 - niveau) / 2
+    return np.quantile(echantillons, [alpha, 1 - alpha], axis=0).T
+
+
+# ---------------------------------------------------------------- Morris
+
+def echantillon_morris(k, r, niveaux=4, rng=None):
+    """
+    Plan de Morris : r trajectoires de k+1 points dans l’hypercube unité, chaque pas modifiant
+    un seul facteur de ±Δ, Δ = niveaux / (2 (niveaux - 1)).
+    Renvoie (U de forme (r (k+1), k), Δ).
+    """
+    rng = np.random.default_rng(rng)
+    delta = niveaux / (2 * (niveaux - 1))
+    grille = np.arange(niveaux) / (niveaux - 1)
+    depart = grille[grille <= 1 - delta + 1e-12]
+    x = rng.choice(depart, size=(r, k))
+    signes = rng.choice([-1.0, 1.0], size=(r, k))
+    permutations = np.argsort(rng.random((r, k)), axis=1)
+    B = np.tril(np.ones((k + 1, k)), -1)
+    J = np.ones((k + 1, k))
+    # B* = (J x* + Δ/2 ((2B - J) D* + J)) P*, vectorisé sur les trajectoires
+    traj = x[:, None, :] + 0.5 * delta * ((2 * B - J)[None] * signes[:, None, :] + J[None])
+    traj = np.take_along_axis(traj, permutations[:, None, :], axis=2)
+    return traj.reshape(r * (k + 1), k), delta
+
+
+def indices_morris(modele, k, r=100, niveaux=4, graine=None, n_bootstrap=500,
+                   niveau_confiance=NIVEAU_CONFIANCE, max_workers=1, taille_bloc=100_000, noms=None):
+    """
+    Criblage de Morris d’un modèle vectorisé modele(U) -> {sortie: tableau}.
+    Pour chaque sortie et chaque facteur : mu, mu* (moyenne des |effets élémentaires|),
+    sigma et intervalle de confiance bootstrap de mu*. Effets exprimés par unité de
+    l’hypercube (comparables d’un facteur à l’autre).
+    """
+    rng = np.random.default_rng(graine)
+    U, delta = echantillon_morris(k, r, niveaux, rng)
+    Y = evaluer(modele, U, max_workers, taille_bloc)
+    noms = list(noms) if noms else [f"x{j}" for j in range(k)]
+    Ut = U.reshape(r, k + 1, k)
+    dU = np.diff(Ut, axis=1)                     # (r, k, k)
+    facteur = np.argmax(np.abs(dU) > 0, axis=2)  # facteur modifié à chaque pas
+    pas = np.take_along_axis(dU, facteur[:, :, None], axis=2)[:, :, 0]
+    tirages = rng.integers(0, r, size=(n_bootstrap, r))
+    res = {}
+    for sortie, y in Y.items():
+        dy = np.diff(y.reshape(r, k + 1), axis=1)
+        effets = np.empty((r, k))
+        np.put_along_axis(effets, facteur, dy / pas, axis=1)
+        mu_etoile_boot = np.abs(effets)[tirages].mean(axis=1)   # (n_bootstrap, k)
+        ic = _intervalle(mu_etoile_boot, niveau_confiance)
+        res[sortie] = {
+            nom: {
+                "mu": float(effets[:, j].mean()),
+                "mu_etoile": float(np.abs(effets[:, j]).mean()),
+                "sigma": float(effets[:, j].std(ddof=1)) if r > 1 else 0.0,
+                "mu_etoile_ic": (float(ic[j, 0]), float(ic[j, 1])),
+            }
+            for j, nom in enumerate(noms)
+        }
+    res["Evaluations"] = len(U)
+    return res
+
+
+# ---------------------------------------------------------------- Sobol
+
+def echantillon_saltelli(k, N, rng=None):
+    """
+    Matrices de Saltelli : A, B (N x k) indépendantes et les k matrices AB_i
+    (A dont la colonne i est prise dans B), empilées en un seul plan de N (k + 2) lignes
+    [A ; B ; AB_1 ; ... ; AB_k].
+    """
+    rng = np.random.default_rng(rng)
+    A = rng.random((N, k))
+    B = rng.random((N, k))
+    AB = np.repeat(A[None], k, axis=0)
+    idx = np.arange(k)
+    AB[idx, :, idx] = B.T
+    return np.concatenate([A, B, AB.reshape(k * N, k)])
+
+
+def indices_sobol(modele, k, N=4096, graine=None, n_bootstrap=200, niveau_confiance=NIVEAU_CONFIANCE,
+                  max_workers=1, taille_bloc=100_000, noms=None):
+    """
+    Indices de Sobol du premier ordre (estimateur de Saltelli 2010) et totaux (Jansen)
+    d’un modèle vectorisé modele(U) -> {sortie: tableau}, avec intervalles de confiance
+    bootstrap (rééchantillonnage des lignes de A / B). Coût : N (k + 2) évaluations.
+    """
+    rng = np.random.default_rng(graine)
+    U = echantillon_saltelli(k, N, rng)
+    Y = evaluer(modele, U, max_workers, taille_bloc)
+    noms = list(noms) if noms else [f"x{j}" for j in range(k)]
+    tirages = rng.integers(0, N, size=(n_bootstrap, N))
+    res = {}
+    for sortie, y in Y.items():
+        fA, fB = y[:N], y[N:2 * N]
+        fAB = y[2 * N:].reshape(k, N)
+        fA_b, fB_b = fA[tirages], fB[tirages]
+        V = np.var(np.concatenate([fA, fB]))
+        V_b = np.var(np.concatenate([fA_b, fB_b], axis=1), axis=1)
+        indices = {}
+        for j, nom in enumerate(noms):
+            fABj_b = fAB[j][tirages]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                S1 = np.mean(fB * (fAB[j] - fA)) / V
+                ST = 0.5 * np.mean((fA - fAB[j]) ** 2) / V
+                S1_b = np.mean(fB_b * (fABj_b - fA_b), axis=1) / V_b
+                ST_b = 0.5 * np.mean((fA_b - fABj_b) ** 2, axis=1) / V_b
+            ic1 = _intervalle(S1_b, niveau_confiance)
+            icT = _intervalle(ST_b, niveau_confiance)
+            indices[nom] = {
+                "S1": float(S1),
+                "S1_ic": (float(ic1[0]), float(ic1[1])),
+                "ST": float(ST),
+                "ST_ic": (float(icT[0]), float(icT[1])),
+            }
+        res[sortie] = indices
+    res["Evaluations"] = len(U)
+    return res
+
+
+# ---------------------------------------------------------------- Moteur
+
+def sensibilite_moteur(P=500.0, methode="sobol", facteurs=None, sorties=SORTIES_DEFAUT, graine=None,
+                       max_workers=1, **options):
+    """
+    Analyse de sensibilité globale du dimensionnement (calcul_complet + pièces).
+    - methode : "sobol" (options : N, n_bootstrap, niveau_confiance, taille_bloc)
+      ou "morris" (options : r, niveaux, n_bootstrap, niveau_confiance, taille_bloc)
+    - facteurs : {nom: (min, max)} parmi FACTEURS_CALCUL et PROPORTIONS (facteurs_par_defaut())
+    - options : autres paramètres de calcul_complet fixés (gaz, materiau...) ou de la méthode
+    Renvoie les indices par sortie et par facteur, plus "Classement" : facteurs triés par
+    influence décroissante (ST ou mu*) pour chaque sortie.
+    """
+    facteurs = dict(facteurs_par_defaut() if facteurs is None else facteurs)
+    inconnus = set(facteurs) - set(FACTEURS_CALCUL) - set(PROPORTIONS)
+    if inconnus:
+        raise ValueError(f"Facteurs inconnus : {sorted(inconnus)}")
+    cles_methode = {"sobol": ("N", "n_bootstrap", "niveau_confiance", "taille_bloc"),
+                    "morris": ("r", "niveaux", "n_bootstrap", "niveau_confiance", "taille_bloc")}
+    if methode not in cles_methode:
+        raise ValueError(f"Méthode inconnue : {methode} (attendu : sobol, morris)")
+    options_methode = {k: options.pop(k) for k in list(options) if k in cles_methode[methode]}
+    modele = functools.partial(modele_moteur, facteurs=facteurs, P=P, sorties=tuple(sorties), **options)
+    calcul = indices_sobol if methode == "sobol" else indices_morris
+    res = calcul(modele, len(facteurs), graine=graine, max_workers=max_workers, noms=list(facteurs),
+                 **options_methode)
+    critere = "ST" if methode == "sobol" else "mu_etoile"
+    res["Classement"] = {
+        s: sorted(res[s], key=lambda nom: res[s][nom][critere], reverse=True) for s in sorties
+    }
+    return res
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    res = sensibilite_moteur(P=500, methode="sobol", N=8192, graine=0)
+    print(f"{res['Evaluations']} évaluations en {time.perf_counter() - t0:.2f} s")
+    for sortie in ("Masse_cylindre_kg", "Puissance_specifique_W_kg", "Masse_totale_kg"):
+        print(f"\n{sortie}")
+        for nom in res["Classement"][sortie][:6]:
+            i = res[sortie][nom]
+            print(f"  {nom:34} S1={i['S1']:.3f} [{i['S1_ic'][0]:.3f}, {i['S1_ic'][1]:.3f}]  "
+                  f"ST={i['ST']:.3f} [{i['ST_ic'][0]:.3f}, {i['ST_ic'][1]:.3f}]")
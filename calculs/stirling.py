@@ -3,6 +3,11 @@
 
 import math
 
+import numpy as np
+
+from calculs import gaz as gaz_travail
+from materiaux import propriete as propriete_materiau, proprietes_lot as proprietes_materiaux
+
 # Valeurs physiques par défaut (réalistes mais adaptables)
 DEFAULTS = {
     'Th': 650.0,
@@ -21,6 +26,22 @@ MATERIAUX = {
     "Laiton": {"rho": 8500, "limite_rupture": 300e6},
 }
 
+# Pertes d’écoulement dans les échangeurs (modèle réduit) : fraction du travail perdue
+# Λ = XI_ECOULEMENT · ½ ρ (K_VITESSE_GAZ · v_piston)² / (pm · (Th - Tc)/Th), avec ρ
+# la masse volumique du gaz à la température moyenne logarithmique et à pm.
+# Le rendement saisi est celui d’un moteur à air : pour un autre gaz il est corrigé
+# par (1 - Λ_gaz) / (1 - Λ_air), les autres pertes étant supposées inchangées.
+# Somme des coefficients de perte de charge singulière réchauffeur + régénérateur +
+# refroidisseur, de l’ordre de 1 à 1,5 chacun (entrée, sortie, coudes ; Idelchik)
+XI_ECOULEMENT = 4.0
+# Vitesse du gaz dans les échangeurs / vitesse moyenne du piston : rapport de la section
+# du piston à la section de passage libre des échangeurs, 10 à 30 sur les machines
+# décrites par Urieli et Berchowitz (Stirling Cycle Engine Analysis, 1984)
+K_VITESSE_GAZ = 20.0
+# Borne de Λ : garde 1 - Λ > 0 (au-delà, le moteur ne fournit plus de travail net)
+LAMBDA_MAX = 0.95
+ITERATIONS_GAZ = 30
+
 def safe_float(val, default):
     try:
         if val is None or val == "":
@@ -119,18 +140,24 @@ def archi_conseillee(Nc):
     else:
         return "En ligne"
 
-def epaisseur_paroi_min(D_int, pm, limite_rupture, coef_secu=2.0):
+def epaisseur_paroi_min(D_int, pm, limite_rupture, coef_secu=2.0, T=None, materiau="Acier"):
+    # T (K) : température de paroi, la limite à 20 °C est alors réduite selon la matière.
+    # Limite annulée par la température (p. ex. aluminium au-delà de 500 °C) : paroi irréalisable, inf.
     if D_int <= 0 or pm <= 0 or limite_rupture <= 0:
         return 0.0
+    if T is not None:
+        limite_rupture = propriete_materiau(materiau, "Rm", T, limite_rupture)
+        if limite_rupture <= 0:
+            return math.inf
     sigma_adm = limite_rupture / coef_secu
     return (pm * D_int) / (2 * sigma_adm)
 
-def calcul_complet(P, Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None, C=None, gaz="Air", materiau="Acier"):
-    if P is None or P == "" or float(P) <= 0:
-        raise ValueError("La puissance P doit être renseignée et strictement positive.")
-
+def resoudre_parametres(Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None):
+    """
+    Paramètres de DEFAULTS effectivement utilisés par calcul_complet (valeurs vides ou
+    invalides remplacées, Th décalé de 10 K si Th == Tc) et drapeaux autofill.
+    """
     flags = {}
-
     Th, flags['Th'] = safe_float(Th, DEFAULTS['Th'])
     Tc, flags['Tc'] = safe_float(Tc, DEFAULTS['Tc'])
     pm, flags['pm'] = safe_float(pm, DEFAULTS['pm'])
@@ -142,36 +169,49 @@ def calcul_complet(P, Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None, C=No
         Th += 10
         flags['Th'] = True
 
-    mat_data = MATERIAUX.get(materiau, MATERIAUX["Acier"])
+    return {'Th': Th, 'Tc': Tc, 'pm': pm, 'f': f, 'Nc': Nc, 'eta': eta}, flags
 
-    Vs = volume_balaye(float(P), Nc, pm, f, Th, Tc, eta)
+def calcul_complet(P, Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None, C=None, gaz="Air", materiau="Acier",
+                   resistance_a_chaud=False):
+    # Même enchaînement que calcul_complet_batch (_correction_gaz et _cylindre communs),
+    # sur des scalaires : un appel isolé ne paie pas la mise en colonnes ni la diffusion
+    # des paramètres ; les deux chemins sont égaux à l’arrondi près, ce que vérifient les tests.
+    if P is None or P == "" or float(P) <= 0:
+        raise ValueError("La puissance P doit être renseignée et strictement positive.")
+    P = float(P)
 
-    if C is not None and C != "":
-        course_effective = float(C)
-        D = diametre_cylindre(Vs, course_effective)
-        course_flag = False
-    else:
-        course_effective, D = course_diam_carre(Vs)
-        course_flag = True
+    valeurs, flags = resoudre_parametres(Th, Tc, pm, f, Nc, eta)
+    Th, Tc, pm, f, Nc, eta = (valeurs[nom] for nom in DEFAULTS)
 
-    D_int = D
-    e_min = epaisseur_paroi_min(D_int, pm, mat_data["limite_rupture"])
-    D_ext = D_int + 2 * e_min
-    h = course_effective
+    mat_data = MATERIAUX.get(materiau, MATERIAUX["Acier"])
+    limite = float(mat_data["limite_rupture"])
+    if resistance_a_chaud:
+        limite = float(propriete_materiau(str(materiau), "Rm", Th, limite))
 
-    volume_cylindre = math.pi * ((D_ext / 2)**2 - (D_int / 2)**2) * h
-    masse_cylindre = volume_cylindre * mat_data["rho"]
+    nom = gaz_travail.nom_gaz(gaz)
+    T_gaz = gaz_travail.temperature_moyenne_log(Th, Tc)
+    props = gaz_travail.proprietes(nom, T_gaz, pm)
+    est_air = nom == "Air"
 
-    archi = archi_conseillee(Nc)
-    v_pist = vitesse_piston(course_effective, f)
+    # volume_balaye, avec la correction de rendement du gaz, puis le cylindre (cf. calcul_complet_batch)
+    dT = (Th - Tc) / Th
+    eta_c = eta / 100 if eta > 1 else eta
+    denom = Nc * pm * f * dT * eta_c
+    nul = abs(Th - Tc) < 1e-8 or Th <= 0 or Tc < 0 or denom <= 0
+    course_flag = C is None or C == "" or math.isnan(float(C))
+    course_impose = math.nan if course_flag else float(C)
 
-    Th_C = Th - 273.15
-    Tc_C = Tc - 273.15
+    rho_air = props["rho"] if est_air else gaz_travail.propriete("Air", "rho", T_gaz, pm)
+    Vs, facteur, pertes = (float(x) for x in _correction_gaz(P, denom, nul, course_flag, course_impose, f, pm, dT,
+                                                              rho_air, props["rho"] / rho_air, est_air))
+    course_effective, D, e_min, D_ext, masse_cylindre = (
+        float(x) for x in _cylindre(Vs, course_flag, course_impose, pm, limite, mat_data["rho"]))
+    h = course_effective
 
-    retour = {
-        "Puissance_W": float(P),
-        "Temp_chaud_C": Th_C,
-        "Temp_froid_C": Tc_C,
+    return {
+        "Puissance_W": P,
+        "Temp_chaud_C": Th - 273.15,
+        "Temp_froid_C": Tc - 273.15,
         "Pression_Pa": pm,
         "Frequence_Hz": f,
         "Nb_cylindres": Nc,
@@ -180,16 +220,245 @@ def calcul_complet(P, Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None, C=No
         "Materiau": materiau,
         "Volume_balayé_m3": Vs,
         "Course_m": course_effective,
-        "Diametre_interne_m": D_int,
+        "Diametre_interne_m": D,
         "Epaisseur_min_m": e_min,
+        "Paroi_realisable": math.isfinite(e_min),
         "Diametre_externe_m": D_ext,
         "Longueur_cylindre_m": h,
         "Masse_cylindre_kg": masse_cylindre,
-        "Architecture": archi,
-        "Vitesse_piston_m_s": v_pist,
+        "Architecture": archi_conseillee(Nc),
+        "Vitesse_piston_m_s": vitesse_piston(course_effective, f),
         "Puissance_specifique_W_kg": puissance_specifique(P, masse_cylindre),
+        "Rendement_effectif": eta_c * facteur,
+        "Pertes_ecoulement": pertes,
+        "Gamma_gaz": props["gamma"],
+        "Masse_volumique_gaz_kg_m3": props["rho"],
+        "Viscosite_gaz_Pa_s": props["mu"],
+        "Conductivite_gaz_W_m_K": props["k"],
         "autofill": flags,
-        "course_autofill": course_flag
+        "course_autofill": course_flag,
     }
 
-    return retour
+def _cote_carre(Vs):
+    """Course = diamètre d’un cylindre carré de volume Vs (course_diam_carre), 0 si Vs <= 0."""
+    return np.where(Vs <= 0, 0.0, (4 * Vs / np.pi) ** (1/3))
+
+def _borne_pertes(lam):
+    """Λ ramené dans [0, LAMBDA_MAX] (NaN conservé)."""
+    return np.minimum(np.maximum(lam, 0.0), LAMBDA_MAX)
+
+def _correction_gaz(P, denom, nul, course_flag, course_impose, f, pm, dT, rho_air, rapport_rho, est_air):
+    """
+    Volume balayé avec la correction de rendement du gaz (facteur 1 exact pour l’air),
+    commune à calcul_complet et calcul_complet_batch (scalaires ou colonnes). Pour une
+    course auto-calculée, la vitesse du piston dépend du volume balayé : point fixe.
+    Renvoie (Vs, facteur, pertes Λ).
+    """
+    P, denom = np.asarray(P, dtype=float), np.asarray(denom, dtype=float)
+    facteur, pertes = np.ones(P.shape), np.zeros(P.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(1 if np.all(est_air) else ITERATIONS_GAZ):
+            Vs = np.where(nul, 0.0, P / (denom * facteur))
+            v_gaz = K_VITESSE_GAZ * 2 * np.where(course_flag, _cote_carre(Vs), course_impose) * f
+            lam_air = _borne_pertes(XI_ECOULEMENT * 0.5 * rho_air * v_gaz**2 / (pm * dT))
+            lam = _borne_pertes(lam_air * rapport_rho)
+            pertes = np.where(np.isfinite(lam), lam, 0.0)
+            nouveau = np.where(est_air | ~np.isfinite(lam), 1.0, (1 - lam) / (1 - lam_air))
+            ecart = np.max(np.abs(nouveau - facteur), initial=0.0)
+            facteur = nouveau
+            if ecart < 1e-12:
+                break
+        Vs = np.where(nul, 0.0, P / (denom * facteur))
+    return Vs, facteur, pertes
+
+def _cylindre(Vs, course_flag, course_impose, pm, limite, rho):
+    """
+    Cylindre d’un volume balayé, commun aux deux chemins : course imposée (diametre_cylindre)
+    ou cylindre carré (course_diam_carre), épaisseur de paroi (epaisseur_paroi_min,
+    coef_secu = 2.0, inf sans résistance), diamètre extérieur et masse.
+    Renvoie (course, D, e_min, D_ext, masse).
+    """
+    Vs, course_impose = np.asarray(Vs, dtype=float), np.asarray(course_impose, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        carre = _cote_carre(Vs)
+        D_impose = np.where(course_impose <= 0, 0.0, np.sqrt(4 * Vs / (np.pi * course_impose)))
+        course = np.where(course_flag, carre, course_impose)
+        D = np.where(course_flag, carre, D_impose)
+        sigma_adm = limite / 2.0
+        e_min = np.where((D <= 0) | (pm <= 0), 0.0, np.where(limite <= 0, np.inf, (pm * D) / (2 * sigma_adm)))
+        D_ext = D + 2 * e_min
+        masse = np.pi * ((D_ext / 2)**2 - (D / 2)**2) * course * rho
+    return course, D, e_min, D_ext, masse
+
+# ---------------------------------------------------------------------------
+# Calcul en lot (vectorisé NumPy)
+# ---------------------------------------------------------------------------
+
+PARAMETRES_LOT = ("P", "Th", "Tc", "pm", "f", "Nc", "eta", "C", "gaz", "materiau")
+
+def _est_vide(val):
+    return val is None or (isinstance(val, str) and val == "")
+
+def _colonne_safe(val, default, n, entier=False):
+    """
+    Équivalent vectorisé de safe_float / safe_int.
+    Renvoie (valeurs, drapeaux_autofill) sous forme de tableaux de longueur n.
+    """
+    dtype = np.int64 if entier else float
+    if _est_vide(val):
+        return np.full(n, default, dtype=dtype), np.ones(n, dtype=bool)
+    arr = np.broadcast_to(np.asarray(val), (n,))
+    if arr.dtype.kind in "biuf":
+        x = arr.astype(float)
+        with np.errstate(invalid="ignore"):
+            if entier:
+                # int() tronque vers zéro et échoue sur NaN/inf
+                x = np.trunc(x)
+                invalide = ~np.isfinite(x) | (x <= 0)
+            else:
+                invalide = np.isnan(x) | ((default > 0) & (x <= 0))
+        return np.where(invalide, default, x).astype(dtype), invalide
+    # Colonne hétérogène (None, chaînes...) : on repasse par la version scalaire
+    conv = safe_int if entier else safe_float
+    paires = [conv(v, default) for v in arr.tolist()]
+    valeurs = np.array([p[0] for p in paires], dtype=dtype)
+    drapeaux = np.array([p[1] for p in paires], dtype=bool)
+    return valeurs, drapeaux
+
+def _colonne_course(C, n):
+    """Course imposée (NaN = non renseignée) et drapeau course_autofill."""
+    if _est_vide(C):
+        return np.full(n, np.nan), np.ones(n, dtype=bool)
+    arr = np.broadcast_to(np.asarray(C), (n,))
+    if arr.dtype.kind in "biuf":
+        course = arr.astype(float)
+    else:
+        course = np.array([np.nan if _est_vide(v) else float(v) for v in arr.tolist()])
+    return course, np.isnan(course)
+
+def _colonne_puissance(P, n):
+    arr = np.broadcast_to(np.asarray(P), (n,))
+    if arr.dtype.kind not in "biuf":
+        if any(_est_vide(v) for v in arr.tolist()):
+            raise ValueError("La puissance P doit être renseignée et strictement positive.")
+        arr = np.array([float(v) for v in arr.tolist()])
+    P = arr.astype(float)
+    if np.any(P <= 0):
+        raise ValueError("La puissance P doit être renseignée et strictement positive.")
+    return P
+
+def calcul_complet_batch(P, Th=None, Tc=None, pm=None, f=None, Nc=None, eta=None, C=None, gaz="Air", materiau="Acier",
+                         resistance_a_chaud=False):
+    """
+    Version vectorisée de `calcul_complet` sur des tableaux NumPy.
+    - Chaque paramètre accepte un scalaire ou un tableau 1-D (diffusion NumPy).
+    - P peut aussi être un dict de colonnes ou un tableau structuré contenant
+      les champs de PARAMETRES_LOT.
+    - Une course C à NaN (ou None dans une colonne objet) est considérée non renseignée.
+    - resistance_a_chaud : épaisseur de paroi dimensionnée avec la limite de rupture à Th
+      (module materiaux) au lieu de la valeur à 20 °C ; une matière sans résistance à Th
+      donne une épaisseur infinie et Paroi_realisable à False.
+    Renvoie un dict de colonnes avec les mêmes clés que `calcul_complet`
+    ("autofill" est un dict de tableaux booléens).
+    """
+    if isinstance(P, dict) or getattr(getattr(P, "dtype", None), "names", None):
+        colonnes = P
+        noms = colonnes.keys() if isinstance(colonnes, dict) else colonnes.dtype.names
+        valeurs = dict(Th=Th, Tc=Tc, pm=pm, f=f, Nc=Nc, eta=eta, C=C, gaz=gaz, materiau=materiau)
+        for nom in PARAMETRES_LOT[1:]:
+            if nom in noms:
+                valeurs[nom] = colonnes[nom]
+        P = colonnes["P"]
+        Th, Tc, pm, f = valeurs["Th"], valeurs["Tc"], valeurs["pm"], valeurs["f"]
+        Nc, eta, C = valeurs["Nc"], valeurs["eta"], valeurs["C"]
+        gaz, materiau = valeurs["gaz"], valeurs["materiau"]
+
+    formes = [np.shape(x) for x in (P, Th, Tc, pm, f, Nc, eta, C, gaz, materiau) if not _est_vide(x)]
+    forme = np.broadcast_shapes(*formes)
+    if len(forme) > 1:
+        raise ValueError("Les paramètres du calcul en lot doivent être des scalaires ou des tableaux 1-D.")
+    n = forme[0] if forme else 1
+
+    P = _colonne_puissance(P, n)
+    flags = {}
+    Th, flags['Th'] = _colonne_safe(Th, DEFAULTS['Th'], n)
+    Tc, flags['Tc'] = _colonne_safe(Tc, DEFAULTS['Tc'], n)
+    pm, flags['pm'] = _colonne_safe(pm, DEFAULTS['pm'], n)
+    f, flags['f'] = _colonne_safe(f, DEFAULTS['f'], n)
+    Nc, flags['Nc'] = _colonne_safe(Nc, DEFAULTS['Nc'], n, entier=True)
+    eta, flags['eta'] = _colonne_safe(eta, DEFAULTS['eta'], n)
+
+    proches = np.abs(Th - Tc) < 1e-6
+    Th = np.where(proches, Th + 10, Th)
+    flags['Th'] = flags['Th'] | proches
+
+    materiaux = np.broadcast_to(np.asarray(materiau, dtype=object), (n,))
+    if isinstance(materiau, str):
+        mat_data = MATERIAUX.get(materiau, MATERIAUX["Acier"])
+        rho, limite = float(mat_data["rho"]), float(mat_data["limite_rupture"])
+    else:
+        uniques, inverse = np.unique(materiaux.astype(str), return_inverse=True)
+        donnees = [MATERIAUX.get(m, MATERIAUX["Acier"]) for m in uniques]
+        rho = np.array([d["rho"] for d in donnees], dtype=float)[inverse]
+        limite = np.array([d["limite_rupture"] for d in donnees], dtype=float)[inverse]
+    if resistance_a_chaud:
+        limite = proprietes_materiaux(materiaux.astype(str), "Rm", Th, limite)
+
+    gaz_noms = np.broadcast_to(np.asarray(gaz, dtype=object), (n,))
+    T_gaz = np.broadcast_to(gaz_travail.temperature_moyenne_log(Th, Tc), (n,))
+    props = gaz_travail.proprietes(gaz_travail.nom_gaz(gaz) if isinstance(gaz, str) else gaz_noms, T_gaz, pm)
+    if isinstance(gaz, str):
+        est_air = np.full(n, gaz_travail.nom_gaz(gaz) == "Air")
+    else:
+        est_air = np.array([gaz_travail.nom_gaz(g) == "Air" for g in gaz_noms.tolist()], dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # volume_balaye
+        dT = (Th - Tc) / Th
+        eta_c = np.where(eta > 1, eta / 100, eta)
+        denom = Nc * pm * f * dT * eta_c
+        nul = (np.abs(Th - Tc) < 1e-8) | (Th <= 0) | (Tc < 0) | (denom <= 0)
+        course_impose, course_flag = _colonne_course(C, n)
+
+        rho_air = props["rho"] if np.all(est_air) else gaz_travail.propriete("Air", "rho", T_gaz, pm)
+        Vs, facteur, pertes = _correction_gaz(P, denom, nul, course_flag, course_impose, f, pm, dT,
+                                              rho_air, props["rho"] / rho_air, est_air)
+        course, D, e_min, D_ext, masse = _cylindre(Vs, course_flag, course_impose, pm, limite, rho)
+        h = course
+
+        v_pist = 2 * course * f
+        p_spec = np.where(masse <= 0, 0.0, P / masse)
+
+    nc_uniques, nc_inverse = np.unique(Nc, return_inverse=True)
+    archi = np.array([archi_conseillee(int(v)) for v in nc_uniques], dtype=object)[nc_inverse]
+
+    return {
+        "Puissance_W": P,
+        "Temp_chaud_C": Th - 273.15,
+        "Temp_froid_C": Tc - 273.15,
+        "Pression_Pa": pm,
+        "Frequence_Hz": f,
+        "Nb_cylindres": Nc,
+        "Rendement": eta,
+        "Gaz": gaz_noms,
+        "Materiau": materiaux,
+        "Volume_balayé_m3": Vs,
+        "Course_m": course,
+        "Diametre_interne_m": D,
+        "Epaisseur_min_m": e_min,
+        "Paroi_realisable": np.isfinite(e_min),
+        "Diametre_externe_m": D_ext,
+        "Longueur_cylindre_m": h,
+        "Masse_cylindre_kg": masse,
+        "Architecture": archi,
+        "Vitesse_piston_m_s": v_pist,
+        "Puissance_specifique_W_kg": p_spec,
+        "Rendement_effectif": eta_c * facteur,
+        "Pertes_ecoulement": pertes,
+        "Gamma_gaz": props["gamma"],
+        "Masse_volumique_gaz_kg_m3": props["rho"],
+        "Viscosite_gaz_Pa_s": props["mu"],
+        "Conductivite_gaz_W_m_K": props["k"],
+        "autofill": flags,
+        "course_autofill": course_flag,
+    }
@@ -2,23 +2,45 @@
 
 import math
 
+import numpy as np
+
+from calculs.catalogue import colonnes, lignes, premiere, roulement
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+from calculs.tolerances import ecarts
+
 # Tableau minimal de roulements à billes standard ISO (SKF 6000, 6001, ...)
+# charge_C : charge dynamique de base (N), charge_C0 : charge statique de base (N), masse (kg)
 ROULEMENTS_ISO = [
-    {"ref": "6000", "d": 10.0, "D": 26.0, "B": 8.0, "charge_C": 4.55e3},
-    {"ref": "6001", "d": 12.0, "D": 28.0, "B": 8.0, "charge_C": 5.10e3},
-    {"ref": "6002", "d": 15.0, "D": 32.0, "B": 9.0, "charge_C": 6.55e3},
-    {"ref": "6003", "d": 17.0, "D": 35.0, "B": 10.0, "charge_C": 7.90e3},
-    {"ref": "6004", "d": 20.0, "D": 42.0, "B": 12.0, "charge_C": 9.65e3},
+    {"ref": "6000", "d": 10.0, "D": 26.0, "B": 8.0, "charge_C": 4.55e3, "charge_C0": 1.96e3, "masse": 0.019},
+    {"ref": "6001", "d": 12.0, "D": 28.0, "B": 8.0, "charge_C": 5.10e3, "charge_C0": 2.36e3, "masse": 0.022},
+    {"ref": "6002", "d": 15.0, "D": 32.0, "B": 9.0, "charge_C": 6.55e3, "charge_C0": 2.85e3, "masse": 0.030},
+    {"ref": "6003", "d": 17.0, "D": 35.0, "B": 10.0, "charge_C": 7.90e3, "charge_C0": 3.25e3, "masse": 0.039},
+    {"ref": "6004", "d": 20.0, "D": 42.0, "B": 12.0, "charge_C": 9.65e3, "charge_C0": 5.00e3, "masse": 0.069},
+    {"ref": "6200", "d": 10.0, "D": 30.0, "B": 9.0, "charge_C": 5.40e3, "charge_C0": 2.36e3, "masse": 0.032},
+    {"ref": "6201", "d": 12.0, "D": 32.0, "B": 10.0, "charge_C": 7.28e3, "charge_C0": 3.10e3, "masse": 0.037},
+    {"ref": "6202", "d": 15.0, "D": 35.0, "B": 11.0, "charge_C": 8.06e3, "charge_C0": 3.75e3, "masse": 0.045},
+    {"ref": "6203", "d": 17.0, "D": 40.0, "B": 12.0, "charge_C": 9.95e3, "charge_C0": 4.75e3, "masse": 0.065},
+    {"ref": "6204", "d": 20.0, "D": 47.0, "B": 14.0, "charge_C": 13.5e3, "charge_C0": 6.55e3, "masse": 0.106},
+    {"ref": "6300", "d": 10.0, "D": 35.0, "B": 11.0, "charge_C": 8.52e3, "charge_C0": 3.40e3, "masse": 0.053},
+    {"ref": "6301", "d": 12.0, "D": 37.0, "B": 12.0, "charge_C": 10.1e3, "charge_C0": 4.15e3, "masse": 0.060},
+    {"ref": "6302", "d": 15.0, "D": 42.0, "B": 13.0, "charge_C": 11.9e3, "charge_C0": 5.40e3, "masse": 0.082},
+    {"ref": "6303", "d": 17.0, "D": 47.0, "B": 14.0, "charge_C": 14.3e3, "charge_C0": 6.55e3, "masse": 0.115},
+    {"ref": "6304", "d": 20.0, "D": 52.0, "B": 15.0, "charge_C": 16.8e3, "charge_C0": 7.80e3, "masse": 0.144},
     # ... compléter au besoin
 ]
 
+# Durée de vie nominale ISO 281 : L10 = (C / P)^p millions de tours, p = 3 pour les billes
+EXPOSANT_BILLES = 3
+DUREE_CIBLE_H = 10_000      # Durée L10h visée par défaut (fonctionnement intermittent)
+
 MATERIAUX_SUPP = {
     "Alu": {"densite": 2700, "limite": 140e6},
     "Acier": {"densite": 7850, "limite": 240e6},
     "Fonte": {"densite": 7200, "limite": 110e6},
 }
 
-# Tolerances ISO de logement (glissant H7, serrant N6...)
+# Écarts de logement de référence (Ø18 à 30 mm) repris dans le catalogue ; les écarts
+# selon le diamètre du roulement sont donnés par calculs.tolerances (ISO 286)
 TOLERANCES_ISO = {
     "H7": 0.021,    # mm sur D jusqu'à 25 mm, voir ISO 286-2 pour détails
     "N6": 0.011,
@@ -26,18 +48,121 @@ TOLERANCES_ISO = {
 
 def choix_roulement(d_arbre_mm, charge_radiale_N, type="billes"):
     """Sélectionne le premier roulement standard adapté en diamètre ET charge"""
-    for roulement in ROULEMENTS_ISO:
-        if roulement["d"] >= d_arbre_mm and roulement["charge_C"] >= charge_radiale_N:
-            return roulement
+    ligne = premiere("SELECT ref FROM roulements WHERE d >= ? AND charge_C >= ? ORDER BY rowid LIMIT 1",
+                     (d_arbre_mm, charge_radiale_N))
+    if ligne is not None:
+        return roulement(ligne["ref"])
     raise ValueError("Aucun roulement standard ISO trouvé pour cet arbre/charge.")
 
-class SupportRoulement:
+# Index du choix en lot, reconstruit quand les colonnes du catalogue changent (recharger)
+_index_choix = []
+
+def _index_choix_roulement():
+    """
+    Alésages et charges C distincts triés, puis pour chaque alésage mini les roulements
+    d’alésage suffisant triés par charge C croissante : clé (rang d’alésage, rang de charge)
+    aplatie et plus petit indice du catalogue parmi les roulements de charge au moins égale.
+    """
+    col = colonnes("roulements")
+    if not _index_choix or _index_choix[0] is not col:
+        alesages, charges = np.unique(col["d"]), np.unique(col["charge_C"])
+        rang_C = np.searchsorted(charges, col["charge_C"])
+        cles, premiers = [], []
+        for k, d in enumerate(alesages):
+            candidats = np.flatnonzero(col["d"] >= d)
+            ordre = candidats[np.argsort(rang_C[candidats], kind="stable")]
+            cles.append(k * (charges.size + 1) + rang_C[ordre])
+            premiers.append(np.minimum.accumulate(ordre[::-1])[::-1])
+        _index_choix[:] = [col, alesages, charges, np.concatenate(cles), np.concatenate(premiers)]
+    return _index_choix[1:]
+
+def choix_roulement_lot(d_arbre_mm, charge_radiale_N):
+    """
+    Version en lot de `choix_roulement` (diffusion NumPy sur les diamètres et les charges) :
+    même roulement que le calcul scalaire, trouvé par np.searchsorted sur le catalogue trié
+    par alésage puis par charge C, sans boucle sur les cas.
+    Renvoie Indice (ligne du catalogue, -1 si aucun roulement ne convient), ref (vide si
+    aucun), les colonnes du roulement retenu (NaN si aucun) et Possible.
+    """
+    alesages, charges, cles, premiers = _index_choix_roulement()
+    d, F = np.broadcast_arrays(np.asarray(d_arbre_mm, dtype=float), np.asarray(charge_radiale_N, dtype=float))
+    k = np.searchsorted(alesages, d)
+    r = np.searchsorted(charges, F)
+    pos = np.searchsorted(cles, k * (charges.size + 1) + r)
+    pos_borne = np.minimum(pos, cles.size - 1)
+    possible = (k < alesages.size) & (r < charges.size) & (pos < cles.size) & (cles[pos_borne] < (k + 1) * (charges.size + 1))
+    indice = np.where(possible, premiers[pos_borne], -1)
+    col = colonnes("roulements")
+    choix = np.maximum(indice, 0)
+    res = {"Indice": indice, "ref": np.where(possible, col["ref"][choix], "")}
+    for cle, valeurs in colonnes_catalogue().items():
+        res[cle] = np.where(possible, valeurs[choix], np.nan)
+    res["Possible"] = possible
+    return res
+
+def colonnes_catalogue(catalogue=None):
+    """
+    Colonnes NumPy du catalogue (d, D, B, charge_C, charge_C0, masse), même ordre que les lignes ;
+    par défaut la table « roulements » de calculs.catalogue.
+    """
+    cles = ("d", "D", "B", "charge_C", "charge_C0", "masse")
+    if catalogue is None:
+        return {cle: colonnes("roulements")[cle] for cle in cles}
+    return {cle: np.array([r[cle] for r in catalogue], dtype=float) for cle in cles}
+
+def charge_equivalente(charges, vitesses=None, axis=-1):
+    """
+    Charge dynamique équivalente d’un cycle (moyenne cubique, N) :
+    P_m = (Σ |F|³ n / Σ n)^(1/3), n vitesse de rotation (ou durée) associée à chaque échantillon ;
+    sans vitesses, échantillons équirépartis (par ex. un tour à vitesse constante).
+    """
+    F3 = np.abs(np.asarray(charges, dtype=float)) ** EXPOSANT_BILLES
+    if vitesses is None:
+        moyenne = np.mean(F3, axis=axis)
+    else:
+        n = np.broadcast_to(np.asarray(vitesses, dtype=float), F3.shape)
+        moyenne = np.sum(F3 * n, axis=axis) / np.sum(n, axis=axis)
+    return moyenne ** (1 / EXPOSANT_BILLES)
+
+def duree_L10h(charge_C, charge_P, f):
+    """Durée nominale L10h (h) : (C / P)^3 · 10^6 tours à f tours/s. Diffusion NumPy sur C, P et f."""
+    C, P, f = (np.asarray(x, dtype=float) for x in (charge_C, charge_P, f))
+    with np.errstate(divide="ignore"):
+        return np.where(P > 0, (C / np.where(P > 0, P, 1.0)) ** EXPOSANT_BILLES, np.inf) * 1e6 / (3600 * f)
+
+def choix_roulement_duree(d_arbre_mm, charge_P_N, f, duree_h=DUREE_CIBLE_H, charge_max_N=None, s0=1.0):
+    """
+    Roulement le plus léger du catalogue dont l’alésage convient à l’arbre, dont la durée L10h
+    sous la charge équivalente P à f (Hz) atteint duree_h, et dont la charge statique C0
+    couvre s0 x la charge maximale (par défaut P). Tout le catalogue est évalué d’un coup.
+    """
+    col = colonnes_catalogue()
+    charge_max_N = charge_P_N if charge_max_N is None else charge_max_N
+    duree = duree_L10h(col["charge_C"], charge_P_N, f)
+    possible = (col["d"] >= d_arbre_mm) & (duree >= duree_h) & (col["charge_C0"] >= s0 * charge_max_N)
+    if not possible.any():
+        raise ValueError(f"Aucun roulement standard ISO n’atteint {duree_h:.0f} h pour cet arbre/charge.")
+    return lignes("roulements")[int(np.argmin(np.where(possible, col["masse"], np.inf)))]
+
+class SupportRoulement(Piece):
     """
     Modélisation d’un support de roulement pour CAO :
     - Géométrie, matière, masse, tolérances, RDM.
     - Choix auto du roulement standard
     """
 
+    __slots__ = (
+        "d_arbre_mm", "charge_radiale_N", "matiere", "largeur_support", "epaisseur",
+        "type_tolerance", "avec_circlips", "avec_joint", "roulement", "d_alésage",
+        "largeur_roulement", "frequence_Hz", "duree_cible_h",
+    )
+    ARGUMENTS = {
+        "d_arbre_mm": "d_arbre_mm", "charge_radiale_N": "charge_radiale_N", "matiere": "matiere",
+        "largeur_support_mm": "largeur_support", "epaisseur_mm": "epaisseur",
+        "type_tolerance": "type_tolerance", "avec_circlips": "avec_circlips",
+        "avec_joint": "avec_joint", "frequence_Hz": "frequence_Hz", "duree_cible_h": "duree_cible_h",
+    }
+
     def __init__(
         self,
         d_arbre_mm,
@@ -47,7 +172,9 @@ class SupportRoulement:
         epaisseur_mm=10,
         type_tolerance="H7",
         avec_circlips=False,
-        avec_joint=False
+        avec_joint=False,
+        frequence_Hz=None,          # Vitesse de rotation (tr/s) : donne la durée L10h
+        duree_cible_h=None,         # Durée L10h visée : choix du plus léger (sinon sur la seule charge C)
     ):
         self.d_arbre_mm = d_arbre_mm
         self.charge_radiale_N = charge_radiale_N
@@ -57,13 +184,20 @@ class SupportRoulement:
         self.type_tolerance = type_tolerance
         self.avec_circlips = avec_circlips
         self.avec_joint = avec_joint
+        self.frequence_Hz = frequence_Hz
+        self.duree_cible_h = duree_cible_h
 
         # Sélection du roulement
-        self.roulement = choix_roulement(d_arbre_mm, charge_radiale_N)
-        self.d_alésage = self.roulement["D"] + (TOLERANCES_ISO.get(type_tolerance, 0.021))
+        if duree_cible_h is None:
+            self.roulement = choix_roulement(d_arbre_mm, charge_radiale_N)
+        elif frequence_Hz is None:
+            raise ValueError("Une durée cible suppose une fréquence de rotation.")
+        else:
+            self.roulement = choix_roulement_duree(d_arbre_mm, charge_radiale_N, frequence_Hz, duree_cible_h)
+        self.d_alésage = self.roulement["D"] + ecarts(type_tolerance, self.roulement["D"])[0]
         self.largeur_roulement = self.roulement["B"]
 
-    @property
+    @propriete_cachee
     def masse(self):
         """Masse du support (approximé en cylindre plein hors alésage roulement)"""
         r_ext = (self.d_alésage / 2 + self.epaisseur)
@@ -71,17 +205,26 @@ class SupportRoulement:
         volume = math.pi * (r_ext**2 - r_int**2) * self.largeur_support / 1000  # mm3 -> cm3
         return volume * MATERIAUX_SUPP[self.matiere]["densite"] / 1e6  # en kg
 
-    @property
+    @propriete_cachee
     def contrainte_max(self):
         """Vérification RDM simple sous charge radiale (approchée)"""
         S = (self.d_alésage / 2) * self.largeur_support / 1000  # surface appui (mm2 -> cm2)
         if S <= 0: return 0
         return self.charge_radiale_N / (S * 1e-4)  # N / cm2 -> Pa
 
+    @propriete_cachee
+    def duree_L10h(self):
+        """Durée nominale L10h (h) du roulement choisi, None sans fréquence de rotation"""
+        if self.frequence_Hz is None:
+            return None
+        return float(duree_L10h(self.roulement["charge_C"], self.charge_radiale_N, self.frequence_Hz))
+
     def tol_alesage(self):
-        """Tolérance d'alésage selon la norme"""
-        return TOLERANCES_ISO.get(self.type_tolerance, 0.021)
+        """Intervalle de tolérance de l'alésage du logement (mm, ISO 286 au diamètre du roulement)"""
+        sup, inf = ecarts(self.type_tolerance, self.roulement["D"])
+        return round(float(sup - inf), 4)
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Arbre (mm)": self.d_arbre_mm,
@@ -97,13 +240,16 @@ class SupportRoulement:
             "Avec joint": self.avec_joint,
             "Masse support (kg)": round(self.masse, 4),
             "Contrainte max (Pa)": int(self.contrainte_max),
+            "Durée L10 (h)": (self.duree_L10h if self.duree_L10h is None or math.isinf(self.duree_L10h)
+                              else round(self.duree_L10h)),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"SupportRoulement(Arbre={self.d_arbre_mm} mm, "
             f"Roulement={self.roulement['ref']}, "
-            f"Alésage={self.roulement['D']:.2f} mm H7, "
+            f"Alésage={self.roulement['D']:.2f} mm {self.type_tolerance}, "
             f"Charge={self.charge_radiale_N} N, Mat={self.matiere})"
         )
 
@@ -121,3 +267,16 @@ if __name__ == "__main__":
     )
     print(supp)
     print("Paramètres CAO :", supp.to_dict())
+
+    # Balayage de 100 000 couples arbre/charge en un appel
+    rng = np.random.default_rng(0)
+    lot = choix_roulement_lot(rng.uniform(5, 25, 100_000), rng.uniform(1e3, 2e4, 100_000))
+    print(f"Lot : {int(lot['Possible'].sum())} / 100000 cas pourvus, premiers : {lot['ref'][:5]}")
+
+    # Charge d’un tour d’embiellage (efforts d’inertie répartis sur deux paliers), durée visée
+    from calculs.cinematique import forces_inertie
+    efforts = forces_inertie(0.02, 0.08, 25.0, 0.4, 0.2)
+    charges = np.hypot(efforts["Force_alternative_N"] + efforts["Force_rotative_x_N"], efforts["Force_rotative_y_N"]) / 2
+    P = float(charge_equivalente(charges))
+    supp = SupportRoulement(d_arbre_mm=12, charge_radiale_N=P, frequence_Hz=25.0, duree_cible_h=DUREE_CIBLE_H)
+    print(f"P = {P:.0f} N -> {supp.roulement['ref']}, L10h = {supp.duree_L10h:.0f} h")
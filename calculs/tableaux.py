@@ -0,0 +1,437 @@
+# calculs/tableaux.py
+
+import inspect
+import math
+from functools import cached_property
+
+import numpy as np
+
+from calculs import bielle as bielle_mod
+from calculs import piston as piston_mod
+from calculs.bielle import BielleStirling
+from calculs.cylindre import CylindreStirling
+from calculs.piston import PistonStirling
+from calculs.villebrequin import VillebrequinStirling
+from materiaux import proprietes_lot as proprietes_materiaux
+
+# Collections de pièces « en colonnes » : un tableau NumPy contigu (lecture seule) par
+# paramètre, les grandeurs dérivées (volumes, masses, surfaces, inerties...) étant les
+# mêmes expressions que dans les classes scalaires, évaluées sur toutes les lignes à la
+# fois (les plus réutilisées étant conservées). `ligne(i)` reconstruit l’objet scalaire
+# de la ligne i.
+
+def _correspondance(cles, fonction):
+    """Colonne des fonction(cle) pour une colonne de clés textuelles (une évaluation par clé distincte)."""
+    cles = np.asarray(cles, dtype=object)
+    if cles.ndim == 0 or (cles.size and cles.strides[0] == 0):
+        return np.full(max(cles.size, 1) if cles.ndim else 1, float(fonction(str(cles.flat[0]))))
+    uniques, inverse = np.unique(cles.astype(str), return_inverse=True)
+    return np.array([fonction(c) for c in uniques], dtype=float)[inverse.reshape(-1)]
+
+def _colonnes_materiau(materiaux, table, cle):
+    """Colonne des valeurs table[materiau][cle] (matériau inconnu -> "Acier")."""
+    return _correspondance(materiaux, lambda m: table.get(m, table["Acier"])[cle])
+
+def _proportions(proportions, module):
+    """Constantes de proportion du module, éventuellement remplacées (scalaires ou colonnes)."""
+    proportions = proportions or {}
+    return lambda nom: proportions.get(nom, getattr(module, nom))
+
+
+class _TableauPieces:
+    """
+    Base des collections : CLASSE est la classe scalaire ; chaque argument de son
+    constructeur (CLASSE.ARGUMENTS) donne une colonne du même nom que l’attribut de
+    l’objet scalaire. Les arguments absents prennent la valeur par défaut du
+    constructeur scalaire. Les lignes ne sont pas validées (un tirage aberrant donne des
+    grandeurs aberrantes, pas une exception) : `ligne(i)` applique les contrôles scalaires.
+    """
+
+    CLASSE = None
+    TEXTES = ()
+    ENTIERS = ()
+
+    def __init__(self, **colonnes):
+        inconnus = set(colonnes) - set(self.CLASSE.ARGUMENTS)
+        if inconnus:
+            raise ValueError(f"Paramètres inconnus pour {type(self).__name__} : {', '.join(sorted(inconnus))}")
+        signature = inspect.signature(self.CLASSE.__init__).parameters
+        valeurs = {}
+        for arg in self.CLASSE.ARGUMENTS:
+            if arg in colonnes:
+                valeurs[arg] = colonnes[arg]
+            elif signature[arg].default is not inspect.Parameter.empty:
+                valeurs[arg] = signature[arg].default
+            else:
+                raise ValueError(f"Paramètre obligatoire manquant pour {type(self).__name__} : {arg}")
+        forme = np.broadcast_shapes(*(np.shape(v) for v in valeurs.values()))
+        if len(forme) > 1:
+            raise ValueError("Les colonnes doivent être des scalaires ou des tableaux 1-D.")
+        self._n = forme[0] if forme else 1
+        for arg, attr in self.CLASSE.ARGUMENTS.items():
+            if arg in self.TEXTES:
+                col = np.broadcast_to(np.asarray(valeurs[arg], dtype=object), (self._n,))
+            else:
+                dtype = np.int64 if arg in self.ENTIERS else float
+                col = np.array(np.broadcast_to(np.asarray(valeurs[arg], dtype=dtype), (self._n,)))
+                col.flags.writeable = False
+            setattr(self, attr, col)
+        self._deriver()
+
+    def _deriver(self):
+        """Colonnes dérivées du constructeur scalaire (ajustements, grandeurs annexes)."""
+
+    def __len__(self):
+        return self._n
+
+    def ligne(self, i):
+        """Objet scalaire (CLASSE) de la ligne i."""
+        arguments = {}
+        for arg, attr in self.CLASSE.ARGUMENTS.items():
+            v = getattr(self, attr)[i]
+            arguments[arg] = v.item() if isinstance(v, np.generic) else v
+        return self.CLASSE(**arguments)
+
+    @classmethod
+    def depuis_objets(cls, pieces):
+        """Collection construite à partir d’une liste d’objets scalaires."""
+        return cls(**{arg: [getattr(p, attr) for p in pieces] for arg, attr in cls.CLASSE.ARGUMENTS.items()})
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._n} lignes)"
+
+
+class CylindreArray(_TableauPieces):
+    """
+    Cylindres en colonnes (cf. CylindreStirling). L’épaisseur est portée au diamètre
+    de perçage du taraudage ligne par ligne, sans message.
+    """
+
+    CLASSE = CylindreStirling
+    TEXTES = ("matiere", "etat_surface", "dim_vis_iso")
+    ENTIERS = ("nb_vis",)
+
+    def _deriver(self):
+        self.diam_percage_vis = _correspondance(
+            self.dim_vis_iso, lambda d: CylindreStirling.DIAM_PERCAGE_TARAUD_ISO.get(d, 5.0)) / 1000.0
+        self.epaisseur = np.maximum(self.epaisseur, self.diam_percage_vis)
+        self.entraxe_vis = (self.diametre / 2) * self.entraxe_vis_pct
+        for col in (self.diam_percage_vis, self.epaisseur, self.entraxe_vis):
+            col.flags.writeable = False
+
+    @classmethod
+    def depuis_calcul_complet(cls, res, epaisseur_m=0.003, rugosite_um=0.8, etat_surface="Usinage fin",
+                              nb_vis=6, dim_vis_iso="M6", entraxe_vis_pct=0.85):
+        """Équivalent en colonnes de CylindreStirling.depuis_calcul_complet (calcul_complet_batch)."""
+        from calculs.stirling import MATERIAUX
+        materiaux = np.asarray(res.get("Materiau", "Acier"), dtype=object)
+        return cls(
+            diametre_m=res["Diametre_interne_m"],
+            course_m=res["Course_m"],
+            epaisseur_m=epaisseur_m,
+            matiere=materiaux,
+            densite_kg_m3=_colonnes_materiau(materiaux, MATERIAUX, "rho"),
+            rugosite_um=rugosite_um,
+            etat_surface=etat_surface,
+            Tc=np.asarray(res["Temp_froid_C"], dtype=float) + 273.15,
+            Th=np.asarray(res["Temp_chaud_C"], dtype=float) + 273.15,
+            nb_vis=nb_vis,
+            dim_vis_iso=dim_vis_iso,
+            entraxe_vis_pct=entraxe_vis_pct,
+            limite_rupture_MPa=_colonnes_materiau(materiaux, MATERIAUX, "limite_rupture") / 1e6,
+        )
+
+    @property
+    def rayon(self):
+        return self.diametre / 2
+
+    @cached_property
+    def rayon_ext(self):
+        return self.rayon + self.epaisseur
+
+    @property
+    def diametre_ext(self):
+        return self.diametre + 2 * self.epaisseur
+
+    @cached_property
+    def volume_interne(self):
+        return math.pi * (self.rayon ** 2) * self.course
+
+    @cached_property
+    def volume_metal(self):
+        vi = self.volume_interne
+        ve = math.pi * (self.rayon_ext ** 2) * self.course
+        fond = math.pi * (self.rayon_ext ** 2) * self.epaisseur
+        return np.maximum(ve - vi, 0) + fond
+
+    @cached_property
+    def masse(self):
+        return self.volume_metal * self.densite
+
+    @property
+    def surface_interne(self):
+        return math.pi * self.diametre * self.course
+
+    @cached_property
+    def surface_fond(self):
+        return math.pi * (self.rayon ** 2)
+
+    @property
+    def surface_externe(self):
+        return math.pi * self.diametre_ext * self.course
+
+    @property
+    def surface_totale_interne(self):
+        return self.surface_interne + 2 * self.surface_fond
+
+    @property
+    def surface_totale_externe(self):
+        sf = math.pi * (self.rayon_ext ** 2)
+        return self.surface_externe + 2 * sf
+
+    @cached_property
+    def section_anneau_autour_taraudage(self):
+        r_ext = self.rayon_ext * 1000
+        r_trou = self.diam_percage_vis * 1000 / 2
+        section = math.pi * (r_ext ** 2 - r_trou ** 2) - math.pi * (self.rayon * 1000) ** 2
+        return np.maximum(section, 0)
+
+    @property
+    def effort_max_admissible_par_taraudage(self):
+        S = self.section_anneau_autour_taraudage / 1e6
+        return S * self.limite_rupture_MPa * 1e6
+
+    @property
+    def effort_total_visserie(self):
+        return self.nb_vis * self.effort_max_admissible_par_taraudage
+
+    @cached_property
+    def pression_maxi_admissible(self):
+        S_fond = self.surface_fond
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(S_fond > 0, self.effort_total_visserie / S_fond, 0.0)
+
+    @cached_property
+    def limite_rupture_chaude_MPa(self):
+        return proprietes_materiaux(self.matiere, "Rm", self.Th, self.limite_rupture_MPa)
+
+    @cached_property
+    def pression_maxi_admissible_chaude(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rapport = np.where(self.limite_rupture_MPa > 0, self.limite_rupture_chaude_MPa / self.limite_rupture_MPa, 0.0)
+        return self.pression_maxi_admissible * rapport
+
+
+class PistonArray(_TableauPieces):
+    """Pistons en colonnes (cf. PistonStirling)."""
+
+    CLASSE = PistonStirling
+    TEXTES = ("matiere", "etat_surface")
+    ENTIERS = ("nb_rainures",)
+
+    @classmethod
+    def depuis_cylindres(cls, cylindres, proportions=None):
+        """
+        Équivalent en colonnes de PistonStirling.depuis_cylindre.
+        - proportions : {"RAPPORT_HAUTEUR_COURSE": valeur, ...} remplaçant les constantes
+          du module piston (scalaires ou colonnes)
+        """
+        p = _proportions(proportions, piston_mod)
+        diam, course = cylindres.diametre, cylindres.course
+        hauteur_piston = course * p("RAPPORT_HAUTEUR_COURSE")
+        return cls(
+            diametre_m=diam,
+            hauteur_m=hauteur_piston,
+            epaisseur_fond_m=p("EPAISSEUR_FOND_M"),
+            epaisseur_jupe_m=p("EPAISSEUR_JUPE_M"),
+            hauteur_jupe_m=hauteur_piston - p("EPAISSEUR_FOND_M"),
+            matiere="AlSi12",
+            densite_kg_m3=p("DENSITE_PISTON"),
+            rugosite_um=0.8,
+            etat_surface="Rectifié",
+            nb_rainures=np.where(diam < 0.04, 2, 3),
+            axe_diam_m=diam * p("RAPPORT_AXE_DIAMETRE"),
+            axe_longueur_m=diam * p("RAPPORT_AXE_LONGUEUR"),
+        )
+
+    @property
+    def rayon(self):
+        return self.diametre / 2
+
+    @property
+    def volume_externe(self):
+        return math.pi * self.rayon**2 * self.hauteur
+
+    @property
+    def volume_interne(self):
+        r_int = self.rayon - self.epaisseur_jupe
+        return np.maximum(0, math.pi * r_int**2 * self.hauteur_jupe)
+
+    @property
+    def volume_fond(self):
+        return math.pi * self.rayon**2 * self.epaisseur_fond
+
+    @property
+    def volume_axe(self):
+        r = self.axe_diam / 2
+        return math.pi * r**2 * self.axe_longueur
+
+    @cached_property
+    def volume_total(self):
+        return self.volume_externe - self.volume_interne + self.volume_axe
+
+    @cached_property
+    def masse(self):
+        return self.volume_total * self.densite
+
+    @property
+    def surface_totale(self):
+        surf_lateral = math.pi * self.diametre * self.hauteur
+        surf_faces = 2 * math.pi * self.rayon**2
+        surf_axe = math.pi * self.axe_diam * self.axe_longueur + 2 * math.pi * (self.axe_diam / 2)**2
+        return surf_lateral + surf_faces + surf_axe
+
+
+class BielleArray(_TableauPieces):
+    """Bielles en colonnes (cf. BielleStirling)."""
+
+    CLASSE = BielleStirling
+    TEXTES = ("matiere", "etat_surface")
+
+    @classmethod
+    def depuis_stirling(cls, res, proportions=None):
+        """
+        Équivalent en colonnes de bielle_depuis_stirling (valeurs de repli comprises pour
+        une course ou un diamètre nuls).
+        - proportions : {"RAPPORT_LONGUEUR_COURSE": valeur, ...} remplaçant les constantes
+          du module bielle (scalaires ou colonnes)
+        """
+        p = _proportions(proportions, bielle_mod)
+        course = np.asarray(res["Course_m"], dtype=float)
+        diametre_piston = np.asarray(res["Diametre_interne_m"], dtype=float)
+        materiaux = np.asarray(res.get("Materiau", "Acier"), dtype=object)
+        largeur_corps = np.where(diametre_piston != 0, diametre_piston * p("RAPPORT_LARGEUR_DIAMETRE"), 0.012)
+        return cls(
+            longueur_m=np.where(course != 0, p("RAPPORT_LONGUEUR_COURSE") * course, 0.05),
+            largeur_corps_m=largeur_corps,
+            epaisseur_corps_m=largeur_corps / p("DIVISEUR_EPAISSEUR_CORPS"),
+            diametre_tete_m=np.where(diametre_piston != 0, diametre_piston * p("RAPPORT_TETE_DIAMETRE"), 0.018),
+            diametre_pied_m=np.where(diametre_piston != 0, diametre_piston * p("RAPPORT_PIED_DIAMETRE"), 0.010),
+            axe_tete_diam_m=np.where(diametre_piston != 0, diametre_piston * p("RAPPORT_AXE_TETE_DIAMETRE"), 0.008),
+            axe_pied_diam_m=np.where(diametre_piston != 0, diametre_piston * p("RAPPORT_AXE_PIED_DIAMETRE"), 0.008),
+            matiere=materiaux,
+            densite_kg_m3=_colonnes_materiau(materiaux, bielle_mod.MATERIAUX, "rho"),
+        )
+
+    @property
+    def section(self):
+        return self.largeur * self.epaisseur
+
+    @property
+    def volume_corps(self):
+        return self.section * self.longueur
+
+    @property
+    def volume_tete(self):
+        return math.pi * (self.diametre_tete / 2) ** 2 * self.epaisseur
+
+    @property
+    def volume_pied(self):
+        return math.pi * (self.diametre_pied / 2) ** 2 * self.epaisseur
+
+    @cached_property
+    def volume_total(self):
+        return self.volume_corps + self.volume_tete + self.volume_pied
+
+    @cached_property
+    def masse(self):
+        return self.volume_total * self.densite
+
+    @property
+    def surface_totale(self):
+        surf_corps = 2 * (self.largeur + self.epaisseur) * self.longueur
+        surf_tete = math.pi * self.diametre_tete * self.epaisseur
+        surf_pied = math.pi * self.diametre_pied * self.epaisseur
+        return surf_corps + surf_tete + surf_pied
+
+    @property
+    def moment_quadratique(self):
+        return (self.largeur * self.epaisseur ** 3) / 12
+
+
+class VillebrequinArray(_TableauPieces):
+    """Vilebrequins en colonnes (cf. VillebrequinStirling)."""
+
+    CLASSE = VillebrequinStirling
+    TEXTES = ("matiere", "etat_surface")
+    ENTIERS = ("nb_manetons",)
+
+    @property
+    def volume_maneton(self):
+        return self.nb_manetons * math.pi * (self.rayon_maneton ** 2) * self.largeur_maneton
+
+    @cached_property
+    def volume_axe(self):
+        return math.pi * (self.diametre_axe / 2) ** 2 * self.longueur_axe
+
+    @property
+    def volume_bras(self):
+        return 2 * self.nb_manetons * self.largeur_bras * self.epaisseur_bras * self.rayon_maneton
+
+    @cached_property
+    def volume_contrepoids(self):
+        return 2 * self.nb_manetons * math.pi * (self.diametre_contrepoids / 2) ** 2 * self.largeur_contrepoids
+
+    @cached_property
+    def volume_total(self):
+        return self.volume_axe + self.volume_maneton + self.volume_bras + self.volume_contrepoids
+
+    @cached_property
+    def masse(self):
+        return self.volume_total * self.densite
+
+    @property
+    def surface_axe(self):
+        return math.pi * self.diametre_axe * self.longueur_axe
+
+    @property
+    def surface_manetons(self):
+        return self.nb_manetons * math.pi * 2 * self.rayon_maneton * self.largeur_maneton
+
+    @property
+    def surface_contrepoids(self):
+        return 2 * self.nb_manetons * math.pi * self.diametre_contrepoids * self.largeur_contrepoids
+
+    @property
+    def surface_totale(self):
+        return self.surface_axe + self.surface_manetons + self.surface_contrepoids
+
+    @property
+    def moment_inertie_axe(self):
+        m = self.densite * self.volume_axe
+        R = self.diametre_axe / 2
+        return 0.5 * m * R ** 2
+
+    @property
+    def moment_inertie_contrepoids(self):
+        m = self.densite * self.volume_contrepoids
+        R = self.diametre_contrepoids / 2
+        return m * R ** 2 / 2
+
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.stirling import calcul_complet_batch
+
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    res = calcul_complet_batch(P=rng.uniform(50, 2000, n), pm=rng.uniform(5e5, 3e6, n))
+    t0 = time.perf_counter()
+    cylindres = CylindreArray.depuis_calcul_complet(res)
+    pistons = PistonArray.depuis_cylindres(cylindres)
+    bielles = BielleArray.depuis_stirling(res)
+    masse = cylindres.masse + pistons.masse + bielles.masse
+    print(f"{n} variantes en {time.perf_counter() - t0:.2f} s, masse médiane {np.median(masse):.3f} kg")
+    print("Ligne 0 :", cylindres.ligne(0))
+    print("Ligne 0 :", pistons.ligne(0))
@@ -0,0 +1,216 @@
+# calculs/tolerances.py
+
+import functools
+import re
+
+import numpy as np
+
+# Tolérances et ajustements ISO 286-1/-2 pour les cotes nominales jusqu’à 500 mm.
+# Les écarts de toutes les positions usuelles (arbres c à u, alésages C à U) et des
+# qualités IT1 à IT16 sont précalculés à l’import dans deux tableaux (position, qualité,
+# palier) ; une requête n’est plus qu’une indexation NumPy, sur une cote ou sur un lot.
+
+# Paliers de cotes nominales (mm) : intervalles ]a, b], 0 à 3 mm inclus. Les intervalles
+# intermédiaires ne servent qu’aux écarts c, r, s et u ; les qualités IT et les autres
+# écarts fondamentaux sont donnés par palier principal.
+PALIERS_MM = (0, 3, 6, 10, 14, 18, 24, 30, 40, 50, 65, 80, 100, 120, 140, 160, 180, 200, 225, 250,
+              280, 315, 355, 400, 450, 500)
+PALIER_PRINCIPAL = (0, 1, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 8, 9, 9, 9, 10, 10, 11, 11, 12, 12)
+COTE_MAX_MM = PALIERS_MM[-1]
+
+# Intervalles de tolérance fondamentaux IT (µm) par palier principal
+# (≤3, 3-6, 6-10, 10-18, 18-30, 30-50, 50-80, 80-120, 120-180, 180-250, 250-315, 315-400, 400-500)
+IT_UM = {
+    1: (0.8, 1, 1, 1.2, 1.5, 1.5, 2, 2.5, 3.5, 4.5, 6, 7, 8),
+    2: (1.2, 1.5, 1.5, 2, 2.5, 2.5, 3, 4, 5, 7, 8, 9, 10),
+    3: (2, 2.5, 2.5, 3, 4, 4, 5, 6, 8, 10, 12, 13, 15),
+    4: (3, 4, 4, 5, 6, 7, 8, 10, 12, 14, 16, 18, 20),
+    5: (4, 5, 6, 8, 9, 11, 13, 15, 18, 20, 23, 25, 27),
+    6: (6, 8, 9, 11, 13, 16, 19, 22, 25, 29, 32, 36, 40),
+    7: (10, 12, 15, 18, 21, 25, 30, 35, 40, 46, 52, 57, 63),
+    8: (14, 18, 22, 27, 33, 39, 46, 54, 63, 72, 81, 89, 97),
+    9: (25, 30, 36, 43, 52, 62, 74, 87, 100, 115, 130, 140, 155),
+    10: (40, 48, 58, 70, 84, 100, 120, 140, 160, 185, 210, 230, 250),
+    11: (60, 75, 90, 110, 130, 160, 190, 220, 250, 290, 320, 360, 400),
+    12: (100, 120, 150, 180, 210, 250, 300, 350, 400, 460, 520, 570, 630),
+    13: (140, 180, 220, 270, 330, 390, 460, 540, 630, 720, 810, 890, 970),
+    14: (250, 300, 360, 430, 520, 620, 740, 870, 1000, 1150, 1300, 1400, 1550),
+    15: (400, 480, 580, 700, 840, 1000, 1200, 1400, 1600, 1850, 2100, 2300, 2500),
+    16: (600, 750, 900, 1100, 1300, 1600, 1900, 2200, 2500, 2900, 3200, 3600, 4000),
+}
+QUALITES = tuple(IT_UM)
+
+# Écarts fondamentaux des arbres (µm) : écart supérieur es de c à h, écart inférieur ei
+# de k à u (k : qualités 4 à 7, nul sinon). 13 valeurs par palier principal ou 25 par
+# palier intermédiaire.
+ECARTS_FONDAMENTAUX_ARBRES = {
+    "c": (-60, -70, -80, -95, -95, -110, -110, -120, -130, -140, -150, -170, -180, -200, -210, -230,
+          -240, -260, -280, -300, -330, -360, -400, -440, -480),
+    "d": (-20, -30, -40, -50, -65, -80, -100, -120, -145, -170, -190, -210, -230),
+    "e": (-14, -20, -25, -32, -40, -50, -60, -72, -85, -100, -110, -125, -135),
+    "f": (-6, -10, -13, -16, -20, -25, -30, -36, -43, -50, -56, -62, -68),
+    "g": (-2, -4, -5, -6, -7, -9, -10, -12, -14, -15, -17, -18, -20),
+    "h": (0,) * 13,
+    "k": (0, 1, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 5),
+    "m": (2, 4, 6, 7, 8, 9, 11, 13, 15, 17, 20, 21, 23),
+    "n": (4, 8, 10, 12, 15, 17, 20, 23, 27, 31, 34, 37, 40),
+    "p": (6, 12, 15, 18, 22, 26, 32, 37, 43, 50, 56, 62, 68),
+    "r": (10, 15, 19, 23, 23, 28, 28, 34, 34, 41, 43, 51, 54, 63, 65, 68, 77, 80, 84, 94, 98, 108, 114,
+          126, 132),
+    "s": (14, 19, 23, 28, 28, 35, 35, 43, 43, 53, 59, 71, 79, 92, 100, 108, 122, 130, 140, 158, 170, 190,
+          208, 232, 252),
+    "u": (18, 23, 28, 33, 33, 41, 48, 60, 70, 87, 102, 124, 144, 170, 190, 210, 236, 258, 284, 315, 350,
+          390, 435, 490, 540),
+}
+POSITIONS_ARBRES = ("c", "d", "e", "f", "g", "h", "js", "k", "m", "n", "p", "r", "s", "u")
+POSITIONS_ALESAGES = tuple(p.upper() for p in POSITIONS_ARBRES)
+POSITIONS = POSITIONS_ARBRES + POSITIONS_ALESAGES
+
+MOTIF_CODE = re.compile(r"^([A-Za-z]{1,2})(\d{1,2})$")
+
+def _par_palier(valeurs):
+    """Valeurs par palier intermédiaire (25) à partir de 13 valeurs par palier principal ou de 25."""
+    valeurs = np.asarray(valeurs, dtype=float)
+    return valeurs[list(PALIER_PRINCIPAL)] if valeurs.size == 13 else valeurs
+
+def _tables_ecarts():
+    """Écarts supérieurs et inférieurs (µm), tableaux (position, qualité, palier)."""
+    it = np.array([_par_palier(IT_UM[q]) for q in QUALITES])                 # (qualité, palier)
+    it_precedent = np.vstack([it[:1], it[:-1]])
+    au_dela_3mm = np.arange(len(PALIERS_MM) - 1)[None, :] > 0
+    # Δ = ITn - ITn-1 des alésages K à U, nul jusqu’à 3 mm
+    delta = np.where(au_dela_3mm, it - it_precedent, 0.0)
+    delta[0] = 0.0
+    qualite = np.array(QUALITES, dtype=float)[:, None]
+    # js7 à js11 : une valeur IT impaire est arrondie au pair inférieur
+    it_js = np.where((qualite >= 7) & (qualite <= 11), 2 * np.floor(it / 2), it)
+    sup, inf = {}, {}
+    for pos in POSITIONS_ARBRES:
+        if pos == "js":
+            sup[pos], inf[pos] = it_js / 2, -it_js / 2
+            continue
+        ef = np.broadcast_to(_par_palier(ECARTS_FONDAMENTAUX_ARBRES[pos]), it.shape)
+        if pos in "cdefgh":
+            sup[pos], inf[pos] = ef, ef - it
+        else:
+            ei = np.where((qualite >= 4) & (qualite <= 7), ef, 0.0) if pos == "k" else ef
+            sup[pos], inf[pos] = ei + it, ei
+    for pos in POSITIONS_ARBRES:
+        POS = pos.upper()
+        if pos == "js":
+            sup[POS], inf[POS] = it_js / 2, -it_js / 2
+            continue
+        ef = np.broadcast_to(_par_palier(ECARTS_FONDAMENTAUX_ARBRES[pos]), it.shape)
+        if pos in "cdefgh":
+            inf[POS] = -ef
+            sup[POS] = inf[POS] + it
+            continue
+        if pos == "k":
+            ES = np.where(qualite <= 8, -ef + delta, 0.0)
+        elif pos == "m":
+            ES = np.where(qualite <= 8, -ef + delta, -ef)
+        elif pos == "n":
+            ES = np.where(qualite <= 8, -ef + delta, np.where(au_dela_3mm, 0.0, -ef))
+        else:
+            ES = np.where(qualite <= 7, -ef + delta, -ef)
+        sup[POS], inf[POS] = ES, ES - it
+    return (np.array([sup[p] for p in POSITIONS]), np.array([inf[p] for p in POSITIONS]), it)
+
+ECARTS_SUP_UM, ECARTS_INF_UM, IT_PALIERS_UM = _tables_ecarts()
+for _table in (ECARTS_SUP_UM, ECARTS_INF_UM, IT_PALIERS_UM):
+    _table.setflags(write=False)
+
+# Palier de chaque cote entière : une cote D appartient au palier de ceil(D)
+PALIER_PAR_MM = np.searchsorted(np.array(PALIERS_MM), np.arange(COTE_MAX_MM + 1)) - 1
+PALIER_PAR_MM[0] = 0
+PALIER_PAR_MM.setflags(write=False)
+
+@functools.lru_cache(maxsize=None)
+def _analyser(code):
+    """(indice de position, indice de qualité) d’un code « H7 », « g6 », « js5 »..."""
+    trouve = MOTIF_CODE.match(str(code).strip())
+    lettres, qualite = (trouve.group(1), int(trouve.group(2))) if trouve else (None, None)
+    if lettres not in POSITIONS or qualite not in IT_UM:
+        raise ValueError(f"Code de tolérance inconnu : {code} (positions {', '.join(POSITIONS)}, "
+                         f"qualités {QUALITES[0]} à {QUALITES[-1]})")
+    return POSITIONS.index(lettres), QUALITES.index(qualite)
+
+def _indices_codes(code):
+    if isinstance(code, str):
+        return _analyser(code)
+    codes = np.asarray(code, dtype=str)
+    uniques, inverse = np.unique(codes, return_inverse=True)
+    indices = np.array([_analyser(c) for c in uniques], dtype=np.intp).reshape(-1, 2)
+    return indices[inverse, 0].reshape(codes.shape), indices[inverse, 1].reshape(codes.shape)
+
+def paliers(D_mm):
+    """Indice de palier ISO 286 de chaque cote nominale (mm), 0 < D ≤ 500."""
+    D = np.asarray(D_mm, dtype=float)
+    if np.any(~(D > 0)) or np.any(D > COTE_MAX_MM):
+        raise ValueError(f"Cote nominale hors du domaine ISO 286 ]0, {COTE_MAX_MM}] mm")
+    return PALIER_PAR_MM[np.ceil(D).astype(np.intp)]
+
+def ecarts(code, D_mm):
+    """
+    Écarts (supérieur, inférieur) en mm d’une tolérance (« H7 », « g6 »...) à la cote
+    nominale D_mm. Code et cote acceptent des tableaux (diffusion NumPy).
+    """
+    i_pos, i_q = _indices_codes(code)
+    i_pal = paliers(D_mm)
+    # + 0.0 : pas d’écart « -0.0 » à l’affichage
+    return ECARTS_SUP_UM[i_pos, i_q, i_pal][()] / 1000 + 0.0, ECARTS_INF_UM[i_pos, i_q, i_pal][()] / 1000 + 0.0
+
+def intervalle_tolerance(qualite, D_mm):
+    """Intervalle de tolérance fondamental ITn (mm) à la cote nominale D_mm."""
+    if qualite not in IT_UM:
+        raise ValueError(f"Qualité inconnue : IT{qualite}")
+    return IT_PALIERS_UM[QUALITES.index(qualite), paliers(D_mm)][()] / 1000
+
+def cotes_limites(code, D_mm):
+    """Cotes (mini, maxi) en mm de la pièce tolérancée."""
+    sup, inf = ecarts(code, D_mm)
+    return D_mm + inf, D_mm + sup
+
+def ajustement(alesage, arbre=None, D_mm=None):
+    """
+    Ajustement alésage/arbre (« H7/g6 » ou « H7 », « g6 ») à la cote nominale D_mm :
+    jeux maxi et mini (mm, négatifs pour un serrage), serrage maxi et type (« jeu »,
+    « incertain » ou « serrage »). Codes et cotes acceptent des tableaux.
+    """
+    if arbre is None:
+        alesage, arbre = np.char.partition(np.asarray(alesage, dtype=str), "/")[..., ::2].T
+    codes_alesage, codes_arbre = np.asarray(alesage, dtype=str), np.asarray(arbre, dtype=str)
+    if np.any(np.char.islower(codes_alesage)) or np.any(np.char.isupper(codes_arbre)):
+        raise ValueError("Ajustement attendu sous la forme alésage (majuscules) / arbre (minuscules)")
+    ES, EI = ecarts(alesage if isinstance(alesage, str) else codes_alesage, D_mm)
+    es, ei = ecarts(arbre if isinstance(arbre, str) else codes_arbre, D_mm)
+    jeu_max, jeu_min = ES - ei, EI - es
+    return {
+        "Jeu_max_mm": jeu_max,
+        "Jeu_min_mm": jeu_min,
+        "Serrage_max_mm": -jeu_min,
+        "Type": np.where(jeu_min >= 0, "jeu", np.where(jeu_max <= 0, "serrage", "incertain"))[()],
+    }
+
+def verifier_ajustements(ajustements):
+    """
+    Ajustements d’un ensemble, {nom: (code « H7/g6 », cote nominale mm)}, évalués en un
+    seul appel vectorisé. Renvoie {nom: dict de ajustement}.
+    """
+    noms = list(ajustements)
+    codes = np.array([str(ajustements[nom][0]) for nom in noms])
+    cotes = np.array([float(ajustements[nom][1]) for nom in noms])
+    res = ajustement(codes, D_mm=cotes)
+    return {nom: {cle: valeurs[i].item() for cle, valeurs in res.items()} for i, nom in enumerate(noms)}
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+
+    for code in ("H7/g6", "H7/k6", "H7/p6"):
+        res = ajustement(code, D_mm=32.0)
+        print(f"Ø32 {code} : jeu {res['Jeu_min_mm']:+.3f} / {res['Jeu_max_mm']:+.3f} mm ({res['Type']})")
+    D = np.random.default_rng(0).uniform(1, 500, 1_000_000)
+    t0 = time.perf_counter()
+    lot = ajustement("H7", "f7", D)
+    print(f"10^6 ajustements H7/f7 : {1000 * (time.perf_counter() - t0):.1f} ms")
@@ -0,0 +1,186 @@
+# calculs/vibrations.py
+
+import math
+
+import numpy as np
+
+from calculs.cinematique import FRACTION_BIELLE_ALTERNATIVE
+from materiaux import famille
+
+# Ligne d’arbre à paramètres localisés :
+# - torsion : chaîne libre-libre vilebrequin -- arbre -- volant (-- accouplement -- génératrice),
+#   inerties J (kg.m²) reliées par des raideurs k (N.m/rad), K φ = ω² J φ
+# - flexion : arbre sur deux paliers (appuis simples aux extrémités), masse propre répartie sur
+#   nb_elements nœuds + volant ponctuel, matrice de souplesse F, F M φ = φ / ω²
+# Les valeurs propres sont calculées par np.linalg.eigvalsh sur des piles de matrices
+# (une matrice par design) : un balayage entier est traité en un appel.
+
+MODULES_ELASTIQUES = {
+    "Acier": {"E": 210e9, "G": 81e9},
+    "Inox": {"E": 193e9, "G": 77e9},
+    "Aluminium": {"E": 70e9, "G": 26e9},
+    "Laiton": {"E": 100e9, "G": 37e9},
+}
+ORDRES_EXCITATION = (1, 2)      # Harmoniques du couple / des efforts par tour
+MARGE_MINI = 0.20               # Écart relatif minimal entre fréquence propre et excitation
+NB_ELEMENTS_FLEXION = 10
+
+def modules_elastiques(matiere):
+    """Modules d’Young et de Coulomb (Pa) d’une matière, par famille (« Alu 6061 » -> Aluminium ; ValueError si inconnue)."""
+    return MODULES_ELASTIQUES[famille(matiere)]
+
+def _lot(*valeurs):
+    """Colonnes de même longueur (B,) pour un lot de B designs."""
+    tableaux = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in valeurs))
+    return [np.ascontiguousarray(t) for t in tableaux]
+
+def frequences_torsion(inerties, raideurs):
+    """
+    Fréquences propres (Hz) d’une chaîne libre-libre d’inerties (..., n) reliées par des
+    raideurs (..., n-1) ; le mode rigide (fréquence nulle) est retiré : forme (..., n-1).
+    """
+    J = np.asarray(inerties, dtype=float)
+    k = np.asarray(raideurs, dtype=float)
+    n = J.shape[-1]
+    K = np.zeros(J.shape + (n,))
+    i = np.arange(n - 1)
+    K[..., i, i] += k
+    K[..., i + 1, i + 1] += k
+    K[..., i, i + 1] -= k
+    K[..., i + 1, i] -= k
+    s = 1 / np.sqrt(J)
+    A = K * s[..., :, None] * s[..., None, :]
+    omega2 = np.linalg.eigvalsh(A)[..., 1:]
+    return np.sqrt(np.maximum(omega2, 0.0)) / (2 * math.pi)
+
+def _souplesse_appuis_simples(positions):
+    """Souplesse adimensionnelle (x L³ / E I) d’une poutre sur appuis simples, positions en fraction de L."""
+    xa = np.minimum.outer(positions, positions)
+    xb = np.maximum.outer(positions, positions)
+    return (1 - xb) * xa * (1 - (1 - xb) ** 2 - xa ** 2) / 6
+
+def frequences_flexion(longueur, diametre, densite, E, masse_volant=0.0, position_volant=0.5,
+                       nb_elements=NB_ELEMENTS_FLEXION):
+    """
+    Fréquences propres de flexion (Hz, forme (B, nb_elements + 1)) d’un arbre plein sur deux
+    paliers portant un volant ponctuel (masse en kg, position en fraction de la longueur).
+    La souplesse adimensionnelle ne dépend que des positions : elle est commune au lot.
+    """
+    L, d, rho, E, m_v = _lot(longueur, diametre, densite, E, masse_volant)
+    positions = np.r_[np.arange(1, nb_elements + 1) / (nb_elements + 1), position_volant]
+    F = _souplesse_appuis_simples(positions)
+    I = math.pi * d ** 4 / 64
+    masse_arbre = rho * math.pi * (d / 2) ** 2 * L
+    masses = np.empty((L.size, positions.size))
+    masses[:, :-1] = (masse_arbre / (nb_elements + 1))[:, None]
+    masses[:, -1] = m_v
+    s = np.sqrt(masses)
+    A = (L ** 3 / (E * I))[:, None, None] * F * s[:, :, None] * s[:, None, :]
+    lam = np.linalg.eigvalsh(A)[:, ::-1]          # plus grande souplesse modale = plus basse fréquence
+    with np.errstate(divide="ignore"):
+        return np.where(lam > 0, 1 / np.sqrt(np.maximum(lam, 1e-300)), np.inf) / (2 * math.pi)
+
+def marges(frequences_propres, f, ordres=ORDRES_EXCITATION):
+    """
+    Écart relatif minimal |f_n - k f| / (k f) entre les fréquences propres (B, m) et les
+    excitations d’ordre k à la fréquence de rotation f (B,).
+    """
+    fn = np.asarray(frequences_propres, dtype=float)[..., None]
+    excitation = np.multiply.outer(np.atleast_1d(np.asarray(f, dtype=float)), np.asarray(ordres, dtype=float))
+    ecart = np.abs(fn - excitation[:, None, :]) / excitation[:, None, :]
+    return ecart.reshape(ecart.shape[0], -1).min(axis=1)
+
+def ligne_arbre(f, inertie_vilebrequin, diametre_arbre, longueur_arbre, densite_arbre=7850.0, E=None, G=None,
+                inertie_volant=0.0, masse_volant=0.0, position_volant=0.5, inertie_generateur=0.0,
+                raideur_accouplement=None, ordres=ORDRES_EXCITATION, marge_mini=MARGE_MINI,
+                nb_elements=NB_ELEMENTS_FLEXION):
+    """
+    Analyse vibratoire d’un lot de lignes d’arbre (paramètres scalaires ou tableaux 1-D) :
+    - torsion : vilebrequin (+ moitié de l’arbre) -- arbre G Ip / L -- volant (+ moitié de
+      l’arbre) ; génératrice sur le volant, ou derrière un accouplement de raideur donnée
+    - flexion : arbre sur paliers portant le volant ; la première fréquence est la vitesse critique
+    - marges vis-à-vis des ordres d’excitation, Resonance si l’une est < marge_mini
+    E, G : par défaut ceux de l’acier.
+    """
+    E = MODULES_ELASTIQUES["Acier"]["E"] if E is None else E
+    G = MODULES_ELASTIQUES["Acier"]["G"] if G is None else G
+    f, J_v, d, L, rho, G, J_vol, J_gen = _lot(f, inertie_vilebrequin, diametre_arbre, longueur_arbre, densite_arbre,
+                                              G, inertie_volant, inertie_generateur)
+    masse_arbre = rho * math.pi * (d / 2) ** 2 * L
+    J_arbre = 0.5 * masse_arbre * (d / 2) ** 2
+    k_arbre = G * (math.pi * d ** 4 / 32) / L
+    if raideur_accouplement is None:
+        inerties = np.stack([J_v + J_arbre / 2, J_vol + J_gen + J_arbre / 2], axis=-1)
+        raideurs = k_arbre[:, None]
+    else:
+        if np.any(J_gen <= 0):
+            raise ValueError("Un accouplement élastique suppose une inertie de génératrice > 0.")
+        (k_acc,) = _lot(raideur_accouplement)
+        inerties = np.stack([J_v + J_arbre / 2, J_vol + J_arbre / 2, J_gen], axis=-1)
+        raideurs = np.stack([k_arbre, np.broadcast_to(k_acc, k_arbre.shape)], axis=-1)
+    torsion = frequences_torsion(inerties, raideurs)
+    flexion = frequences_flexion(L, d, rho, E, masse_volant, position_volant, nb_elements)
+    marge_torsion = marges(torsion, f, ordres)
+    marge_flexion = marges(flexion[:, :1], f, (1,))
+    return {
+        "Frequences_torsion_Hz": torsion,
+        "Frequences_flexion_Hz": flexion,
+        "Vitesse_critique_tr_min": flexion[:, 0] * 60,
+        "Raideur_torsion_arbre_N_m_rad": k_arbre,
+        "Inerties_kg_m2": inerties,
+        "Marge_torsion": marge_torsion,
+        "Marge_flexion": marge_flexion,
+        "Resonance": (marge_torsion < marge_mini) | (marge_flexion < marge_mini),
+    }
+
+def inertie_vilebrequin(villebrequin, bielle=None, piston=None, fraction_bielle=FRACTION_BIELLE_ALTERNATIVE):
+    """
+    Inertie polaire du vilebrequin (axe + contrepoids), augmentée si bielle et piston sont
+    donnés de l’inertie moyenne de l’embiellage par maneton : m_rot r² + m_alt r² / 2.
+    Accepte les pièces scalaires ou les collections de calculs.tableaux.
+    """
+    J = villebrequin.moment_inertie_axe + villebrequin.moment_inertie_contrepoids
+    if bielle is not None and piston is not None:
+        r = villebrequin.rayon_maneton
+        m_alt = piston.masse + fraction_bielle * bielle.masse
+        m_rot = (1 - fraction_bielle) * bielle.masse
+        J = J + villebrequin.nb_manetons * (m_rot + m_alt / 2) * r ** 2
+    return J
+
+def depuis_pieces(villebrequin, arbre, f, bielle=None, piston=None, **options):
+    """ligne_arbre à partir des pièces (vilebrequin, ArbreStirling, et optionnellement bielle et piston)."""
+    modules = modules_elastiques(arbre.matiere)
+    options.setdefault("E", modules["E"])
+    options.setdefault("G", modules["G"])
+    return ligne_arbre(f, inertie_vilebrequin(villebrequin, bielle, piston), arbre.diametre, arbre.longueur,
+                       arbre.densite, **options)
+
+def depuis_balayage(res, diametre_arbre_m=0.012, longueur_arbre_m=0.080, **options):
+    """
+    ligne_arbre pour tout un balayage (résultat de calcul_complet_batch) : vilebrequin, bielle
+    et piston de chaque design en collections, fréquence de rotation Frequence_Hz du design.
+    """
+    from calculs.tableaux import BielleArray, CylindreArray, PistonArray, VillebrequinArray
+
+    course = np.asarray(res["Course_m"], dtype=float)
+    villebrequin = VillebrequinArray(nb_manetons=res["Nb_cylindres"], rayon_maneton_m=course / 2,
+                                     diametre_axe_m=diametre_arbre_m, longueur_axe_m=longueur_arbre_m)
+    piston = PistonArray.depuis_cylindres(CylindreArray.depuis_calcul_complet(res))
+    J = inertie_vilebrequin(villebrequin, BielleArray.depuis_stirling(res), piston)
+    return ligne_arbre(res["Frequence_Hz"], J, diametre_arbre_m, longueur_arbre_m, **options)
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    import time
+    from calculs.assemblage import AssemblageMoteur
+    from calculs.stirling import calcul_complet, calcul_complet_batch
+
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    res = depuis_pieces(moteur.villebrequin, moteur.arbre, 25, bielle=moteur.bielle, piston=moteur.piston,
+                        inertie_volant=2e-3, masse_volant=1.5)
+    print(f"Torsion {res['Frequences_torsion_Hz'][0, 0]:.0f} Hz, vitesse critique {res['Vitesse_critique_tr_min'][0]:.0f} tr/min, "
+          f"marges {res['Marge_torsion'][0]:.2f} / {res['Marge_flexion'][0]:.2f}, résonance : {bool(res['Resonance'][0])}")
+    lot = calcul_complet_batch(P=np.linspace(100, 2000, 10_000), f=np.linspace(10, 60, 10_000))
+    t0 = time.perf_counter()
+    vib = depuis_balayage(lot, inertie_volant=2e-3, masse_volant=1.5)
+    print(f"{lot['Course_m'].size} designs en {time.perf_counter() - t0:.2f} s, {int(vib['Resonance'].sum())} en résonance")
@@ -2,13 +2,29 @@
 
 import math
 
-class VillebrequinStirling:
+from calculs.piece import Piece, propriete_cachee, resultat_cache
+
+class VillebrequinStirling(Piece):
     """
     Modélisation d’un vilebrequin de moteur Stirling pour CAO :
     - Dimensions maneton, bras, masses d’équilibrage, paliers
     - Masse, volume, matière, état de surface, moments d’inertie principaux
     """
 
+    __slots__ = (
+        "nb_manetons", "rayon_maneton", "largeur_maneton", "diametre_axe", "longueur_axe",
+        "largeur_bras", "epaisseur_bras", "diametre_contrepoids", "largeur_contrepoids", "matiere",
+        "densite", "rugosite", "etat_surface",
+    )
+    ARGUMENTS = {
+        "nb_manetons": "nb_manetons", "rayon_maneton_m": "rayon_maneton",
+        "largeur_maneton_m": "largeur_maneton", "diametre_axe_m": "diametre_axe",
+        "longueur_axe_m": "longueur_axe", "largeur_bras_m": "largeur_bras",
+        "epaisseur_bras_m": "epaisseur_bras", "diametre_contrepoids_m": "diametre_contrepoids",
+        "largeur_contrepoids_m": "largeur_contrepoids", "matiere": "matiere",
+        "densite_kg_m3": "densite", "rugosite_um": "rugosite", "etat_surface": "etat_surface",
+    }
+
     def __init__(
         self,
         nb_manetons=1,
@@ -41,70 +57,71 @@ class VillebrequinStirling:
         self.rugosite = rugosite_um
         self.etat_surface = etat_surface
 
-    @property
+    @propriete_cachee
     def volume_maneton(self):
         "Volume du/des maneton(s), cylindre(s) plein(s)"
         return self.nb_manetons * math.pi * (self.rayon_maneton ** 2) * self.largeur_maneton
 
-    @property
+    @propriete_cachee
     def volume_axe(self):
         "Volume de l’axe principal (hors bras et manetons)"
         return math.pi * (self.diametre_axe / 2) ** 2 * self.longueur_axe
 
-    @property
+    @propriete_cachee
     def volume_bras(self):
         "Volume des bras (rectangle simple, 2 bras par maneton)"
         return 2 * self.nb_manetons * self.largeur_bras * self.epaisseur_bras * self.rayon_maneton
 
-    @property
+    @propriete_cachee
     def volume_contrepoids(self):
         "Volume total des masses d’équilibrage"
         return 2 * self.nb_manetons * math.pi * (self.diametre_contrepoids / 2) ** 2 * self.largeur_contrepoids
 
-    @property
+    @propriete_cachee
     def volume_total(self):
         "Volume total estimé"
         return self.volume_axe + self.volume_maneton + self.volume_bras + self.volume_contrepoids
 
-    @property
+    @propriete_cachee
     def masse(self):
         "Masse totale (kg)"
         return self.volume_total * self.densite
 
-    @property
+    @propriete_cachee
     def surface_axe(self):
         "Surface latérale de l’axe (m²)"
         return math.pi * self.diametre_axe * self.longueur_axe
 
-    @property
+    @propriete_cachee
     def surface_manetons(self):
         "Surface latérale manetons (m²)"
         return self.nb_manetons * math.pi * 2 * self.rayon_maneton * self.largeur_maneton
 
-    @property
+    @propriete_cachee
     def surface_contrepoids(self):
         "Surface latérale masses d’équilibrage (m²)"
         return 2 * self.nb_manetons * math.pi * self.diametre_contrepoids * self.largeur_contrepoids
 
-    @property
+    @propriete_cachee
     def surface_totale(self):
         "Surface totale extérieure estimée (m²)"
         return self.surface_axe + self.surface_manetons + self.surface_contrepoids
 
-    @property
+    @propriete_cachee
     def moment_inertie_axe(self):
         "Moment d’inertie de l’axe principal (kg.m²) pour rotation centrale"
         m = self.densite * self.volume_axe
         R = self.diametre_axe / 2
         return 0.5 * m * R ** 2
 
-    @property
+    @propriete_cachee
     def moment_inertie_contrepoids(self):
         "Moment d’inertie masses d’équilibrage (par rapport à l’axe)"
         m = self.densite * self.volume_contrepoids
         R = self.diametre_contrepoids / 2
         return m * R ** 2 / 2
 
+    @resultat_cache
     def to_dict(self):
         return {
             "Nb manetons": self.nb_manetons,
@@ -127,6 +144,7 @@ class VillebrequinStirling:
             "Moment inertie contrepoids (g.mm2)": round(self.moment_inertie_contrepoids * 1e7, 2),
         }
 
+    @resultat_cache
     def __repr__(self):
         return (
             f"VillebrequinStirling({self.nb_manetons} manetons, "
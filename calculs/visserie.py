@@ -14,6 +14,66 @@ VIS_ISO = [
     # ... complète selon tes besoins
 ]
 
+# Classes de qualité ISO 898-1 : Rm, Re (MPa)
+CLASSES_QUALITE = {
+    "4.6": {"Rm": 400, "Re": 240},
+    "5.6": {"Rm": 500, "Re": 300},
+    "8.8": {"Rm": 800, "Re": 640},
+    "10.9": {"Rm": 1040, "Re": 940},
+    "12.9": {"Rm": 1220, "Re": 1100},
+}
+
+# Filetages ISO métriques (ISO 261 / 724), pas gros et pas fins usuels (mm) :
+# d_perc perçage de passage moyen ISO 273, d_taraud foret de taraudage normalisé (ISO 2306),
+# s cote sur plats de la tête hexagonale ISO 4017. d2, d3 et la section résistante
+# As = π/4 ((d2 + d3)/2)² sont déduits du profil de base.
+FILETAGES_ISO = [
+    {"designation": "M1.6", "d_nom": 1.6, "pas": 0.35, "d_perc": 1.8, "d_taraud": 1.25, "s": 3.2, "serie": "gros"},
+    {"designation": "M2", "d_nom": 2.0, "pas": 0.4, "d_perc": 2.4, "d_taraud": 1.6, "s": 4.0, "serie": "gros"},
+    {"designation": "M2.5", "d_nom": 2.5, "pas": 0.45, "d_perc": 2.9, "d_taraud": 2.05, "s": 5.0, "serie": "gros"},
+    {"designation": "M3", "d_nom": 3.0, "pas": 0.5, "d_perc": 3.4, "d_taraud": 2.5, "s": 5.5, "serie": "gros"},
+    {"designation": "M4", "d_nom": 4.0, "pas": 0.7, "d_perc": 4.5, "d_taraud": 3.3, "s": 7.0, "serie": "gros"},
+    {"designation": "M5", "d_nom": 5.0, "pas": 0.8, "d_perc": 5.5, "d_taraud": 4.2, "s": 8.0, "serie": "gros"},
+    {"designation": "M6", "d_nom": 6.0, "pas": 1.0, "d_perc": 6.6, "d_taraud": 5.0, "s": 10.0, "serie": "gros"},
+    {"designation": "M8", "d_nom": 8.0, "pas": 1.25, "d_perc": 9.0, "d_taraud": 6.8, "s": 13.0, "serie": "gros"},
+    {"designation": "M8x1", "d_nom": 8.0, "pas": 1.0, "d_perc": 9.0, "d_taraud": 7.0, "s": 13.0, "serie": "fin"},
+    {"designation": "M10", "d_nom": 10.0, "pas": 1.5, "d_perc": 11.0, "d_taraud": 8.5, "s": 16.0, "serie": "gros"},
+    {"designation": "M10x1.25", "d_nom": 10.0, "pas": 1.25, "d_perc": 11.0, "d_taraud": 8.8, "s": 16.0, "serie": "fin"},
+    {"designation": "M10x1", "d_nom": 10.0, "pas": 1.0, "d_perc": 11.0, "d_taraud": 9.0, "s": 16.0, "serie": "fin"},
+    {"designation": "M12", "d_nom": 12.0, "pas": 1.75, "d_perc": 13.5, "d_taraud": 10.2, "s": 18.0, "serie": "gros"},
+    {"designation": "M12x1.5", "d_nom": 12.0, "pas": 1.5, "d_perc": 13.5, "d_taraud": 10.5, "s": 18.0, "serie": "fin"},
+    {"designation": "M12x1.25", "d_nom": 12.0, "pas": 1.25, "d_perc": 13.5, "d_taraud": 10.8, "s": 18.0, "serie": "fin"},
+    {"designation": "M14", "d_nom": 14.0, "pas": 2.0, "d_perc": 15.5, "d_taraud": 12.0, "s": 21.0, "serie": "gros"},
+    {"designation": "M14x1.5", "d_nom": 14.0, "pas": 1.5, "d_perc": 15.5, "d_taraud": 12.5, "s": 21.0, "serie": "fin"},
+    {"designation": "M16", "d_nom": 16.0, "pas": 2.0, "d_perc": 17.5, "d_taraud": 14.0, "s": 24.0, "serie": "gros"},
+    {"designation": "M16x1.5", "d_nom": 16.0, "pas": 1.5, "d_perc": 17.5, "d_taraud": 14.5, "s": 24.0, "serie": "fin"},
+    {"designation": "M18", "d_nom": 18.0, "pas": 2.5, "d_perc": 20.0, "d_taraud": 15.5, "s": 27.0, "serie": "gros"},
+    {"designation": "M18x1.5", "d_nom": 18.0, "pas": 1.5, "d_perc": 20.0, "d_taraud": 16.5, "s": 27.0, "serie": "fin"},
+    {"designation": "M20", "d_nom": 20.0, "pas": 2.5, "d_perc": 22.0, "d_taraud": 17.5, "s": 30.0, "serie": "gros"},
+    {"designation": "M20x1.5", "d_nom": 20.0, "pas": 1.5, "d_perc": 22.0, "d_taraud": 18.5, "s": 30.0, "serie": "fin"},
+    {"designation": "M22", "d_nom": 22.0, "pas": 2.5, "d_perc": 24.0, "d_taraud": 19.5, "s": 34.0, "serie": "gros"},
+    {"designation": "M22x1.5", "d_nom": 22.0, "pas": 1.5, "d_perc": 24.0, "d_taraud": 20.5, "s": 34.0, "serie": "fin"},
+    {"designation": "M24", "d_nom": 24.0, "pas": 3.0, "d_perc": 26.0, "d_taraud": 21.0, "s": 36.0, "serie": "gros"},
+    {"designation": "M24x2", "d_nom": 24.0, "pas": 2.0, "d_perc": 26.0, "d_taraud": 22.0, "s": 36.0, "serie": "fin"},
+    {"designation": "M27", "d_nom": 27.0, "pas": 3.0, "d_perc": 30.0, "d_taraud": 24.0, "s": 41.0, "serie": "gros"},
+    {"designation": "M27x2", "d_nom": 27.0, "pas": 2.0, "d_perc": 30.0, "d_taraud": 25.0, "s": 41.0, "serie": "fin"},
+    {"designation": "M30", "d_nom": 30.0, "pas": 3.5, "d_perc": 33.0, "d_taraud": 26.5, "s": 46.0, "serie": "gros"},
+    {"designation": "M30x2", "d_nom": 30.0, "pas": 2.0, "d_perc": 33.0, "d_taraud": 28.0, "s": 46.0, "serie": "fin"},
+    {"designation": "M33", "d_nom": 33.0, "pas": 3.5, "d_perc": 36.0, "d_taraud": 29.5, "s": 50.0, "serie": "gros"},
+    {"designation": "M36", "d_nom": 36.0, "pas": 4.0, "d_perc": 39.0, "d_taraud": 32.0, "s": 55.0, "serie": "gros"},
+    {"designation": "M36x3", "d_nom": 36.0, "pas": 3.0, "d_perc": 39.0, "d_taraud": 33.0, "s": 55.0, "serie": "fin"},
+    {"designation": "M42", "d_nom": 42.0, "pas": 4.5, "d_perc": 45.0, "d_taraud": 37.5, "s": 65.0, "serie": "gros"},
+    {"designation": "M48", "d_nom": 48.0, "pas": 5.0, "d_perc": 52.0, "d_taraud": 43.0, "s": 75.0, "serie": "gros"},
+]
+for _f in FILETAGES_ISO:
+    _f["d2"] = _f["d_nom"] - 0.649519 * _f["pas"]
+    _f["d3"] = _f["d_nom"] - 1.226869 * _f["pas"]
+    _f["section"] = math.pi / 4 * ((_f["d2"] + _f["d3"]) / 2) ** 2
+del _f
+
+# Diamètres de perçage pour taraudage (pas gros, mm), partagés par le cylindre et le couvercle
+DIAM_PERCAGE_TARAUD_ISO = {f["designation"]: f["d_taraud"] for f in FILETAGES_ISO if f["serie"] == "gros"}
+
 def get_vis(designation):
     """Retourne les propriétés d’une vis ISO métrique par désignation (ex : 'M6')."""
     for vis in VIS_ISO:
@@ -27,12 +87,10 @@ def resistance_vis(F, type_effort, classe, Securite, nb_vis):
     Aucune valeur par défaut : tout est obligatoire.
     """
     # Sélection des propriétés matière
-    table_Rm = {"8.8": 800, "10.9": 1040, "12.9": 1220}
-    table_Re = {"8.8": 640, "10.9": 940, "12.9": 1100}
-    if str(classe) not in table_Re:
+    if str(classe) not in ("8.8", "10.9", "12.9"):
         raise ValueError("Classe de vis inconnue (8.8, 10.9, 12.9)")
-    Rm = table_Rm[str(classe)]
-    Re = table_Re[str(classe)]
+    Rm = CLASSES_QUALITE[str(classe)]["Rm"]
+    Re = CLASSES_QUALITE[str(classe)]["Re"]
 
     # Contrainte admissible selon l’effort
     if type_effort == "traction":
@@ -0,0 +1,144 @@
+# materiaux.py
+
+import functools
+
+import numpy as np
+
+from calculs import catalogue
+
+# Propriétés des matériaux en fonction de la température : valeurs à 20 °C du catalogue
+# (calculs.catalogue, table « materiaux ») multipliées par des coefficients de réduction
+# tabulés, dilatation et conductivité tabulées directement. Interpolation linéaire
+# (np.interp) sur TEMPERATURES_K, bornée aux extrémités de la table.
+# Sources des tables (valeurs arrondies) : EN 1993-1-2 (acier au carbone, inox 1.4301),
+# EN 1999-1-2 (alliages d’aluminium), données fabricants pour le laiton CuZn37.
+
+TEMPERATURES_K = np.array([20.0, 100.0, 200.0, 300.0, 400.0, 500.0, 600.0, 700.0]) + 273.15
+PROPRIETES = ("E", "Re", "Rm", "alpha", "k")
+
+# Par famille : coefficients de réduction de E, Re, Rm (rapport à 20 °C), dilatation
+# thermique moyenne depuis 20 °C alpha (1/K) et conductivité k (W/m/K)
+TABLES_TEMPERATURE = {
+    "Acier": {
+        "E": (1.00, 1.00, 0.90, 0.80, 0.70, 0.60, 0.31, 0.13),
+        "Re": (1.00, 1.00, 1.00, 1.00, 1.00, 0.78, 0.47, 0.23),
+        "Rm": (1.00, 1.00, 1.00, 1.00, 0.90, 0.70, 0.47, 0.23),
+        "alpha": (11.7e-6, 12.0e-6, 12.5e-6, 13.0e-6, 13.5e-6, 13.9e-6, 14.3e-6, 14.6e-6),
+        "k": (53.3, 50.7, 47.3, 44.0, 40.7, 37.4, 34.0, 30.7),
+    },
+    "Inox": {
+        "E": (1.00, 0.96, 0.92, 0.88, 0.84, 0.80, 0.76, 0.71),
+        "Re": (1.00, 0.82, 0.68, 0.64, 0.60, 0.54, 0.49, 0.40),
+        "Rm": (1.00, 0.87, 0.77, 0.73, 0.72, 0.67, 0.58, 0.43),
+        "alpha": (16.0e-6, 16.5e-6, 17.0e-6, 17.5e-6, 17.8e-6, 18.1e-6, 18.4e-6, 18.7e-6),
+        "k": (14.9, 15.9, 17.1, 18.4, 19.7, 20.9, 22.2, 23.5),
+    },
+    "Aluminium": {
+        "E": (1.00, 0.97, 0.86, 0.68, 0.40, 0.0, 0.0, 0.0),
+        "Re": (1.00, 0.95, 0.79, 0.31, 0.06, 0.0, 0.0, 0.0),
+        "Rm": (1.00, 0.95, 0.80, 0.35, 0.08, 0.0, 0.0, 0.0),
+        "alpha": (23.1e-6, 23.7e-6, 24.6e-6, 25.5e-6, 26.4e-6, 27.3e-6, 28.2e-6, 29.0e-6),
+        "k": (167.0, 172.0, 178.0, 183.0, 185.0, 187.0, 189.0, 190.0),
+    },
+    "Laiton": {
+        "E": (1.00, 0.97, 0.93, 0.88, 0.82, 0.75, 0.68, 0.60),
+        "Re": (1.00, 0.95, 0.85, 0.65, 0.40, 0.20, 0.10, 0.05),
+        "Rm": (1.00, 0.95, 0.87, 0.70, 0.45, 0.25, 0.12, 0.06),
+        "alpha": (19.0e-6, 19.3e-6, 19.8e-6, 20.3e-6, 20.8e-6, 21.3e-6, 21.7e-6, 22.1e-6),
+        "k": (120.0, 130.0, 140.0, 150.0, 160.0, 165.0, 170.0, 175.0),
+    },
+}
+# Désignation -> famille, sans tenir compte de la casse : « inox » n’importe où dans le
+# nom (« Acier inox 316L » -> Inox), puis par préfixe (« Acier C45 » -> Acier,
+# « AlSi12 », « Alu 6061 » -> Aluminium...). Une désignation hors de ces familles est refusée.
+MOT_INOX = "inox"
+FAMILLES = {"acier": "Acier", "fonte": "Acier", "laiton": "Laiton", "al": "Aluminium"}
+# Coefficients appliqués aux valeurs à 20 °C, les autres propriétés étant absolues
+REDUCTIONS = ("E", "Re", "Rm")
+
+def famille(nom):
+    """Famille de TABLES_TEMPERATURE d’une désignation de matière ; ValueError si inconnue."""
+    cle = str(nom).strip().lower()
+    if MOT_INOX in cle:
+        return "Inox"
+    for prefixe, fam in FAMILLES.items():
+        if cle.startswith(prefixe):
+            return fam
+    raise ValueError(f"Famille de matière inconnue : {nom!r} (attendu : {', '.join(TABLES_TEMPERATURE)})")
+
+def valeurs_ambiantes(nom):
+    """
+    E, Re, Rm (Pa) à 20 °C : ligne du catalogue (Rm à défaut de sa limite de rupture),
+    valeurs manquantes prises dans la ligne de la famille.
+    """
+    ligne = catalogue.materiau(nom) or {}
+    base = catalogue.materiau(famille(nom)) or {}
+    return {
+        "E": ligne.get("E") or base.get("E"),
+        "Re": ligne.get("Re") or base.get("Re"),
+        "Rm": ligne.get("Rm") or ligne.get("limite_rupture") or base.get("Rm"),
+    }
+
+@functools.lru_cache(maxsize=64)
+def _interpoler(fam, prop, octets, forme):
+    T = np.frombuffer(octets, dtype=float)
+    resultat = np.interp(T, TEMPERATURES_K, TABLES_TEMPERATURE[fam][prop]).reshape(forme)
+    resultat.setflags(write=False)
+    return resultat
+
+def facteur(nom, prop, T):
+    """
+    Valeur tabulée de `prop` pour la matière `nom` aux températures T (K, scalaire ou
+    tableau) : coefficient de réduction pour E, Re et Rm, valeur absolue pour alpha et k.
+    Mémorisé par (famille, propriété, grille de températures) ; le résultat est en lecture seule.
+    """
+    if prop not in PROPRIETES:
+        raise ValueError(f"Propriété inconnue : {prop} (attendu : {', '.join(PROPRIETES)})")
+    T = np.asarray(T, dtype=float)
+    resultat = _interpoler(famille(nom), prop, T.tobytes(), T.shape)
+    return float(resultat) if resultat.ndim == 0 else resultat
+
+def propriete(nom, prop, T, valeur_ambiante=None):
+    """
+    Propriété `prop` (E, Re, Rm en Pa ; alpha en 1/K ; k en W/m/K) à la température T (K).
+    - valeur_ambiante : valeur à 20 °C à réduire (par ex. la limite de rupture d’une pièce),
+      par défaut celle du catalogue
+    """
+    f = facteur(nom, prop, T)
+    if prop not in REDUCTIONS:
+        return f
+    base = valeurs_ambiantes(nom)[prop] if valeur_ambiante is None else valeur_ambiante
+    if base is None:
+        raise ValueError(f"Pas de valeur {prop} à 20 °C pour {nom}")
+    return base * f
+
+def proprietes(nom, T):
+    """Toutes les propriétés de PROPRIETES à la température T (K)."""
+    return {prop: propriete(nom, prop, T) for prop in PROPRIETES}
+
+def proprietes_lot(noms, prop, T, valeur_ambiante=None):
+    """
+    `prop` pour un tableau de matières, de températures (et de valeurs à 20 °C) diffusables,
+    avec une interpolation par matière distincte.
+    """
+    noms, T = np.broadcast_arrays(np.asarray(noms, dtype=str), np.asarray(T, dtype=float))
+    base = None if valeur_ambiante is None else np.broadcast_to(np.asarray(valeur_ambiante, dtype=float), T.shape)
+    resultat = np.empty(T.shape)
+    for nom in np.unique(noms):
+        choix = noms == nom
+        resultat[choix] = propriete(str(nom), prop, T[choix], None if base is None else base[choix])
+    return resultat
+
+def dilatation(nom, longueur, T, T_ref=293.15):
+    """Allongement (même unité que longueur) entre T_ref et T, dilatation moyenne depuis 20 °C."""
+    return longueur * (facteur(nom, "alpha", T) * (np.asarray(T) - 293.15)
+                       - facteur(nom, "alpha", T_ref) * (T_ref - 293.15))
+
+# Exemple d’utilisation
+if __name__ == "__main__":
+    for nom in ("Acier", "Inox", "Aluminium", "Laiton"):
+        chaud = proprietes(nom, 650.0)
+        print(f"{nom:10} à 650 K : Rm {chaud['Rm'] / 1e6:6.1f} MPa (20 °C : {valeurs_ambiantes(nom)['Rm'] / 1e6:.0f}), "
+              f"E {chaud['E'] / 1e9:5.1f} GPa, alpha {chaud['alpha'] * 1e6:.1f} µm/m/K, k {chaud['k']:.1f} W/m/K")
+    T = np.linspace(293.15, 973.15, 1_000_000)
+    print("Rm de l’acier sur 10^6 températures :", propriete("Acier", "Rm", T)[[0, -1]])
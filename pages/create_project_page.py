@@ -4,10 +4,8 @@ from tkinter import ttk
 from colors import *
 from project_db import save_project, get_aes_key
 
-from calculs.stirling import calcul_complet
-from calculs.cylindre import CylindreStirling
-from calculs.piston import PistonStirling
-from calculs.bielle import BielleStirling
+from calculs.assemblage import AssemblageMoteur
+from calculs.cache import calcul_complet_memo
 from pages.parts_menu_page import PartsMenuPage
 
 class CreateProjectPage(tk.Frame):
@@ -16,6 +14,7 @@ class CreateProjectPage(tk.Frame):
         self.master = master
         self.tech_sheet = None
         self.parts_resume = None
+        self.assemblage = None
         self.validated = False
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -128,7 +127,7 @@ class CreateProjectPage(tk.Frame):
         gaz = self.gaz_var.get() or "Air"
 
         try:
-            tech = calcul_complet(
+            tech = calcul_complet_memo(
                 P=P,
                 gaz=gaz
             )
@@ -200,56 +199,13 @@ class CreateProjectPage(tk.Frame):
     def generate_parts_summary(self):
         tech = self.tech_sheet
         try:
-            cyl = CylindreStirling(
-                diametre_m=tech["Diametre_interne_m"],
-                course_m=tech["Course_m"],
-                epaisseur_m=0.003,
-                matiere=tech["Materiau"] if "Materiau" in tech else "Acier",
-                densite_kg_m3=7850,
-                rugosite_um=0.8,
-                etat_surface="Usinage fin",
-                Th=tech["Temp_chaud_C"]+273.15,
-                Tc=tech["Temp_froid_C"]+273.15,
-                nb_vis=6,
-                dim_vis_iso="M6",
-                entraxe_vis_pct=0.85,
-                limite_rupture_MPa=700
-            )
-            piston = PistonStirling(
-                diametre_m=tech["Diametre_interne_m"]-0.0002,
-                hauteur_m=tech["Course_m"]*0.95,
-                epaisseur_fond_m=0.003,
-                epaisseur_jupe_m=0.002,
-                hauteur_jupe_m=tech["Course_m"]*0.85,
-                matiere="AlSi12",
-                densite_kg_m3=2680,
-                rugosite_um=0.6,
-                etat_surface="Microbillage + rectif",
-                nb_rainures=2,
-                axe_diam_m=0.008,
-                axe_longueur_m=tech["Diametre_interne_m"]*1.1
-            )
-            bielle = BielleStirling(
-                longueur_m=tech["Course_m"]*2.6,
-                largeur_corps_m=0.012,
-                epaisseur_corps_m=0.004,
-                diametre_tete_m=0.018,
-                diametre_pied_m=0.010,
-                axe_tete_diam_m=0.008,
-                axe_pied_diam_m=0.008,
-                matiere="Acier 42CrMo4",
-                densite_kg_m3=7850,
-                etat_surface="Usinage + rectif",
-                rugosite_um=0.8
-            )
-
-            resume = f"=== Résumé des pièces principales ===\n"
-            resume += f"[Cylindre]\n{cyl}\n{cyl.to_dict()}\n\n"
-            resume += f"[Piston]\n{piston}\n{piston.to_dict()}\n\n"
-            resume += f"[Bielle]\n{bielle}\n{bielle.to_dict()}\n\n"
+            # Toutes les pièces dérivent de la fiche technique (course, alésage, matériau...)
+            self.assemblage = AssemblageMoteur(tech)
+            resume = self.assemblage.resume()
             self.update_summary(resume, color=JV)
             self.parts_resume = resume
 
         except Exception as e:
             self.update_summary(f"Erreur lors du calcul des pièces : {e}", color=RV)
             self.parts_resume = None
+            self.assemblage = None
@@ -7,7 +7,7 @@ from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 
-from calculs.cylindre import CylindreStirling
+from calculs.cache import cylindre_memo
 from plans.plans_cylindre import plot_cylindre
 
 class PieceCylindrePage(tk.Frame):
@@ -26,7 +26,7 @@ class PieceCylindrePage(tk.Frame):
         tk.Frame(self, height=3, width=260, bg=JV).pack(pady=(0, 22))
 
         # Création de l'objet cylindre à partir des données tech_sheet
-        self.cylindre = CylindreStirling(
+        self.cylindre = cylindre_memo(
             diametre_m=tech_sheet['Diametre_m'],
             course_m=tech_sheet['Course_m'],
             epaisseur_m=tech_sheet.get('Epaisseur_m', 0.002),
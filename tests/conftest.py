@@ -0,0 +1,32 @@
+# tests/conftest.py
+
+import pytest
+
+
+def pretty_assert(desc, cond, attendu, obtenu):
+    """Affiche le résultat d’une vérification, puis l’affirme."""
+    if cond:
+        print(f"[OK] {desc} -> {obtenu}")
+    else:
+        print(f"[ERREUR] {desc}\n  Attendu: {attendu!r}\n  Obtenu: {obtenu!r}")
+    assert cond, desc
+
+
+# Tests de performance (bornes de durée, dépendantes de la machine) : marqueur perf,
+# exécutés seulement sur demande avec `pytest --perf`.
+def pytest_addoption(parser):
+    parser.addoption("--perf", action="store_true", default=False,
+                     help="exécute aussi les tests de performance (marqueur perf)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: borne de durée dépendante de la machine, exécutée avec --perf")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf"):
+        return
+    saut = pytest.mark.skip(reason="test de performance : lancer pytest avec --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(saut)
@@ -0,0 +1,74 @@
+# tests/test_assemblage.py
+
+import math
+from calculs.assemblage import AssemblageMoteur, GRAPHE, DEPENDANTS
+from calculs.bielle import RAPPORT_LONGUEUR_COURSE
+from calculs.stirling import calcul_complet
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_assemblage_coherence():
+    print("\nTest assemblage moteur : cohérence des pièces")
+    fiche = calcul_complet(P=1000, materiau="Inox")
+    moteur = AssemblageMoteur(fiche).construire()
+    pretty_assert("Piston à l’alésage", moteur.piston.diametre == fiche["Diametre_interne_m"],
+                  fiche["Diametre_interne_m"], moteur.piston.diametre)
+    pretty_assert("Bielle suit la course", math.isclose(moteur.bielle.longueur, RAPPORT_LONGUEUR_COURSE * fiche["Course_m"]),
+                  RAPPORT_LONGUEUR_COURSE * fiche["Course_m"], moteur.bielle.longueur)
+    pretty_assert("Maneton = demi-course", moteur.villebrequin.rayon_maneton == fiche["Course_m"] / 2,
+                  fiche["Course_m"] / 2, moteur.villebrequin.rayon_maneton)
+    pretty_assert("Manetons = cylindres", moteur.villebrequin.nb_manetons == fiche["Nb_cylindres"],
+                  fiche["Nb_cylindres"], moteur.villebrequin.nb_manetons)
+    pretty_assert("Matériau du cylindre", moteur.cylindre.matiere == "Inox" and moteur.cylindre.densite == 8000,
+                  ("Inox", 8000), (moteur.cylindre.matiere, moteur.cylindre.densite))
+    pretty_assert("Couvercle au diamètre extérieur", moteur.couvercle.diametre == moteur.cylindre.diametre_ext,
+                  moteur.cylindre.diametre_ext, moteur.couvercle.diametre)
+    pretty_assert("Axe de piston", moteur.axe_piston.diametre == moteur.piston.axe_diam,
+                  moteur.piston.axe_diam, moteur.axe_piston.diametre)
+    pretty_assert("Une construction par pièce", set(moteur.recalculs.values()) == {1}, {1}, moteur.recalculs)
+    resume = moteur.resume()
+    pretty_assert("Résumé complet", all(f"[{n.replace('_', ' ').capitalize()}]" in resume for n in GRAPHE),
+                  "toutes les pièces", len(resume))
+    try:
+        AssemblageMoteur({"Course_m": 0.03})
+    except ValueError as e:
+        print("[OK] Erreur attendue (alésage manquant):", e)
+    else:
+        raise AssertionError("Pas d’exception pour une fiche incomplète")
+
+def test_assemblage_invalidation():
+    print("\nTest assemblage moteur : recalcul incrémental")
+    moteur = AssemblageMoteur(calcul_complet(P=1000)).construire()
+    invalides = moteur.modifier(Diametre_interne_m=moteur.entrees["Diametre_interne_m"] * 1.1)
+    for nom in ("cylindre", "piston", "joints", "visserie"):
+        pretty_assert(f"Alésage -> {nom} invalidé", nom in invalides, True, invalides)
+    for nom in ("villebrequin", "arbre", "support_roulement"):
+        pretty_assert(f"Alésage -> {nom} conservé", nom not in invalides and moteur.est_valide(nom), True, invalides)
+    ancien_vbrk = moteur.villebrequin
+    moteur.construire()
+    pretty_assert("Piston reconstruit une fois", moteur.recalculs["piston"] == 2, 2, moteur.recalculs["piston"])
+    pretty_assert("Vilebrequin non reconstruit", moteur.recalculs["villebrequin"] == 1 and moteur.villebrequin is ancien_vbrk,
+                  1, moteur.recalculs["villebrequin"])
+    pretty_assert("Roulements non reconstruits", moteur.recalculs["support_roulement"] == 1,
+                  1, moteur.recalculs["support_roulement"])
+    pretty_assert("Piston à jour", moteur.piston.diametre == moteur.entrees["Diametre_interne_m"],
+                  moteur.entrees["Diametre_interne_m"], moteur.piston.diametre)
+    pretty_assert("Valeur inchangée : rien d’invalidé", moteur.modifier(Course_m=moteur.entrees["Course_m"]) == (),
+                  (), None)
+    invalides = moteur.modifier(diametre_arbre_m=0.015)
+    pretty_assert("Arbre -> ligne d’arbre seule", set(invalides) == {"villebrequin", "arbre", "support_roulement"},
+                  {"villebrequin", "arbre", "support_roulement"}, invalides)
+    pretty_assert("Fermeture transitive", DEPENDANTS["cylindre"] >= {"piston", "axe_piston", "joints", "couvercle"},
+                  "piston, axe, joints, couvercle", DEPENDANTS["cylindre"])
+    try:
+        moteur.modifier(alesage=0.05)
+    except ValueError as e:
+        print("[OK] Erreur attendue (entrée inconnue):", e)
+    else:
+        raise AssertionError("Pas d’exception pour une entrée inconnue")
+
+if __name__ == "__main__":
+    test_assemblage_coherence()
+    test_assemblage_invalidation()
+    print("\n==== FIN TESTS assemblage ====\n")
@@ -0,0 +1,110 @@
+# tests/test_assemblage_visse.py
+
+import time
+import numpy as np
+import pytest
+from calculs.assemblage_visse import evaluer_assemblage, choix_vis, depuis_pieces, indices_filetages, FILETAGES
+from calculs.visserie import FILETAGES_ISO, DIAM_PERCAGE_TARAUD_ISO
+from calculs.cylindre import CylindreStirling
+from calculs.couvercle_cylindre import CouvercleCylindreStirling
+from calculs.assemblage import AssemblageMoteur
+from calculs.stirling import calcul_complet
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_filetages():
+    print("\nTest table des filetages ISO")
+    sections = {f["designation"]: f["section"] for f in FILETAGES_ISO}
+    for nom, attendu in (("M6", 20.1), ("M10", 58.0), ("M16", 157.0), ("M24", 353.0)):
+        pretty_assert(f"Section résistante {nom}", abs(sections[nom] - attendu) / attendu < 0.005, attendu, sections[nom])
+    pretty_assert("Perçage de taraudage commun", CylindreStirling.DIAM_PERCAGE_TARAUD_ISO is DIAM_PERCAGE_TARAUD_ISO
+                  and CouvercleCylindreStirling.DIAM_PERCAGE_TARAUD_ISO is DIAM_PERCAGE_TARAUD_ISO
+                  and DIAM_PERCAGE_TARAUD_ISO["M6"] == 5.0, 5.0, DIAM_PERCAGE_TARAUD_ISO["M6"])
+    pretty_assert("Désignations insensibles à la casse", list(indices_filetages(["m8", "M10x1.25"])) ==
+                  [list(FILETAGES["designation"]).index("M8"), list(FILETAGES["designation"]).index("M10x1.25")], None, None)
+    base = dict(F=1000, nb_vis=4, classe="8.8", designation="M6", longueur_serree=0.01)
+    for mauvais in (dict(designation="M7"), dict(classe="9.9")):
+        params = {**base, **mauvais}
+        try:
+            evaluer_assemblage(**params)
+            pretty_assert(f"Entrée refusée {mauvais}", False, "ValueError", None)
+        except ValueError:
+            pretty_assert(f"Entrée refusée {mauvais}", True, "ValueError", "ValueError")
+
+def test_evaluer_assemblage():
+    print("\nTest évaluation VDI 2230")
+    # Précharges et couples de référence (VDI 2230 tab. A1, μ = 0.12, ν = 0.9, Rp0.2 = 660 MPa)
+    for nom, F_M, M_A in (("M8", 19.1e3, 24.6), ("M10", 30.3e3, 48.0), ("M12", 44.1e3, 84.0)):
+        res = evaluer_assemblage(0.0, 1, "8.8", nom, 0.02)
+        F_M_660 = res["Precharge_max_N"] * 660 / 640
+        pretty_assert(f"Précharge {nom}", abs(F_M_660 / F_M - 1) < 0.03, F_M, F_M_660)
+        pretty_assert(f"Couple {nom}", abs(res["Couple_serrage_N_m"] * 660 / 640 / M_A - 1) < 0.08, M_A, res["Couple_serrage_N_m"])
+    res = evaluer_assemblage(8000.0, 4, "8.8", "M6", 0.01)
+    pretty_assert("Facteur de charge dans ]0, n[", 0 < res["Facteur_charge"] < 0.5, "0 - 0.5", res["Facteur_charge"])
+    pretty_assert("Serrage résiduel", np.isclose(res["Serrage_residuel_N"], res["Precharge_min_N"]
+                  - (1 - res["Facteur_charge"]) * 2000.0 - res["Perte_tassement_N"]), None, res["Serrage_residuel_N"])
+    glissant = evaluer_assemblage(8000.0, 4, "8.8", "M6", 0.01, mu_filet=0.2, mu_tete=0.2)
+    pretty_assert("Frottement élevé : précharge réduite, couple accru", glissant["Precharge_max_N"] < res["Precharge_max_N"]
+                  and glissant["Couple_serrage_N_m"] > res["Couple_serrage_N_m"], None, glissant["Couple_serrage_N_m"])
+    alu = evaluer_assemblage(8000.0, 4, "8.8", "M6", 0.01, mat_taraud="Aluminium")
+    pretty_assert("Taraudage aluminium : implantation plus longue", alu["Implantation_mini_m"] > 2 * res["Implantation_mini_m"],
+                  "> 2x acier", alu["Implantation_mini_m"])
+    for nom in ("Alu", "Alu 6061", "AlSi12"):
+        leger = evaluer_assemblage(5000.0, 6, "8.8", "M6", 0.005, mat_taraud=nom)
+        reference = evaluer_assemblage(5000.0, 6, "8.8", "M6", 0.005, mat_taraud="Aluminium")
+        pretty_assert(f"Taraudage « {nom} » traité en aluminium", leger["Longueur_implantation_m"] == 0.012
+                      and leger["Securite_arrachement"] == reference["Securite_arrachement"],
+                      (0.012, reference["Securite_arrachement"]), (leger["Longueur_implantation_m"], leger["Securite_arrachement"]))
+    decolle = evaluer_assemblage(1e5, 4, "8.8", "M6", 0.01)
+    pretty_assert("Décollement détecté", not decolle["OK"] and decolle["Serrage_residuel_N"] < 0, "< 0", decolle["Serrage_residuel_N"])
+    # Lot = calculs isolés
+    F = np.array([2e3, 1e4, 5e4])
+    lot = evaluer_assemblage(F, [4, 6, 8], ["8.8", "10.9", "12.9"], ["M5", "M8", "M12"], 0.012)
+    seul = evaluer_assemblage(1e4, 6, "10.9", "M8", 0.012)
+    pretty_assert("Lot = calcul isolé", all(np.isclose(lot[cle][1], seul[cle]) for cle in ("Precharge_max_N", "Facteur_charge",
+                  "Securite_vis", "Securite_arrachement")), seul["Securite_vis"], lot["Securite_vis"][1])
+
+def test_choix_vis():
+    print("\nTest choix de la vis")
+    rng = np.random.default_rng(1)
+    n = 100_000
+    F, nb, classes = rng.uniform(1e3, 2e5, n), rng.integers(3, 13, n), rng.choice(["5.6", "8.8"], n)
+    lot = choix_vis(F, nb, classes, 0.01)
+    pretty_assert("100 000 assemblages", lot["Indice"].shape == (n,), (n,), lot["Indice"].shape)
+    trouve = lot["Indice"] >= 0
+    pretty_assert("Solutions conformes", np.all(lot["OK"][trouve]) and np.all(lot["Designation"][~trouve] == ""), True, int(trouve.sum()))
+    # Le filetage gros précédent (section inférieure) ne convient pas
+    gros = [i for i in FILETAGES["ordre_section"] if FILETAGES["gros"][i]]
+    trop_gros = [(int(k), lot["Designation"][k]) for k in np.flatnonzero(trouve)[:200]
+                 if gros.index(lot["Indice"][k]) > 0
+                 and evaluer_assemblage(F[k], nb[k], classes[k], gros[gros.index(lot["Indice"][k]) - 1], 0.01)["OK"]]
+    pretty_assert("Plus petit filetage retenu", not trop_gros, [], trop_gros)
+    pretty_assert("Cas scalaire", choix_vis(8000.0, 4, "8.8", 0.01)["Designation"] == "M5", "M5", choix_vis(8000.0, 4, "8.8", 0.01)["Designation"])
+
+def test_depuis_pieces():
+    print("\nTest vissage du couvercle")
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    res = depuis_pieces(moteur.cylindre, moteur.couvercle, moteur.entrees["Pression_Pa"])
+    pretty_assert("Couvercle nominal", bool(res["OK"]) and res["Designation"] == moteur.cylindre.dim_vis_iso, True, res["Serrage_residuel_N"])
+    pretty_assert("Pièce de l’assemblage", moteur.assemblage_couvercle["OK"] and moteur.assemblage_couvercle["Designation"] == "M6",
+                  "M6", moteur.assemblage_couvercle["Designation"])
+
+@pytest.mark.perf
+def test_perf_choix_vis():
+    print("\nTest durée du choix de vis")
+    rng = np.random.default_rng(1)
+    n = 100_000
+    F, nb, classes = rng.uniform(1e3, 2e5, n), rng.integers(3, 13, n), rng.choice(["5.6", "8.8"], n)
+    t0 = time.perf_counter()
+    choix_vis(F, nb, classes, 0.01)
+    duree = time.perf_counter() - t0
+    pretty_assert("100 000 assemblages", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_filetages()
+    test_evaluer_assemblage()
+    test_choix_vis()
+    test_depuis_pieces()
+    test_perf_choix_vis()
+    print("\n==== FIN TESTS assemblage_visse ====\n")
@@ -0,0 +1,124 @@
+# tests/test_balayage.py
+
+import csv
+import math
+import os
+import tempfile
+import traceback
+import numpy as np
+from calculs.balayage import Grille, Plage, balayer, lire_colonnes, evaluer_en_parallele, colonnes_sortie
+from calculs.stirling import calcul_complet
+from conftest import pretty_assert
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def grille_test():
+    return Grille(
+        P=Plage(50, 400, 5),
+        Th=[650, 800],
+        pm=[5e5, 1e6, 2e6],
+        Nc=[1, 2, 4],
+        C=[None, 0.02],
+        materiau=["Acier", "Aluminium"],
+    )
+
+class Interruption(Exception):
+    pass
+
+def test_grille():
+    print("\nTest Grille")
+    g = grille_test()
+    print(g)
+    pretty_assert("Taille produit cartésien", len(g) == 5 * 2 * 3 * 3 * 2 * 2, 360, len(g))
+    colonnes, codes = g.bloc(0, len(g))
+    pretty_assert("Dernière ligne", colonnes["materiau"][-1] == "Aluminium" and colonnes["C"][-1] == 0.02,
+                  "Aluminium / 0.02", (colonnes["materiau"][-1], colonnes["C"][-1]))
+    pretty_assert("Codes matériau", set(codes["materiau"].tolist()) == {0, 1}, {0, 1}, set(codes["materiau"].tolist()))
+    pretty_assert("Plage -> linspace", np.array_equal(g.valeurs["P"], np.linspace(50, 400, 5)), np.linspace(50, 400, 5), g.valeurs["P"])
+    litteral = Grille(P=500, Nc=(1, 2, 4), Th=(600, 700, 5))
+    pretty_assert("Tuple = valeurs littérales", list(litteral.valeurs["Nc"]) == [1, 2, 4]
+                  and list(litteral.valeurs["Th"]) == [600, 700, 5], [1, 2, 4], litteral.valeurs["Nc"])
+    try:
+        Grille(P=500, gaz=Plage(1, 2, 3))
+    except ValueError as e:
+        print("[OK] Erreur attendue (Plage sur un paramètre texte):", e)
+    else:
+        raise AssertionError("Pas d’exception pour une Plage sur un paramètre texte")
+    try:
+        Grille(Th=[600, 700])
+    except ValueError as e:
+        print("[OK] Erreur attendue (P manquant):", e)
+    else:
+        raise AssertionError("Pas d’exception sans P")
+
+def test_balayer_et_reprise():
+    print("\nTest balayer (pool de processus) + reprise")
+    g = grille_test()
+    with tempfile.TemporaryDirectory() as dossier:
+        rapport = balayer(g, dossier, taille_bloc=50, max_workers=2)
+        print("Rapport :", rapport)
+        pretty_assert("Tous les designs", rapport["designs"] == len(g), len(g), rapport["designs"])
+        pretty_assert("Débit par processus", all(v > 0 for v in rapport["debit_par_processus"].values()),
+                      "> 0", rapport["debit_par_processus"])
+
+        colonnes, categories = lire_colonnes(dossier)
+        pretty_assert("Colonnes binaires", list(colonnes) == colonnes_sortie(g), colonnes_sortie(g), list(colonnes))
+        for i in (0, 77, len(g) - 1):
+            C = None if math.isnan(colonnes["C"][i]) else float(colonnes["C"][i])
+            ref = calcul_complet(P=colonnes["P"][i], Th=colonnes["Th"][i], pm=colonnes["pm"][i],
+                                 Nc=int(colonnes["Nc"][i]), C=C,
+                                 materiau=categories["materiau"][colonnes["materiau"][i]])
+            assert np.isclose(colonnes["Masse_cylindre_kg"][i], ref["Masse_cylindre_kg"], rtol=1e-12, atol=0), i
+            assert np.isclose(colonnes["Diametre_interne_m"][i], ref["Diametre_interne_m"], rtol=1e-12, atol=0), i
+
+        with open(os.path.join(dossier, "resultats.csv"), encoding="utf-8") as fh:
+            lignes = list(csv.reader(fh))
+        pretty_assert("Lignes CSV", len(lignes) == len(g) + 1, len(g) + 1, len(lignes))
+        pretty_assert("Valeur CSV", float(lignes[78][lignes[0].index("Masse_cylindre_kg")]) == colonnes["Masse_cylindre_kg"][77],
+                      colonnes["Masse_cylindre_kg"][77], lignes[78])
+        reference_csv = lignes
+        reference_bin = {k: np.array(v) for k, v in colonnes.items()}
+        del colonnes
+
+    with tempfile.TemporaryDirectory() as dossier:
+        def couper(termines, total):
+            if termines == 3:
+                raise Interruption()
+        try:
+            balayer(g, dossier, taille_bloc=50, max_workers=1, rappel=couper)
+        except Interruption:
+            print("[OK] Balayage interrompu après 3 blocs")
+        rapport = balayer(g, dossier, taille_bloc=50, max_workers=2)
+        pretty_assert("Reprise au bloc 3", rapport["blocs_repris"] == 3, 3, rapport["blocs_repris"])
+        pretty_assert("Designs restants", rapport["designs"] == len(g) - 150, len(g) - 150, rapport["designs"])
+        colonnes, _ = lire_colonnes(dossier)
+        for k, v in reference_bin.items():
+            assert np.array_equal(v, colonnes[k], equal_nan=True), k
+        with open(os.path.join(dossier, "resultats.csv"), encoding="utf-8") as fh:
+            assert list(csv.reader(fh)) == reference_csv
+        print("[OK] Résultats repris identiques au balayage complet")
+        del colonnes
+        try:
+            balayer(Grille(P=[10, 20]), dossier, taille_bloc=50)
+        except ValueError as e:
+            print("[OK] Erreur attendue (grille différente):", e)
+        else:
+            raise AssertionError("Pas d’exception pour une reprise sur une autre grille")
+
+def test_evaluer_en_parallele():
+    print("\nTest evaluer_en_parallele")
+    try:
+        colonnes = {"P": np.linspace(10, 500, 1000), "Nc": np.tile([1, 2, 4, 6], 250), "materiau": "Inox"}
+        res = evaluer_en_parallele(colonnes, max_workers=2, taille_bloc=300)
+        ref = calcul_complet(P=colonnes["P"][999], Nc=6, materiau="Inox")
+        pretty_assert("Concaténation des blocs", res["Masse_cylindre_kg"][999] == ref["Masse_cylindre_kg"],
+                      ref["Masse_cylindre_kg"], res["Masse_cylindre_kg"][999])
+    except Exception:
+        print(traceback.format_exc())
+        raise
+
+if __name__ == "__main__":
+    test_grille()
+    test_balayer_et_reprise()
+    test_evaluer_en_parallele()
+    print("\n==== FIN TESTS balayage ====\n")
@@ -0,0 +1,127 @@
+# tests/test_cache.py
+
+import threading
+import time
+from calculs.cache import (
+    CacheLRU, memoise, normaliser, cache_desactive, calcul_complet_memo, cylindre_memo,
+    piston_depuis_cylindre_memo, CACHE
+)
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_normaliser():
+    print("\nTest normaliser")
+    pretty_assert("Arrondi des flottants", normaliser(0.1 + 0.2) == normaliser(0.3), 0.3, normaliser(0.1 + 0.2))
+    pretty_assert("Entier et flottant", normaliser(2) == normaliser(2.0), 2.0, normaliser(2))
+    pretty_assert("Dict trié", normaliser({"b": 1, "a": 2}) == normaliser({"a": 2, "b": 1}), "ordre indifférent",
+                  normaliser({"b": 1, "a": 2}))
+
+def test_cache_lru():
+    print("\nTest CacheLRU (éviction, TTL, compteurs)")
+    cache = CacheLRU(taille_max=2, ttl=None)
+    appels = []
+
+    @memoise(cache=cache)
+    def carre(x, decalage=0):
+        appels.append(x)
+        return x * x + decalage
+
+    carre(2)
+    carre(2, decalage=0)      # défaut résolu : même clé
+    carre(2.0000000000000004) # arrondi : même clé
+    carre(3)
+    carre(4)                  # évince 2
+    carre(2)
+    s = cache.stats()
+    print("  Stats :", s)
+    pretty_assert("Hits", s["hits"] == 2, 2, s["hits"])
+    pretty_assert("Misses", s["misses"] == 4, 4, s["misses"])
+    pretty_assert("Evictions", s["evictions"] == 2, 2, s["evictions"])
+    pretty_assert("Appels réels", appels == [2, 3, 4, 2], [2, 3, 4, 2], appels)
+
+    cache_ttl = CacheLRU(taille_max=8, ttl=0.05)
+    f = memoise(lambda x: [x], cache=cache_ttl)
+    f(1)
+    f(1)
+    time.sleep(0.08)
+    f(1)
+    s = cache_ttl.stats()
+    pretty_assert("Expiration TTL", s["expirations"] == 1 and s["hits"] == 1, "1 expiration", s)
+
+    cache_long = CacheLRU(taille_max=8)
+
+    @memoise(cache=cache_long, ttl=0.05)
+    def courte(x):
+        return [x]
+
+    @memoise(cache=cache_long)
+    def longue(x):
+        return [x]
+
+    courte(1)
+    longue(1)
+    time.sleep(0.08)
+    courte(1)
+    longue(1)
+    s = cache_long.stats()
+    pretty_assert("TTL par fonction (memoise(ttl=...))", s["expirations"] == 1 and s["hits"] == 1, "1 expiration", s)
+
+    with cache_desactive(cache):
+        carre(3)
+    pretty_assert("Cache contourné", appels[-1] == 3 and cache.stats()["hits"] == 2, "appel réel", appels)
+
+def test_cache_concurrent():
+    print("\nTest accès concurrents")
+    cache = CacheLRU(taille_max=16)
+
+    @memoise(cache=cache)
+    def identite(x):
+        return x
+
+    def travail():
+        for i in range(2000):
+            assert identite(i % 32) == i % 32
+
+    fils = [threading.Thread(target=travail) for _ in range(8)]
+    for t in fils:
+        t.start()
+    for t in fils:
+        t.join()
+    s = cache.stats()
+    pretty_assert("Compteurs cohérents", s["hits"] + s["misses"] == 16000 and len(cache) <= 16, 16000, s)
+
+def test_points_entree():
+    print("\nTest points d’entrée mémoïsés")
+    CACHE.vider()
+    CACHE.reinitialiser_stats()
+    a = calcul_complet_memo(P=120, gaz="Air")
+    a["Puissance_W"] = -1  # la copie renvoyée peut être modifiée sans polluer le cache
+    b = calcul_complet_memo(120)
+    pretty_assert("Résultat intact", b["Puissance_W"] == 120.0, 120.0, b["Puissance_W"])
+    CACHE.reinitialiser_stats()
+    implicite = calcul_complet_memo(P=500)
+    explicite = calcul_complet_memo(P=500, Th=650, pm=1e6)
+    pretty_assert("Valeurs de DEFAULTS explicites : même entrée", CACHE.stats()["hits"] == 1
+                  and explicite["Diametre_interne_m"] == implicite["Diametre_interne_m"], "1 hit", CACHE.stats())
+    pretty_assert("Drapeaux autofill de l’appel", implicite["autofill"]["Th"] and not explicite["autofill"]["Th"]
+                  and explicite["autofill"]["Tc"], (True, False), (implicite["autofill"]["Th"], explicite["autofill"]["Th"]))
+    CACHE.reinitialiser_stats()
+    params = dict(diametre_m=0.03, course_m=0.025, epaisseur_m=0.005, matiere="Acier", densite_kg_m3=7850,
+                  rugosite_um=0.8, etat_surface="Usinage fin", Tc=300, Th=650, nb_vis=6, dim_vis_iso="M6",
+                  entraxe_vis_pct=0.85, limite_rupture_MPa=700)
+    c1 = cylindre_memo(**params)
+    c2 = cylindre_memo(**params)
+    pretty_assert("Cylindre partagé", c1 is c2, "même objet", (id(c1), id(c2)))
+    p1 = piston_depuis_cylindre_memo(c1)
+    p2 = piston_depuis_cylindre_memo(c2)
+    pretty_assert("Piston partagé", p1 is p2, "même objet", (id(p1), id(p2)))
+    s = CACHE.stats()
+    pretty_assert("Compteurs globaux", s["hits"] == 2 and s["misses"] == 2, "2 hits / 2 misses", s)
+
+if __name__ == "__main__":
+    test_normaliser()
+    test_cache_lru()
+    test_cache_concurrent()
+    test_points_entree()
+    print("\n==== FIN TESTS cache ====\n")
@@ -0,0 +1,109 @@
+# tests/test_catalogue.py
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
+import pytest
+from calculs import catalogue
+from calculs.support_roulement import ROULEMENTS_ISO, choix_roulement
+from calculs.visserie import FILETAGES_ISO
+from calculs.joints import trouve_joint_torique
+from calculs.vibrations import MODULES_ELASTIQUES
+from materiaux import famille
+from conftest import pretty_assert
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_chargement_differe():
+    print("\nTest chargement différé")
+    racine = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    code = "import calculs.catalogue as c, calculs.joints, calculs.support_roulement; print(c.connexion.cache_info().currsize)"
+    sortie = subprocess.run([sys.executable, "-c", code], cwd=racine, capture_output=True, text=True, check=True).stdout
+    pretty_assert("Import sans lecture du catalogue", sortie.strip() == "0", "0", sortie.strip())
+
+def test_tables():
+    print("\nTest contenu des tables")
+    pretty_assert("Roulements", [r["ref"] for r in catalogue.lignes("roulements")][:len(ROULEMENTS_ISO)]
+                  == [r["ref"] for r in ROULEMENTS_ISO], len(ROULEMENTS_ISO), len(catalogue.lignes("roulements")))
+    pretty_assert("Roulement 6201 (colonne D)", catalogue.roulement("6201")["D"] == 32.0, 32.0, catalogue.roulement("6201"))
+    pretty_assert("Filetages", len(catalogue.lignes("filetages")) == len(FILETAGES_ISO)
+                  and catalogue.filetage("m10x1.25")["pas"] == 1.25, len(FILETAGES_ISO), catalogue.filetage("m10x1.25"))
+    pretty_assert("Joints toriques", len(catalogue.lignes("joints")) > 2000, "> 2000", len(catalogue.lignes("joints")))
+    alu = catalogue.materiau("Aluminium")
+    pretty_assert("Matériau fusionné", alu["densite"] == 2700 and alu["Rm"] == 150e6 and alu["E"] == 70e9, "2700, 150 MPa, 70 GPa", alu)
+    pretty_assert("Matériau absent", catalogue.materiau("Unobtainium") is None, None, None)
+    for ligne in catalogue.lignes("materiaux"):
+        attendu = MODULES_ELASTIQUES[famille(ligne["nom"])]
+        assert (ligne["E"], ligne["G"]) == (attendu["E"], attendu["G"]), ligne
+    pretty_assert("Modules par famille (Alu -> aluminium)", catalogue.materiau("Alu")["E"] == 70e9, 70e9, catalogue.materiau("Alu"))
+    pretty_assert("Tolérance H7", catalogue.tolerance("H7") == 0.021, 0.021, catalogue.tolerance("H7"))
+    col = catalogue.colonnes("roulements")
+    pretty_assert("Colonnes NumPy", col["charge_C"].dtype == float and col["ref"].size == len(catalogue.lignes("roulements")),
+                  "float", col["charge_C"].dtype)
+    try:
+        catalogue.lignes("vis")
+        pretty_assert("Table inconnue refusée", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Table inconnue refusée", True, "ValueError", "ValueError")
+
+def test_requetes_indexees():
+    print("\nTest requêtes indexées")
+    catalogue.connexion()
+    plan = catalogue.requete("EXPLAIN QUERY PLAN SELECT ref FROM joints WHERE mat = ? AND d_int >= ? ORDER BY d_int LIMIT 1",
+                             ("NBR", 20.0))
+    pretty_assert("Index (mat, d_int) utilisé", any("idx_joints" in ligne["detail"] for ligne in plan), "idx_joints", plan)
+    pretty_assert("Choix de roulement servi par le catalogue", choix_roulement(12, 6000)["ref"] == "6002", "6002", choix_roulement(12, 6000))
+    pretty_assert("Joint servi par le catalogue", trouve_joint_torique(d_arbre_mm=20.0)["ref_joint"].startswith("OR 20"), "OR 20x..", None)
+
+def test_reconstruction():
+    print("\nTest reconstruction sur changement des sources")
+    dossier, base = catalogue.DOSSIER_DONNEES, catalogue.FICHIER_BASE
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(os.path.join(dossier, "joints_toriques.csv"), tmp)
+        try:
+            catalogue.DOSSIER_DONNEES, catalogue.FICHIER_BASE = tmp, os.path.join(tmp, "catalogue.sqlite")
+            catalogue.recharger()
+            pretty_assert("Base construite au premier appel", catalogue.roulement("6201") is not None
+                          and os.path.exists(catalogue.FICHIER_BASE), True, os.listdir(tmp))
+            date = os.stat(catalogue.FICHIER_BASE).st_mtime_ns
+            catalogue.recharger()
+            catalogue.connexion()
+            pretty_assert("Base réutilisée si les sources sont inchangées", os.stat(catalogue.FICHIER_BASE).st_mtime_ns == date,
+                          date, os.stat(catalogue.FICHIER_BASE).st_mtime_ns)
+            with open(os.path.join(tmp, "roulements_fabricant.csv"), "w", encoding="utf-8") as f:
+                f.write("# Extrait fabricant\nref;d;D;B;charge_C;charge_C0;masse\n61801;12;21;5;1.43e3;0.67e3;0.006\n")
+            catalogue.recharger()
+            ajout = catalogue.roulement("61801")
+            pretty_assert("CSV fabricant ajouté", ajout is not None and ajout["D"] == 21.0 and ajout["charge_C"] == 1430.0, 21.0, ajout)
+            pretty_assert("Base en lecture seule", _ecriture_refusee(), True, None)
+        finally:
+            catalogue.DOSSIER_DONNEES, catalogue.FICHIER_BASE = dossier, base
+            catalogue.recharger()
+
+def _ecriture_refusee():
+    try:
+        catalogue.connexion().execute("DELETE FROM roulements")
+    except Exception:
+        return True
+    return False
+
+@pytest.mark.perf
+def test_perf_requetes():
+    print("\nTest durée des requêtes indexées")
+    diametres = np.linspace(5, 200, 10_000)
+    t0 = time.perf_counter()
+    for d in diametres:
+        catalogue.premiere("SELECT ref FROM joints WHERE mat = ? AND d_int >= ? ORDER BY d_int LIMIT 1", ("NBR", float(d)))
+    duree = (time.perf_counter() - t0) / diametres.size
+    pretty_assert("Requête indexée < 100 µs", duree < 1e-4, "< 100 µs", f"{duree * 1e6:.1f} µs")
+
+if __name__ == "__main__":
+    test_chargement_differe()
+    test_tables()
+    test_requetes_indexees()
+    test_reconstruction()
+    test_perf_requetes()
+    print("\n==== FIN TESTS catalogue ====\n")
@@ -0,0 +1,115 @@
+# tests/test_cinematique.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.cinematique import cinematique, forces_inertie, depuis_pieces, angles, FRACTION_BIELLE_ALTERNATIVE
+from calculs.assemblage import AssemblageMoteur
+from calculs.stirling import calcul_complet, calcul_complet_batch
+from calculs.tableaux import CylindreArray, PistonArray, BielleArray, VillebrequinArray
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_cinematique_exacte():
+    print("\nTest cinématique bielle-manivelle")
+    r, L, f = 0.02, 0.08, 30.0
+    omega = 2 * math.pi * f
+    res = cinematique(r, L, f)
+    theta = res["Angle_vilebrequin_rad"]
+    pretty_assert("3600 angles par défaut", res["Position_m"].shape == (3600,), (3600,), res["Position_m"].shape)
+    pretty_assert("PMH / PMB", math.isclose(res["Position_m"][0], r + L) and math.isclose(res["Position_m"][1800], L - r),
+                  (r + L, L - r), (res["Position_m"][0], res["Position_m"][1800]))
+    pretty_assert("Course = 2 r", math.isclose(np.max(res["Deplacement_PMH_m"]), 2 * r), 2 * r, np.max(res["Deplacement_PMH_m"]))
+    # Dérivées par différences finies centrées (pas angulaire dθ, dt = dθ / ω)
+    dt = (theta[1] - theta[0]) / omega
+    v_num = (np.roll(res["Position_m"], -1) - np.roll(res["Position_m"], 1)) / (2 * dt)
+    a_num = (np.roll(res["Vitesse_m_s"], -1) - np.roll(res["Vitesse_m_s"], 1)) / (2 * dt)
+    ev = np.max(np.abs(v_num - res["Vitesse_m_s"])) / np.max(np.abs(res["Vitesse_m_s"]))
+    ea = np.max(np.abs(a_num - res["Acceleration_m_s2"])) / np.max(np.abs(res["Acceleration_m_s2"]))
+    pretty_assert("Vitesse = dérivée de la position", ev < 1e-5, "< 1e-5", ev)
+    pretty_assert("Accélération = dérivée de la vitesse", ea < 1e-5, "< 1e-5", ea)
+    lam = r / L
+    pretty_assert("Accélération au PMH = -r ω² (1 + λ)", math.isclose(res["Acceleration_m_s2"][0], -r * omega ** 2 * (1 + lam)),
+                  -r * omega ** 2 * (1 + lam), res["Acceleration_m_s2"][0])
+    pretty_assert("Angle de bielle maxi = asin λ", math.isclose(np.max(res["Angle_bielle_rad"]), math.asin(lam), rel_tol=1e-6),
+                  math.asin(lam), np.max(res["Angle_bielle_rad"]))
+    # Bielle très longue : mouvement harmonique
+    long = cinematique(r, 1e4, f)
+    pretty_assert("λ -> 0 : harmonique", np.allclose(long["Acceleration_m_s2"], -r * omega ** 2 * np.cos(theta), atol=1e-3 * r * omega ** 2),
+                  "-r ω² cos θ", long["Acceleration_m_s2"][:3])
+    try:
+        cinematique(0.05, 0.04, f)
+        pretty_assert("Bielle plus courte que la manivelle refusée", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Bielle plus courte que la manivelle refusée", True, "ValueError", "ValueError")
+
+def test_forces_inertie():
+    print("\nTest forces d’inertie")
+    r, L, f, m_p, m_b = 0.02, 0.08, 30.0, 0.3, 0.15
+    omega = 2 * math.pi * f
+    res = forces_inertie(r, L, f, m_p, m_b)
+    m_alt = m_p + FRACTION_BIELLE_ALTERNATIVE * m_b
+    pretty_assert("Masse alternative", math.isclose(res["Masse_alternative_kg"], m_alt), m_alt, res["Masse_alternative_kg"])
+    pretty_assert("Masse rotative", math.isclose(res["Masse_rotative_kg"], m_b - FRACTION_BIELLE_ALTERNATIVE * m_b),
+                  2 * m_b / 3, res["Masse_rotative_kg"])
+    # Développement en harmoniques : écart d’ordre λ³ (termes d’ordre 4)
+    somme = res["Force_alternative_primaire_N"] + res["Force_alternative_secondaire_N"]
+    ecart = np.max(np.abs(somme - res["Force_alternative_N"])) / np.max(np.abs(res["Force_alternative_N"]))
+    pretty_assert("Harmoniques 1 + 2 ≈ force exacte", ecart < (r / L) ** 3, f"< {(r / L) ** 3:.4f}", ecart)
+    centrifuge = np.hypot(res["Force_rotative_x_N"], res["Force_rotative_y_N"])
+    pretty_assert("Force centrifuge constante", np.allclose(centrifuge, 2 * m_b / 3 * r * omega ** 2),
+                  2 * m_b / 3 * r * omega ** 2, centrifuge[:3])
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    pieces = depuis_pieces(moteur.villebrequin, moteur.bielle, moteur.piston, f=25)
+    direct = forces_inertie(moteur.villebrequin.rayon_maneton, moteur.bielle.longueur, 25,
+                            moteur.piston.masse, moteur.bielle.masse)
+    pretty_assert("Depuis les pièces", np.array_equal(pieces["Force_alternative_N"], direct["Force_alternative_N"]),
+                  "identique", pieces["Force_alternative_max_N"])
+
+def test_cinematique_lot():
+    print("\nTest lot de designs")
+    n = 500
+    rng = np.random.default_rng(1)
+    r = rng.uniform(0.005, 0.03, n)
+    L = rng.uniform(0.08, 0.15, n)
+    f = rng.uniform(5, 50, n)
+    m_p = rng.uniform(0.1, 1.0, n)
+    m_b = rng.uniform(0.05, 0.5, n)
+    lot = forces_inertie(r, L, f, m_p, m_b)
+    pretty_assert("Forme (designs, angles)", lot["Force_alternative_N"].shape == (n, 3600), (n, 3600), lot["Force_alternative_N"].shape)
+    for i in (0, 123, n - 1):
+        seul = forces_inertie(r[i], L[i], f[i], m_p[i], m_b[i])
+        pretty_assert(f"Design {i} = calcul isolé", np.allclose(lot["Force_alternative_N"][i], seul["Force_alternative_N"], rtol=1e-12, atol=0)
+                      and math.isclose(lot["Force_alternative_max_N"][i], seul["Force_alternative_max_N"], rel_tol=1e-12),
+                      "identique", seul["Force_alternative_max_N"])
+    # Collections de pièces (calculs.tableaux)
+    res = calcul_complet_batch(P=[200, 500, 1000])
+    cyl = CylindreArray.depuis_calcul_complet(res)
+    piston = PistonArray.depuis_cylindres(cyl)
+    bielle = BielleArray.depuis_stirling(res)
+    vil = VillebrequinArray(rayon_maneton_m=np.asarray(res["Course_m"]) / 2)
+    coll = depuis_pieces(vil, bielle, piston, f=np.array([20.0, 25.0, 30.0]), theta=angles(360))
+    pretty_assert("Collections de pièces", coll["Acceleration_m_s2"].shape == (3, 360), (3, 360), coll["Acceleration_m_s2"].shape)
+    simple = cinematique(0.02, 0.08, 30.0, dtype=np.float32)
+    pretty_assert("Calcul en float32", simple["Acceleration_m_s2"].dtype == np.float32, np.float32, simple["Acceleration_m_s2"].dtype)
+
+@pytest.mark.perf
+def test_perf_forces_inertie():
+    print("\nTest durée du calcul en lot")
+    n = 500
+    rng = np.random.default_rng(1)
+    r, L = rng.uniform(0.005, 0.03, n), rng.uniform(0.08, 0.15, n)
+    f, m_p, m_b = rng.uniform(5, 50, n), rng.uniform(0.1, 1.0, n), rng.uniform(0.05, 0.5, n)
+    t0 = time.perf_counter()
+    forces_inertie(r, L, f, m_p, m_b)
+    duree = time.perf_counter() - t0
+    pretty_assert("Lot en une opération", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_cinematique_exacte()
+    test_forces_inertie()
+    test_cinematique_lot()
+    test_perf_forces_inertie()
+    print("\n==== FIN TESTS cinematique ====\n")
@@ -0,0 +1,56 @@
+# tests/test_dimensionnement.py
+
+import math
+import numpy as np
+from calculs.dimensionnement import dimensionner, bissection
+from calculs.stirling import calcul_complet_batch
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_bissection():
+    print("\nTest bissection vectorisée")
+    cibles = np.array([2.0, 9.0, 200.0])
+    x = bissection(lambda v: v ** 2 - cibles, np.zeros(3), np.full(3, 10.0), tol=1e-12)
+    pretty_assert("Racines carrées", np.allclose(x[:2], np.sqrt(cibles[:2])), np.sqrt(cibles[:2]), x[:2])
+    pretty_assert("Non encadrée -> NaN", math.isnan(x[2]), "nan", x[2])
+
+def test_dimensionner():
+    print("\nTest dimensionner")
+    contraintes = dict(D_max=0.035, v_piston_max=1.8, pm_max=4e6, materiaux=["Acier", "Aluminium", "Inox"])
+    res = dimensionner(P=250, **contraintes)
+    for k in ("Materiau", "Pression_Pa", "Course_m", "Diametre_interne_m", "Masse_cylindre_kg"):
+        print(f"  {k:22}: {res[k]}")
+    pretty_assert("Alésage respecté", res["Diametre_interne_m"] <= 0.035 * (1 + 1e-5), "<= 35 mm", res["Diametre_interne_m"])
+    pretty_assert("Vitesse piston respectée", res["Vitesse_piston_m_s"] <= 1.8 + 1e-12, "<= 1.8", res["Vitesse_piston_m_s"])
+    pretty_assert("Pression respectée", res["Pression_Pa"] <= 4e6, "<= 4e6", res["Pression_Pa"])
+
+    # Recherche exhaustive grossière : aucun design faisable ne doit être plus léger
+    rng = np.random.default_rng(0)
+    n = 20000
+    mat = rng.choice(contraintes["materiaux"], n)
+    pm = rng.uniform(1e5, 4e6, n)
+    C = rng.uniform(0.001, 1.8 / 50, n)
+    lot = calcul_complet_batch(P=250, pm=pm, C=C, materiau=mat)
+    ok = (lot["Diametre_interne_m"] <= 0.035) & (lot["Vitesse_piston_m_s"] <= 1.8)
+    meilleur_aleatoire = lot["Masse_cylindre_kg"][ok].min()
+    pretty_assert("Optimal vs recherche aléatoire", res["Masse_cylindre_kg"] <= meilleur_aleatoire * (1 + 1e-6),
+                  f"<= {meilleur_aleatoire}", res["Masse_cylindre_kg"])
+
+    try:
+        dimensionner(P=5000, D_max=0.01, v_piston_max=0.5, pm_max=2e6)
+    except ValueError as e:
+        print("[OK] Erreur attendue (contraintes infaisables):", e)
+    else:
+        raise AssertionError("Pas d’exception pour des contraintes infaisables")
+    try:
+        dimensionner(P=100, D_max=0.03, materiaux=["Titane"])
+    except ValueError as e:
+        print("[OK] Erreur attendue (matériau inconnu):", e)
+    else:
+        raise AssertionError("Pas d’exception pour un matériau inconnu")
+
+if __name__ == "__main__":
+    test_bissection()
+    test_dimensionner()
+    print("\n==== FIN TESTS dimensionnement ====\n")
@@ -0,0 +1,92 @@
+# tests/test_equilibrage.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.equilibrage import (facteurs_phases, efforts_sans_contrepoids, forces_residuelles, optimiser_desequilibre,
+                                 contrepoids_optimal, depuis_pieces, positions_manetons)
+from calculs.assemblage import AssemblageMoteur
+from calculs.stirling import calcul_complet
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_facteurs_phases():
+    print("\nTest facteurs de calage")
+    deux = facteurs_phases([0, math.pi], positions_manetons(2, 0.08))
+    pretty_assert("2 manetons à 180° : primaire équilibré", deux["Force_primaire"] < 1e-12, 0, deux["Force_primaire"])
+    pretty_assert("2 manetons à 180° : secondaire non équilibré", math.isclose(deux["Force_secondaire"], 2), 2, deux["Force_secondaire"])
+    pretty_assert("2 manetons à 180° : couple primaire", deux["Moment_primaire_m"] > 0, "> 0", deux["Moment_primaire_m"])
+    quatre = facteurs_phases([0, math.pi, math.pi, 0], positions_manetons(4, 0.16))
+    pretty_assert("4 manetons plan : forces et moments primaires équilibrés",
+                  quatre["Force_primaire"] < 1e-12 and quatre["Moment_primaire_m"] < 1e-12, 0, quatre)
+
+def test_monocylindre():
+    print("\nTest équilibrage monocylindre")
+    r, L, f, m_alt = 0.02, 0.08, 30.0, 0.3
+    w2 = (2 * math.pi * f) ** 2
+    efforts = efforts_sans_contrepoids([0.0], r, L, f, m_alt, 0.0)
+    libre = forces_residuelles(efforts, 0.0)
+    pretty_assert("Sans contrepoids : m r ω² (1 + λ)", math.isclose(libre["Force_max_N"], m_alt * r * w2 * (1 + r / L), rel_tol=1e-9),
+                  m_alt * r * w2 * (1 + r / L), libre["Force_max_N"])
+    U = np.linspace(0, m_alt * r, 301)
+    res = optimiser_desequilibre(efforts, U)
+    fraction = res["Desequilibre_optimal_kg_m"] / (m_alt * r)
+    pretty_assert("Balourd optimal ≈ moitié de la masse alternative", 0.3 < fraction < 0.7, "0.3 - 0.7", fraction)
+    pretty_assert("Crête réduite", res["Force_max_N"].min() < 0.75 * libre["Force_max_N"], "< 75 %", res["Force_max_N"].min())
+    # Évaluation par blocs = calcul direct, quelle que soit la taille des blocs
+    for i in (0, 57, 300):
+        direct = forces_residuelles(efforts, U[i])["Force_max_N"]
+        pretty_assert(f"Candidat {i} = calcul direct", math.isclose(res["Force_max_N"][i], direct, rel_tol=1e-9), direct, res["Force_max_N"][i])
+    petits_blocs = optimiser_desequilibre(efforts, U, taille_bloc=3600 * 7)
+    pretty_assert("Découpage en blocs", np.array_equal(petits_blocs["Force_max_N"], res["Force_max_N"]), "identique", petits_blocs["Indice_optimal"])
+    # Balourd rotatif seul : entièrement compensé par un contrepoids de même balourd
+    rotatif = efforts_sans_contrepoids([0.0], r, L, f, 0.0, 0.2)
+    reste = forces_residuelles(rotatif, 0.2 * r)["Force_max_N"]
+    pretty_assert("Masse rotative compensée", reste < 1e-9, 0, reste)
+
+def test_contrepoids_pieces():
+    print("\nTest recherche des contrepoids")
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    vil, bielle, piston = moteur.villebrequin, moteur.bielle, moteur.piston
+    efforts = depuis_pieces(vil, bielle, piston, f=25)
+    libre = forces_residuelles(efforts, 0.0)["Force_max_N"]
+    diametres, largeurs = np.linspace(0.01, 0.08, 200), np.linspace(0.005, 0.02, 25)
+    res = contrepoids_optimal(vil, bielle, piston, 25, diametres, largeurs)
+    pretty_assert("5000 candidats", res["Force_max_N"].size == 5000, 5000, res["Force_max_N"].size)
+    pretty_assert("Crête résiduelle réduite", res["Residus"]["Force_max_N"] < libre, f"< {libre:.1f}", res["Residus"]["Force_max_N"])
+    nouveau = res["Villebrequin"]
+    pretty_assert("Vilebrequin modifié par replace", nouveau.diametre_contrepoids == res["Diametre_contrepoids_m"]
+                  and vil.diametre_contrepoids != nouveau.diametre_contrepoids, res["Diametre_contrepoids_m"], nouveau.diametre_contrepoids)
+    # Manetons à 180° : la force résultante ne dépend pas des contrepoids, le couple si
+    oppose = depuis_pieces(vil, bielle, piston, f=25, phase=math.pi)
+    U = np.linspace(0, 0.01, 101)
+    force = optimiser_desequilibre(oppose, U)
+    couple = optimiser_desequilibre(oppose, U, poids_moment=1 / 0.04)
+    pretty_assert("180° : force indépendante du balourd", np.ptp(force["Force_max_N"]) < 1e-9 * force["Force_max_N"][0],
+                  "constante", np.ptp(force["Force_max_N"]))
+    pretty_assert("180° : couple réduit par les contrepoids", couple["Moment_max_N_m"][couple["Indice_optimal"]] < couple["Moment_max_N_m"][0],
+                  couple["Moment_max_N_m"][0], couple["Moment_max_N_m"][couple["Indice_optimal"]])
+    try:
+        depuis_pieces(vil, bielle, piston, f=25, phases=[0.0])
+        pretty_assert("Nombre de phases contrôlé", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Nombre de phases contrôlé", True, "ValueError", "ValueError")
+
+@pytest.mark.perf
+def test_perf_contrepoids():
+    print("\nTest durée de l’optimisation des contrepoids")
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    diametres, largeurs = np.linspace(0.01, 0.08, 200), np.linspace(0.005, 0.02, 25)
+    t0 = time.perf_counter()
+    contrepoids_optimal(moteur.villebrequin, moteur.bielle, moteur.piston, 25, diametres, largeurs)
+    duree = time.perf_counter() - t0
+    pretty_assert("5000 candidats", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_facteurs_phases()
+    test_monocylindre()
+    test_contrepoids_pieces()
+    test_perf_contrepoids()
+    print("\n==== FIN TESTS equilibrage ====\n")
@@ -0,0 +1,121 @@
+# tests/test_fatigue.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.fatigue import (rainflow, points_inversion, contraintes, coefficient_securite, limite_endurance,
+                             analyse_fatigue, spectre_vilebrequin, materiau_fatigue)
+from calculs.arbre import ArbreStirling
+from calculs.axe_piston import AxePistonStirling
+from calculs.cinematique import forces_inertie
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def rainflow_sequentiel(signal):
+    """Référence : méthode des quatre points avec pile, point par point."""
+    pile, etendues, moyennes = [], [], []
+    for x in signal[points_inversion(signal)]:
+        pile.append(x)
+        while len(pile) >= 4:
+            a, b, c, d = pile[-4:]
+            if abs(b - c) <= abs(a - b) and abs(b - c) <= abs(c - d):
+                etendues.append(abs(b - c))
+                moyennes.append((b + c) / 2)
+                del pile[-3:-1]
+            else:
+                break
+    return np.array(etendues), np.array(moyennes), np.array(pile)
+
+def _tri(etendues, moyennes):
+    ordre = np.lexsort((moyennes, etendues))
+    return etendues[ordre], moyennes[ordre]
+
+def test_rainflow():
+    print("\nTest comptage rainflow")
+    rng = np.random.default_rng(3)
+    for n in (10, 1000, 50_000):
+        signal = rng.normal(size=n).cumsum()
+        res = rainflow(signal)
+        complets = res["Nombre"] == 1.0
+        ref_e, ref_m, residu = rainflow_sequentiel(signal)
+        e, m = _tri(res["Etendue"][complets], res["Moyenne"][complets])
+        re, rm = _tri(ref_e, ref_m)
+        pretty_assert(f"Cycles complets = référence séquentielle ({n} points)",
+                      e.size == re.size and np.allclose(e, re, rtol=0, atol=1e-12) and np.allclose(m, rm, rtol=0, atol=1e-12),
+                      re.size, e.size)
+        pretty_assert(f"Demi-cycles du résidu ({n} points)", np.sum(~complets) == max(residu.size - 1, 0),
+                      residu.size - 1, int(np.sum(~complets)))
+    # Signal entier avec paliers et égalités d’étendues
+    entier = rng.integers(-3, 4, 5000).astype(float)
+    res = rainflow(entier)
+    ref_e, ref_m, _ = rainflow_sequentiel(entier)
+    pretty_assert("Égalités d’étendues", np.sum(res["Nombre"] == 1.0) == ref_e.size, ref_e.size, int(np.sum(res["Nombre"] == 1.0)))
+    # Histoire classique (ASTM E1049) : -2 1 -3 5 -1 3 -4 4 -2
+    astm = rainflow(np.array([-2, 1, -3, 5, -1, 3, -4, 4, -2], dtype=float))
+    pretty_assert("Histoire ASTM : un cycle complet (-1, 3), six demi-cycles",
+                  list(astm["Etendue"][astm["Nombre"] == 1.0]) == [4.0] and np.sum(astm["Nombre"] == 0.5) == 6,
+                  [4.0], astm["Etendue"][astm["Nombre"] == 1.0])
+    theta = np.linspace(0, 2 * math.pi, 3600, endpoint=False)
+    sinus = rainflow(2.0 * np.sin(theta) + 1.0, periodique=True)
+    pretty_assert("Sinus périodique : un cycle d’étendue 4", sinus["Nombre"].sum() == 1.0 and math.isclose(sinus["Etendue"].max(), 4.0, rel_tol=1e-5)
+                  and math.isclose(sinus["Moyenne"][np.argmax(sinus["Etendue"])], 1.0, abs_tol=1e-5), (1.0, 4.0), sinus)
+
+def test_contraintes():
+    print("\nTest contraintes et coefficients de sécurité")
+    arbre = ArbreStirling(diametre_m=0.012, longueur_m=0.080)
+    W = math.pi * 0.012 ** 3 / 32
+    ctr = contraintes(arbre, np.array([2.0, 0.0, -1.0]), np.array([0.0, 3.0, 1.0]))
+    pretty_assert("Flexion M / W", math.isclose(ctr["Contrainte_flexion_Pa"][0], 2.0 / W), 2.0 / W, ctr["Contrainte_flexion_Pa"][0])
+    pretty_assert("Torsion pure : σ_eq = √3 τ", math.isclose(ctr["Von_Mises_Pa"][1], math.sqrt(3) * 3.0 / (2 * W)),
+                  math.sqrt(3) * 3.0 / (2 * W), ctr["Von_Mises_Pa"][1])
+    pretty_assert("Équivalent signé", ctr["Von_Mises_signe_Pa"][2] < 0 < ctr["Von_Mises_signe_Pa"][1], "-/+", ctr["Von_Mises_signe_Pa"])
+    mat = materiau_fatigue("Acier C45")
+    S_e = limite_endurance(mat, 0.012, "Rectifié fin")
+    pretty_assert("Limite d’endurance corrigée", 0.7 * mat["sigma_D"] < S_e < mat["sigma_D"], "< sigma_D", S_e)
+    pretty_assert("Surface usinée moins favorable", limite_endurance(mat, 0.012, "Usinage standard") < S_e, "<", S_e)
+    goodman = coefficient_securite(100e6, 100e6, S_e, mat["Rm"], mat["Re"], "goodman")
+    soderberg = coefficient_securite(100e6, 100e6, S_e, mat["Rm"], mat["Re"], "soderberg")
+    attendu = 1 / (100e6 / S_e + 100e6 / mat["Rm"])
+    pretty_assert("Goodman", math.isclose(goodman, attendu), attendu, goodman)
+    pretty_assert("Soderberg plus sévère", soderberg < goodman, "<", soderberg)
+    pretty_assert("Compression moyenne négligée", math.isclose(coefficient_securite(100e6, -200e6, S_e, mat["Rm"], mat["Re"]), S_e / 100e6),
+                  S_e / 100e6, None)
+    try:
+        coefficient_securite(1e6, 0, S_e, mat["Rm"], mat["Re"], "gerber")
+        pretty_assert("Critère inconnu refusé", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Critère inconnu refusé", True, "ValueError", "ValueError")
+
+def test_analyse_fatigue():
+    print("\nTest analyse de fatigue sur un tour de vilebrequin")
+    efforts = forces_inertie(0.02, 0.08, 30.0, 0.4, 0.2)
+    M, T = spectre_vilebrequin(efforts, 0.02, porte_a_faux=0.03)
+    arbre = ArbreStirling(diametre_m=0.012, longueur_m=0.080)
+    res = analyse_fatigue(arbre, M, T)
+    pretty_assert("Arbre 12 mm en endurance", res["Coefficient_securite"] > 1 and res["Dommage_par_passage"] == 0,
+                  "> 1", res["Coefficient_securite"])
+    fin = analyse_fatigue(arbre.replace(diametre_m=0.005), M, T)
+    pretty_assert("Arbre 5 mm endommagé", fin["Coefficient_securite"] < 1 and fin["Duree_vie_passages"] < math.inf,
+                  "< 1", (fin["Coefficient_securite"], fin["Duree_vie_passages"]))
+    pretty_assert("Soderberg <= Goodman", analyse_fatigue(arbre, M, T, critere="soderberg")["Coefficient_securite"]
+                  <= res["Coefficient_securite"], "<=", None)
+    axe = AxePistonStirling(0.008, 0.025, "Acier trempé 100Cr6", 7810, 0.6, "Rectifié miroir")
+    pretty_assert("Axe de piston", analyse_fatigue(axe, M / 3)["Coefficient_plastification"] > 1, "> 1", None)
+
+@pytest.mark.perf
+def test_perf_rainflow():
+    print("\nTest durée du comptage rainflow")
+    long = np.random.default_rng(0).normal(size=1_000_000).cumsum()
+    t0 = time.perf_counter()
+    rainflow(long)
+    duree = time.perf_counter() - t0
+    pretty_assert("10^6 points", duree < 1.0, "< 1 s", duree)
+
+if __name__ == "__main__":
+    test_rainflow()
+    test_contraintes()
+    test_analyse_fatigue()
+    test_perf_rainflow()
+    print("\n==== FIN TESTS fatigue ====\n")
@@ -0,0 +1,91 @@
+# tests/test_gaz.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.gaz import proprietes, proprietes_exactes, propriete, nom_gaz, PROPRIETES
+from calculs.stirling import calcul_complet, calcul_complet_batch
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_gaz_proprietes():
+    print("\nTest propriétés des gaz de travail")
+    # Valeurs de référence à 300 K, 1 bar (tables usuelles)
+    references = {
+        "Air": {"cp": 1005, "gamma": 1.400, "mu": 1.85e-5, "k": 0.0263, "rho": 1.161},
+        "He": {"cp": 5193, "gamma": 1.667, "mu": 1.99e-5, "k": 0.155, "rho": 0.1604},
+        "H2": {"cp": 14310, "gamma": 1.405, "mu": 8.96e-6, "k": 0.183, "rho": 0.0808},
+        "N2": {"cp": 1040, "gamma": 1.400, "mu": 1.79e-5, "k": 0.0259, "rho": 1.123},
+    }
+    for g, ref in references.items():
+        pr = proprietes(g, 300.0, 1e5)
+        for nom, attendu in ref.items():
+            pretty_assert(f"{g} {nom} à 300 K", math.isclose(pr[nom], attendu, rel_tol=0.05), attendu, pr[nom])
+    pretty_assert("Noms de l’interface", [nom_gaz(g) for g in ("Hélium (He)", "Hydrogène (H₂)", "Azote (N₂)")]
+                  == ["He", "H2", "N2"], ["He", "H2", "N2"], None)
+    for faute in ("Helim", ""):
+        try:
+            nom_gaz(faute)
+            pretty_assert(f"Gaz inconnu {faute!r} refusé", False, "ValueError", None)
+        except ValueError:
+            pretty_assert(f"Gaz inconnu {faute!r} refusé", True, "ValueError", "ValueError")
+    # Gaz réel : masse volumique croissante avec la pression, Z proche de 1 pour l’hélium
+    rho = propriete("Air", "rho", 300.0, np.array([1e5, 1e6, 1e7]))
+    pretty_assert("Masse volumique croissante avec p", np.all(np.diff(rho) > 0), "croissante", rho)
+    Z = propriete("He", "Z", 500.0, 5e6)
+    pretty_assert("Z hélium", abs(Z - 1) < 0.02, "≈ 1", Z)
+
+def test_gaz_tables():
+    print("\nTest interpolation des tables")
+    rng = np.random.default_rng(0)
+    T = rng.uniform(250, 1200, 20_000)
+    p = rng.uniform(1e5, 2e7, 20_000)
+    for g in ("Air", "He", "H2", "N2"):
+        tab, ref = proprietes(g, T, p), proprietes_exactes(g, T, p)
+        ecart = max(float(np.max(np.abs(tab[nom] / ref[nom] - 1))) for nom in PROPRIETES)
+        pretty_assert(f"Tables {g} vs calcul direct", ecart < 0.01, "< 1 %", ecart)
+    # Gaz mélangés dans une même colonne
+    noms = np.array(["Air", "He", "Hydrogène (H₂)"], dtype=object)
+    melange = proprietes(noms, 400.0, 1e6)["cp"]
+    seuls = [proprietes(g, 400.0, 1e6)["cp"] for g in noms]
+    pretty_assert("Colonne de gaz", np.allclose(melange, seuls, rtol=0, atol=0), seuls, melange)
+
+def test_gaz_dimensionnement():
+    print("\nTest effet du gaz sur le dimensionnement")
+    air = calcul_complet(P=1000, gaz="Air")
+    pretty_assert("Air : rendement inchangé", air["Rendement_effectif"] == 0.2, 0.2, air["Rendement_effectif"])
+    he = calcul_complet(P=1000, gaz="Hélium (He)")
+    h2 = calcul_complet(P=1000, gaz="Hydrogène (H₂)")
+    co2 = calcul_complet(P=1000, gaz="Dioxyde de carbone (CO₂)")
+    pretty_assert("Gaz légers : moins de pertes", h2["Pertes_ecoulement"] < he["Pertes_ecoulement"] < air["Pertes_ecoulement"],
+                  "H2 < He < Air", (h2["Pertes_ecoulement"], he["Pertes_ecoulement"], air["Pertes_ecoulement"]))
+    pretty_assert("Gaz légers : cylindre plus petit",
+                  h2["Volume_balayé_m3"] < he["Volume_balayé_m3"] < air["Volume_balayé_m3"] < co2["Volume_balayé_m3"],
+                  "H2 < He < Air < CO2", (h2["Volume_balayé_m3"], he["Volume_balayé_m3"], air["Volume_balayé_m3"]))
+    pretty_assert("Gamma hélium", math.isclose(he["Gamma_gaz"], 5 / 3, rel_tol=1e-3), 5 / 3, he["Gamma_gaz"])
+    # Point fixe (course auto-calculée) : la correction est cohérente avec la course obtenue
+    impose = calcul_complet(P=1000, gaz="Hélium (He)", C=he["Course_m"])
+    pretty_assert("Point fixe course / rendement", math.isclose(impose["Volume_balayé_m3"], he["Volume_balayé_m3"],
+                  rel_tol=1e-9), he["Volume_balayé_m3"], impose["Volume_balayé_m3"])
+    lot = calcul_complet_batch(P=[1000, 1000, 1000], gaz=np.array(["Air", "Hélium (He)", "Hydrogène (H₂)"], dtype=object))
+    pretty_assert("Lot multi-gaz = scalaire", np.allclose(lot["Volume_balayé_m3"],
+                  [air["Volume_balayé_m3"], he["Volume_balayé_m3"], h2["Volume_balayé_m3"]], rtol=1e-12, atol=0),
+                  "identique", lot["Volume_balayé_m3"])
+
+@pytest.mark.perf
+def test_perf_proprietes():
+    print("\nTest durée des propriétés en lot")
+    T = np.random.default_rng(0).uniform(300, 900, 1_000_000)
+    t0 = time.perf_counter()
+    proprietes("He", T, 2e6)
+    duree = time.perf_counter() - t0
+    pretty_assert("10^6 points", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_gaz_proprietes()
+    test_gaz_tables()
+    test_gaz_dimensionnement()
+    test_perf_proprietes()
+    print("\n==== FIN TESTS gaz ====\n")
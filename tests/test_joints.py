@@ -1,7 +1,11 @@
 # tests\test_joints.py
 
+import time
 import traceback
-from calculs.joints import trouve_joint_torique, nb_joints_requis
+import numpy as np
+import pytest
+from calculs.joints import trouve_joint_torique, nb_joints_requis, meilleurs_joints, index_joints, CRITERES_MONTAGE
+from conftest import pretty_assert
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -25,12 +29,12 @@ def test_trouve_joint_torique():
         },
         {
             "desc": "Aucun joint adapté (diamètre trop grand)",
-            "params": dict(d_arbre_mm=100.0),
+            "params": dict(d_arbre_mm=1000.0),
             "expect_fail": True
         },
         {
             "desc": "Aucun joint adapté (diamètre trop petit)",
-            "params": dict(d_arbre_mm=2.0),
+            "params": dict(d_arbre_mm=0.5),
             "expect_fail": True
         },
         {
@@ -62,6 +66,48 @@ def test_trouve_joint_torique():
             if test["expect_fail"]:
                 print("ERREUR : Exception attendue NON LEVÉE !", test["params"])
 
+def test_meilleurs_joints():
+    print("\n==== TEST : meilleurs_joints ====")
+    nbr = index_joints()["NBR"]
+    # Recherche exhaustive de référence : meilleur score parmi toutes les lignes admissibles
+    e_min, e_max, e_vise = CRITERES_MONTAGE["dynamique"]["etirement"]
+    q_min, q_max, q_vise = CRITERES_MONTAGE["dynamique"]["ecrasement"]
+    for d, alesage in ((20.0, 24.0), (43.1, 48.0), (8.0, 11.0)):
+        res = trouve_joint_torique(d_arbre_mm=d, d_alésage_mm=alesage)
+        meilleur, score_ref = None, np.inf
+        for jt in nbr["lignes"]:
+            s = d / jt["d_int"] - 1
+            q = 1 - (alesage - d) / 2 / (jt["section"] / np.sqrt(1 + s))
+            remplissage = np.pi / 4 * jt["section"] ** 2 / (1 + s) / ((alesage - d) / 2 * 1.3 * jt["section"])
+            if e_min - 1e-9 <= s <= e_max + 1e-9 and q_min - 1e-9 <= q <= q_max + 1e-9 and remplissage <= 0.85 + 1e-9:
+                score = ((s - e_vise) / 0.025) ** 2 + ((q - q_vise) / 0.05) ** 2
+                if score < score_ref:
+                    meilleur, score_ref = jt["ref"], score
+        pretty_assert(f"Ø{d} dans Ø{alesage} : meilleur joint = recherche exhaustive", res["ref_joint"] == meilleur,
+                      meilleur, res["ref_joint"])
+        pretty_assert(f"Ø{d} : écrasement dans la plage", 10 <= res["ecrasement (%)"] <= 20, "10 - 20 %", res["ecrasement (%)"])
+        section_montee = res["section (mm)"] / np.sqrt(1 + res["etirement (%)"] / 100)
+        pretty_assert(f"Ø{d} : gorge de l’alésage imposé", res["d_alesage (mm)"] == alesage
+                      and "d_alesage_recommande (mm)" not in res and "profondeur_gorge_recom (mm)" not in res
+                      and np.isclose(1 - res["profondeur_gorge (mm)"] / section_montee, res["ecrasement (%)"] / 100, atol=1e-3),
+                      (alesage - d) / 2, res["profondeur_gorge (mm)"])
+    # Lot = appels isolés, -1 si aucun joint
+    d = np.array([0.5, 6.0, 20.0, 43.1, 1000.0])
+    lot = meilleurs_joints(d, d + 4.0)
+    refs = [nbr["lignes"][i]["ref"] if i >= 0 else None for i in lot["indice"]]
+    isoles = []
+    for x in d:
+        try:
+            isoles.append(trouve_joint_torique(d_arbre_mm=x, d_alésage_mm=x + 4.0)["ref_joint"])
+        except ValueError:
+            isoles.append(None)
+    pretty_assert("Lot = appels isolés", refs == isoles, isoles, refs)
+    pretty_assert("Infaisables à -1", lot["indice"][0] == -1 and lot["indice"][-1] == -1, -1, lot["indice"])
+    pretty_assert("Autre matériau", trouve_joint_torique(d_arbre_mm=20.0, mat="FKM")["mat"] == "FKM", "FKM", None)
+    balayage = np.random.default_rng(0).uniform(3, 300, 200_000)
+    grand = meilleurs_joints(balayage)
+    pretty_assert("200 000 diamètres", grand["indice"].shape == balayage.shape, balayage.shape, grand["indice"].shape)
+
 def test_nb_joints_requis():
     print("\n==== TEST : nb_joints_requis ====")
     cas = [
@@ -75,7 +121,18 @@ def test_nb_joints_requis():
         print(f"Longueur {case['longueur_mm']} mm, pas {case['pas_joints_mm']} mm : nb joints = {res} (attendu {case['attendu']})")
         assert res == case["attendu"], f"Erreur nb_joints_requis pour {case}"
 
+@pytest.mark.perf
+def test_perf_meilleurs_joints():
+    print("\nTest durée du choix de joints en lot")
+    balayage = np.random.default_rng(0).uniform(3, 300, 200_000)
+    t0 = time.perf_counter()
+    meilleurs_joints(balayage)
+    duree = time.perf_counter() - t0
+    pretty_assert("200 000 diamètres", duree < 2.0, "< 2 s", duree)
+
 if __name__ == "__main__":
     test_trouve_joint_torique()
+    test_meilleurs_joints()
     test_nb_joints_requis()
+    test_perf_meilleurs_joints()
     print("\n==== FIN TESTS joints ====\n")
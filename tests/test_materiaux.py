@@ -0,0 +1,110 @@
+# tests/test_materiaux.py
+
+import time
+import numpy as np
+import pytest
+import materiaux
+from materiaux import propriete, proprietes, proprietes_lot, facteur, famille, dilatation
+from calculs.stirling import epaisseur_paroi_min, calcul_complet, calcul_complet_batch
+from calculs.cylindre import CylindreStirling
+from calculs.tableaux import CylindreArray
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_proprietes():
+    print("\nTest propriétés en température")
+    noms = ("Acier XC48", "Alu 6061", "Inox 304L", "Fonte GS", "Acier inox 316L", "Acier Inox 304L", "AlSi12",
+            "Alliage léger", "aluminium 7075-T6", "Laiton")
+    attendu = ["Acier", "Aluminium", "Inox", "Acier", "Inox", "Inox", "Aluminium", "Aluminium", "Aluminium", "Laiton"]
+    pretty_assert("Familles", [famille(n) for n in noms] == attendu, attendu, [famille(n) for n in noms])
+    for nom in ("Titane", "Bronze", ""):
+        try:
+            famille(nom)
+            pretty_assert(f"Famille inconnue refusée : {nom!r}", False, "ValueError", None)
+        except ValueError:
+            pretty_assert(f"Famille inconnue refusée : {nom!r}", True, "ValueError", "ValueError")
+    pretty_assert("Rm à chaud de l’« Acier inox 316L » : table inox", propriete("Acier inox 316L", "Rm", 773.15)
+                  == propriete("Inox", "Rm", 773.15), propriete("Inox", "Rm", 773.15), propriete("Acier inox 316L", "Rm", 773.15))
+    pretty_assert("Valeur à 20 °C = catalogue", propriete("Acier", "Rm", 293.15) == 400e6, 400e6, propriete("Acier", "Rm", 293.15))
+    pretty_assert("Rm acier à 500 °C (EN 1993-1-2)", np.isclose(propriete("Acier", "Rm", 773.15), 0.70 * 400e6), 280e6,
+                  propriete("Acier", "Rm", 773.15))
+    pretty_assert("Interpolation linéaire", np.isclose(facteur("Aluminium", "Re", 523.15), (0.79 + 0.31) / 2), 0.55,
+                  facteur("Aluminium", "Re", 523.15))
+    pretty_assert("Bornes tenues", facteur("Inox", "E", 100.0) == 1.0 and facteur("Inox", "E", 2000.0) == 0.71, None, None)
+    chaud = proprietes("Laiton", 650.0)
+    pretty_assert("Toutes les propriétés", set(chaud) == {"E", "Re", "Rm", "alpha", "k"} and 0 < chaud["Rm"] < 300e6,
+                  None, chaud)
+    pretty_assert("Valeur ambiante imposée", propriete("Acier C45", "Rm", 773.15, 650e6) == 0.70 * 650e6, 455e6, None)
+    alu, fonte = materiaux.valeurs_ambiantes("Alu"), materiaux.valeurs_ambiantes("Fonte")
+    pretty_assert("Rm à défaut de Rm : limite de rupture du catalogue", alu["Rm"] == 140e6 and fonte["Rm"] == 110e6,
+                  (140e6, 110e6), (alu["Rm"], fonte["Rm"]))
+    pretty_assert("Re manquant pris dans la famille", alu["Re"] == 110e6 and fonte["Re"] == 235e6, (110e6, 235e6),
+                  (alu["Re"], fonte["Re"]))
+    pretty_assert("Rm à chaud de l’Alu", np.isclose(propriete("Alu", "Rm", 573.15), 0.35 * 140e6), 0.35 * 140e6,
+                  propriete("Alu", "Rm", 573.15))
+    pretty_assert("Dilatation", np.isclose(dilatation("Acier", 1.0, 373.15), 12.0e-6 * 80), 0.96e-3, dilatation("Acier", 1.0, 373.15))
+    try:
+        propriete("Acier", "nu", 300.0)
+        pretty_assert("Propriété inconnue refusée", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Propriété inconnue refusée", True, "ValueError", "ValueError")
+
+def test_vectorisation():
+    print("\nTest vectorisation et mémorisation")
+    T = np.linspace(250.0, 1000.0, 1_000_000)
+    Rm = propriete("Inox", "Rm", T)
+    pretty_assert("10^6 températures", Rm.shape == T.shape, T.shape, Rm.shape)
+    pretty_assert("Lot = scalaire", np.isclose(Rm[123456], propriete("Inox", "Rm", T[123456])), None, Rm[123456])
+    pretty_assert("Grille mémorisée", facteur("Inox", "Rm", T) is facteur("Inox 316", "Rm", T.copy())
+                  and not facteur("Inox", "Rm", T).flags.writeable, True, materiaux._interpoler.cache_info())
+    lot = proprietes_lot(["Acier", "Aluminium", "Acier"], "E", [293.15, 473.15, 773.15])
+    pretty_assert("Lot multi-matières", np.allclose(lot, [210e9, 0.86 * 70e9, 0.60 * 210e9]), None, lot)
+
+def test_dimensionnement_a_chaud():
+    print("\nTest dimensionnement avec les valeurs à chaud")
+    froid = epaisseur_paroi_min(0.05, 2e6, 150e6)
+    chaud = epaisseur_paroi_min(0.05, 2e6, 150e6, T=573.15, materiau="Aluminium")
+    pretty_assert("Paroi aluminium à 300 °C", np.isclose(chaud, froid / 0.35), froid / 0.35, chaud)
+    pretty_assert("Sans température : inchangé", epaisseur_paroi_min(0.05, 2e6, 150e6) == froid, froid, None)
+    ref = calcul_complet(P=500, materiau="Aluminium")
+    res = calcul_complet(P=500, materiau="Aluminium", resistance_a_chaud=True)
+    pretty_assert("calcul_complet à chaud : paroi plus épaisse", res["Epaisseur_min_m"] > ref["Epaisseur_min_m"],
+                  ref["Epaisseur_min_m"], res["Epaisseur_min_m"])
+    lot = calcul_complet_batch(P=[500, 500], materiau=np.array(["Aluminium", "Inox"], dtype=object), resistance_a_chaud=True)
+    inox = calcul_complet(P=500, materiau="Inox", resistance_a_chaud=True)
+    pretty_assert("Lot = scalaire", np.allclose(lot["Epaisseur_min_m"], [res["Epaisseur_min_m"], inox["Epaisseur_min_m"]],
+                                                rtol=1e-12, atol=0), None, lot["Epaisseur_min_m"])
+    fondu = calcul_complet(P=500, Th=780, materiau="Aluminium", resistance_a_chaud=True)
+    pretty_assert("Aluminium sans résistance à Th : paroi irréalisable", fondu["Epaisseur_min_m"] == np.inf
+                  and fondu["Paroi_realisable"] is False, np.inf, fondu["Epaisseur_min_m"])
+    pretty_assert("epaisseur_paroi_min sans résistance", epaisseur_paroi_min(0.05, 2e6, 150e6, T=1053.15, materiau="Aluminium")
+                  == np.inf, np.inf, None)
+    pretty_assert("Sans température, limite nulle : 0 comme avant", epaisseur_paroi_min(0.05, 2e6, 0.0) == 0.0, 0.0,
+                  epaisseur_paroi_min(0.05, 2e6, 0.0))
+    melange = calcul_complet_batch(P=500, Th=[650, 1053.15], materiau="Aluminium", resistance_a_chaud=True)
+    pretty_assert("Lot : ligne irréalisable marquée", list(melange["Paroi_realisable"]) == [True, False]
+                  and np.isinf(melange["Epaisseur_min_m"][1]), [True, False], melange["Paroi_realisable"])
+    cyl = CylindreStirling.depuis_calcul_complet(ref)
+    pretty_assert("Pression admissible à Th", np.isclose(cyl.pression_maxi_admissible_chaude,
+                  cyl.pression_maxi_admissible * facteur("Aluminium", "Rm", cyl.Th)), None,
+                  cyl.to_dict()["Pression max admissible à Th (bar)"])
+    cyls = CylindreArray.depuis_calcul_complet(calcul_complet_batch(P=[500, 500], materiau=np.array(["Aluminium", "Acier"], dtype=object)))
+    pretty_assert("Colonnes = pièce", np.isclose(cyls.pression_maxi_admissible_chaude[0], cyl.pression_maxi_admissible_chaude),
+                  cyl.pression_maxi_admissible_chaude, cyls.pression_maxi_admissible_chaude)
+
+@pytest.mark.perf
+def test_perf_propriete():
+    print("\nTest durée de l’interpolation en lot")
+    T = np.linspace(250.0, 1000.0, 1_000_000)
+    t0 = time.perf_counter()
+    propriete("Acier", "E", T)
+    duree = time.perf_counter() - t0
+    pretty_assert("10^6 températures", duree < 1.0, "< 1 s", duree)
+
+if __name__ == "__main__":
+    test_proprietes()
+    test_vectorisation()
+    test_dimensionnement_a_chaud()
+    test_perf_propriete()
+    print("\n==== FIN TESTS materiaux ====\n")
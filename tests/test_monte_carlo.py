@@ -0,0 +1,74 @@
+# tests/test_monte_carlo.py
+
+import math
+import numpy as np
+from calculs.monte_carlo import (
+    StatistiquesFlux, chaine_pieces, propager, normale, triangulaire, tolerance, uniforme
+)
+from calculs.stirling import calcul_complet, calcul_complet_batch
+from calculs.cylindre import CylindreStirling
+from calculs.piston import PistonStirling
+from calculs.bielle import bielle_depuis_stirling
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_statistiques_flux():
+    print("\nTest StatistiquesFlux (Welford/Chan + esquisse de quantiles)")
+    rng = np.random.default_rng(1)
+    x = rng.lognormal(0.0, 0.5, 1_000_000)
+    stats = StatistiquesFlux()
+    for bloc in np.array_split(x, 7):
+        stats.ajouter(bloc)
+    pretty_assert("Moyenne", math.isclose(stats.moyenne, x.mean(), rel_tol=1e-12), x.mean(), stats.moyenne)
+    pretty_assert("Écart-type", math.isclose(stats.ecart_type, x.std(ddof=1), rel_tol=1e-10), x.std(ddof=1), stats.ecart_type)
+    for q in (0.01, 0.05, 0.5, 0.95, 0.99):
+        exact = np.quantile(x, q)
+        approx = stats.quantile(q)
+        pretty_assert(f"Quantile {q}", abs(approx - exact) < 0.01 * x.std(), exact, approx)
+    a, b = StatistiquesFlux().ajouter(x[:300_000]), StatistiquesFlux().ajouter(x[300_000:])
+    a.fusionner(b)
+    pretty_assert("Fusion", a.n == x.size and math.isclose(a.variance, x.var(ddof=1), rel_tol=1e-10),
+                  x.var(ddof=1), a.variance)
+    inval = StatistiquesFlux().ajouter([1.0, np.nan, np.inf, 3.0])
+    pretty_assert("Valeurs non finies ignorées", inval.n == 2 and inval.invalides == 2 and inval.moyenne == 2.0,
+                  "n=2, invalides=2", (inval.n, inval.invalides))
+
+def test_chaine_pieces():
+    print("\nTest chaîne de pièces vectorisée vs objets")
+    lot = calcul_complet_batch(P=[80, 250, 900], pm=[8e5, 1e6, 2e6], materiau=["Acier", "Aluminium", "Inox"])
+    chaine = chaine_pieces(lot)
+    for i in range(3):
+        data = calcul_complet(P=lot["Puissance_W"][i], pm=lot["Pression_Pa"][i], materiau=lot["Materiau"][i])
+        cyl = CylindreStirling.depuis_calcul_complet(data)
+        piston = PistonStirling.depuis_cylindre(cyl)
+        bielle = bielle_depuis_stirling(data)
+        attendu = (cyl.masse, piston.masse, bielle.masse, cyl.pression_maxi_admissible)
+        obtenu = (chaine["Masse_cylindre_piece_kg"][i], chaine["Masse_piston_kg"][i],
+                  chaine["Masse_bielle_kg"][i], chaine["Pression_maxi_admissible_Pa"][i])
+        pretty_assert(f"Design {i}", np.allclose(obtenu, attendu, rtol=1e-12, atol=0), attendu, obtenu)
+
+def test_propager():
+    print("\nTest propager")
+    lois = {"eta": triangulaire(0.15, 0.20, 0.24), "Th": normale(650, 15), "pm": tolerance(1e6, 1e5),
+            "f": uniforme(24, 26)}
+    res = propager(P=300, lois=lois, n=300_000, taille_bloc=50_000, graine=7)
+    print(f"  {res['Echantillons']} tirages en {res['Duree_s']:.2f} s")
+    p = res["Puissance_effective_W"]
+    pretty_assert("Bande de puissance ordonnée", p["p5"] < p["p50"] < p["p95"], "p5 < p50 < p95", p)
+    pretty_assert("Tous les tirages valides", p["n"] == 300_000 and p["invalides"] == 0, 300_000, p["n"])
+    bis = propager(P=300, lois=lois, n=300_000, taille_bloc=50_000, graine=7, max_workers=2)
+    pretty_assert("Reproductible, indépendant du pool", bis["Masse_totale_kg"] == res["Masse_totale_kg"],
+                  res["Masse_totale_kg"]["p50"], bis["Masse_totale_kg"]["p50"])
+    try:
+        propager(P=300, lois={"materiau": "Acier"})
+    except ValueError as e:
+        print("[OK] Erreur attendue (paramètre non incertain):", e)
+    else:
+        raise AssertionError("Pas d’exception pour un paramètre inconnu")
+
+if __name__ == "__main__":
+    test_statistiques_flux()
+    test_chaine_pieces()
+    test_propager()
+    print("\n==== FIN TESTS monte_carlo ====\n")
@@ -0,0 +1,79 @@
+# tests/test_nodal.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.nodal import simuler, simuler_lot, depuis_pieces, echangeur, ECHANGEURS
+from calculs.cylindre import CylindreStirling
+from calculs.displacer import DisplacerStirling
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _echangeurs(longueur=0.02):
+    return {nom: echangeur(4e-4, 2e-3, longueur) for nom in ECHANGEURS}
+
+def test_nodal_depuis_pieces():
+    print("\nTest modèle nodal depuis les pièces")
+    cyl = CylindreStirling(0.04, 0.03, 0.006, "Acier", 7850, 0.8, "Usinage fin", 300, 850, 6, "M6", 0.85, 700)
+    disp = DisplacerStirling(diametre_m=0.038, hauteur_m=0.05)
+    res = depuis_pieces(cyl, disp, pm=1e6, f=25)
+    pretty_assert("Régime cyclique atteint", res["Converge"], True, res["Cycles"])
+    bilan = res["Chaleur_rechauffeur_J"] + res["Chaleur_refroidisseur_J"] + res["Chaleur_regenerateur_J"]
+    pretty_assert("Bilan énergétique", math.isclose(bilan, res["Travail_indique_J"], rel_tol=1e-3),
+                  res["Travail_indique_J"], bilan)
+    carnot = 1 - 300 / 850
+    pretty_assert("Rendements ordonnés", 0 < res["Rendement"] < res["Rendement_ideal"] < carnot,
+                  f"0 < réel < idéal < {carnot:.3f}", (res["Rendement"], res["Rendement_ideal"]))
+    pretty_assert("Pertes de charge", 0 < res["Pertes_charge_W"] < res["Puissance_indiquee_W"],
+                  "positives", res["Pertes_charge_W"])
+    pretty_assert("Pression moyenne", math.isclose(np.mean(res["Pression_Pa"]), 1e6, rel_tol=1e-9),
+                  1e6, np.mean(res["Pression_Pa"]))
+
+def test_nodal_lot():
+    print("\nTest modèle nodal en lot")
+    Th = np.array([650.0, 800.0, 950.0])
+    pm = np.array([5e5, 1e6, 2e6])
+    lot = simuler(Vse=30e-6, Vsc=25e-6, Th=Th, Tc=300, pm=pm, echangeurs=_echangeurs(), Vde=2e-6, Vdc=2e-6)
+    for i in range(3):
+        seul = simuler(Vse=30e-6, Vsc=25e-6, Th=Th[i], Tc=300, pm=pm[i], echangeurs=_echangeurs(), Vde=2e-6, Vdc=2e-6)
+        pretty_assert(f"Design {i} lot = isolé", math.isclose(lot["Puissance_nette_W"][i], seul["Puissance_nette_W"],
+                      rel_tol=1e-6), seul["Puissance_nette_W"], lot["Puissance_nette_W"][i])
+    # Modèle adiabatique idéal linéaire en pression moyenne
+    double = simuler(Vse=30e-6, Vsc=25e-6, Th=Th, Tc=300, pm=2 * pm, echangeurs=_echangeurs(), Vde=2e-6, Vdc=2e-6)
+    rapport = double["Travail_indique_J"] / lot["Travail_indique_J"]
+    pretty_assert("Travail proportionnel à pm", np.allclose(rapport, 2.0, rtol=1e-9), 2.0, rapport)
+    # Gaz nommé : constantes prises design par design, indépendantes du reste du lot et du découpage
+    Th, pm = np.array([500.0, 1100.0]), np.array([5e5, 2e7])
+    args = dict(Vse=30e-6, Vsc=25e-6, Tc=300, echangeurs=_echangeurs(), Vde=2e-6, Vdc=2e-6, gaz="Air", tol=1e-6)
+    lot = simuler(Th=Th, pm=pm, **args)
+    seuls = [simuler(Th=Th[i], pm=pm[i], **args)["Rendement"] for i in range(2)]
+    pretty_assert("Gaz nommé : lot = designs isolés", np.allclose(lot["Rendement"], seuls, rtol=1e-6, atol=0),
+                  seuls, lot["Rendement"])
+    blocs = simuler_lot(taille_bloc=1, Th=Th, pm=pm, **args)
+    pretty_assert("Gaz nommé : indépendant de taille_bloc", np.allclose(blocs["Rendement"], lot["Rendement"], rtol=1e-6, atol=0),
+                  lot["Rendement"], blocs["Rendement"])
+    try:
+        simuler(Vse=30e-6, Vsc=25e-6, Th=800, Tc=300, pm=1e6, echangeurs=_echangeurs(), Vde=0.0, Vdc=2e-6)
+    except ValueError as e:
+        print("[OK] Erreur attendue (volume mort nul):", e)
+    else:
+        raise AssertionError("Pas d’exception pour un volume mort nul")
+
+@pytest.mark.perf
+def test_perf_nodal():
+    print("\nTest durée d’un design nodal")
+    cyl = CylindreStirling(0.04, 0.03, 0.006, "Acier", 7850, 0.8, "Usinage fin", 300, 850, 6, "M6", 0.85, 700)
+    disp = DisplacerStirling(diametre_m=0.038, hauteur_m=0.05)
+    t0 = time.perf_counter()
+    res = depuis_pieces(cyl, disp, pm=1e6, f=25)
+    duree = time.perf_counter() - t0
+    print(f"  Convergence en {res['Cycles']} cycles, {duree * 1000:.1f} ms")
+    pretty_assert("Durée d’un design", duree < 0.25, "< 250 ms (cible 50 ms)", duree)
+
+if __name__ == "__main__":
+    test_nodal_depuis_pieces()
+    test_nodal_lot()
+    test_perf_nodal()
+    print("\n==== FIN TESTS nodal ====\n")
@@ -0,0 +1,59 @@
+# tests/test_pareto.py
+
+import numpy as np
+from calculs.pareto import optimiser, tri_non_domine, distance_encombrement
+from calculs.stirling import calcul_complet_batch
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_tri_non_domine():
+    print("\nTest tri non dominé / distance d’encombrement")
+    F = np.array([[1, 4], [2, 2], [4, 1], [3, 3], [5, 5], [np.nan, np.nan]], dtype=float)
+    rangs = tri_non_domine(F)
+    pretty_assert("Rangs", rangs.tolist() == [0, 0, 0, 1, 2, 3], [0, 0, 0, 1, 2, 3], rangs.tolist())
+    d = distance_encombrement(F[:3], rangs[:3])
+    pretty_assert("Extrémités infinies", np.isinf(d[[0, 2]]).all() and np.isfinite(d[1]), "[inf, fini, inf]", d)
+
+def test_optimiser():
+    print("\nTest optimiser (NSGA-II)")
+    res = optimiser(P=300, taille_population=100, generations=60, graine=3, patience=None)
+    F = np.column_stack([-res["objectifs"]["Puissance_specifique_W_kg"], res["objectifs"]["Masse_cylindre_kg"],
+                         res["objectifs"]["Epaisseur_min_m"], res["objectifs"]["Vitesse_piston_m_s"]])
+    print(f"  {res['evaluations']} évaluations, {res['taille_front']} designs non dominés")
+    pretty_assert("Front non dominé", (tri_non_domine(F) == 0).all(), "tous rang 0", tri_non_domine(F))
+    pretty_assert("Évaluations", res["evaluations"] == 100 * 61, 6100, res["evaluations"])
+
+    # Les entrées renvoyées redonnent les objectifs
+    e = res["entrees"]
+    lot = calcul_complet_batch(P=300, pm=e["pm"], f=e["f"], C=e["C"], Nc=e["Nc"], materiau=e["materiau"])
+    pretty_assert("Entrées cohérentes", np.array_equal(lot["Masse_cylindre_kg"], res["objectifs"]["Masse_cylindre_kg"]),
+                  "identiques", lot["Masse_cylindre_kg"][:3])
+
+    # Meilleure puissance spécifique au moins aussi bonne qu’un tirage aléatoire de même budget
+    rng = np.random.default_rng(0)
+    n = 6100
+    alea = calcul_complet_batch(P=300, pm=rng.uniform(2e5, 5e6, n), f=rng.uniform(5, 60, n),
+                                C=rng.uniform(0.005, 0.08, n), Nc=rng.integers(1, 13, n),
+                                materiau=rng.choice(["Acier", "Aluminium", "Inox", "Laiton"], n))
+    pretty_assert("Mieux qu’aléatoire", F[:, 0].min() <= -alea["Puissance_specifique_W_kg"].max(),
+                  alea["Puissance_specifique_W_kg"].max(), -F[:, 0].min())
+
+    bis = optimiser(P=300, taille_population=100, generations=60, graine=3, patience=None, max_workers=2)
+    pretty_assert("Reproductible (graine, pool)", np.array_equal(bis["entrees"]["pm"], e["pm"]),
+                  "fronts identiques", bis["taille_front"])
+
+    court = optimiser(P=300, taille_population=40, generations=1000, graine=1, patience=5, tol=1e-2)
+    pretty_assert("Arrêt anticipé", court["arret_anticipe"] and court["generations"] < 1000,
+                  "< 1000 générations", court["generations"])
+    try:
+        optimiser(P=300, materiaux=["Titane"])
+    except ValueError as ex:
+        print("[OK] Erreur attendue (matériau inconnu):", ex)
+    else:
+        raise AssertionError("Pas d’exception pour un matériau inconnu")
+
+if __name__ == "__main__":
+    test_tri_non_domine()
+    test_optimiser()
+    print("\n==== FIN TESTS pareto ====\n")
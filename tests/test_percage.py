@@ -0,0 +1,118 @@
+# tests/test_percage.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.percage import (positions, positions_arrondies, ligaments, orifices_couvercle, depuis_pieces,
+                             combinaisons_realisables, ligament_requis, paroi_percee)
+from calculs.cylindre import CylindreStirling
+from calculs.couvercle_cylindre import CouvercleCylindreStirling
+from calculs.assemblage import AssemblageMoteur
+from calculs.stirling import calcul_complet
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _couvercle(**options):
+    params = dict(diametre_m=0.06, epaisseur_m=0.005, matiere="Acier", densite_kg_m3=7850, rugosite_um=0.8,
+                  etat_surface="Usiné", type_couvercle="plat", diam_entrée_air_m=0.008, nb_entree_air=1,
+                  diam_entrée_bruleur_m=0.012, nb_entree_bruleur=1, distance_bruleur_centre_m=0.0,
+                  nb_vis=6, dim_vis_iso="M5", entraxe_vis_pct=0.85)
+    params.update(options)
+    return CouvercleCylindreStirling(**params)
+
+def test_positions():
+    print("\nTest positions des perçages")
+    for n, r in ((6, 20.86), (5, 12.345), (8, 31.0)):
+        boucle = [(round(r * math.cos(2 * math.pi * i / n), 2), round(r * math.sin(2 * math.pi * i / n), 2)) for i in range(n)]
+        pretty_assert(f"{n} trous sur R{r} = boucle", positions_arrondies(n, r) == boucle, boucle[:2], positions_arrondies(n, r)[:2])
+    pretty_assert("Positions mémorisées en lecture seule", positions(6, 20.0) is positions(6, 20.0)
+                  and not positions(6, 20.0).flags.writeable, True, positions.cache_info())
+    pretty_assert("Liste exportée indépendante", positions_arrondies(6, 20.0) is not positions_arrondies(6, 20.0), True, None)
+    couv = _couvercle()
+    pretty_assert("Couvercle", couv.perçage_vis == positions_arrondies(6, couv.entraxe_vis * 1000), None, couv.perçage_vis[:2])
+
+def test_ligaments():
+    print("\nTest ligaments")
+    res = ligaments(6, 20.0, 5.0, r_int_mm=15.0, r_ext_mm=25.0)
+    pretty_assert("Entre vis 2 R sin(π/n) - d", np.isclose(res["Ligament_entre_vis_mm"], 2 * 20 * math.sin(math.pi / 6) - 5),
+                  15.0, res["Ligament_entre_vis_mm"])
+    pretty_assert("Alésage et bord", np.isclose(res["Ligament_alesage_mm"], 2.5) and np.isclose(res["Ligament_bord_mm"], 2.5)
+                  and res["OK"], 2.5, res["Ligament_mini_mm"])
+    # Orifice centré sur un trou puis entre deux trous : écart angulaire au trou le plus proche
+    pile = ligaments(6, 20.0, 5.0, orifices=[(20.0, 0.0, 4.0)])
+    entre = ligaments(6, 20.0, 5.0, orifices=[(20.0 * math.cos(math.pi / 6), 20.0 * math.sin(math.pi / 6), 4.0)])
+    pretty_assert("Orifice sur un trou", np.isclose(pile["Ligament_orifices_mm"], -4.5) and not pile["OK"], -4.5, pile["Ligament_orifices_mm"])
+    attendu = 2 * 20 * math.sin(math.pi / 12) - 4.5
+    pretty_assert("Orifice entre deux trous", np.isclose(entre["Ligament_orifices_mm"], attendu), attendu, entre["Ligament_orifices_mm"])
+    # Lot = calcul trou par trou
+    rng = np.random.default_rng(4)
+    ports = np.column_stack((rng.uniform(-30, 30, 5), rng.uniform(-30, 30, 5), rng.uniform(2, 10, 5)))
+    n, R, d = rng.integers(3, 13, 500), rng.uniform(10, 40, 500), rng.uniform(2, 10, 500)
+    lot = ligaments(n, R, d, orifices=ports)
+    for k in range(0, 500, 25):
+        xy = positions(int(n[k]), float(R[k]))
+        dist = np.hypot(xy[:, None, 0] - ports[None, :, 0], xy[:, None, 1] - ports[None, :, 1])
+        direct = np.min(dist - (d[k] + ports[None, :, 2]) / 2)
+        assert np.isclose(lot["Ligament_orifices_mm"][k], direct), (k, lot["Ligament_orifices_mm"][k], direct)
+    pretty_assert("Lot = tous les couples trou/orifice", True, None, lot["Ligament_orifices_mm"][:3])
+    pretty_assert("Ligament requis", list(ligament_requis([1.0, 5.0])) == [1.0, 2.5], [1.0, 2.5], None)
+    epaisseur, entraxe = paroi_percee(24.5, 5.0)
+    juste = ligaments(6, entraxe, 5.0, r_int_mm=24.5, r_ext_mm=24.5 + epaisseur)
+    pretty_assert("Paroi mini : ligaments requis des deux côtés", epaisseur == 10.0 and juste["OK"]
+                  and np.isclose(juste["Ligament_alesage_mm"], 2.5) and np.isclose(juste["Ligament_bord_mm"], 2.5), 10.0, juste)
+    pretty_assert("Paroi plus épaisse conservée", paroi_percee(24.5, 5.0, 12.0) == (12.0, 30.5), (12.0, 30.5),
+                  paroi_percee(24.5, 5.0, 12.0))
+
+def test_pieces():
+    print("\nTest vérification des pièces")
+    for P in (300, 500, 2000):
+        moteur = AssemblageMoteur(calcul_complet(P=P))
+        pretty_assert(f"Assemblage P={P} W : perçages du couvercle conformes", moteur.piece("percages_couvercle")["OK"],
+                      True, moteur.percages_couvercle)
+    cyl, couv = moteur.cylindre, moteur.couvercle
+    pretty_assert("Même cercle d’entraxe", moteur.percages_couvercle["Ecart_entraxe_mm"] == 0.0 and couv.perçage_vis == cyl.percage_vis,
+                  0.0, moteur.percages_couvercle["Ecart_entraxe_mm"])
+    pretty_assert("Cylindre : perçages dans la paroi", cyl.verification_percages["OK"]
+                  and cyl.verification_percages["Ligament_alesage_mm"] > 0, "> 0", cyl.to_dict()["Ligament mini perçages (mm)"])
+    res = moteur.percages_couvercle
+    pretty_assert("Identique à depuis_pieces", res["Ligament_mini_mm"] == float(depuis_pieces(cyl, couv)["Ligament_mini_mm"]),
+                  None, res["Ligament_mini_mm"])
+    dedans = AssemblageMoteur(calcul_complet(P=500), entraxe_vis_pct=0.85)
+    pretty_assert("Entraxe imposé dans l’alésage : interférence signalée", not dedans.percages_couvercle["OK"]
+                  and dedans.percages_couvercle["Ligament_alesage_mm"] < 0, "< 0", dedans.percages_couvercle["Ligament_alesage_mm"])
+    decale = _couvercle(distance_bruleur_centre_m=0.019)
+    orifices = orifices_couvercle(decale)
+    pretty_assert("Orifices du couvercle", orifices.shape == (2, 3) and np.isclose(orifices[0, 0], 19.0)
+                  and orifices[1, 0] < 0, None, orifices)
+    pretty_assert("Brûleur excentré sur les vis", decale.verification_percages["Ligament_orifices_mm"] < 0
+                  and not decale.verification_percages["OK"], "< 0", decale.verification_percages["Ligament_orifices_mm"])
+
+def test_recherche():
+    print("\nTest recherche des combinaisons")
+    possibles = combinaisons_realisables(30.0, r_int_mm=24.5, r_ext_mm=40.0)
+    pretty_assert("Grille évaluée", possibles["nb_vis"].size > 0, "> 0", possibles["nb_vis"].size)
+    for k in range(0, possibles["nb_vis"].size, 37):
+        d = CylindreStirling.DIAM_PERCAGE_TARAUD_ISO[possibles["dim_vis_iso"][k]]
+        seul = ligaments(possibles["nb_vis"][k], possibles["entraxe_mm"][k], d, 24.5, 40.0)
+        assert seul["OK"] and np.isclose(seul["Ligament_mini_mm"], possibles["Ligament_mini_mm"][k]), k
+    pretty_assert("Combinaisons conformes", True, None, list(zip(possibles["nb_vis"][:3], possibles["dim_vis_iso"][:3])))
+    pretty_assert("Aucune combinaison dans une paroi de 1 mm", combinaisons_realisables(25.0, 24.5, 25.5)["nb_vis"].size == 0,
+                  0, None)
+
+@pytest.mark.perf
+def test_perf_recherche():
+    print("\nTest durée de la recherche")
+    t0 = time.perf_counter()
+    combinaisons_realisables(30.0, r_int_mm=24.5, r_ext_mm=40.0)
+    duree = time.perf_counter() - t0
+    pretty_assert("Grille évaluée", duree < 0.5, "< 0.5 s", duree)
+
+if __name__ == "__main__":
+    test_positions()
+    test_ligaments()
+    test_pieces()
+    test_recherche()
+    test_perf_recherche()
+    print("\n==== FIN TESTS percage ====\n")
@@ -0,0 +1,89 @@
+# tests/test_piece.py
+
+import copy
+import pickle
+import time
+import pytest
+from calculs.cylindre import CylindreStirling
+from calculs.piston import PistonStirling
+from calculs.support_roulement import SupportRoulement
+from calculs.couvercle_cylindre import CouvercleCylindreStirling
+from calculs.cache import normaliser
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _cylindre(**modif):
+    arguments = dict(diametre_m=0.04, course_m=0.03, epaisseur_m=0.006, matiere="Acier", densite_kg_m3=7850,
+                     rugosite_um=0.8, etat_surface="Usinage fin", Tc=300, Th=850, nb_vis=6, dim_vis_iso="M6",
+                     entraxe_vis_pct=0.85, limite_rupture_MPa=700)
+    arguments.update(modif)
+    return CylindreStirling(**arguments)
+
+def test_piece_immuable():
+    print("\nTest pièces immuables")
+    cyl = _cylindre()
+    pretty_assert("Pas de __dict__", not hasattr(cyl, "__dict__"), False, hasattr(cyl, "__dict__"))
+    try:
+        cyl.diametre = 0.05
+    except AttributeError as e:
+        print("[OK] Erreur attendue (affectation):", e)
+    else:
+        raise AssertionError("Affectation acceptée sur une pièce figée")
+    try:
+        cyl.attribut_inconnu = 1
+    except AttributeError as e:
+        print("[OK] Erreur attendue (nouvel attribut):", e)
+    else:
+        raise AssertionError("Nouvel attribut accepté")
+    grand = cyl.replace(diametre_m=0.05)
+    pretty_assert("replace -> nouvelle pièce", grand.diametre == 0.05 and cyl.diametre == 0.04, 0.05, grand.diametre)
+    pretty_assert("replace recalcule", grand.masse > cyl.masse, f"> {cyl.masse}", grand.masse)
+    pretty_assert("replace sans changement = égal", cyl.replace() == cyl and hash(cyl.replace()) == hash(cyl), True, None)
+    try:
+        cyl.replace(alesage=0.05)
+    except ValueError as e:
+        print("[OK] Erreur attendue (argument inconnu):", e)
+    else:
+        raise AssertionError("Argument inconnu accepté par replace")
+
+def test_piece_cache():
+    print("\nTest grandeurs dérivées en cache")
+    cyl = _cylindre()
+    d1 = cyl.to_dict()
+    d1["Masse (kg)"] = -1
+    d2 = cyl.to_dict()
+    pretty_assert("to_dict copié", d2["Masse (kg)"] > 0, "> 0", d2["Masse (kg)"])
+    pretty_assert("repr stable", repr(cyl) is repr(cyl), True, repr(cyl))
+    piston = PistonStirling.depuis_cylindre(cyl)
+    pretty_assert("Masse piston en cache", piston.masse is piston.masse, True, piston.masse)
+
+def test_piece_copie():
+    print("\nTest copie et sérialisation")
+    supp = SupportRoulement(d_arbre_mm=15, charge_radiale_N=4000, matiere="Acier")
+    for nom, copie in (("pickle", pickle.loads(pickle.dumps(supp))), ("deepcopy", copy.deepcopy(supp))):
+        pretty_assert(f"{nom} : pièce égale", copie == supp and copie.to_dict() == supp.to_dict(), supp, copie)
+    couv = CouvercleCylindreStirling(0.05, 0.005, "Inox", 7950, 0.6, "Rectifié", "plat", 0.008, 1, 0.012, 1,
+                                     0.0, 6, "M6", 0.85)
+    pretty_assert("Arguments avec accents", couv.replace(diam_entrée_air_m=0.01).diam_entrée_air == 0.01,
+                  0.01, None)
+    cle = normaliser(_cylindre())
+    pretty_assert("Clé de cache par arguments", cle == normaliser(_cylindre(diametre_m=0.04 + 1e-15))
+                  and cle != normaliser(_cylindre(diametre_m=0.041)), True, cle[0])
+
+@pytest.mark.perf
+def test_perf_to_dict():
+    print("\nTest durée de to_dict")
+    cyl = _cylindre()
+    t0 = time.perf_counter()
+    for _ in range(10_000):
+        cyl.to_dict()
+    duree = time.perf_counter() - t0
+    pretty_assert("10^4 to_dict", duree < 0.5, "< 0.5 s", duree)
+
+if __name__ == "__main__":
+    test_piece_immuable()
+    test_piece_cache()
+    test_piece_copie()
+    test_perf_to_dict()
+    print("\n==== FIN TESTS piece ====\n")
@@ -0,0 +1,72 @@
+# tests/test_schmidt.py
+
+import math
+import numpy as np
+from calculs.schmidt import simuler, travail_schmidt_analytique, depuis_pieces, temperature_regenerateur
+from calculs.cylindre import CylindreStirling
+from calculs.displacer import DisplacerStirling
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_schmidt_alpha_analytique():
+    print("\nTest Schmidt alpha vs solution fermée")
+    params = dict(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, Vde=3e-6, Vdc=2e-6, Vr=4e-6)
+    res = simuler(type_moteur="alpha", **params)
+    ref = travail_schmidt_analytique(**params)
+    pretty_assert("Travail indiqué", math.isclose(res["Travail_indique_J"], ref, rel_tol=1e-9), ref, res["Travail_indique_J"])
+    pretty_assert("Rendement de Carnot", math.isclose(res["Rendement"], 1 - 300 / 850, rel_tol=1e-9),
+                  1 - 300 / 850, res["Rendement"])
+    pretty_assert("Pression moyenne", math.isclose(np.mean(res["Pression_Pa"]), 1e6, rel_tol=1e-9), 1e6, np.mean(res["Pression_Pa"]))
+    bilan = res["Chaleur_chaude_J"] + res["Chaleur_froide_J"]
+    pretty_assert("Bilan énergétique", math.isclose(bilan, res["Travail_indique_J"]), res["Travail_indique_J"], bilan)
+
+def test_schmidt_lot():
+    print("\nTest Schmidt en lot (gamma)")
+    Vr = np.array([0.0, 2e-6, 8e-6, 20e-6])
+    lot = simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, f=25, Nc=2, Vr=Vr)
+    pretty_assert("Forme des pressions", lot["Pression_Pa"].shape == (4, 360), (4, 360), lot["Pression_Pa"].shape)
+    for i, v in enumerate(Vr):
+        seul = simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, f=25, Nc=2, Vr=v)
+        assert math.isclose(seul["Puissance_indiquee_W"], lot["Puissance_indiquee_W"][i], rel_tol=1e-12)
+    baisse = np.all(np.diff(lot["Puissance_indiquee_W"]) < 0)
+    pretty_assert("Le volume mort réduit la puissance", baisse, "décroissante", lot["Puissance_indiquee_W"])
+    # Pistons en phase ou en opposition : volumes en phase, cycle sans aire (W = 0)
+    morts = dict(Vde=3e-6, Vdc=2e-6, Vr=4e-6)
+    angles = np.radians([0, 90, 180])
+    alpha = simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, phase=angles, type_moteur="alpha", **morts)
+    ref = [travail_schmidt_analytique(20e-6, 18e-6, 850, 300, 1e6, phase=a, **morts) for a in angles]
+    W = alpha["Travail_indique_J"]
+    pretty_assert("Alpha à 0°, 90° et 180° = solution fermée", np.allclose(W, ref, rtol=1e-9, atol=1e-12 * W[1]), ref, W)
+    pretty_assert("Phase 0° ou 180° : travail nul", abs(W[0]) < 1e-12 * W[1] and abs(W[2]) < 1e-12 * W[1]
+                  and abs(ref[0]) < 1e-12 * W[1] and abs(ref[2]) < 1e-12 * W[1], 0.0, (W[0], W[2]))
+    gamma = simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, phase=angles, **morts)["Travail_indique_J"]
+    pretty_assert("Gamma à 0° ou 180° : travail nul", abs(gamma[0]) < 1e-12 * gamma[1] and abs(gamma[2]) < 1e-12 * gamma[1],
+                  0.0, gamma)
+    try:
+        simuler(Vse=20e-6, Vsc=18e-6, Th=850, Tc=300, pm=1e6, type_moteur="beta")
+    except ValueError as e:
+        print("[OK] Erreur attendue (type inconnu):", e)
+    else:
+        raise AssertionError("Pas d’exception pour un type de moteur inconnu")
+
+def test_schmidt_depuis_pieces():
+    print("\nTest Schmidt depuis CylindreStirling / DisplacerStirling")
+    cyl = CylindreStirling(
+        diametre_m=0.030, course_m=0.025, epaisseur_m=0.005, matiere="Acier", densite_kg_m3=7850,
+        rugosite_um=1.6, etat_surface="Usinée", Tc=300, Th=850, nb_vis=6, dim_vis_iso="M6",
+        entraxe_vis_pct=0.8, limite_rupture_MPa=400
+    )
+    galette = DisplacerStirling(diametre_m=0.029, hauteur_m=0.030)
+    res = depuis_pieces(cyl, galette, pm=1e6, f=25)
+    pretty_assert("Puissance positive", res["Puissance_indiquee_W"] > 0, "> 0", res["Puissance_indiquee_W"])
+    pretty_assert("Carnot (gamma)", math.isclose(res["Rendement"], 1 - cyl.Tc / cyl.Th, rel_tol=1e-9),
+                  1 - cyl.Tc / cyl.Th, res["Rendement"])
+    pretty_assert("T régénérateur", math.isclose(float(temperature_regenerateur(850, 300)), 550 / math.log(850 / 300)),
+                  "moyenne log", float(temperature_regenerateur(850, 300)))
+
+if __name__ == "__main__":
+    test_schmidt_alpha_analytique()
+    test_schmidt_lot()
+    test_schmidt_depuis_pieces()
+    print("\n==== FIN TESTS Schmidt ====\n")
@@ -0,0 +1,69 @@
+# tests/test_sensibilite.py
+
+import numpy as np
+from calculs.sensibilite import (
+    indices_sobol, indices_morris, echantillon_morris, echantillon_saltelli, sensibilite_moteur
+)
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def ishigami(U):
+    x = -np.pi + 2 * np.pi * U
+    return {"y": np.sin(x[:, 0]) + 7 * np.sin(x[:, 1]) ** 2 + 0.1 * x[:, 2] ** 4 * np.sin(x[:, 0])}
+
+def test_plans():
+    print("\nTest plans d’échantillonnage")
+    U, delta = echantillon_morris(k=5, r=20, niveaux=4, rng=0)
+    pas = np.diff(U.reshape(20, 6, 5), axis=1)
+    modifies = np.count_nonzero(np.abs(pas) > 1e-12, axis=2)
+    pretty_assert("Morris : un facteur par pas", (modifies == 1).all(), 1, np.unique(modifies))
+    pretty_assert("Morris : hypercube unité", U.min() >= 0 and U.max() <= 1, "[0, 1]", (U.min(), U.max()))
+    S = echantillon_saltelli(k=3, N=8, rng=0)
+    A, B, AB = S[:8], S[8:16], S[16:].reshape(3, 8, 3)
+    pretty_assert("Saltelli : AB_i", all(np.array_equal(AB[i][:, i], B[:, i]) and
+                  np.array_equal(np.delete(AB[i], i, 1), np.delete(A, i, 1)) for i in range(3)), True, S.shape)
+
+def test_sobol_ishigami():
+    print("\nTest Sobol (fonction d’Ishigami, indices analytiques)")
+    res = indices_sobol(ishigami, k=3, N=50_000, graine=1, n_bootstrap=100)
+    S1_ref, ST_ref = [0.3139, 0.4424, 0.0], [0.5576, 0.4424, 0.2437]
+    for j in range(3):
+        i = res["y"][f"x{j}"]
+        print(f"  x{j}: S1={i['S1']:.4f} {i['S1_ic']}  ST={i['ST']:.4f} {i['ST_ic']}")
+        pretty_assert(f"S1 x{j}", abs(i["S1"] - S1_ref[j]) < 0.03, S1_ref[j], i["S1"])
+        pretty_assert(f"ST x{j}", abs(i["ST"] - ST_ref[j]) < 0.03, ST_ref[j], i["ST"])
+        pretty_assert(f"IC x{j}", i["ST_ic"][0] <= i["ST"] <= i["ST_ic"][1], "ST dans son IC", i["ST_ic"])
+
+def test_morris_ishigami():
+    print("\nTest Morris (fonction d’Ishigami)")
+    res = indices_morris(ishigami, k=3, r=200, graine=2)
+    mu = [res["y"][f"x{j}"]["mu_etoile"] for j in range(3)]
+    pretty_assert("Tous influents", min(mu) > 0, "> 0", mu)
+
+def test_sensibilite_moteur():
+    print("\nTest sensibilité du dimensionnement")
+    res = sensibilite_moteur(P=500, methode="sobol", N=2048, graine=3, n_bootstrap=50)
+    classement = res["Classement"]["Masse_cylindre_kg"]
+    print("  Classement masse cylindre :", classement[:5])
+    pretty_assert("Nc en tête", classement[0] == "Nc", "Nc", classement[0])
+    bielle = res["Masse_bielle_kg"]
+    pretty_assert("Axe de piston sans effet sur la bielle",
+                  abs(bielle["piston.RAPPORT_AXE_DIAMETRE"]["ST"]) < 1e-12, 0.0,
+                  bielle["piston.RAPPORT_AXE_DIAMETRE"]["ST"])
+    bis = sensibilite_moteur(P=500, methode="sobol", N=2048, graine=3, n_bootstrap=50, max_workers=2, taille_bloc=10_000)
+    pretty_assert("Pool = séquentiel", bis["Masse_totale_kg"] == res["Masse_totale_kg"], "identiques",
+                  bis["Masse_totale_kg"]["pm"])
+    morris = sensibilite_moteur(P=500, methode="morris", r=50, graine=4)
+    pretty_assert("Morris moteur", morris["Classement"]["Masse_piston_kg"][0] in ("C", "pm", "Nc", "f", "eta"),
+                  "paramètre de calcul", morris["Classement"]["Masse_piston_kg"][:3])
+    pool = sensibilite_moteur(P=500, methode="morris", r=50, graine=4, max_workers=2, taille_bloc=200)
+    pretty_assert("Morris : pool = séquentiel", pool["Masse_totale_kg"] == morris["Masse_totale_kg"], "identiques",
+                  pool["Masse_totale_kg"]["pm"])
+
+if __name__ == "__main__":
+    test_plans()
+    test_sobol_ishigami()
+    test_morris_ishigami()
+    test_sensibilite_moteur()
+    print("\n==== FIN TESTS sensibilite ====\n")
@@ -2,7 +2,9 @@
 
 import traceback
 import math
+import numpy as np
 import calculs.stirling as st
+from conftest import pretty_assert as verifier   # vérification affirmée (le pretty_assert local n’affiche que)
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -171,6 +173,67 @@ def test_calcul_complet():
         print("  Exception inattendue:", e)
         print(traceback.format_exc())
 
+def _egal(a, b):
+    """Égalité des deux chemins : exacte hors flottants, à 1e-12 près pour les flottants (racine cubique NumPy / libm)."""
+    if isinstance(b, float):
+        return bool(np.isclose(a, b, rtol=1e-12, atol=0.0)) or (np.isnan(a) and np.isnan(b))
+    return a == b
+
+def test_calcul_complet_batch():
+    print("Test calcul_complet_batch")
+    cas = [
+        dict(P=400, Th=850, Tc=300, pm=12e5, f=25, Nc=4, eta=0.28, C=0.018),
+        dict(P=120),
+        dict(P=100, Th=500, Tc=500),
+        dict(P=250, Th="", Tc=None, pm=-1, f="x", Nc=2.7, eta=26, C=""),
+        dict(P=80, Th=700, Tc=300, Nc=6, C=0.0, materiau="Aluminium"),
+        dict(P=60, materiau="Inconnu"),
+    ]
+    colonnes = {k: [c.get(k) for c in cas] for k in ("P", "Th", "Tc", "pm", "f", "Nc", "eta", "C")}
+    colonnes["materiau"] = [c.get("materiau", "Acier") for c in cas]
+    lot = st.calcul_complet_batch(colonnes)
+    ecarts = []
+    for i, c in enumerate(cas):
+        ref = st.calcul_complet(**c)
+        for k, v in ref.items():
+            if k == "autofill":
+                ecarts += [(i, kk) for kk, drapeau in v.items() if lot[k][kk][i] != drapeau]
+            elif not _egal(lot[k][i], v):
+                ecarts.append((i, k, lot[k][i], v))
+    verifier("Lot identique au calcul scalaire", not ecarts, [], ecarts)
+
+    # Chemin scalaire = chemin en lot, sur des designs tirés au hasard
+    ecarts = []
+    rng = np.random.default_rng(7)
+    gaz, materiaux = ["Air", "He", "H2", "N2"], ["Acier", "Aluminium", "Inox", "Laiton"]
+    for i in range(200):
+        kw = dict(P=rng.uniform(10, 5000), Th=rng.uniform(400, 1000), pm=rng.uniform(1e5, 5e6), f=rng.uniform(5, 60),
+                  Nc=int(rng.integers(1, 8)), C=None if i % 2 else rng.uniform(0.005, 0.1))
+        options = dict(gaz=gaz[i % 4], materiau=materiaux[i % 3], resistance_a_chaud=i % 5 == 0)
+        ref = st.calcul_complet(**kw, **options)
+        lot = st.calcul_complet_batch(**{k: [v] for k, v in kw.items()}, **options)
+        ecarts += [(i, k, lot[k][0], v) for k, v in ref.items()
+                   if k not in ("autofill", "Gaz", "Materiau") and not _egal(lot[k][0], v)]
+    verifier("Scalaire = lot (200 designs)", not ecarts, [], ecarts[:3])
+
+    # Colonnes numériques pures : NaN sur C = course non renseignée, Th==Tc décalé de 10 K
+    lot = st.calcul_complet_batch(
+        P=np.array([100.0, 200.0]), Th=np.array([600.0, 300.0]), Tc=300.0,
+        C=np.array([np.nan, 0.02]), materiau=np.array(["Inox", "Laiton"])
+    )
+    verifier("Course autofill", list(lot["course_autofill"]) == [True, False], [True, False], lot["course_autofill"])
+    verifier("Décalage Th==Tc", lot["Temp_chaud_C"][1] == 310 - 273.15 and lot["autofill"]["Th"][1], 36.85, lot["Temp_chaud_C"][1])
+    ref = st.calcul_complet(P=200, Th=300, Tc=300, C=0.02, materiau="Laiton")
+    verifier("Masse avec décalage = scalaire", _egal(lot["Masse_cylindre_kg"][1], ref["Masse_cylindre_kg"]),
+             ref["Masse_cylindre_kg"], lot["Masse_cylindre_kg"][1])
+
+    try:
+        st.calcul_complet_batch(P=np.array([10.0, 0.0]))
+    except ValueError as e:
+        print("  [OK] Erreur attendue (P<=0 dans le lot):", e)
+    else:
+        raise AssertionError("Pas d’exception pour P<=0 dans le lot")
+
 if __name__ == "__main__":
     print("==== TESTS CALCULS STIRLING ====\n")
     test_puissance_stirling()
@@ -183,4 +246,5 @@ if __name__ == "__main__":
     test_archi_conseillee()
     test_check_params()
     test_calcul_complet()
+    test_calcul_complet_batch()
     print("\n==== FIN TESTS STIRLING ====")
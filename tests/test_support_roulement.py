@@ -3,7 +3,13 @@
 
 import math
 import traceback
+import numpy as np
+import pytest
 from calculs.support_roulement import SupportRoulement, choix_roulement, ROULEMENTS_ISO, MATERIAUX_SUPP
+from calculs.support_roulement import charge_equivalente, duree_L10h, choix_roulement_duree, colonnes_catalogue
+from calculs.support_roulement import choix_roulement_lot
+import time
+from conftest import pretty_assert as verifier   # vérification affirmée (le pretty_assert local n’affiche que)
 import sys, os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -45,7 +51,7 @@ def test_support_roulement_init():
         )
         d = supp.to_dict()
         pretty_assert("Roulement choisi", d["Roulement choisi"] == "6002", "6002", d["Roulement choisi"])
-        pretty_assert("Tolérance", math.isclose(d["Tol. d'alésage (mm)"], 0.021, abs_tol=1e-4), "0.021", d["Tol. d'alésage (mm)"])
+        pretty_assert("Tolérance", math.isclose(d["Tol. d'alésage (mm)"], 0.025, abs_tol=1e-4), "0.025", d["Tol. d'alésage (mm)"])
         pretty_assert("Masse > 0", d["Masse support (kg)"] > 0, ">", d["Masse support (kg)"])
         pretty_assert("Contrainte max > 0", d["Contrainte max (Pa)"] > 0, ">", d["Contrainte max (Pa)"])
     except Exception as e:
@@ -96,10 +102,75 @@ def test_repr_et_dict():
         print("  Exception inattendue :", e)
         print(traceback.format_exc())
 
+def test_duree_L10():
+    print("\nTest durée L10 et choix sur spectre de charge")
+    # Moyenne cubique : une charge constante est sa propre charge équivalente
+    P = charge_equivalente(np.full(3600, 500.0))
+    verifier("Charge constante", math.isclose(P, 500.0), 500.0, P)
+    # Deux paliers de charge sur des durées égales : ((1000³ + 2000³) / 2)^(1/3)
+    P = charge_equivalente([1000.0, 2000.0], vitesses=[1.0, 1.0])
+    attendu = ((1000.0 ** 3 + 2000.0 ** 3) / 2) ** (1 / 3)
+    verifier("Moyenne cubique", math.isclose(P, attendu), attendu, P)
+    L10h = duree_L10h(5100.0, 1000.0, 25.0)
+    attendu = 5.1 ** 3 * 1e6 / (3600 * 25)
+    verifier("L10h 6001 à 1 kN, 25 tr/s", math.isclose(L10h, attendu), attendu, L10h)
+    # Tout le catalogue d’un coup, plusieurs charges par diffusion
+    col = colonnes_catalogue()
+    grille = duree_L10h(col["charge_C"][None, :], np.array([[500.0], [1000.0]]), 25.0)
+    verifier("Catalogue x charges, durée décroissante avec la charge", grille.shape == (2, len(ROULEMENTS_ISO))
+             and np.all(grille[0] > grille[1]), (2, len(ROULEMENTS_ISO)), grille.shape)
+    r = choix_roulement_duree(12, 1000.0, 25.0, duree_h=10_000)
+    possibles = [x for x in ROULEMENTS_ISO if x["d"] >= 12 and duree_L10h(x["charge_C"], 1000.0, 25.0) >= 10_000]
+    plus_leger = min(possibles, key=lambda x: x["masse"])
+    verifier("Plus léger atteignant 10 000 h", r == plus_leger, plus_leger["ref"], r["ref"])
+    supp = SupportRoulement(d_arbre_mm=12, charge_radiale_N=1000, frequence_Hz=25.0, duree_cible_h=10_000)
+    verifier("Support : durée atteinte", supp.duree_L10h >= 10_000 and supp.roulement is r, ">= 10000",
+             supp.to_dict()["Durée L10 (h)"])
+    try:
+        choix_roulement_duree(12, 5000.0, 50.0, duree_h=50_000)
+    except ValueError as e:
+        print("[OK] Erreur attendue (durée inaccessible):", e)
+    else:
+        raise AssertionError("Pas d’exception pour une durée inaccessible")
+
+def test_choix_roulement_lot():
+    print("\nTest choix_roulement en lot")
+    rng = np.random.default_rng(3)
+    d, F = rng.uniform(5, 25, 2000), rng.uniform(1e3, 2e4, 2000)
+    d[:3], F[:3] = [12, 17, 50], [3000, 6000, 5000]
+    lot = choix_roulement_lot(d, F)
+    attendus = []
+    for di, Fi in zip(d, F):
+        try:
+            attendus.append(choix_roulement(di, Fi)["ref"])
+        except ValueError:
+            attendus.append("")
+    verifier("Lot = choix_roulement", list(lot["ref"]) == attendus, attendus[:3], lot["ref"][:3])
+    impossibles = lot["Indice"] < 0
+    verifier("Cas impossibles signalés", np.array_equal(impossibles, ~lot["Possible"]) and np.all(np.isnan(lot["D"][impossibles]))
+             and impossibles[2], True, int(impossibles.sum()))
+    verifier("Alésage >= arbre", np.all(lot["d"][~impossibles] >= d[~impossibles]), True, None)
+    un = choix_roulement_lot(15, 4000)
+    verifier("Cas scalaire", un["ref"] == "6002" and un["Indice"].shape == (), "6002", un["ref"])
+    grille = choix_roulement_lot(np.linspace(5, 30, 1000)[:, None], np.linspace(500, 2e4, 1000)[None, :])
+    verifier("Grille 1000 x 1000", grille["Indice"].shape == (1000, 1000), (1000, 1000), grille["Indice"].shape)
+
+@pytest.mark.perf
+def test_perf_choix_roulement_lot():
+    print("\n==== TEST : durée de choix_roulement_lot ====")
+    choix_roulement_lot(np.linspace(5, 30, 1000)[:, None], np.linspace(500, 2e4, 1000)[None, :])
+    t0 = time.perf_counter()
+    choix_roulement_lot(np.linspace(5, 30, 1000)[:, None], np.linspace(500, 2e4, 1000)[None, :])
+    duree = time.perf_counter() - t0
+    verifier("Grille 1000 x 1000", duree < 1.0, "< 1 s", duree)
+
 if __name__ == "__main__":
     print("==== TESTS SUPPORT_ROULEMENT ====")
     test_choix_roulement()
     test_support_roulement_init()
     test_erreurs()
     test_repr_et_dict()
+    test_duree_L10()
+    test_choix_roulement_lot()
+    test_perf_choix_roulement_lot()
     print("\n==== FIN TESTS SUPPORT_ROULEMENT ====")
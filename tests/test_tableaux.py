@@ -0,0 +1,87 @@
+# tests/test_tableaux.py
+
+import time
+import numpy as np
+import pytest
+from calculs.tableaux import BielleArray, CylindreArray, PistonArray, VillebrequinArray
+from calculs.stirling import calcul_complet, calcul_complet_batch
+from calculs.cylindre import CylindreStirling
+from calculs.piston import PistonStirling
+from calculs.bielle import bielle_depuis_stirling
+from calculs.villebrequin import VillebrequinStirling
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _compare(desc, tableau, objets, proprietes):
+    for nom in proprietes:
+        obtenu = getattr(tableau, nom)
+        attendu = np.array([getattr(o, nom) for o in objets])
+        pretty_assert(f"{desc}.{nom}", np.allclose(obtenu, attendu, rtol=1e-12, atol=0), attendu, obtenu)
+
+def test_tableaux_vs_objets():
+    print("\nTest collections en colonnes vs objets scalaires")
+    lot = calcul_complet_batch(P=[80, 250, 900, 3000], pm=[8e5, 1e6, 2e6, 3e6],
+                               materiau=["Acier", "Aluminium", "Inox", "Laiton"])
+    cylindres = CylindreArray.depuis_calcul_complet(lot)
+    pistons = PistonArray.depuis_cylindres(cylindres)
+    bielles = BielleArray.depuis_stirling(lot)
+    objets_cyl, objets_piston, objets_bielle = [], [], []
+    for i in range(len(cylindres)):
+        data = calcul_complet(P=lot["Puissance_W"][i], pm=lot["Pression_Pa"][i], materiau=lot["Materiau"][i])
+        cyl = CylindreStirling.depuis_calcul_complet(data)
+        objets_cyl.append(cyl)
+        objets_piston.append(PistonStirling.depuis_cylindre(cyl))
+        objets_bielle.append(bielle_depuis_stirling(data))
+    _compare("Cylindre", cylindres, objets_cyl, ("epaisseur", "volume_metal", "masse", "surface_totale_interne",
+                                                 "surface_totale_externe", "pression_maxi_admissible"))
+    _compare("Piston", pistons, objets_piston, ("nb_rainures", "volume_total", "masse", "surface_totale"))
+    _compare("Bielle", bielles, objets_bielle, ("volume_total", "masse", "surface_totale", "moment_quadratique"))
+    ligne = pistons.ligne(2)
+    pretty_assert("ligne() -> objet scalaire", isinstance(ligne, PistonStirling) and ligne.masse == objets_piston[2].masse
+                  and ligne.rainures == objets_piston[2].rainures, objets_piston[2], ligne)
+    pretty_assert("Colonnes en lecture seule", not cylindres.diametre.flags.writeable, False, cylindres.diametre.flags.writeable)
+
+def test_villebrequin_array():
+    print("\nTest VillebrequinArray")
+    objets = [VillebrequinStirling(nb_manetons=n, rayon_maneton_m=r) for n, r in ((1, 0.009), (2, 0.015), (4, 0.02))]
+    tableau = VillebrequinArray.depuis_objets(objets)
+    _compare("Vilebrequin", tableau, objets, ("volume_total", "masse", "surface_totale",
+                                              "moment_inertie_axe", "moment_inertie_contrepoids"))
+    defauts = VillebrequinArray(rayon_maneton_m=np.linspace(0.005, 0.02, 4))
+    pretty_assert("Défauts du constructeur scalaire", len(defauts) == 4 and np.all(defauts.diametre_axe == 0.012),
+                  0.012, defauts.diametre_axe)
+    try:
+        VillebrequinArray(rayon=0.01)
+    except ValueError as e:
+        print("[OK] Erreur attendue (paramètre inconnu):", e)
+    else:
+        raise AssertionError("Pas d’exception pour un paramètre inconnu")
+
+def test_tableaux_million():
+    print("\nTest 10^6 variantes")
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    lot = calcul_complet_batch(P=rng.uniform(50, 2000, n), pm=rng.uniform(5e5, 3e6, n))
+    cylindres = CylindreArray.depuis_calcul_complet(lot)
+    masse = cylindres.masse + PistonArray.depuis_cylindres(cylindres).masse + BielleArray.depuis_stirling(lot).masse
+    pretty_assert("Masses finies", np.all(np.isfinite(masse)) and len(masse) == n, n, len(masse))
+
+@pytest.mark.perf
+def test_perf_tableaux():
+    print("\nTest durée sur 10^6 variantes")
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    lot = calcul_complet_batch(P=rng.uniform(50, 2000, n), pm=rng.uniform(5e5, 3e6, n))
+    t0 = time.perf_counter()
+    cylindres = CylindreArray.depuis_calcul_complet(lot)
+    cylindres.masse + PistonArray.depuis_cylindres(cylindres).masse + BielleArray.depuis_stirling(lot).masse
+    duree = time.perf_counter() - t0
+    pretty_assert("Durée", duree < 5.0, "< 5 s", duree)
+
+if __name__ == "__main__":
+    test_tableaux_vs_objets()
+    test_villebrequin_array()
+    test_tableaux_million()
+    test_perf_tableaux()
+    print("\n==== FIN TESTS tableaux ====\n")
@@ -0,0 +1,90 @@
+# tests/test_tolerances.py
+
+import time
+import numpy as np
+import pytest
+from calculs.tolerances import ecarts, ajustement, cotes_limites, intervalle_tolerance, verifier_ajustements, paliers
+from calculs.support_roulement import SupportRoulement
+from calculs.displacer import DisplacerStirling
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_ecarts():
+    print("\nTest écarts ISO 286-2")
+    # Valeurs des tables ISO 286-2 (µm)
+    references = {
+        ("H7", 6): (12, 0), ("H7", 32): (25, 0), ("h8", 6): (0, -18), ("F7", 40): (50, 25), ("G6", 5): (12, 4),
+        ("K7", 40): (7, -18), ("M7", 40): (0, -25), ("N7", 40): (-8, -33), ("P7", 40): (-17, -42),
+        ("S7", 40): (-34, -59), ("U7", 20): (-33, -54), ("N9", 2): (-4, -29), ("N9", 20): (0, -52),
+        ("js7", 40): (12, -12), ("JS7", 10): (7, -7), ("k6", 20): (15, 2), ("r6", 100): (73, 51),
+        ("c11", 45): (-130, -290), ("g6", 3): (-2, -8), ("u6", 25): (61, 48),
+    }
+    for (code, D), attendu in references.items():
+        obtenu = tuple(round(e * 1000) for e in ecarts(code, D))
+        pretty_assert(f"{code} Ø{D}", obtenu == attendu, attendu, obtenu)
+    pretty_assert("Bornes des paliers ]a, b]", list(paliers([3, 3.001, 10, 10.5, 500])) == [0, 1, 2, 3, 24], None, None)
+    pretty_assert("IT7 Ø32", np.isclose(intervalle_tolerance(7, 32), 0.025), 0.025, intervalle_tolerance(7, 32))
+    pretty_assert("Cotes limites", np.allclose(cotes_limites("g6", 20.0), (19.98, 19.993)), (19.98, 19.993), cotes_limites("g6", 20.0))
+    for code, D in (("X7", 10), ("H17", 10), ("H7", 0), ("H7", 600)):
+        try:
+            ecarts(code, D)
+            pretty_assert(f"Refus {code} Ø{D}", False, "ValueError", None)
+        except ValueError:
+            pretty_assert(f"Refus {code} Ø{D}", True, "ValueError", "ValueError")
+
+def test_ajustements():
+    print("\nTest ajustements")
+    glissant = ajustement("H7/g6", D_mm=32)
+    pretty_assert("H7/g6 Ø32 : jeu", glissant["Type"] == "jeu" and np.isclose(glissant["Jeu_min_mm"], 0.009)
+                  and np.isclose(glissant["Jeu_max_mm"], 0.050), "0.009 / 0.050", glissant)
+    pretty_assert("H7/k6 Ø32 : incertain", ajustement("H7", "k6", 32)["Type"] == "incertain", "incertain", None)
+    serre = ajustement("H7/s6", D_mm=50)
+    pretty_assert("H7/s6 Ø50 : serrage", serre["Type"] == "serrage" and np.isclose(serre["Serrage_max_mm"], 0.059), 0.059, serre)
+    try:
+        ajustement("g6/H7", D_mm=10)
+        pretty_assert("Ordre alésage/arbre imposé", False, "ValueError", None)
+    except ValueError:
+        pretty_assert("Ordre alésage/arbre imposé", True, "ValueError", "ValueError")
+    rng = np.random.default_rng(2)
+    D = rng.uniform(0.5, 500, 1_000_000)
+    codes = rng.choice(["H7/g6", "H7/p6", "F8/h7", "K7/h6"], D.size)
+    lot = ajustement(codes, D_mm=D)
+    pretty_assert("10^6 ajustements", lot["Jeu_max_mm"].shape == D.shape, D.shape, lot["Jeu_max_mm"].shape)
+    for k in rng.integers(0, D.size, 20):
+        seul = ajustement(str(codes[k]), D_mm=D[k])
+        assert np.isclose(seul["Jeu_min_mm"], lot["Jeu_min_mm"][k]) and seul["Type"] == lot["Type"][k], k
+    pretty_assert("Lot = calcul isolé", True, None, lot["Type"][:4])
+    ensemble = verifier_ajustements({"axe displacer": ("H7/h8", 6), "logement roulement": ("H7/h6", 32)})
+    pretty_assert("Ensemble", ensemble["axe displacer"]["Jeu_max_mm"] == 0.03 and ensemble["logement roulement"]["Type"] == "jeu",
+                  0.03, ensemble)
+
+def test_pieces():
+    print("\nTest tolérances des pièces")
+    supp = SupportRoulement(d_arbre_mm=15, charge_radiale_N=4000, matiere="Alu", type_tolerance="H7")
+    pretty_assert("Logement H7 Ø32 (6002)", supp.roulement["D"] == 32 and supp.tol_alesage() == 0.025
+                  and np.isclose(supp.d_alésage, 32.025), 0.025, supp.tol_alesage())
+    serre = SupportRoulement(d_arbre_mm=15, charge_radiale_N=4000, matiere="Alu", type_tolerance="N6")
+    pretty_assert("Logement N6 Ø32", np.isclose(serre.d_alésage, 32 - 0.012), 31.988, serre.d_alésage)
+    disp = DisplacerStirling(diametre_m=0.05, hauteur_m=0.06, epaisseur_fond_m=0.002, axe_diam_m=0.006)
+    joints = disp.joints_toriques
+    pretty_assert("Axe Ø6 h8 / H7", joints["Écarts axe (mm)"] == (0.0, -0.018) and joints["Écarts alésage (mm)"] == (0.012, 0.0)
+                  and joints["Jeu axe/guide (mm)"] == (0.0, 0.03), (0.0, 0.03), joints["Jeu axe/guide (mm)"])
+
+@pytest.mark.perf
+def test_perf_ajustements():
+    print("\nTest durée des ajustements en lot")
+    rng = np.random.default_rng(2)
+    D = rng.uniform(0.5, 500, 1_000_000)
+    codes = rng.choice(["H7/g6", "H7/p6", "F8/h7", "K7/h6"], D.size)
+    t0 = time.perf_counter()
+    ajustement(codes, D_mm=D)
+    duree = time.perf_counter() - t0
+    pretty_assert("10^6 ajustements", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_ecarts()
+    test_ajustements()
+    test_pieces()
+    test_perf_ajustements()
+    print("\n==== FIN TESTS tolerances ====\n")
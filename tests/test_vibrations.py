@@ -0,0 +1,80 @@
+# tests/test_vibrations.py
+
+import math
+import time
+import numpy as np
+import pytest
+from calculs.vibrations import (frequences_torsion, frequences_flexion, ligne_arbre, marges, depuis_pieces,
+                                depuis_balayage, modules_elastiques)
+from calculs.assemblage import AssemblageMoteur
+from calculs.stirling import calcul_complet, calcul_complet_batch
+from conftest import pretty_assert
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def test_torsion():
+    print("\nTest fréquences de torsion")
+    J1, J2, k = 2e-4, 3e-3, 500.0
+    f2 = frequences_torsion([J1, J2], [k])
+    attendu = math.sqrt(k * (J1 + J2) / (J1 * J2)) / (2 * math.pi)
+    pretty_assert("Deux inerties", math.isclose(f2[0], attendu, rel_tol=1e-9), attendu, f2[0])
+    # Trois inerties identiques : ω² = k/J et 3k/J
+    f3 = frequences_torsion(np.full((5, 3), 1e-3), np.full((5, 2), 100.0))
+    w = np.sqrt([100.0 / 1e-3, 300.0 / 1e-3]) / (2 * math.pi)
+    pretty_assert("Trois inerties, lot de 5", f3.shape == (5, 2) and np.allclose(f3, w), w, f3[0])
+    pretty_assert("Marge", math.isclose(marges([[110.0]], 100.0, (1,))[0], 0.1), 0.1, marges([[110.0]], 100.0, (1,)))
+    pretty_assert("Modules : Acier C45 -> acier", modules_elastiques("Acier C45")["E"] == 210e9, 210e9, modules_elastiques("Acier C45"))
+    pretty_assert("Modules : Alu -> aluminium", modules_elastiques("Alu")["E"] == 70e9, 70e9, modules_elastiques("Alu"))
+
+def test_flexion():
+    print("\nTest fréquences de flexion")
+    L, d, rho, E = 0.5, 0.02, 7850.0, 210e9
+    I, A = math.pi * d ** 4 / 64, math.pi * d ** 2 / 4
+    uniforme = frequences_flexion(L, d, rho, E, nb_elements=20)[0, 0]
+    attendu = math.pi / (2 * L ** 2) * math.sqrt(E * I / (rho * A))
+    pretty_assert("Poutre uniforme sur appuis simples", math.isclose(uniforme, attendu, rel_tol=0.02), attendu, uniforme)
+    masse = frequences_flexion(L, d, 1e-3, E, masse_volant=5.0)[0, 0]
+    attendu = math.sqrt(48 * E * I / (5.0 * L ** 3)) / (2 * math.pi)
+    pretty_assert("Masse ponctuelle au milieu", math.isclose(masse, attendu, rel_tol=1e-3), attendu, masse)
+
+def test_ligne_arbre():
+    print("\nTest ligne d’arbre")
+    moteur = AssemblageMoteur(calcul_complet(P=500))
+    res = depuis_pieces(moteur.villebrequin, moteur.arbre, 25, bielle=moteur.bielle, piston=moteur.piston,
+                        inertie_volant=2e-3, masse_volant=1.5)
+    pretty_assert("Moteur nominal hors résonance", not res["Resonance"][0], False, res["Marge_torsion"])
+    # Fréquence de rotation placée sur le premier mode de torsion (ordre 2)
+    f_res = res["Frequences_torsion_Hz"][0, 0] / 2
+    resonant = depuis_pieces(moteur.villebrequin, moteur.arbre, f_res, bielle=moteur.bielle, piston=moteur.piston,
+                             inertie_volant=2e-3, masse_volant=1.5)
+    pretty_assert("Résonance détectée", resonant["Resonance"][0] and resonant["Marge_torsion"][0] < 1e-9, True, resonant["Marge_torsion"])
+    acc = depuis_pieces(moteur.villebrequin, moteur.arbre, 25, inertie_volant=2e-3, inertie_generateur=1e-3,
+                        raideur_accouplement=50.0)
+    pretty_assert("Accouplement élastique : deux modes", acc["Frequences_torsion_Hz"].shape == (1, 2), (1, 2), acc["Frequences_torsion_Hz"])
+    # Lot = designs isolés
+    lot = ligne_arbre([20, 30, 40], [1e-4, 2e-4, 3e-4], [0.010, 0.012, 0.014], 0.08, inertie_volant=1e-3, masse_volant=1.0)
+    seul = ligne_arbre(30, 2e-4, 0.012, 0.08, inertie_volant=1e-3, masse_volant=1.0)
+    pretty_assert("Lot = calcul isolé", np.allclose(lot["Frequences_torsion_Hz"][1], seul["Frequences_torsion_Hz"][0])
+                  and np.allclose(lot["Frequences_flexion_Hz"][1], seul["Frequences_flexion_Hz"][0]), seul["Vitesse_critique_tr_min"],
+                  lot["Vitesse_critique_tr_min"][1])
+    n = 20_000
+    balayage = calcul_complet_batch(P=np.linspace(100, 2000, n), f=np.linspace(10, 60, n))
+    vib = depuis_balayage(balayage, inertie_volant=2e-3, masse_volant=1.5)
+    pretty_assert("Balayage de 20 000 designs", vib["Resonance"].shape == (n,), (n,), vib["Resonance"].shape)
+
+@pytest.mark.perf
+def test_perf_balayage():
+    print("\nTest durée sur un balayage")
+    n = 20_000
+    balayage = calcul_complet_batch(P=np.linspace(100, 2000, n), f=np.linspace(10, 60, n))
+    t0 = time.perf_counter()
+    depuis_balayage(balayage, inertie_volant=2e-3, masse_volant=1.5)
+    duree = time.perf_counter() - t0
+    pretty_assert("Balayage de 20 000 designs", duree < 2.0, "< 2 s", duree)
+
+if __name__ == "__main__":
+    test_torsion()
+    test_flexion()
+    test_ligne_arbre()
+    test_perf_balayage()
+    print("\n==== FIN TESTS vibrations ====\n")
@@ -5,7 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import traceback
 from calculs.visserie import (
-    get_vis, resistance_vis, perçage_taraudage_recommande, check_assemblage, calc_visserie
+    get_vis, resistance_vis, perçage_taraudage_recommande, check_assemblage, calc_visserie, FILETAGES_ISO
 )
 import sys, os
 
@@ -69,6 +69,11 @@ def test_percage_taraudage():
     v = perçage_taraudage_recommande("M6")
     pretty_assert("M6 : d_percage correct", abs(v["d_percage"]-6.6) < 0.01, 6.6, v["d_percage"])
     pretty_assert("M6 : d_taraudage correct", abs(v["d_taraudage"]-5.0) < 0.01, 5.0, v["d_taraudage"])
+    forets = {f["designation"]: f["d_taraud"] for f in FILETAGES_ISO}
+    for dim, foret in (("M8", 6.8), ("M12", 10.2), ("M8x1", 7.0)):
+        d = forets[dim]
+        pretty_assert(f"{dim} : foret de taraudage normalisé", d == foret, foret, d)
+        assert d == foret, dim
     try:
         perçage_taraudage_recommande("M20")
     except Exception as e: